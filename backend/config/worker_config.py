@@ -51,6 +51,13 @@ class WorkerResourceConfig:
     # Minimum workers to maintain
     min_workers: int = 1
 
+    # Pre-imported idle worker processes kept by the daemon (0 = cold spawn only).
+    # Opt-in (--warm-pool-size / AIPM_WARM_POOL_SIZE): idle workers hold memory
+    warm_pool_size: int = 0
+
+    # Local HTTP /metrics endpoint port of the daemon (None = disabled, 0 = any free port)
+    metrics_port: Optional[int] = None
+
     def __post_init__(self):
         """Validate configuration values"""
         if self.max_concurrent_workers < 1:
@@ -77,6 +84,12 @@ class WorkerResourceConfig:
         if self.max_retries < 0:
             raise ValueError("max_retries must be >= 0")
 
+        if self.warm_pool_size < 0:
+            raise ValueError("warm_pool_size must be >= 0")
+
+        if self.metrics_port is not None and not (0 <= self.metrics_port <= 65535):
+            raise ValueError("metrics_port must be between 0 and 65535")
+
 
 @dataclass
 class WorkerPriorityConfig:
@@ -180,6 +193,8 @@ def load_config_from_env() -> WorkerResourceConfig:
         AIPM_MAX_MEMORY_PERCENT: Memory threshold
         AIPM_WORKER_TIMEOUT: Worker timeout in seconds
         AIPM_TASK_TIMEOUT: Task timeout in seconds
+        AIPM_WARM_POOL_SIZE: Pre-imported idle worker processes (0 = disabled)
+        AIPM_METRICS_PORT: Daemon /metrics endpoint port (0 = any free port)
         AIPM_ENABLE_MONITORING: Enable resource monitoring (true/false)
         AIPM_ENABLE_AUTO_SCALING: Enable auto-scaling (true/false)
 
@@ -204,6 +219,12 @@ def load_config_from_env() -> WorkerResourceConfig:
     if os.getenv("AIPM_TASK_TIMEOUT"):
         config.task_timeout = int(os.getenv("AIPM_TASK_TIMEOUT"))
 
+    if os.getenv("AIPM_WARM_POOL_SIZE"):
+        config.warm_pool_size = int(os.getenv("AIPM_WARM_POOL_SIZE"))
+
+    if os.getenv("AIPM_METRICS_PORT"):
+        config.metrics_port = int(os.getenv("AIPM_METRICS_PORT"))
+
     # Load boolean values
     if os.getenv("AIPM_ENABLE_MONITORING"):
         config.enable_resource_monitoring = os.getenv("AIPM_ENABLE_MONITORING").lower() == "true"
@@ -2,6 +2,8 @@
 AI PM Framework - Cost Management Module
 
 タスクの難易度スコアリング・トークン推定・コスト管理機能を提供。
+
+公開関数は属性アクセス時に遅延インポートする（utils/lazy_import.py）。
 """
 
 from pathlib import Path
@@ -10,8 +12,16 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from .task_complexity import calculate_complexity
-from .cost_tracker import record_cost, estimate_cost, calculate_cost, MODEL_PRICING
+from utils.lazy_import import lazy_exports
+
+# 公開名 → 定義元サブモジュール
+_LAZY_EXPORTS = {
+    "calculate_complexity": ".task_complexity",
+    "record_cost": ".cost_tracker",
+    "estimate_cost": ".cost_tracker",
+    "calculate_cost": ".cost_tracker",
+    "MODEL_PRICING": ".cost_tracker",
+}
 
 __all__ = [
     "calculate_complexity",
@@ -20,3 +30,5 @@ __all__ = [
     "calculate_cost",
     "MODEL_PRICING",
 ]
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -4,6 +4,10 @@ AI PM Framework - Cost Analysis Report CLI
 
 Generate cost analysis reports from task data with support for multiple report types.
 
+Closed days are read from the cost_daily_rollups table (see cost_rollup.py);
+only the not-yet-rolled-up days (normally just today) are aggregated from the
+raw tasks table.
+
 Usage:
     python -m cost.cost_report project [PROJECT_ID] [options]
     python -m cost.cost_report order PROJECT_ID [ORDER_ID] [options]
@@ -71,6 +75,7 @@ from utils.db import (
     rows_to_dicts,
     DatabaseError,
 )
+from cost.cost_rollup import bucket_source
 from utils.validation import (
     validate_project_name,
     validate_order_id,
@@ -104,33 +109,19 @@ def report_by_project(
     try:
         conn = get_connection(db_path)
 
-        # Build query
-        query = """
+        source, params = bucket_source(
+            conn, project_id=project_id, from_date=from_date, to_date=to_date,
+        )
+        query = f"""
         SELECT
             project_id,
-            COUNT(*) as task_count,
-            COALESCE(SUM(cost_usd), 0) as total_cost_usd,
-            COALESCE(AVG(complexity_score), 0) as avg_complexity,
-            COALESCE(SUM(actual_tokens), 0) as total_tokens
-        FROM tasks
-        WHERE 1=1
+            COALESCE(SUM(task_count), 0) as task_count,
+            COALESCE(SUM(total_cost_usd), 0) as total_cost_usd,
+            COALESCE(SUM(complexity_sum) * 1.0 / NULLIF(SUM(complexity_count), 0), 0) as avg_complexity,
+            COALESCE(SUM(total_tokens), 0) as total_tokens
+        FROM ({source})
+        GROUP BY project_id ORDER BY project_id
         """
-        params = []
-
-        # Project filter
-        if project_id:
-            query += " AND project_id = ?"
-            params.append(project_id)
-
-        # Date filters
-        if from_date:
-            query += " AND DATE(created_at) >= DATE(?)"
-            params.append(from_date)
-        if to_date:
-            query += " AND DATE(created_at) <= DATE(?)"
-            params.append(to_date)
-
-        query += " GROUP BY project_id ORDER BY project_id"
 
         rows = fetch_all(conn, query, tuple(params))
         data = rows_to_dicts(rows)
@@ -205,33 +196,20 @@ def report_by_order(
                 "error": f"Project not found: {project_id}",
             }
 
-        # Build query
-        query = """
+        source, params = bucket_source(
+            conn, project_id=project_id, order_id=order_id,
+            from_date=from_date, to_date=to_date,
+        )
+        query = f"""
         SELECT
             order_id,
-            COUNT(*) as task_count,
-            COALESCE(SUM(cost_usd), 0) as total_cost_usd,
-            COALESCE(AVG(complexity_score), 0) as avg_complexity,
-            COALESCE(SUM(actual_tokens), 0) as total_tokens
-        FROM tasks
-        WHERE project_id = ?
+            COALESCE(SUM(task_count), 0) as task_count,
+            COALESCE(SUM(total_cost_usd), 0) as total_cost_usd,
+            COALESCE(SUM(complexity_sum) * 1.0 / NULLIF(SUM(complexity_count), 0), 0) as avg_complexity,
+            COALESCE(SUM(total_tokens), 0) as total_tokens
+        FROM ({source})
+        GROUP BY order_id ORDER BY order_id
         """
-        params = [project_id]
-
-        # Order filter
-        if order_id:
-            query += " AND order_id = ?"
-            params.append(order_id)
-
-        # Date filters
-        if from_date:
-            query += " AND DATE(created_at) >= DATE(?)"
-            params.append(from_date)
-        if to_date:
-            query += " AND DATE(created_at) <= DATE(?)"
-            params.append(to_date)
-
-        query += " GROUP BY order_id ORDER BY order_id"
 
         rows = fetch_all(conn, query, tuple(params))
         data = rows_to_dicts(rows)
@@ -292,33 +270,19 @@ def report_by_model(
     try:
         conn = get_connection(db_path)
 
-        # Build query
-        query = """
+        source, params = bucket_source(
+            conn, project_id=project_id, from_date=from_date, to_date=to_date,
+        )
+        query = f"""
         SELECT
-            COALESCE(recommended_model, 'Unknown') as model,
-            COUNT(*) as task_count,
-            COALESCE(SUM(cost_usd), 0) as total_cost_usd,
-            COALESCE(AVG(complexity_score), 0) as avg_complexity,
-            COALESCE(SUM(actual_tokens), 0) as total_tokens
-        FROM tasks
-        WHERE 1=1
+            model,
+            COALESCE(SUM(task_count), 0) as task_count,
+            COALESCE(SUM(total_cost_usd), 0) as total_cost_usd,
+            COALESCE(SUM(complexity_sum) * 1.0 / NULLIF(SUM(complexity_count), 0), 0) as avg_complexity,
+            COALESCE(SUM(total_tokens), 0) as total_tokens
+        FROM ({source})
+        GROUP BY model ORDER BY total_cost_usd DESC
         """
-        params = []
-
-        # Project filter
-        if project_id:
-            query += " AND project_id = ?"
-            params.append(project_id)
-
-        # Date filters
-        if from_date:
-            query += " AND DATE(created_at) >= DATE(?)"
-            params.append(from_date)
-        if to_date:
-            query += " AND DATE(created_at) <= DATE(?)"
-            params.append(to_date)
-
-        query += " GROUP BY recommended_model ORDER BY total_cost_usd DESC"
 
         rows = fetch_all(conn, query, tuple(params))
         data = rows_to_dicts(rows)
@@ -382,34 +346,22 @@ def generate_summary_report(
     try:
         conn = get_connection(db_path)
 
-        # --- Build common WHERE clause ---
-        where_parts = []
-        params = []  # type: List[Any]
-
-        if project_id:
-            where_parts.append("project_id = ?")
-            params.append(project_id)
-        if start_date:
-            where_parts.append("DATE(created_at) >= DATE(?)")
-            params.append(start_date)
-        if end_date:
-            where_parts.append("DATE(created_at) <= DATE(?)")
-            params.append(end_date)
-
-        where_clause = (" WHERE " + " AND ".join(where_parts)) if where_parts else ""
+        # --- Bucket source (daily rollups + today's raw tasks) ---
+        source, params = bucket_source(
+            conn, project_id=project_id, from_date=start_date, to_date=end_date,
+        )
 
         # --- Overview ---
         overview_query = f"""
         SELECT
-            COUNT(*) as total_tasks,
+            COALESCE(SUM(task_count), 0) as total_tasks,
             COUNT(DISTINCT project_id) as total_projects,
             COUNT(DISTINCT order_id) as total_orders,
-            COALESCE(SUM(cost_usd), 0) as total_cost_usd,
-            COALESCE(AVG(cost_usd), 0) as avg_cost_per_task,
-            COALESCE(SUM(actual_tokens), 0) as total_tokens,
-            COALESCE(AVG(complexity_score), 0) as avg_complexity
-        FROM tasks
-        {where_clause}
+            COALESCE(SUM(total_cost_usd), 0) as total_cost_usd,
+            COALESCE(SUM(total_cost_usd) / NULLIF(SUM(cost_count), 0), 0) as avg_cost_per_task,
+            COALESCE(SUM(total_tokens), 0) as total_tokens,
+            COALESCE(SUM(complexity_sum) * 1.0 / NULLIF(SUM(complexity_count), 0), 0) as avg_complexity
+        FROM ({source})
         """
         overview_row = fetch_one(conn, overview_query, tuple(params))
         overview = row_to_dict(overview_row) if overview_row else {
@@ -426,12 +378,11 @@ def generate_summary_report(
         by_project_query = f"""
         SELECT
             project_id,
-            COUNT(*) as task_count,
-            COALESCE(SUM(cost_usd), 0) as total_cost_usd,
-            COALESCE(AVG(complexity_score), 0) as avg_complexity,
-            COALESCE(SUM(actual_tokens), 0) as total_tokens
-        FROM tasks
-        {where_clause}
+            COALESCE(SUM(task_count), 0) as task_count,
+            COALESCE(SUM(total_cost_usd), 0) as total_cost_usd,
+            COALESCE(SUM(complexity_sum) * 1.0 / NULLIF(SUM(complexity_count), 0), 0) as avg_complexity,
+            COALESCE(SUM(total_tokens), 0) as total_tokens
+        FROM ({source})
         GROUP BY project_id
         ORDER BY total_cost_usd DESC
         """
@@ -441,14 +392,13 @@ def generate_summary_report(
         # --- By model ---
         by_model_query = f"""
         SELECT
-            COALESCE(recommended_model, 'Unknown') as model,
-            COUNT(*) as task_count,
-            COALESCE(SUM(cost_usd), 0) as total_cost_usd,
-            COALESCE(AVG(complexity_score), 0) as avg_complexity,
-            COALESCE(SUM(actual_tokens), 0) as total_tokens
-        FROM tasks
-        {where_clause}
-        GROUP BY recommended_model
+            model,
+            COALESCE(SUM(task_count), 0) as task_count,
+            COALESCE(SUM(total_cost_usd), 0) as total_cost_usd,
+            COALESCE(SUM(complexity_sum) * 1.0 / NULLIF(SUM(complexity_count), 0), 0) as avg_complexity,
+            COALESCE(SUM(total_tokens), 0) as total_tokens
+        FROM ({source})
+        GROUP BY model
         ORDER BY total_cost_usd DESC
         """
         by_model_rows = fetch_all(conn, by_model_query, tuple(params))
@@ -459,11 +409,10 @@ def generate_summary_report(
         SELECT
             project_id,
             order_id,
-            COUNT(*) as task_count,
-            COALESCE(SUM(cost_usd), 0) as total_cost_usd,
-            COALESCE(SUM(actual_tokens), 0) as total_tokens
-        FROM tasks
-        {where_clause}
+            COALESCE(SUM(task_count), 0) as task_count,
+            COALESCE(SUM(total_cost_usd), 0) as total_cost_usd,
+            COALESCE(SUM(total_tokens), 0) as total_tokens
+        FROM ({source})
         GROUP BY project_id, order_id
         ORDER BY total_cost_usd DESC
         LIMIT 10
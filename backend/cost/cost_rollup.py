@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Cost Daily Rollup
+
+tasks テーブルのコスト情報を (project, order, model, day) 単位で日次集計した
+cost_daily_rollups テーブルを管理する。
+
+- 締まった日（昨日以前）のバケットのみ集計済みとして保持し、
+  cost_rollup_state.rolled_through に集計済みの最終日を記録する
+- 当日分（未集計の日）はレポート時に tasks を created_at の範囲条件で直接集計する
+- 集計済みの日に属するタスクの追加・削除・更新（コスト記録、ORDER/モデル/
+  複雑度の変更、遅れて登録されたタスク）は tasks のトリガーがバケットに反映する
+  （migration 010）。created_at をどの時計で書いたかに関係なく集計から漏れない
+
+Usage:
+    python backend/cost/cost_rollup.py refresh   # 未集計の締まった日を集計
+    python backend/cost/cost_rollup.py backfill  # 全期間を再集計
+    python backend/cost/cost_rollup.py check     # 集計値と tasks の整合性チェック
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# パス設定
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils.db import (
+    get_connection,
+    close_connection,
+    transaction,
+    execute_query,
+    fetch_all,
+    fetch_one,
+    DatabaseError,
+)
+
+ROLLUP_TABLE = "cost_daily_rollups"
+STATE_TABLE = "cost_rollup_state"
+
+# 集計済みの日のバケットを tasks の変更に追従させるトリガー
+ROLLUP_TRIGGERS = (
+    "trigger_tasks_cost_rollup_insert",
+    "trigger_tasks_cost_rollup_delete",
+    "trigger_tasks_cost_rollup_update",
+)
+
+# recommended_model が NULL のタスクの集計キー（レポート表示と同じ）
+UNKNOWN_MODEL = "Unknown"
+
+# 整合性チェックでのコストの許容誤差（浮動小数の加算順序による差）
+COST_TOLERANCE = 1e-6
+
+# tasks を1行 = 1バケットの形に集計するSELECT句
+_RAW_BUCKET_COLUMNS = f"""
+    project_id,
+    order_id,
+    COALESCE(recommended_model, '{UNKNOWN_MODEL}') AS model,
+    COUNT(*) AS task_count,
+    COUNT(cost_usd) AS cost_count,
+    COALESCE(SUM(cost_usd), 0) AS total_cost_usd,
+    COALESCE(SUM(actual_tokens), 0) AS total_tokens,
+    COUNT(complexity_score) AS complexity_count,
+    COALESCE(SUM(complexity_score), 0) AS complexity_sum
+"""
+
+_BUCKET_FIELDS = (
+    "project_id", "order_id", "model", "task_count", "cost_count",
+    "total_cost_usd", "total_tokens", "complexity_count", "complexity_sum",
+)
+
+
+# ---------------------------------------------------------------------------
+# State
+# ---------------------------------------------------------------------------
+
+def rollups_available(conn: sqlite3.Connection) -> bool:
+    """集計テーブルと同期トリガーが存在するか（マイグレーション適用済みか）"""
+    names = (ROLLUP_TABLE, STATE_TABLE) + ROLLUP_TRIGGERS
+    row = fetch_one(
+        conn,
+        f"SELECT COUNT(*) AS n FROM sqlite_master WHERE name IN ({', '.join('?' * len(names))})",
+        names,
+    )
+    return row["n"] == len(names)
+
+
+def get_rolled_through(conn: sqlite3.Connection) -> Optional[str]:
+    """集計済みの最終日（YYYY-MM-DD）。未集計ならNone"""
+    row = fetch_one(conn, f"SELECT rolled_through FROM {STATE_TABLE} WHERE id = 1")
+    return row["rolled_through"] if row else None
+
+
+def _set_rolled_through(conn: sqlite3.Connection, day: str) -> None:
+    execute_query(
+        conn,
+        f"""
+        INSERT INTO {STATE_TABLE} (id, rolled_through, updated_at)
+        VALUES (1, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(id) DO UPDATE SET
+            rolled_through = excluded.rolled_through,
+            updated_at = excluded.updated_at
+        """,
+        (day,),
+    )
+
+
+def _sql_day(conn: sqlite3.Connection, modifier: str = "") -> str:
+    """SQLite基準（UTC、CURRENT_TIMESTAMPと同じ）の日付を取得"""
+    if modifier:
+        return fetch_one(conn, "SELECT DATE('now', ?) AS d", (modifier,))["d"]
+    return fetch_one(conn, "SELECT DATE('now') AS d")["d"]
+
+
+# ---------------------------------------------------------------------------
+# Maintenance
+# ---------------------------------------------------------------------------
+
+def _materialize(conn: sqlite3.Connection, start_day: Optional[str], end_day: str) -> int:
+    """
+    [start_day, end_day] の日次バケットを tasks から集計して書き込む
+
+    Returns:
+        書き込んだバケット数
+    """
+    where = ["created_at < DATE(?, '+1 day')"]
+    params: List[Any] = [end_day]
+    if start_day:
+        where.append("created_at >= ?")
+        params.append(start_day)
+
+    cursor = execute_query(
+        conn,
+        f"""
+        INSERT INTO {ROLLUP_TABLE} (
+            {", ".join(_BUCKET_FIELDS)}, day, updated_at
+        )
+        SELECT {_RAW_BUCKET_COLUMNS}, DATE(created_at) AS day, CURRENT_TIMESTAMP
+        FROM tasks
+        WHERE {" AND ".join(where)} AND DATE(created_at) IS NOT NULL
+        GROUP BY project_id, order_id, model, day
+        ON CONFLICT(project_id, order_id, model, day) DO UPDATE SET
+            task_count = excluded.task_count,
+            cost_count = excluded.cost_count,
+            total_cost_usd = excluded.total_cost_usd,
+            total_tokens = excluded.total_tokens,
+            complexity_count = excluded.complexity_count,
+            complexity_sum = excluded.complexity_sum,
+            updated_at = excluded.updated_at
+        """,
+        tuple(params),
+    )
+    return cursor.rowcount
+
+
+def refresh_rollups(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """
+    未集計の締まった日（昨日まで）を集計する
+
+    初回（rolled_through 未設定）は全期間を集計する。
+    呼び出し側でコミットすること。
+
+    Returns:
+        {"rolled_through": str, "buckets": int}
+    """
+    yesterday = _sql_day(conn, "-1 day")
+    rolled_through = get_rolled_through(conn)
+
+    if rolled_through is not None and rolled_through >= yesterday:
+        return {"rolled_through": rolled_through, "buckets": 0}
+
+    start_day = None
+    if rolled_through is not None:
+        start_day = fetch_one(conn, "SELECT DATE(?, '+1 day') AS d", (rolled_through,))["d"]
+
+    buckets = _materialize(conn, start_day, yesterday)
+    _set_rolled_through(conn, yesterday)
+    return {"rolled_through": yesterday, "buckets": buckets}
+
+
+def backfill_rollups(db_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    集計テーブルを全期間について作り直す
+
+    Returns:
+        {"rolled_through": str, "buckets": int}
+    """
+    with transaction(db_path=db_path) as conn:
+        if not rollups_available(conn):
+            raise DatabaseError(
+                f"{ROLLUP_TABLE} table or triggers not found. Run migrations first."
+            )
+        execute_query(conn, f"DELETE FROM {ROLLUP_TABLE}")
+        yesterday = _sql_day(conn, "-1 day")
+        buckets = _materialize(conn, None, yesterday)
+        _set_rolled_through(conn, yesterday)
+    return {"rolled_through": yesterday, "buckets": buckets}
+
+
+# ---------------------------------------------------------------------------
+# Report source
+# ---------------------------------------------------------------------------
+
+def bucket_source(
+    conn: sqlite3.Connection,
+    project_id: Optional[str] = None,
+    order_id: Optional[str] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> Tuple[str, List[Any]]:
+    """
+    レポート集計用のバケット行を返すサブクエリを構築する
+
+    集計済みの日は cost_daily_rollups、未集計の日（当日分）は tasks を
+    created_at の範囲条件で集計し、UNION ALL で結合する。集計テーブルが
+    存在しない場合は tasks 全体を集計する。
+
+    返されるサブクエリの列:
+        project_id, order_id, model, task_count, cost_count, total_cost_usd,
+        total_tokens, complexity_count, complexity_sum
+
+    Returns:
+        (SQL, パラメータ)
+    """
+    rolled_through = None
+    if rollups_available(conn):
+        try:
+            refresh_rollups(conn)
+            conn.commit()
+        except (DatabaseError, sqlite3.Error):
+            # 書き込めない場合も、集計済み範囲以降は tasks から集計するため結果は正しい
+            conn.rollback()
+        rolled_through = get_rolled_through(conn)
+
+    def _filters(day_expr: str) -> Tuple[List[str], List[Any]]:
+        parts, params = [], []
+        if project_id:
+            parts.append("project_id = ?")
+            params.append(project_id)
+        if order_id:
+            parts.append("order_id = ?")
+            params.append(order_id)
+        if from_date:
+            parts.append(f"{day_expr} >= DATE(?)")
+            params.append(from_date)
+        if to_date:
+            parts.append(f"{day_expr} <= DATE(?)")
+            params.append(to_date)
+        return parts, params
+
+    raw_where, raw_params = _filters("DATE(created_at)")
+    if rolled_through is None:
+        raw_sql = f"""
+            SELECT {_RAW_BUCKET_COLUMNS} FROM tasks
+            {"WHERE " + " AND ".join(raw_where) if raw_where else ""}
+            GROUP BY project_id, order_id, model
+        """
+        return raw_sql, raw_params
+
+    rollup_where, rollup_params = _filters("day")
+    rollup_where.insert(0, "day <= ?")
+    rollup_params.insert(0, rolled_through)
+
+    raw_where.insert(0, "created_at >= DATE(?, '+1 day')")
+    raw_params.insert(0, rolled_through)
+
+    sql = f"""
+        SELECT {", ".join(_BUCKET_FIELDS)} FROM {ROLLUP_TABLE}
+        WHERE {" AND ".join(rollup_where)}
+        UNION ALL
+        SELECT {_RAW_BUCKET_COLUMNS} FROM tasks
+        WHERE {" AND ".join(raw_where)}
+        GROUP BY project_id, order_id, model
+    """
+    return sql, rollup_params + raw_params
+
+
+# ---------------------------------------------------------------------------
+# Consistency check
+# ---------------------------------------------------------------------------
+
+def check_consistency(db_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    集計済み範囲について、集計テーブルと tasks の生データを突き合わせる
+
+    Returns:
+        {"success": bool, "consistent": bool, "rolled_through": str,
+         "checked_buckets": int, "mismatches": [...]}
+    """
+    conn = get_connection(db_path)
+    try:
+        if not rollups_available(conn):
+            return {"success": False, "error": f"{ROLLUP_TABLE} table or triggers not found"}
+
+        rolled_through = get_rolled_through(conn)
+        if rolled_through is None:
+            return {
+                "success": True,
+                "consistent": True,
+                "rolled_through": None,
+                "checked_buckets": 0,
+                "mismatches": [],
+            }
+
+        key_fields = ("project_id", "order_id", "model", "day")
+        value_fields = _BUCKET_FIELDS[3:]
+
+        raw_rows = fetch_all(
+            conn,
+            f"""
+            SELECT {_RAW_BUCKET_COLUMNS}, DATE(created_at) AS day FROM tasks
+            WHERE created_at < DATE(?, '+1 day') AND DATE(created_at) IS NOT NULL
+            GROUP BY project_id, order_id, model, day
+            """,
+            (rolled_through,),
+        )
+        rollup_rows = fetch_all(
+            conn,
+            f"SELECT * FROM {ROLLUP_TABLE} WHERE day <= ?",
+            (rolled_through,),
+        )
+    finally:
+        close_connection(conn)
+
+    raw = {tuple(r[k] for k in key_fields): r for r in raw_rows}
+    rolled = {tuple(r[k] for k in key_fields): r for r in rollup_rows}
+
+    mismatches = []
+    for key in sorted(set(raw) | set(rolled), key=lambda k: tuple(str(v) for v in k)):
+        expected, actual = raw.get(key), rolled.get(key)
+        diffs = {}
+        for field in value_fields:
+            exp_value = expected[field] if expected else 0
+            act_value = actual[field] if actual else 0
+            if field == "total_cost_usd":
+                equal = abs((exp_value or 0) - (act_value or 0)) <= COST_TOLERANCE
+            else:
+                equal = exp_value == act_value
+            if not equal:
+                diffs[field] = {"expected": exp_value, "actual": act_value}
+        # 全タスクが消えたバケットは 0 行として残っていても不整合ではない
+        if diffs and not (expected is None and actual["task_count"] == 0):
+            mismatches.append({**dict(zip(key_fields, key)), "diffs": diffs})
+
+    return {
+        "success": True,
+        "consistent": not mismatches,
+        "rolled_through": rolled_through,
+        "checked_buckets": len(set(raw) | set(rolled)),
+        "mismatches": mismatches,
+    }
+
+
+# ============================================================================
+# CLI Interface
+# ============================================================================
+
+def main() -> int:
+    """CLI エントリーポイント。"""
+    from config import setup_utf8_output
+    setup_utf8_output()
+
+    parser = argparse.ArgumentParser(
+        description="AI PM Framework - Cost Daily Rollup",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Sub-commands")
+    for name, help_text in (
+        ("refresh", "Roll up closed days that are not yet materialized"),
+        ("backfill", "Rebuild all rollups from the tasks table"),
+        ("check", "Compare rollups against raw task data"),
+    ):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("--db-path", default=None, help="Database file path")
+        sub.add_argument("--json", action="store_true", dest="output_json",
+                         help="Output in JSON format")
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    db_path = Path(args.db_path) if args.db_path else None
+
+    try:
+        if args.command == "refresh":
+            with transaction(db_path=db_path) as conn:
+                if not rollups_available(conn):
+                    raise DatabaseError(f"{ROLLUP_TABLE} table or triggers not found. Run migrations first.")
+                result = refresh_rollups(conn)
+        elif args.command == "backfill":
+            result = backfill_rollups(db_path)
+        else:
+            result = check_consistency(db_path)
+    except DatabaseError as e:
+        print(f"[ERROR] Database error: {e}", file=sys.stderr)
+        return 1
+
+    if args.output_json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    elif args.command == "check":
+        if not result.get("success"):
+            print(f"[ERROR] {result.get('error')}", file=sys.stderr)
+            return 1
+        status = "OK" if result["consistent"] else "MISMATCH"
+        print(f"[{status}] rolled through {result['rolled_through']}, "
+              f"{result['checked_buckets']} buckets checked, "
+              f"{len(result['mismatches'])} mismatches")
+        for m in result["mismatches"][:20]:
+            print(f"  {m['project_id']} {m['order_id']} {m['model']} {m['day']}: "
+                  + ", ".join(f"{k} {v['actual']} != {v['expected']}" for k, v in m["diffs"].items()))
+    else:
+        print(f"[OK] Rolled through {result['rolled_through']} ({result['buckets']} buckets written)")
+
+    if args.command == "check" and not result.get("consistent", False):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -95,6 +95,8 @@ def record_cost(
     """
     トークン使用量とコストをtasksテーブルに記録する。
 
+    集計済みの日に属するタスクの日次コスト集計は、tasks のトリガーが更新する。
+
     Args:
         db_path: データベースファイルパス
         project_id: プロジェクトID (e.g., AI_PM_PJ)
@@ -183,6 +185,51 @@ def estimate_cost(model: str, estimated_tokens: int) -> dict:
     }
 
 
+def estimate_task_cost(
+    project_id: str,
+    task_id: str,
+    db_path: Optional[str] = None,
+    model: Optional[str] = None,
+) -> dict:
+    """
+    タスク予測モデル（worker/task_duration.py）の予測トークン数からコストを見積もる。
+
+    Args:
+        project_id: プロジェクトID
+        task_id: タスクID
+        db_path: DBパス（Noneの場合はデフォルト）
+        model: 見積もりに使うモデル名（Noneの場合はタスクの recommended_model）
+
+    Returns:
+        dict: {"task_id", "model", "estimated_tokens", "estimated_tokens_p90",
+               "estimated_cost_usd", "estimated_cost_usd_p90", "predicted_seconds"}
+
+    Raises:
+        ValueError: タスクが存在しない、または未知のモデル名
+    """
+    from worker.task_duration import predict_task
+
+    conn = get_connection(db_path)
+    try:
+        prediction = predict_task(project_id, task_id, conn)
+    finally:
+        close_connection(conn)
+
+    if prediction is None:
+        raise ValueError(f"タスクが見つかりません: {project_id}/{task_id}")
+
+    model = model or prediction["recommended_model"]
+    return {
+        "task_id": task_id,
+        "model": model,
+        "estimated_tokens": prediction["tokens"],
+        "estimated_tokens_p90": prediction["tokens_p90"],
+        "estimated_cost_usd": estimate_cost(model, prediction["tokens"])["estimated_cost_usd"],
+        "estimated_cost_usd_p90": estimate_cost(model, prediction["tokens_p90"])["estimated_cost_usd"],
+        "predicted_seconds": round(prediction["seconds"], 1),
+    }
+
+
 # ============================================================================
 # CLI Interface
 # ============================================================================
@@ -200,6 +247,9 @@ Examples:
 
   # Estimate cost
   python backend/cost/cost_tracker.py estimate --model Opus --tokens 20000
+
+  # Estimate cost of a task from the task prediction model
+  python backend/cost/cost_tracker.py estimate --project AI_PM_PJ --task TASK_1028
         """,
     )
 
@@ -255,16 +305,29 @@ Examples:
     )
     estimate_parser.add_argument(
         "--model",
-        required=True,
         choices=list(MODEL_PRICING.keys()),
-        help="AI model name",
+        help="AI model name (required with --tokens; defaults to the task's model with --task)",
     )
     estimate_parser.add_argument(
         "--tokens",
         type=int,
-        required=True,
         help="Estimated total token count",
     )
+    estimate_parser.add_argument(
+        "--project",
+        dest="project_id",
+        help="Project ID (used with --task)",
+    )
+    estimate_parser.add_argument(
+        "--task",
+        dest="task_id",
+        help="Task ID: predict tokens with the task prediction model",
+    )
+    estimate_parser.add_argument(
+        "--db-path",
+        default=None,
+        help="Database file path (default: data/aipm.db)",
+    )
     estimate_parser.add_argument(
         "--json",
         action="store_true",
@@ -309,7 +372,34 @@ def main() -> int:
 
             return 0
 
+        elif args.command == "estimate" and args.task_id:
+            if not args.project_id:
+                print("[ERROR] --task requires --project", file=sys.stderr)
+                return 1
+            result = estimate_task_cost(
+                project_id=args.project_id,
+                task_id=args.task_id,
+                db_path=args.db_path,
+                model=args.model,
+            )
+
+            if args.output_json:
+                print(json.dumps(result, ensure_ascii=False, indent=2))
+            else:
+                print(f"[Estimate] {args.task_id} - {result['model']} (task prediction model)")
+                print(f"  Tokens (p50/p90):    {result['estimated_tokens']:,} / "
+                      f"{result['estimated_tokens_p90']:,}")
+                print(f"  Cost (p50/p90):      ${result['estimated_cost_usd']:.6f} / "
+                      f"${result['estimated_cost_usd_p90']:.6f}")
+                print(f"  Predicted duration:  {result['predicted_seconds'] / 60:.1f} min")
+
+            return 0
+
         elif args.command == "estimate":
+            if not args.model or args.tokens is None:
+                print("[ERROR] estimate requires --model and --tokens (or --project/--task)",
+                      file=sys.stderr)
+                return 1
             result = estimate_cost(
                 model=args.model,
                 estimated_tokens=args.tokens,
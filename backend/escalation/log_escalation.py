@@ -214,9 +214,9 @@ def _write_escalation_log_file(
 ) -> None:
     """エスカレーションログをファイルに記録"""
     try:
-        # プロジェクトルートを取得
-        project_root = Path(__file__).resolve().parent.parent.parent
-        project_dir = project_root / "PROJECTS" / project_id
+        # プロジェクトディレクトリを取得（USER_DATA_PATH経由）
+        from config.db_config import USER_DATA_PATH
+        project_dir = USER_DATA_PATH / "PROJECTS" / project_id
 
         # 08_ESCALATIONSディレクトリ作成
         escalation_dir = project_dir / "RESULT" / order_id / "08_ESCALATIONS"
@@ -2,20 +2,270 @@
 AI PM Framework - Incident Pattern Analysis
 
 Analyzes incident patterns to identify recurring issues and calculate recurrence rates.
+
+Statistics are computed from an IncidentFrame: a columnar in-memory table
+(category / severity / project codes, timestamps, resolved flags) loaded by
+one windowed scan of the incidents table. Category, severity, period and
+recurrence figures are group-bys over its columns (NumPy when installed).
+
+Benchmark:
+    python backend/incident/analyze_patterns.py --benchmark --incidents 1000000
 """
 
 import json
+import random
+import time
+from array import array
+from bisect import bisect_right
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Sequence, Tuple, Union
 import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.db import get_connection, fetch_all, fetch_one
+from utils.db import get_connection, fetch_all, rows_to_dicts
 from utils.incident_logger import IncidentLogger
 
+# Vectorized group-bys (optional; falls back to a hashed single pass)
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    np = None
+    _HAS_NUMPY = False
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Incident timestamp as seconds since 1970-01-01 (naive, like datetime.now())
+_SQL_TIMESTAMP_SECONDS = "(julianday(timestamp) - 2440587.5) * 86400.0"
+
+
+def _to_seconds(value: Union[datetime, str]) -> float:
+    """Naive datetime / ISO string -> seconds, same convention as _SQL_TIMESTAMP_SECONDS"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return (value - _EPOCH).total_seconds()
+
+
+def _to_julianday(value: datetime) -> float:
+    """Naive datetime -> SQLite julianday() number"""
+    return _to_seconds(value) / 86400.0 + 2440587.5
+
+
+class _Codes:
+    """Dictionary encoding of a string column (name <-> small integer code)"""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[Optional[str]] = []
+        self._index: Dict[Optional[str], int] = {}
+        for name in names:
+            self.code(name)
+
+    def code(self, name: Optional[str]) -> int:
+        code = self._index.get(name)
+        if code is None:
+            code = self._index[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def encode(self, values: Sequence[Optional[str]]) -> Iterable[int]:
+        """Codes for a whole column (registers new names first)"""
+        for name in set(values).difference(self._index):
+            self.code(name)
+        return map(self._index.__getitem__, values)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class IncidentFrame:
+    """
+    Columnar in-memory incident table
+
+    One row per incident, stored as parallel typed arrays:
+        category / severity / project: dictionary codes (array('i'))
+        resolved: 1 if a resolution is recorded (array('b'))
+        timestamp: seconds since 1970-01-01 (array('d'))
+
+    group_by() counts rows per combination of key columns. With NumPy the
+    arrays are wrapped without copying and counted with np.bincount;
+    otherwise a single hashed pass (collections.Counter) is used.
+    """
+
+    KEYS = ('category', 'severity', 'project', 'resolved', 'period')
+
+    def __init__(self, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        self.start = start
+        self.end = end
+        self.categories = _Codes(IncidentLogger.CATEGORIES)
+        self.severities = _Codes(IncidentLogger.SEVERITIES)
+        self.projects = _Codes()
+        self.category = array('i')
+        self.severity = array('i')
+        self.project = array('i')
+        self.resolved = array('b')
+        self.timestamp = array('d')
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def extend(self, rows: Iterable[Sequence[Any]]) -> 'IncidentFrame':
+        """
+        Append rows of (category, severity, project_id, timestamp_seconds, resolved)
+        """
+        rows = list(rows)
+        if not rows:
+            return self
+        # Transpose once, then encode each column at C speed
+        categories, severities, projects, seconds, resolved = zip(*rows)
+        self.category.extend(self.categories.encode(categories))
+        self.severity.extend(self.severities.encode(severities))
+        self.project.extend(self.projects.encode(projects))
+        if None in seconds:
+            seconds = [float('nan') if t is None else t for t in seconds]
+        self.timestamp.extend(seconds)
+        self.resolved.extend(map(bool, resolved))
+        return self
+
+    @classmethod
+    def load(
+        cls,
+        start: datetime,
+        end: Optional[datetime] = None,
+        project_id: Optional[str] = None,
+        category: Optional[str] = None,
+        conn=None
+    ) -> 'IncidentFrame':
+        """
+        Load incidents with start <= timestamp (< end) in one scan
+
+        Args:
+            start: Window start
+            end: Window end (exclusive, optional)
+            project_id: Filter by project ID (optional)
+            category: Filter by category (optional)
+            conn: Database connection (optional)
+
+        Returns:
+            IncidentFrame covering the window
+        """
+        where = ["julianday(timestamp) >= ?"]
+        params: List[Any] = [_to_julianday(start)]
+        if end is not None:
+            where.append("julianday(timestamp) < ?")
+            params.append(_to_julianday(end))
+        if project_id:
+            where.append("project_id = ?")
+            params.append(project_id)
+        if category:
+            where.append("category = ?")
+            params.append(category)
+
+        own_conn = conn is None
+        if own_conn:
+            conn = get_connection()
+        try:
+            cursor = conn.execute(
+                f"""
+                SELECT category, severity, project_id, {_SQL_TIMESTAMP_SECONDS},
+                       COALESCE(resolution, '') != ''
+                FROM incidents
+                WHERE {' AND '.join(where)}
+                """,
+                tuple(params)
+            )
+            frame = cls(start, end).extend(cursor)
+        finally:
+            if own_conn:
+                conn.close()
+        return frame
+
+    def _period(self, bounds: Sequence[float]):
+        """Period index per row: number of bounds <= timestamp"""
+        if _HAS_NUMPY:
+            return np.searchsorted(
+                np.asarray(bounds, dtype=np.float64), self._np(self.timestamp), side='right'
+            )
+        return array('i', map(partial(bisect_right, list(bounds)), self.timestamp))
+
+    @staticmethod
+    def _np(column: array):
+        kind = 'f' if column.typecode == 'd' else 'i'
+        return np.frombuffer(column, dtype=f"{kind}{column.itemsize}")
+
+    def group_by(
+        self,
+        keys: Sequence[str],
+        bounds: Optional[Sequence[Union[datetime, float]]] = None
+    ) -> Dict[Tuple[Any, ...], int]:
+        """
+        Count rows per combination of key columns
+
+        Args:
+            keys: Column names from KEYS
+            bounds: Ascending period boundaries, required for the 'period' key.
+                Period i holds rows with bounds[i-1] <= timestamp < bounds[i].
+
+        Returns:
+            {(value, ...): count} for non-empty groups; category / severity /
+            project are decoded to names, resolved to bool, period to int
+        """
+        for key in keys:
+            if key not in self.KEYS:
+                raise ValueError(f"Unknown group-by key: {key}")
+        if 'period' in keys and bounds is None:
+            raise ValueError("bounds are required to group by period")
+        if not len(self):
+            return {}
+
+        seconds = [b if isinstance(b, (int, float)) else _to_seconds(b) for b in (bounds or ())]
+        sizes = {
+            'category': len(self.categories),
+            'severity': len(self.severities),
+            'project': len(self.projects),
+            'resolved': 2,
+            'period': len(seconds) + 1,
+        }
+        columns = {
+            'category': self.category,
+            'severity': self.severity,
+            'project': self.project,
+            'resolved': self.resolved,
+        }
+        decoders = {
+            'category': self.categories.names.__getitem__,
+            'severity': self.severities.names.__getitem__,
+            'project': self.projects.names.__getitem__,
+            'resolved': bool,
+            'period': int,
+        }
+
+        if _HAS_NUMPY:
+            # Mixed-radix key per row, then one bincount over all rows
+            flat = np.zeros(len(self), dtype=np.int64)
+            for key in keys:
+                column = self._period(seconds) if key == 'period' else self._np(columns[key])
+                flat = flat * sizes[key] + column
+            counts = np.bincount(flat)
+            groups = np.nonzero(counts)[0]
+            coords = np.unravel_index(groups, [sizes[key] for key in keys]) if keys else ()
+            return {
+                tuple(decoders[key](int(c[i])) for key, c in zip(keys, coords)): int(counts[g])
+                for i, g in enumerate(groups)
+            }
+
+        data = [self._period(seconds) if key == 'period' else columns[key] for key in keys]
+        counts = Counter(zip(*data)) if keys else Counter({(): len(self)})
+        return {
+            tuple(decoders[key](value) for key, value in zip(keys, group)): count
+            for group, count in counts.items()
+        }
+
 
 class IncidentPatternAnalyzer:
     """Analyzes incident patterns and provides recommendations"""
@@ -84,6 +334,108 @@ class IncidentPatternAnalyzer:
         ]
     }
 
+    @staticmethod
+    def category_statistics(
+        frame: IncidentFrame,
+        days: int = 30,
+        now: Optional[datetime] = None,
+        categories: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Recurrence, severity and resolution statistics for every category
+
+        Two group-bys over the frame (category x half-period, and
+        category x severity x resolved) replace the per-category queries.
+
+        Args:
+            frame: Incidents with timestamp >= now - days
+            days: Number of days the frame covers
+            now: End of the analysis period (default: now)
+            categories: Categories to report (default: IncidentLogger.CATEGORIES)
+
+        Returns:
+            {category: {'recurrence_stats', 'incident_count',
+                        'severity_distribution', 'resolution_rate'}}
+        """
+        now = now or datetime.now()
+        mid_date = now - timedelta(days=days // 2)
+        halves = frame.group_by(('category', 'period'), bounds=[mid_date])
+        details = frame.group_by(('category', 'severity', 'resolved'))
+
+        stats = {}
+        for category in (categories or IncidentLogger.CATEGORIES):
+            first_half = halves.get((category, 0), 0)
+            second_half = halves.get((category, 1), 0)
+            total = first_half + second_half
+
+            if second_half > first_half * 1.2:
+                trend = 'increasing'
+            elif second_half < first_half * 0.8:
+                trend = 'decreasing'
+            else:
+                trend = 'stable'
+
+            stats[category] = {
+                'recurrence_stats': {
+                    'category': category,
+                    'total_incidents': total,
+                    'days_analyzed': days,
+                    'recurrence_rate': round(total / days if days > 0 else 0, 2),
+                    'first_half_count': first_half,
+                    'second_half_count': second_half,
+                    'trend': trend
+                },
+                'incident_count': total,
+                'severity_distribution': {'HIGH': 0, 'MEDIUM': 0, 'LOW': 0},
+                'resolved_count': 0,
+            }
+
+        for (category, severity, resolved), count in details.items():
+            entry = stats.get(category)
+            if entry is None:
+                continue
+            distribution = entry['severity_distribution']
+            distribution[severity] = distribution.get(severity, 0) + count
+            if resolved:
+                entry['resolved_count'] += count
+
+        for entry in stats.values():
+            resolved_count = entry.pop('resolved_count')
+            total = entry['incident_count']
+            entry['resolution_rate'] = round(resolved_count / total * 100, 1) if total else 0
+
+        return stats
+
+    @staticmethod
+    def _load_incidents(
+        start: datetime,
+        project_id: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Full incident rows since start, newest first, grouped by category (one query)"""
+        query = "SELECT * FROM incidents WHERE julianday(timestamp) >= julianday(?)"
+        params: List[Any] = [start.isoformat()]
+        if category:
+            query += " AND category = ?"
+            params.append(category)
+        if project_id:
+            query += " AND project_id = ?"
+            params.append(project_id)
+        query += " ORDER BY timestamp DESC"
+
+        conn = get_connection()
+        try:
+            incidents = rows_to_dicts(fetch_all(conn, query, tuple(params)))
+        finally:
+            conn.close()
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for incident in incidents:
+            if incident.get('affected_records'):
+                incident['affected_records'] = json.loads(incident['affected_records'])
+            grouped.setdefault(incident['category'], []).append(incident)
+        return grouped
+
     @staticmethod
     def analyze_category_patterns(
         category: str,
@@ -106,30 +458,16 @@ class IncidentPatternAnalyzer:
                 - countermeasures: Recommended countermeasures
                 - severity_distribution: Distribution by severity
         """
-        # Get recurrence rate
-        recurrence_stats = IncidentLogger.get_recurrence_rate(
-            category=category,
-            days=days,
-            project_id=project_id
-        )
+        now = datetime.now()
+        start_date = now - timedelta(days=days)
+        frame = IncidentFrame.load(start_date, project_id=project_id, category=category)
+        stats = IncidentPatternAnalyzer.category_statistics(
+            frame, days, now, categories=[category]
+        )[category]
 
-        # Get incidents in category
-        incidents = IncidentLogger.get_incidents_by_category(
-            category=category,
-            project_id=project_id
-        )
-
-        # Filter by date range
-        start_date = (datetime.now() - timedelta(days=days)).isoformat()
-        filtered_incidents = [
-            inc for inc in incidents
-            if inc['timestamp'] >= start_date
-        ]
-
-        # Calculate severity distribution
-        severity_distribution = {'HIGH': 0, 'MEDIUM': 0, 'LOW': 0}
-        for incident in filtered_incidents:
-            severity_distribution[incident['severity']] += 1
+        incidents = IncidentPatternAnalyzer._load_incidents(
+            start_date, project_id=project_id, category=category
+        ).get(category, [])
 
         # Get countermeasures
         countermeasures = IncidentPatternAnalyzer.COUNTERMEASURES.get(
@@ -137,18 +475,14 @@ class IncidentPatternAnalyzer:
             IncidentPatternAnalyzer.COUNTERMEASURES['OTHER']
         )
 
-        # Calculate resolution rate
-        resolved_count = sum(1 for inc in filtered_incidents if inc.get('resolution'))
-        resolution_rate = (resolved_count / len(filtered_incidents) * 100) if filtered_incidents else 0
-
         return {
             'category': category,
-            'recurrence_stats': recurrence_stats,
-            'incident_count': len(filtered_incidents),
-            'incidents': filtered_incidents,
+            'recurrence_stats': stats['recurrence_stats'],
+            'incident_count': stats['incident_count'],
+            'incidents': incidents,
             'countermeasures': countermeasures,
-            'severity_distribution': severity_distribution,
-            'resolution_rate': round(resolution_rate, 1),
+            'severity_distribution': stats['severity_distribution'],
+            'resolution_rate': stats['resolution_rate'],
             'analysis_period_days': days
         }
 
@@ -156,7 +490,9 @@ class IncidentPatternAnalyzer:
     def analyze_all_categories(
         days: int = 30,
         project_id: Optional[str] = None,
-        min_incidents: int = 1
+        min_incidents: int = 1,
+        include_incidents: bool = True,
+        frame: Optional[IncidentFrame] = None
     ) -> List[Dict[str, Any]]:
         """
         Analyze patterns across all incident categories
@@ -165,22 +501,46 @@ class IncidentPatternAnalyzer:
             days: Number of days to look back
             project_id: Filter by project ID (optional)
             min_incidents: Minimum incidents to include category (default: 1)
+            include_incidents: Attach the incident rows of each category
+                (one extra query; 'incidents' is empty when False)
+            frame: Preloaded IncidentFrame covering the last ``days`` days
+                (optional; loaded with one scan otherwise)
 
         Returns:
             List of analysis results for each category, sorted by recurrence rate
         """
+        now = datetime.now()
+        start_date = now - timedelta(days=days)
+        if frame is None:
+            frame = IncidentFrame.load(start_date, project_id=project_id)
+        stats = IncidentPatternAnalyzer.category_statistics(frame, days, now)
+        incidents = (
+            IncidentPatternAnalyzer._load_incidents(start_date, project_id=project_id)
+            if include_incidents else {}
+        )
+
         results = []
 
         for category in IncidentLogger.CATEGORIES:
-            analysis = IncidentPatternAnalyzer.analyze_category_patterns(
-                category=category,
-                days=days,
-                project_id=project_id
-            )
+            entry = stats[category]
 
             # Only include categories with minimum incident count
-            if analysis['incident_count'] >= min_incidents:
-                results.append(analysis)
+            if entry['incident_count'] < min_incidents:
+                continue
+
+            results.append({
+                'category': category,
+                'recurrence_stats': entry['recurrence_stats'],
+                'incident_count': entry['incident_count'],
+                'incidents': incidents.get(category, []),
+                'countermeasures': IncidentPatternAnalyzer.COUNTERMEASURES.get(
+                    category,
+                    IncidentPatternAnalyzer.COUNTERMEASURES['OTHER']
+                ),
+                'severity_distribution': entry['severity_distribution'],
+                'resolution_rate': entry['resolution_rate'],
+                'analysis_period_days': days
+            })
 
         # Sort by recurrence rate (descending)
         results.sort(
@@ -194,7 +554,8 @@ class IncidentPatternAnalyzer:
     def identify_high_risk_patterns(
         days: int = 30,
         project_id: Optional[str] = None,
-        recurrence_threshold: float = 0.5
+        recurrence_threshold: float = 0.5,
+        frame: Optional[IncidentFrame] = None
     ) -> Dict[str, Any]:
         """
         Identify high-risk incident patterns requiring immediate attention
@@ -203,6 +564,7 @@ class IncidentPatternAnalyzer:
             days: Number of days to analyze
             project_id: Filter by project ID (optional)
             recurrence_threshold: Recurrence rate threshold (incidents/day)
+            frame: Preloaded IncidentFrame covering the last ``days`` days (optional)
 
         Returns:
             Dict containing:
@@ -214,7 +576,9 @@ class IncidentPatternAnalyzer:
         all_analyses = IncidentPatternAnalyzer.analyze_all_categories(
             days=days,
             project_id=project_id,
-            min_incidents=1
+            min_incidents=1,
+            include_incidents=False,
+            frame=frame
         )
 
         # Categories exceeding recurrence threshold
@@ -313,79 +677,162 @@ class IncidentPatternAnalyzer:
         Returns:
             Dict containing comparison metrics
         """
-        # Current period
-        current_start = (datetime.now() - timedelta(days=current_days)).isoformat()
-        current_end = datetime.now().isoformat()
+        now = datetime.now()
+        current_start = now - timedelta(days=current_days)
+        previous_start = now - timedelta(days=current_days + previous_days)
+
+        # One scan over both periods, split by a period group-by
+        frame = IncidentFrame.load(previous_start, end=now, project_id=project_id, category=category)
+        periods = frame.group_by(('category', 'period'), bounds=[current_start])
+        previous_count = periods.get((category, 0), 0)
+        current_count = periods.get((category, 1), 0)
+
+        # Calculate change
+        if previous_count > 0:
+            change_pct = ((current_count - previous_count) / previous_count) * 100
+        else:
+            change_pct = 100.0 if current_count > 0 else 0.0
 
-        # Previous period
-        previous_start = (datetime.now() - timedelta(days=current_days + previous_days)).isoformat()
-        previous_end = current_start
+        # Determine status
+        if change_pct > 20:
+            status = 'WORSENING'
+        elif change_pct < -20:
+            status = 'IMPROVING'
+        else:
+            status = 'STABLE'
 
-        conn = get_connection()
-        try:
-            # Build WHERE clause
-            where_base = "WHERE category = ? AND timestamp >= ? AND timestamp < ?"
-            params_base = [category]
-
-            if project_id:
-                where_base += " AND project_id = ?"
-
-            # Current period count
-            current_params = params_base + [current_start, current_end]
-            if project_id:
-                current_params.append(project_id)
-
-            current_row = fetch_one(
-                conn,
-                f"SELECT COUNT(*) as count FROM incidents {where_base}",
-                tuple(current_params)
-            )
-            current_count = current_row['count'] if current_row else 0
+        return {
+            'category': category,
+            'current_period': {
+                'days': current_days,
+                'count': current_count,
+                'rate': round(current_count / current_days, 2)
+            },
+            'previous_period': {
+                'days': previous_days,
+                'count': previous_count,
+                'rate': round(previous_count / previous_days, 2)
+            },
+            'change_pct': round(change_pct, 1),
+            'status': status
+        }
 
-            # Previous period count
-            previous_params = params_base + [previous_start, previous_end]
-            if project_id:
-                previous_params.append(project_id)
 
-            previous_row = fetch_one(
-                conn,
-                f"SELECT COUNT(*) as count FROM incidents {where_base}",
-                tuple(previous_params)
+def benchmark(incident_count: int = 1_000_000, days: int = 30, seed: int = 0) -> Dict[str, Any]:
+    """
+    Compare the frame-based analysis against the per-category query path
+
+    Synthetic incidents spread over ``2 * days`` days are written to an
+    in-memory SQLite database. The legacy path runs, per category, the
+    recurrence COUNT queries and a full-history category load filtered by
+    timestamp in Python (the former analyze_all_categories). The frame path
+    is one windowed scan plus two group-bys.
+
+    Args:
+        incident_count: Number of incidents
+        days: Analysis period in days
+        seed: Random seed
+
+    Returns:
+        Dict with timings (ms) and whether both paths agree
+    """
+    import sqlite3
+
+    rng = random.Random(seed)
+    now = datetime.now()
+    span = 2 * days * 86400
+    projects = [f"PJ_{i}" for i in range(20)]
+    categories = IncidentLogger.CATEGORIES
+    # Skewed category mix, like real incident logs
+    weights = [1.0 / (i + 1) for i in range(len(categories))]
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        """
+        CREATE TABLE incidents (
+            incident_id TEXT PRIMARY KEY, timestamp DATETIME, project_id TEXT,
+            category TEXT, severity TEXT, resolution TEXT
+        )
+        """
+    )
+    conn.execute("CREATE INDEX idx_incidents_category ON incidents(category)")
+    conn.executemany(
+        "INSERT INTO incidents VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (
+                f"INC_{i:07d}",
+                (now - timedelta(seconds=rng.random() * span)).isoformat(),
+                rng.choice(projects),
+                rng.choices(categories, weights)[0],
+                rng.choice(IncidentLogger.SEVERITIES),
+                "fixed" if rng.random() < 0.4 else None,
             )
-            previous_count = previous_row['count'] if previous_row else 0
-
-            # Calculate change
-            if previous_count > 0:
-                change_pct = ((current_count - previous_count) / previous_count) * 100
-            else:
-                change_pct = 100.0 if current_count > 0 else 0.0
-
-            # Determine status
-            if change_pct > 20:
-                status = 'WORSENING'
-            elif change_pct < -20:
-                status = 'IMPROVING'
-            else:
-                status = 'STABLE'
-
-            return {
-                'category': category,
-                'current_period': {
-                    'days': current_days,
-                    'count': current_count,
-                    'rate': round(current_count / current_days, 2)
-                },
-                'previous_period': {
-                    'days': previous_days,
-                    'count': previous_count,
-                    'rate': round(previous_count / previous_days, 2)
-                },
-                'change_pct': round(change_pct, 1),
-                'status': status
-            }
+            for i in range(incident_count)
+        )
+    )
+    conn.commit()
+
+    start_date = now - timedelta(days=days)
+    mid_date = now - timedelta(days=days // 2)
+
+    started = time.perf_counter()
+    frame = IncidentFrame.load(start_date, conn=conn)
+    scan_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    frame_stats = IncidentPatternAnalyzer.category_statistics(frame, days, now)
+    group_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    legacy_stats = {}
+    for category in categories:
+        counts = [
+            conn.execute(
+                f"SELECT COUNT(*) FROM incidents WHERE category = ? AND {condition}",
+                (category, *params)
+            ).fetchone()[0]
+            for condition, params in (
+                ("timestamp >= ?", (start_date.isoformat(),)),
+                ("timestamp >= ? AND timestamp < ?", (start_date.isoformat(), mid_date.isoformat())),
+                ("timestamp >= ?", (mid_date.isoformat(),)),
+            )
+        ]
+        history = conn.execute(
+            "SELECT timestamp, severity, resolution FROM incidents WHERE category = ? ORDER BY timestamp DESC",
+            (category,)
+        ).fetchall()
+        window = [row for row in history if row[0] >= start_date.isoformat()]
+        distribution = {'HIGH': 0, 'MEDIUM': 0, 'LOW': 0}
+        for row in window:
+            distribution[row[1]] += 1
+        resolved = sum(1 for row in window if row[2])
+        legacy_stats[category] = (
+            counts[1], counts[2], distribution,
+            round(resolved / len(window) * 100, 1) if window else 0,
+        )
+    legacy_ms = (time.perf_counter() - started) * 1000
+    conn.close()
+
+    frame_view = {
+        category: (
+            entry['recurrence_stats']['first_half_count'],
+            entry['recurrence_stats']['second_half_count'],
+            entry['severity_distribution'],
+            entry['resolution_rate'],
+        )
+        for category, entry in frame_stats.items()
+    }
 
-        finally:
-            conn.close()
+    return {
+        'incidents': incident_count,
+        'window_incidents': len(frame),
+        'numpy': _HAS_NUMPY,
+        'scan_ms': round(scan_ms, 1),
+        'group_by_ms': round(group_ms, 1),
+        'frame_ms': round(scan_ms + group_ms, 1),
+        'legacy_ms': round(legacy_ms, 1),
+        'speedup': round(legacy_ms / max(scan_ms + group_ms, 1e-6), 1),
+        'results_match': frame_view == legacy_stats,
+    }
 
 
 def main():
@@ -431,9 +878,24 @@ def main():
         default='text',
         help='Output format (default: text)'
     )
+    parser.add_argument(
+        '--benchmark',
+        action='store_true',
+        help='Benchmark the frame-based analysis on synthetic incidents'
+    )
+    parser.add_argument(
+        '--incidents',
+        type=int,
+        default=1_000_000,
+        help='Number of synthetic incidents for --benchmark (default: 1000000)'
+    )
 
     args = parser.parse_args()
 
+    if args.benchmark:
+        print(json.dumps(benchmark(args.incidents, args.days), indent=2))
+        return
+
     if args.high_risk:
         # High-risk pattern analysis
         result = IncidentPatternAnalyzer.identify_high_risk_patterns(
@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.db import get_connection, fetch_all, fetch_one
 from utils.incident_logger import IncidentLogger
-from analyze_patterns import IncidentPatternAnalyzer
+from analyze_patterns import IncidentFrame, IncidentPatternAnalyzer
 
 
 class IncidentReportGenerator:
@@ -45,18 +45,24 @@ class IncidentReportGenerator:
             project_id=project_id
         )
 
+        # One incident scan shared by the category and high-risk analyses
+        frame = IncidentFrame.load(datetime.fromisoformat(start_date), project_id=project_id)
+
         # Get all category analyses
         category_analyses = IncidentPatternAnalyzer.analyze_all_categories(
             days=days,
             project_id=project_id,
-            min_incidents=0
+            min_incidents=0,
+            include_incidents=False,
+            frame=frame
         )
 
         # Get high-risk patterns
         high_risk = IncidentPatternAnalyzer.identify_high_risk_patterns(
             days=days,
             project_id=project_id,
-            recurrence_threshold=0.3
+            recurrence_threshold=0.3,
+            frame=frame
         )
 
         # Generate report
@@ -548,13 +554,16 @@ def main():
                 start_date=start_date,
                 project_id=args.project_id
             )
+            frame = IncidentFrame.load(datetime.fromisoformat(start_date), project_id=args.project_id)
             category_analyses = IncidentPatternAnalyzer.analyze_all_categories(
                 days=args.days,
-                project_id=args.project_id
+                project_id=args.project_id,
+                frame=frame
             )
             high_risk = IncidentPatternAnalyzer.identify_high_risk_patterns(
                 days=args.days,
-                project_id=args.project_id
+                project_id=args.project_id,
+                frame=frame
             )
             report = json.dumps({
                 'summary': summary,
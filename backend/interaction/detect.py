@@ -5,12 +5,24 @@ AI PM Framework - AI質問検知ロジック
 claude -p（または claude -c）の出力から質問パターンを検知し、
 Interactionを作成してタスクをWAITING_INPUT状態にする
 
+ストリーミング検知（StreamingQuestionDetector）:
+    claude -p の出力をチャンク単位で受け取り、直近の行をリングバッファに保持しながら
+    パターン群ごとに1本に結合した正規表現で判定する。AskUserQuestion は
+    プロセス実行中に検知できるため、Worker は終了やタイムアウトを待たずに
+    WAITING_INPUT へ移行できる。
+
 Usage:
     # モジュールとして使用
     from interaction.detect import QuestionDetector
     detector = QuestionDetector(project_id, task_id)
     result = detector.analyze_output(claude_output)
 
+    # ストリーミング検知
+    stream = detector.stream()
+    for chunk in chunks:
+        early = stream.feed(chunk)   # AskUserQuestion 検知時のみ DetectionResult
+    result = stream.finish()
+
     # コマンドラインから手動テスト
     python backend/interaction/detect.py PROJECT_ID TASK_ID --text "質問テキスト"
     python backend/interaction/detect.py PROJECT_ID TASK_ID --file output.txt
@@ -20,6 +32,7 @@ import argparse
 import json
 import re
 import sys
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -126,6 +139,29 @@ INPUT_WAIT_PATTERNS = [
 ]
 
 
+# ストリーミング検知でリングバッファに保持する行数
+DEFAULT_STREAM_BUFFER_LINES = 200
+
+# 末尾を重視して分析する行数（確認待ち・入力待ち・一般質問パターン）
+ANALYZED_TAIL_LINES = 10
+
+
+def _compile_family(patterns: List[str], flags: int) -> Tuple[re.Pattern, List[re.Pattern]]:
+    """パターン群を (結合済み正規表現, 個別パターン) にコンパイル"""
+    combined = re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+    return combined, [re.compile(p, flags) for p in patterns]
+
+
+# (種別名, スコア, 質問タイプ, 結合済み正規表現, 個別パターン)
+# 結合済み正規表現で1行を1回だけ走査し、ヒットした行のみ個別パターンを評価する
+_ASK_USER_FAMILY = ("ask_user", 1.0, "CHOICE", *_compile_family(ASK_USER_PATTERNS, re.IGNORECASE))
+_TAIL_FAMILIES = [
+    ("confirmation", 0.9, "CONFIRMATION", *_compile_family(CONFIRMATION_PATTERNS, re.IGNORECASE)),
+    ("input_wait", 0.85, "INPUT", *_compile_family(INPUT_WAIT_PATTERNS, re.IGNORECASE)),
+    ("question", 0.7, None, *_compile_family(QUESTION_PATTERNS, re.IGNORECASE | re.MULTILINE)),
+]
+
+
 @dataclass
 class DetectionResult:
     """質問検知結果"""
@@ -190,116 +226,32 @@ class QuestionDetector:
         Returns:
             DetectionResult: 検知結果
         """
-        result = DetectionResult()
-
         if not output or not output.strip():
-            return result
-
-        # 行ごとに分析
-        lines = output.strip().split('\n')
-        last_lines = lines[-10:] if len(lines) > 10 else lines  # 最後の10行を重視
-
-        # 各パターンをチェック
-        scores = []
-
-        # 1. AskUserQuestion パターン（最も確実）
-        for pattern in self._ask_user_patterns:
-            for line in lines:
-                if pattern.search(line):
-                    scores.append(1.0)
-                    result.matched_patterns.append(f"ask_user: {pattern.pattern}")
-                    result.question_type = "CHOICE"
-                    # AskUserQuestion形式から質問と選択肢を抽出
-                    extracted = self._extract_ask_user_question(output)
-                    if extracted:
-                        result.question_text = extracted[0]
-                        result.options = extracted[1]
-
-        # 2. 確認待ちパターン
-        for pattern in self._confirmation_patterns:
-            for line in last_lines:
-                if pattern.search(line):
-                    scores.append(0.9)
-                    result.matched_patterns.append(f"confirmation: {pattern.pattern}")
-                    result.question_type = "CONFIRMATION"
-                    if not result.question_text:
-                        result.question_text = line.strip()
-
-        # 3. 入力待ちパターン
-        for pattern in self._input_wait_patterns:
-            for line in last_lines:
-                if pattern.search(line):
-                    scores.append(0.85)
-                    result.matched_patterns.append(f"input_wait: {pattern.pattern}")
-                    result.question_type = "INPUT"
-                    if not result.question_text:
-                        result.question_text = line.strip()
-
-        # 4. 一般的な質問パターン
-        for pattern in self._question_patterns:
-            for line in last_lines:
-                if pattern.search(line):
-                    scores.append(0.7)
-                    result.matched_patterns.append(f"question: {pattern.pattern}")
-                    if not result.question_text:
-                        result.question_text = line.strip()
-
-        # 信頼度計算
-        if scores:
-            result.confidence = max(scores)
-            result.detected = result.confidence >= self.confidence_threshold
-
-        # 質問テキストが未設定の場合、最後の行を使用
-        if result.detected and not result.question_text:
-            result.question_text = last_lines[-1].strip() if last_lines else ""
-
-        # コンテキスト情報を保存
-        result.context = {
-            "total_lines": len(lines),
-            "analyzed_lines": len(last_lines),
-            "pattern_matches": len(result.matched_patterns),
-        }
+            return DetectionResult()
 
-        return result
+        # 出力全体が手元にあるためバッファは無制限（全行を完結した行として渡す）
+        stream = self.stream(max_lines=None)
+        stream.feed(output.strip() + "\n")
+        return stream.finish()
 
-    def _extract_ask_user_question(self, output: str) -> Optional[Tuple[str, List[str]]]:
+    def stream(self, max_lines: Optional[int] = DEFAULT_STREAM_BUFFER_LINES) -> "StreamingQuestionDetector":
         """
-        AskUserQuestion形式から質問と選択肢を抽出
+        実行中の出力を逐次分析するストリーミング検知器を生成
 
         Args:
-            output: 出力テキスト
+            max_lines: リングバッファに保持する行数（None で無制限）
 
         Returns:
-            (質問文, 選択肢リスト) または None
+            StreamingQuestionDetector: 同じ閾値の検知器
         """
-        try:
-            # JSON形式の質問を探す
-            json_match = re.search(r'\{[^{}]*"questions"\s*:\s*\[[^\]]+\][^{}]*\}', output, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-                questions = data.get("questions", [])
-                if questions:
-                    q = questions[0]
-                    question_text = q.get("question", "")
-                    options = [opt.get("label", "") for opt in q.get("options", [])]
-                    return (question_text, options)
-
-            # より簡易的なパターンマッチング
-            question_match = re.search(r'"question"\s*:\s*"([^"]+)"', output)
-            if question_match:
-                question_text = question_match.group(1)
-                options = []
-                # オプションを抽出
-                options_match = re.search(r'"options"\s*:\s*\[([^\]]+)\]', output)
-                if options_match:
-                    labels = re.findall(r'"label"\s*:\s*"([^"]+)"', options_match.group(1))
-                    options = labels
-                return (question_text, options)
+        return StreamingQuestionDetector(
+            confidence_threshold=self.confidence_threshold,
+            max_lines=max_lines,
+        )
 
-        except (json.JSONDecodeError, AttributeError):
-            pass
-
-        return None
+    def _extract_ask_user_question(self, output: str) -> Optional[Tuple[str, List[str]]]:
+        """AskUserQuestion形式から質問と選択肢を抽出"""
+        return _extract_ask_user_question(output)
 
     def analyze_and_process(
         self,
@@ -332,6 +284,40 @@ class QuestionDetector:
                 result.message = "質問は検知されませんでした"
                 return result
 
+            return self.process_detection(
+                detection,
+                auto_create_interaction=auto_create_interaction,
+                auto_update_task=auto_update_task,
+            )
+
+        except Exception as e:
+            result.error = f"処理エラー: {e}"
+
+        return result
+
+    def process_detection(
+        self,
+        detection: DetectionResult,
+        *,
+        auto_create_interaction: bool = True,
+        auto_update_task: bool = True,
+    ) -> ProcessResult:
+        """
+        検知済みの質問について Interaction 作成とタスク状態更新を行う
+
+        ストリーミング検知（StreamingQuestionDetector.feed）の結果にも使用する。
+
+        Args:
+            detection: 検知結果（detected=True）
+            auto_create_interaction: Interactionを自動作成
+            auto_update_task: タスク状態をWAITING_INPUTに更新
+
+        Returns:
+            ProcessResult: 処理結果
+        """
+        result = ProcessResult(detected=detection.detected, detection_result=detection)
+
+        try:
             # 2. Interaction作成
             if auto_create_interaction:
                 interaction_result = self._create_interaction(detection)
@@ -435,6 +421,233 @@ class QuestionDetector:
             return False
 
 
+
+def _extract_ask_user_question(output: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    AskUserQuestion形式から質問と選択肢を抽出
+
+    JSON として読めない断片（stream-json のネストしたツール入力など）は
+    簡易パターンマッチングで抽出する。
+
+    Args:
+        output: 出力テキスト
+
+    Returns:
+        (質問文, 選択肢リスト) または None
+    """
+    # JSON形式の質問を探す
+    json_match = re.search(r'\{[^{}]*"questions"\s*:\s*\[[^\]]+\][^{}]*\}', output, re.DOTALL)
+    if json_match:
+        try:
+            data = json.loads(json_match.group())
+            questions = data.get("questions", [])
+            if questions:
+                q = questions[0]
+                question_text = q.get("question", "")
+                options = [opt.get("label", "") for opt in q.get("options", [])]
+                return (question_text, options)
+        except (json.JSONDecodeError, AttributeError):
+            pass
+
+    # より簡易的なパターンマッチング
+    question_match = re.search(r'"question"\s*:\s*"([^"]+)"', output)
+    if question_match:
+        question_text = question_match.group(1)
+        options = []
+        # オプションを抽出
+        options_match = re.search(r'"options"\s*:\s*\[([^\]]+)\]', output)
+        if options_match:
+            labels = re.findall(r'"label"\s*:\s*"([^"]+)"', options_match.group(1))
+            options = labels
+        return (question_text, options)
+
+    return None
+
+
+class StreamingQuestionDetector:
+    """
+    claude -p の出力をチャンク単位で分析する質問検知器
+
+    - 完結した行ごとに AskUserQuestion パターン群の結合正規表現を1回だけ評価し、
+      個別パターンのヒット数を数える（出力全体を保持しない）
+    - 直近 max_lines 行をリングバッファに保持し、質問文の抽出と
+      末尾行の分析（確認待ち・入力待ち・一般質問）に使用する
+    - feed() は AskUserQuestion の質問文を抽出できた時点で一度だけ
+      DetectionResult を返す（実行中の早期検知）
+    - finish() は QuestionDetector.analyze_output と同じ採点で最終結果を返す
+
+    Usage:
+        stream = StreamingQuestionDetector()
+        for chunk in chunks:
+            if stream.feed(chunk):
+                break  # WAITING_INPUT へ移行
+        result = stream.finish()
+    """
+
+    def __init__(
+        self,
+        *,
+        confidence_threshold: float = 0.5,
+        max_lines: Optional[int] = DEFAULT_STREAM_BUFFER_LINES,
+    ):
+        self.confidence_threshold = confidence_threshold
+        self._ring: deque = deque(maxlen=max_lines)
+        self._partial = ""
+        self._started = False
+        self._line_count = 0
+        self._trailing_blank = 0
+        self._ask_user_hits = [0] * len(_ASK_USER_FAMILY[4])
+        self._extracted: Optional[Tuple[str, List[str]]] = None
+        self.early_result: Optional[DetectionResult] = None
+
+    def feed(self, chunk: str) -> Optional[DetectionResult]:
+        """
+        出力チャンクを追加
+
+        行の途中で切れたチャンクは次のチャンク（または finish）まで保留する。
+
+        Args:
+            chunk: 出力の断片
+
+        Returns:
+            AskUserQuestion を初めて検知・抽出できた場合のみ DetectionResult
+        """
+        if not chunk:
+            return None
+
+        lines = (self._partial + chunk).split("\n")
+        self._partial = lines.pop()
+        if not lines:
+            return None
+
+        for line in lines:
+            self._add_line(line)
+        return self._check_early()
+
+    def finish(self) -> DetectionResult:
+        """
+        保留中の行を確定し、最終的な検知結果を返す
+
+        Returns:
+            DetectionResult: 出力全体に対する検知結果
+        """
+        if self._partial:
+            self._add_line(self._partial)
+            self._partial = ""
+
+        result = DetectionResult()
+        if self._line_count == 0:
+            return result
+
+        # 末尾の空行を除いた行（analyze_output の strip() に相当）
+        lines = list(self._ring)
+        if self._trailing_blank:
+            del lines[-self._trailing_blank:]
+        if lines:
+            lines[-1] = lines[-1].rstrip()
+        last_lines = lines[-ANALYZED_TAIL_LINES:]
+
+        scores = []
+
+        # 1. AskUserQuestion パターン（最も確実）
+        name, score, question_type, _, patterns = _ASK_USER_FAMILY
+        for pattern, hits in zip(patterns, self._ask_user_hits):
+            for _ in range(hits):
+                scores.append(score)
+                result.matched_patterns.append(f"{name}: {pattern.pattern}")
+                result.question_type = question_type
+        if any(self._ask_user_hits):
+            extracted = self._extract()
+            if extracted:
+                result.question_text = extracted[0]
+                result.options = extracted[1]
+
+        # 2-4. 確認待ち・入力待ち・一般的な質問パターン（末尾行のみ）
+        for name, score, question_type, combined, patterns in _TAIL_FAMILIES:
+            candidates = [line for line in last_lines if combined.search(line)]
+            if not candidates:
+                continue
+            for pattern in patterns:
+                for line in candidates:
+                    if pattern.search(line):
+                        scores.append(score)
+                        result.matched_patterns.append(f"{name}: {pattern.pattern}")
+                        if question_type:
+                            result.question_type = question_type
+                        if not result.question_text:
+                            result.question_text = line.strip()
+
+        # 信頼度計算
+        if scores:
+            result.confidence = max(scores)
+            result.detected = result.confidence >= self.confidence_threshold
+
+        # 質問テキストが未設定の場合、最後の行を使用
+        if result.detected and not result.question_text:
+            result.question_text = last_lines[-1].strip() if last_lines else ""
+
+        # コンテキスト情報を保存
+        result.context = {
+            "total_lines": self._line_count - self._trailing_blank,
+            "analyzed_lines": len(last_lines),
+            "pattern_matches": len(result.matched_patterns),
+        }
+
+        return result
+
+    def _add_line(self, line: str) -> None:
+        """1行を分析してリングバッファに追加"""
+        if not self._started:
+            # 先頭の空行は数えない（analyze_output の strip() に相当）
+            if not line.strip():
+                return
+            self._started = True
+
+        self._ring.append(line)
+        self._line_count += 1
+        self._trailing_blank = self._trailing_blank + 1 if not line.strip() else 0
+
+        combined, patterns = _ASK_USER_FAMILY[3], _ASK_USER_FAMILY[4]
+        if combined.search(line):
+            for i, pattern in enumerate(patterns):
+                if pattern.search(line):
+                    self._ask_user_hits[i] += 1
+
+    def _extract(self) -> Optional[Tuple[str, List[str]]]:
+        """リングバッファから質問と選択肢を抽出（成功した結果を保持）"""
+        if self._extracted is None:
+            self._extracted = _extract_ask_user_question("\n".join(self._ring))
+        return self._extracted
+
+    def _check_early(self) -> Optional[DetectionResult]:
+        """AskUserQuestion の質問文が揃った時点で一度だけ検知結果を返す"""
+        if self.early_result is not None or not any(self._ask_user_hits):
+            return None
+        if _ASK_USER_FAMILY[1] < self.confidence_threshold or not self._extract():
+            return None
+
+        name, score, question_type, _, patterns = _ASK_USER_FAMILY
+        question_text, options = self._extracted
+        self.early_result = DetectionResult(
+            detected=True,
+            question_text=question_text,
+            question_type=question_type,
+            confidence=score,
+            matched_patterns=[
+                f"{name}: {pattern.pattern}"
+                for pattern, hits in zip(patterns, self._ask_user_hits)
+                for _ in range(hits)
+            ],
+            options=options,
+            context={
+                "total_lines": self._line_count,
+                "analyzed_lines": len(self._ring),
+                "pattern_matches": sum(self._ask_user_hits),
+                "streaming": True,
+            },
+        )
+        return self.early_result
+
 def main():
     """コマンドライン実行"""
     # Windows環境でのUTF-8出力設定
@@ -14,8 +14,19 @@ Usage:
     # ドライラン（実際には更新しない）
     python backend/interaction/timeout.py --check --dry-run
 
+    # 常駐モード（次の期限まで待機し、期限到来時のみ処理）
+    python backend/interaction/timeout.py --watch --escalate
+
+期限インデックス:
+    interactions.deadline_at は timeout_at を正規化した生成列（VIRTUAL）で、
+    PENDING のみの部分インデックスを持つ（migrations/add_interaction_deadlines.py）。
+    タイムアウト判定は期限の範囲検索1回と、集合単位の UPDATE で行う。
+    未マイグレーションのDBでは同じ式をインデックスなしで評価する。
+
 Options:
     --check             タイムアウトチェック実行
+    --watch             常駐モード（次の期限まで待機）
+    --max-sleep         常駐モードの最大待機秒数（他プロセスが作成した期限の取りこぼし防止）
     --project           プロジェクトIDでフィルタ
     --timeout-minutes   タイムアウト時間（デフォルト: 1440分=24時間）
     --escalate          タイムアウト時にタスクをESCALATEDに
@@ -26,6 +37,7 @@ Options:
 import argparse
 import json
 import sys
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -56,6 +68,30 @@ from utils.transition import (
 # デフォルトタイムアウト（分）
 DEFAULT_TIMEOUT_MINUTES = 1440  # 24時間
 
+# 常駐モードの最大待機秒数
+DEFAULT_WATCH_MAX_SLEEP = 300
+
+# 期限の正規化形式（SQLite strftime と同じミリ秒精度の文字列で比較する）
+_DEADLINE_SQL_FORMAT = "%Y-%m-%dT%H:%M:%f"
+
+# interactions.deadline_at: timeout_at を正規化した生成列と PENDING の部分インデックス
+DEADLINE_COLUMN_DDL = [
+    f"""
+    ALTER TABLE interactions ADD COLUMN deadline_at TEXT
+        GENERATED ALWAYS AS (strftime('{_DEADLINE_SQL_FORMAT}', timeout_at)) VIRTUAL
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_interactions_deadline
+        ON interactions(deadline_at) WHERE status = 'PENDING'
+    """,
+    # timeout_at がない（または解釈できない）Interaction は created_at 基準
+    f"""
+    CREATE INDEX IF NOT EXISTS idx_interactions_created_no_deadline
+        ON interactions(strftime('{_DEADLINE_SQL_FORMAT}', created_at))
+        WHERE status = 'PENDING' AND deadline_at IS NULL
+    """,
+]
+
 
 @dataclass
 class TimeoutCheckResult:
@@ -141,6 +177,139 @@ def is_timed_out(
     return False
 
 
+def _deadline_key(dt: datetime) -> str:
+    """datetime を deadline_at と比較可能な文字列に変換（ミリ秒に丸める）"""
+    dt = dt + timedelta(microseconds=500)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}"
+
+
+def _parse_deadline_key(key: str) -> datetime:
+    return datetime.strptime(key, "%Y-%m-%dT%H:%M:%S.%f")
+
+
+def has_deadline_column(conn) -> bool:
+    """interactions に deadline_at（期限インデックス）があるか"""
+    # 生成列は table_info に現れないため table_xinfo で確認する
+    rows = fetch_all(conn, "PRAGMA table_xinfo(interactions)")
+    return any(row["name"] == "deadline_at" for row in rows)
+
+
+def add_deadline_column(conn) -> bool:
+    """
+    interactions に deadline_at 生成列と期限インデックスを追加（冪等）
+
+    Args:
+        conn: データベース接続
+
+    Returns:
+        追加した場合True（既に存在する場合False）
+    """
+    if has_deadline_column(conn):
+        return False
+    for ddl in DEADLINE_COLUMN_DDL:
+        execute_query(conn, ddl)
+    return True
+
+
+def _due_interaction_ids_sql(indexed: bool, project_id: Optional[str]) -> str:
+    """
+    期限切れ PENDING Interaction の ID を返す SQL（パラメータ: now, created_cutoff）
+
+    期限あり（deadline_at の範囲検索）と期限なし（created_at 基準）の2本の
+    インデックス検索を UNION ALL でつなぐ。
+    """
+    deadline = "deadline_at" if indexed else f"strftime('{_DEADLINE_SQL_FORMAT}', timeout_at)"
+    project_filter = " AND project_id = ?" if project_id else ""
+    return f"""
+        SELECT id FROM interactions
+        WHERE status = 'PENDING' AND {deadline} < ?{project_filter}
+        UNION ALL
+        SELECT id FROM interactions
+        WHERE status = 'PENDING' AND {deadline} IS NULL
+          AND strftime('{_DEADLINE_SQL_FORMAT}', created_at) < ?{project_filter}
+    """
+
+
+def get_due_interactions(
+    conn,
+    project_id: Optional[str] = None,
+    *,
+    timeout_minutes: int = DEFAULT_TIMEOUT_MINUTES,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    期限切れの PENDING Interaction を取得（is_timed_out と同じ判定を SQL で行う）
+
+    Args:
+        conn: データベース接続
+        project_id: プロジェクトID（フィルタ）
+        timeout_minutes: timeout_at がない場合のタイムアウト時間（分）
+        now: 判定時刻（デフォルト: 現在時刻）
+
+    Returns:
+        期限切れ Interaction 一覧（task_status / task_title 付き、created_at 順）
+    """
+    now = now or datetime.now()
+    due_sql = _due_interaction_ids_sql(has_deadline_column(conn), project_id)
+    params: List[Any] = [_deadline_key(now)]
+    if project_id:
+        params.append(project_id)
+    params.append(_deadline_key(now - timedelta(minutes=timeout_minutes)))
+    if project_id:
+        params.append(project_id)
+
+    rows = fetch_all(
+        conn,
+        f"""
+        SELECT
+            i.*,
+            t.status as task_status,
+            t.title as task_title
+        FROM ({due_sql}) due
+        JOIN interactions i ON i.id = due.id
+        LEFT JOIN tasks t ON i.task_id = t.id AND i.project_id = t.project_id
+        ORDER BY i.created_at ASC
+        """,
+        tuple(params),
+    )
+    return rows_to_dicts(rows)
+
+
+def next_deadline(
+    conn,
+    project_id: Optional[str] = None,
+    *,
+    timeout_minutes: int = DEFAULT_TIMEOUT_MINUTES,
+) -> Optional[datetime]:
+    """
+    PENDING Interaction の最も近い期限（なければNone）
+
+    期限インデックスの先頭を読むだけなので件数に依存しない。
+    """
+    indexed = has_deadline_column(conn)
+    deadline = "deadline_at" if indexed else f"strftime('{_DEADLINE_SQL_FORMAT}', timeout_at)"
+    project_filter = " AND project_id = ?" if project_id else ""
+    params = (project_id,) if project_id else ()
+
+    row = fetch_one(
+        conn,
+        f"""
+        SELECT
+            (SELECT MIN({deadline}) FROM interactions
+             WHERE status = 'PENDING'{project_filter}) AS deadline,
+            (SELECT MIN(strftime('{_DEADLINE_SQL_FORMAT}', created_at)) FROM interactions
+             WHERE status = 'PENDING' AND {deadline} IS NULL{project_filter}) AS created
+        """,
+        params + params,
+    )
+    candidates = []
+    if row and row["deadline"]:
+        candidates.append(_parse_deadline_key(row["deadline"]))
+    if row and row["created"]:
+        candidates.append(_parse_deadline_key(row["created"]) + timedelta(minutes=timeout_minutes))
+    return min(candidates) if candidates else None
+
+
 def process_timeout(
     conn,
     interaction: Dict[str, Any],
@@ -242,6 +411,9 @@ def check_timeouts(
     """
     タイムアウトチェックを実行
 
+    期限切れ Interaction を期限インデックスの範囲検索1回で取得し、
+    TIMEOUT への更新・タスクのエスカレーション・変更履歴を集合単位で書き込む。
+
     Args:
         project_id: プロジェクトID（フィルタ）
         timeout_minutes: タイムアウト時間（分）
@@ -256,37 +428,41 @@ def check_timeouts(
 
     try:
         with transaction(db_path=db_path) as conn:
-            # PENDING Interactionを取得
-            pending = get_pending_interactions(conn, project_id)
-            result.checked_count = len(pending)
-
-            # タイムアウトチェック
-            for interaction in pending:
-                if is_timed_out(interaction, timeout_minutes):
-                    # タイムアウト処理
-                    process_result = process_timeout(
-                        conn,
-                        interaction,
-                        escalate_task=escalate,
-                        dry_run=dry_run
-                    )
-
-                    result.timed_out_count += 1
-                    result.timed_out_interactions.append({
-                        "id": interaction.get("id"),
-                        "task_id": interaction.get("task_id"),
-                        "project_id": interaction.get("project_id"),
-                        "question": interaction.get("question_text", "")[:50],
-                        "created_at": interaction.get("created_at"),
-                    })
-
-                    if process_result.get("task_escalated"):
-                        result.escalated_count += 1
-                        result.escalated_tasks.append({
-                            "task_id": interaction.get("task_id"),
-                            "project_id": interaction.get("project_id"),
-                            "title": interaction.get("task_title"),
-                        })
+            # PENDING 件数（部分インデックスのみで数える）
+            count_query = "SELECT COUNT(*) AS count FROM interactions WHERE status = 'PENDING'"
+            count_params: tuple = ()
+            if project_id:
+                count_query += " AND project_id = ?"
+                count_params = (project_id,)
+            result.checked_count = fetch_one(conn, count_query, count_params)["count"]
+
+            # 期限切れ Interaction を取得
+            due = get_due_interactions(conn, project_id, timeout_minutes=timeout_minutes)
+
+            # エスカレーション対象（回答待ちのタスク）
+            escalations = []
+            if escalate:
+                escalations = [i for i in due if i.get("task_status") == "WAITING_INPUT"]
+
+            if due and not dry_run:
+                _apply_timeouts(conn, due, escalations)
+
+            for interaction in due:
+                result.timed_out_interactions.append({
+                    "id": interaction.get("id"),
+                    "task_id": interaction.get("task_id"),
+                    "project_id": interaction.get("project_id"),
+                    "question": (interaction.get("question_text") or "")[:50],
+                    "created_at": interaction.get("created_at"),
+                })
+            for interaction in escalations:
+                result.escalated_tasks.append({
+                    "task_id": interaction.get("task_id"),
+                    "project_id": interaction.get("project_id"),
+                    "title": interaction.get("task_title"),
+                })
+            result.timed_out_count = len(result.timed_out_interactions)
+            result.escalated_count = len(result.escalated_tasks)
 
             if dry_run:
                 result.message = f"[ドライラン] チェック: {result.checked_count}件, タイムアウト: {result.timed_out_count}件"
@@ -303,6 +479,169 @@ def check_timeouts(
     return result
 
 
+def _apply_timeouts(
+    conn,
+    due: List[Dict[str, Any]],
+    escalations: List[Dict[str, Any]],
+) -> None:
+    """
+    期限切れ Interaction を TIMEOUT に、対象タスクを ESCALATED に集合単位で更新
+
+    ID 一覧は JSON 配列1つで渡し、json_each で展開する。
+    Interaction の状態変更は interactions.updated_at に残る
+    （change_history の entity_type に interaction はない）。
+    """
+    now = datetime.now().isoformat()
+
+    execute_query(
+        conn,
+        """
+        UPDATE interactions
+        SET status = 'TIMEOUT', updated_at = ?
+        WHERE status = 'PENDING' AND id IN (SELECT value FROM json_each(?))
+        """,
+        (now, json.dumps([i["id"] for i in due])),
+    )
+
+    if not escalations:
+        return
+
+    # (project_id, task_id, interaction_id)、タスクごとに最初の Interaction
+    targets: Dict[tuple, str] = {}
+    for interaction in escalations:
+        targets.setdefault((interaction["project_id"], interaction["task_id"]), interaction["id"])
+    targets_json = json.dumps([[p, t, i] for (p, t), i in targets.items()])
+
+    execute_query(
+        conn,
+        """
+        INSERT INTO change_history (
+            entity_type, entity_id, project_id, field_name,
+            old_value, new_value, changed_by, change_reason
+        )
+        SELECT 'task', t.id, t.project_id, 'status', 'WAITING_INPUT', 'ESCALATED', 'System',
+               '対話タイムアウトによるエスカレーション: ' || json_extract(j.value, '$[2]')
+        FROM json_each(?) j
+        JOIN tasks t
+          ON t.project_id = json_extract(j.value, '$[0]') AND t.id = json_extract(j.value, '$[1]')
+        WHERE t.status = 'WAITING_INPUT'
+        """,
+        (targets_json,),
+    )
+    execute_query(
+        conn,
+        """
+        UPDATE tasks
+        SET status = 'ESCALATED', updated_at = ?
+        WHERE status = 'WAITING_INPUT'
+          AND (project_id, id) IN (
+              SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]') FROM json_each(?)
+          )
+        """,
+        (now, targets_json),
+    )
+
+
+class TimeoutWatcher:
+    """
+    常駐タイムアウト処理（次の期限まで待機）
+
+    一定間隔でポーリングする代わりに、期限インデックスの先頭（next_deadline）まで
+    眠り、期限到来時のみ check_timeouts を実行する。他プロセスがより早い期限の
+    Interaction を作成した場合に備え、待機は max_sleep 秒で打ち切る。
+    同一プロセス内からは wake() で即時に再評価できる。
+
+    Usage:
+        watcher = TimeoutWatcher(escalate=True)
+        watcher.run()          # stop() まで常駐
+    """
+
+    def __init__(
+        self,
+        project_id: Optional[str] = None,
+        *,
+        timeout_minutes: int = DEFAULT_TIMEOUT_MINUTES,
+        escalate: bool = False,
+        max_sleep: float = DEFAULT_WATCH_MAX_SLEEP,
+        db_path: Optional[Path] = None,
+    ):
+        self.project_id = project_id
+        self.timeout_minutes = timeout_minutes
+        self.escalate = escalate
+        self.max_sleep = max_sleep
+        self.db_path = db_path
+        self._wake = threading.Event()
+        self._stopped = False
+
+    def next_deadline(self) -> Optional[datetime]:
+        """最も近い期限"""
+        conn = get_connection(self.db_path)
+        try:
+            return next_deadline(conn, self.project_id, timeout_minutes=self.timeout_minutes)
+        finally:
+            conn.close()
+
+    def seconds_until_next(self) -> float:
+        """次の期限までの待機秒数（0以上 max_sleep 以下）"""
+        deadline = self.next_deadline()
+        if deadline is None:
+            return self.max_sleep
+        seconds = (deadline - datetime.now()).total_seconds()
+        return min(max(seconds, 0.0), self.max_sleep)
+
+    def run_once(self) -> TimeoutCheckResult:
+        """期限切れを1回処理"""
+        return check_timeouts(
+            self.project_id,
+            timeout_minutes=self.timeout_minutes,
+            escalate=self.escalate,
+            db_path=self.db_path,
+        )
+
+    def run(
+        self,
+        max_cycles: Optional[int] = None,
+        on_result=None,
+    ) -> None:
+        """
+        stop() まで（または max_cycles 回処理するまで）常駐
+
+        Args:
+            max_cycles: 期限処理の最大回数（テスト用）
+            on_result: 処理した TimeoutCheckResult を受け取るコールバック
+        """
+        cycles = 0
+        while not self._stopped:
+            wait = self.seconds_until_next()
+            if wait > 0:
+                self._wake.wait(wait)
+                self._wake.clear()
+                if self._stopped:
+                    break
+                if self.seconds_until_next() > 0:
+                    continue
+
+            result = self.run_once()
+            cycles += 1
+            if on_result is not None:
+                on_result(result)
+            if not result.success:
+                # DBエラー時は即時再試行せず待機する
+                self._wake.wait(self.max_sleep)
+                self._wake.clear()
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+
+    def wake(self) -> None:
+        """待機を解除して期限を再評価"""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """常駐を終了"""
+        self._stopped = True
+        self._wake.set()
+
+
 def cancel_interaction(
     interaction_id: str,
     *,
@@ -435,6 +774,9 @@ def main():
   # 特定プロジェクト
   python timeout.py --check --project AI_PM_PJ
 
+  # 常駐モード（次の期限まで待機）
+  python timeout.py --watch --escalate
+
   # Interactionをキャンセル
   python timeout.py --cancel INT_00001
 """
@@ -445,6 +787,17 @@ def main():
         action="store_true",
         help="タイムアウトチェック実行"
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="常駐モード（次の期限まで待機し、期限到来時のみ処理）"
+    )
+    parser.add_argument(
+        "--max-sleep",
+        type=float,
+        default=DEFAULT_WATCH_MAX_SLEEP,
+        help=f"常駐モードの最大待機秒数（デフォルト: {DEFAULT_WATCH_MAX_SLEEP}）"
+    )
     parser.add_argument(
         "--cancel",
         metavar="INTERACTION_ID",
@@ -513,6 +866,25 @@ def main():
                 print(f"[ERROR] {result.error}", file=sys.stderr)
                 sys.exit(1)
 
+    elif args.watch:
+        watcher = TimeoutWatcher(
+            args.project,
+            timeout_minutes=args.timeout_minutes,
+            escalate=args.escalate,
+            max_sleep=args.max_sleep,
+        )
+
+        def _report(result: TimeoutCheckResult) -> None:
+            if result.success:
+                print(f"[{datetime.now().isoformat(timespec='seconds')}] {result.message}", flush=True)
+            else:
+                print(f"[ERROR] {result.error}", file=sys.stderr, flush=True)
+
+        try:
+            watcher.run(on_result=_report)
+        except KeyboardInterrupt:
+            watcher.stop()
+
     elif args.cancel:
         result = cancel_interaction(
             args.cancel,
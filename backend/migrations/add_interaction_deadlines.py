@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+マイグレーション: interactionsテーブルに期限インデックス（deadline_at）を追加
+
+目的:
+    タイムアウト処理（interaction/timeout.py）を、PENDING全件の読み込みと
+    Python側の判定から、期限の範囲検索1回と集合単位のUPDATEに置き換える。
+
+変更内容:
+    - interactions に deadline_at 生成列（timeout_at を正規化、VIRTUAL）を追加
+    - idx_interactions_deadline: PENDING の deadline_at 部分インデックス
+    - idx_interactions_created_no_deadline: timeout_at のない PENDING の created_at 部分インデックス
+
+Usage:
+    python backend/migrations/add_interaction_deadlines.py [--dry-run] [--verbose]
+"""
+
+import sys
+from pathlib import Path
+
+# パス設定
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils.migration_base import MigrationRunner
+from interaction.timeout import add_deadline_column
+
+
+def migrate():
+    """マイグレーション実行"""
+    dry_run = "--dry-run" in sys.argv
+    verbose = "--verbose" in sys.argv
+
+    runner = MigrationRunner(
+        "add_interaction_deadlines",
+        backup=True,
+        check_workers=False,
+        dry_run=dry_run,
+        verbose=verbose,
+    )
+
+    def migration_logic(conn):
+        cursor = conn.cursor()
+
+        # テーブル存在チェック
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'interactions'"
+        )
+        if cursor.fetchone() is None:
+            print("  interactions テーブルが存在しません。スキップ。")
+            return True
+
+        if add_deadline_column(conn):
+            print("  deadline_at 生成列と期限インデックスを追加しました。")
+        else:
+            print("  deadline_at カラムは既に存在します。スキップ。")
+
+        return True
+
+    return runner.run(migration_logic)
+
+
+if __name__ == "__main__":
+    success = migrate()
+    sys.exit(0 if success else 1)
@@ -26,7 +26,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # パス設定
 _current_dir = Path(__file__).resolve().parent
@@ -104,10 +104,74 @@ def _match_keywords(text: str, keywords: List[str]) -> List[str]:
     return matched
 
 
+def candidate_filenames() -> List[str]:
+    """
+    選択対象となり得るdocs/ファイル名の一覧（INDEX.md + 各カテゴリ）
+
+    Returns:
+        ファイル名リスト（INDEX.md が先頭）
+    """
+    names = ["INDEX.md"]
+    for defn in CATEGORY_KEYWORDS.values():
+        if defn["filename"] not in names:
+            names.append(defn["filename"])
+    return names
+
+
+def docs_fingerprint(docs_path: Path) -> Optional[List[List[Any]]]:
+    """
+    候補ファイルの (ファイル名, mtime_ns, size) 一覧を返す
+
+    内容を読まずにdocs/の変更を検出するためのキー（WorkerExecutor の
+    プロンプトキャッシュが使用）。
+
+    Args:
+        docs_path: docs/ ディレクトリのパス
+
+    Returns:
+        [[filename, mtime_ns, size], ...]（存在するファイルのみ）。
+        docs/ が存在しない場合は None
+    """
+    if not docs_path.is_dir():
+        return None
+
+    fingerprint = []
+    for filename in candidate_filenames():
+        try:
+            st = (docs_path / filename).stat()
+        except OSError:
+            continue
+        fingerprint.append([filename, st.st_mtime_ns, st.st_size])
+    return fingerprint
+
+
+def load_doc_contents(docs_path: Path) -> Dict[str, str]:
+    """
+    候補ファイルの内容をまとめて読み込む
+
+    Args:
+        docs_path: docs/ ディレクトリのパス
+
+    Returns:
+        {filename: content}（存在しない・読めないファイルは含まない）
+    """
+    contents: Dict[str, str] = {}
+    for filename in candidate_filenames():
+        file_path = docs_path / filename
+        if not file_path.is_file():
+            continue
+        try:
+            contents[filename] = file_path.read_text(encoding="utf-8")
+        except Exception:
+            pass  # 読み取り失敗時はスキップ
+    return contents
+
+
 def select_docs(
     project_id: str,
     task_title: str,
     task_description: str,
+    doc_contents: Optional[Dict[str, str]] = None,
 ) -> List[Dict[str, Any]]:
     """
     タスク内容に基づいて参照すべきdocs/ファイルを選択する。
@@ -123,6 +187,8 @@ def select_docs(
         project_id: プロジェクトID
         task_title: タスクのタイトル
         task_description: タスクの説明文
+        doc_contents: 読み込み済みの {filename: content}（load_doc_contents() の結果）。
+            指定時はファイルを読まずにこちらを使用する
 
     Returns:
         [{"filename": "architecture.md", "content": "...", "reason": "..."}, ...]
@@ -134,6 +200,17 @@ def select_docs(
     if not docs_path.exists() or not docs_path.is_dir():
         return []
 
+    def _read(filename: str) -> Optional[str]:
+        if doc_contents is not None:
+            return doc_contents.get(filename)
+        file_path = docs_path / filename
+        if not file_path.exists() or not file_path.is_file():
+            return None
+        try:
+            return file_path.read_text(encoding="utf-8")
+        except Exception:
+            return None  # 読み取り失敗時はスキップ
+
     # 検索対象テキスト（タイトル + 説明を結合）
     search_text = f"{task_title} {task_description}"
 
@@ -141,18 +218,14 @@ def select_docs(
     selected_filenames: set = set()
 
     # 1. INDEX.md は常に含める
-    index_path = docs_path / "INDEX.md"
-    if index_path.exists() and index_path.is_file():
-        try:
-            content = index_path.read_text(encoding="utf-8")
-            selected.append({
-                "filename": "INDEX.md",
-                "content": content,
-                "reason": "ドキュメント概要（常に含む）",
-            })
-            selected_filenames.add("INDEX.md")
-        except Exception:
-            pass  # 読み取り失敗時はスキップ
+    content = _read("INDEX.md")
+    if content is not None:
+        selected.append({
+            "filename": "INDEX.md",
+            "content": content,
+            "reason": "ドキュメント概要（常に含む）",
+        })
+        selected_filenames.add("INDEX.md")
 
     # 2. カテゴリキーワードマッチング
     for category, defn in CATEGORY_KEYWORDS.items():
@@ -169,21 +242,17 @@ def select_docs(
             continue
 
         # ファイル存在確認＆読み取り
-        file_path = docs_path / filename
-        if not file_path.exists() or not file_path.is_file():
+        content = _read(filename)
+        if content is None:
             continue
 
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            reason = f"キーワードマッチ: {', '.join(matched_keywords)}"
-            selected.append({
-                "filename": filename,
-                "content": content,
-                "reason": reason,
-            })
-            selected_filenames.add(filename)
-        except Exception:
-            pass  # 読み取り失敗時はスキップ
+        reason = f"キーワードマッチ: {', '.join(matched_keywords)}"
+        selected.append({
+            "filename": filename,
+            "content": content,
+            "reason": reason,
+        })
+        selected_filenames.add(filename)
 
     return selected
 
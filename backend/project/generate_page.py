@@ -5,32 +5,49 @@ AI PM Framework - プロジェクト紹介ページ生成スクリプト
 プロジェクトの情報（ステータス・ORDER進捗・タスク統計等）をもとに
 HTML形式の紹介ページを生成する。
 
+生成したページはデータスナップショットとともに
+DBと同じディレクトリの project_pages/{project_id}.snapshot.json に保存し、
+プロジェクトごとの変更トークンが一致する間はキャッシュ済みのページを返す。
+--all では全プロジェクトをグループ化クエリでまとめて処理し、
+内容ハッシュが変わった {project_id}.html のみ書き込む。
+
 Usage:
-    python backend/project/generate_page.py PROJECT_ID [--json]
+    python backend/project/generate_page.py PROJECT_ID [--json] [--no-cache]
+    python backend/project/generate_page.py --all [--output-dir DIR] [--json] [--no-cache]
 
 Arguments:
     PROJECT_ID    プロジェクトID（例: ai_pm_manager_v2）
 
 Options:
     --json        JSON形式で出力
+    --all         全プロジェクトのページを一括生成（PROJECT_ID指定時はそのプロジェクトのみ）
+    --output-dir  一括生成時の出力先（デフォルト: DBと同じディレクトリの project_pages/）
+    --no-cache    スナップショットを使わずに再構築
 
 Output:
     成功時:
-        {"success": true, "html": "<html>...</html>"}
+        {"success": true, "html": "<html>...</html>", "cached": false}
+    一括生成時:
+        {"success": true, "output_dir": "...", "total": 3, "regenerated": [...], "written": [...], "errors": []}
     エラー時:
         {"success": false, "error": "..."}
 
 Example:
     python backend/project/generate_page.py ai_pm_manager_v2 --json
+    python backend/project/generate_page.py --all --json
 """
 
 import argparse
+import hashlib
 import html
 import json
+import logging
+import os
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
 # パス設定
 _current_dir = Path(__file__).resolve().parent
@@ -40,9 +57,7 @@ if str(_package_root) not in sys.path:
 
 from utils.db import (
     get_connection,
-    fetch_one,
     fetch_all,
-    rows_to_dicts,
     DatabaseError,
 )
 from utils.validation import (
@@ -51,130 +66,195 @@ from utils.validation import (
     ValidationError,
 )
 
+logger = logging.getLogger(__name__)
+
+# ページとスナップショットの保存先（DBファイルと同じディレクトリ配下）
+PAGE_DIRNAME = "project_pages"
+SNAPSHOT_VERSION = 1
+
+# ORDER一覧に表示する件数
+ORDER_LIST_LIMIT = 20
+
 
-def _get_project_info(conn, project_id: str) -> Optional[Dict[str, Any]]:
+def _in_filter(column: str, project_ids: Optional[Sequence[str]]) -> Tuple[str, Tuple[str, ...]]:
+    """project_ids による WHERE 句（Noneの場合は全プロジェクト）"""
+    if project_ids is None:
+        return "", ()
+    return f"WHERE {column} IN ({','.join('?' for _ in project_ids)})", tuple(project_ids)
+
+
+def _get_project_infos(
+    conn, project_ids: Optional[Sequence[str]] = None
+) -> Dict[str, Dict[str, Any]]:
     """
-    プロジェクト基本情報を取得
+    プロジェクト基本情報をまとめて取得
 
     Args:
         conn: データベース接続
-        project_id: プロジェクトID
+        project_ids: プロジェクトIDのリスト（Noneの場合は全プロジェクト）
 
     Returns:
-        プロジェクト情報の辞書、見つからない場合はNone
+        プロジェクトID -> プロジェクト情報の辞書
     """
-    row = fetch_one(
+    where, params = _in_filter("id", project_ids)
+    rows = fetch_all(
         conn,
-        """
+        f"""
         SELECT id, name, path, status, current_order_id, created_at, updated_at
-        FROM projects WHERE id = ?
+        FROM projects {where}
+        ORDER BY id
         """,
-        (project_id,)
+        params
     )
-    if row is None:
-        return None
-    return dict(row)
+    return {row["id"]: dict(row) for row in rows}
 
 
-def _get_order_summary(conn, project_id: str) -> List[Dict[str, Any]]:
+def _get_status_groups(
+    conn,
+    table: str,
+    project_ids: Optional[Sequence[str]],
+    timestamps: Sequence[str] = (),
+) -> Dict[str, Dict[str, List[Any]]]:
     """
-    ORDER一覧のサマリを取得
+    プロジェクト・ステータスごとの件数（と最新タイムスタンプ）を1クエリで取得
 
     Args:
         conn: データベース接続
-        project_id: プロジェクトID
+        table: テーブル名（orders / tasks / backlog_items）
+        project_ids: プロジェクトIDのリスト（Noneの場合は全プロジェクト）
+        timestamps: MAX() を取るタイムスタンプ列
 
     Returns:
-        ORDER情報のリスト
+        プロジェクトID -> ステータス -> [件数, 各タイムスタンプの最大値...]
     """
+    where, params = _in_filter("project_id", project_ids)
+    columns = "".join(f", MAX({column}) AS max_{column}" for column in timestamps)
     rows = fetch_all(
         conn,
-        """
-        SELECT id, title, status, created_at, updated_at
-        FROM orders
-        WHERE project_id = ?
-        ORDER BY
-            CASE status
-                WHEN 'IN_PROGRESS' THEN 0
-                WHEN 'REVIEW' THEN 1
-                WHEN 'PLANNING' THEN 2
-                WHEN 'COMPLETED' THEN 3
-                ELSE 4
-            END,
-            created_at DESC
-        LIMIT 20
+        f"""
+        SELECT project_id, status, COUNT(*) AS count{columns}
+        FROM {table} {where}
+        GROUP BY project_id, status
         """,
-        (project_id,)
+        params
     )
-    return rows_to_dicts(rows)
+    groups: Dict[str, Dict[str, List[Any]]] = {}
+    for row in rows:
+        groups.setdefault(row["project_id"], {})[row["status"]] = [
+            row["count"], *(row[f"max_{column}"] for column in timestamps)
+        ]
+    return groups
+
+
+def _task_stats(groups: Dict[str, List[Any]]) -> Dict[str, int]:
+    """ステータス別件数からタスク統計を作成"""
+    return {
+        "total": sum(group[0] for group in groups.values()),
+        "completed": groups.get("COMPLETED", [0])[0],
+        "in_progress": groups.get("IN_PROGRESS", [0])[0],
+        "pending": groups.get("PENDING", [0])[0],
+        "rejected": groups.get("REJECTED", [0])[0],
+    }
+
+
+def _backlog_stats(groups: Dict[str, List[Any]]) -> Dict[str, int]:
+    """ステータス別件数からバックログ統計を作成"""
+    return {
+        "total": sum(group[0] for group in groups.values()),
+        "todo": groups.get("TODO", [0])[0],
+        "in_progress": groups.get("IN_PROGRESS", [0])[0],
+        "done": groups.get("DONE", [0])[0],
+    }
 
 
-def _get_task_stats(conn, project_id: str) -> Dict[str, int]:
+def _get_project_states(
+    conn, project_ids: Optional[Sequence[str]] = None
+) -> Dict[str, Dict[str, Any]]:
     """
-    タスク統計を取得
+    プロジェクトごとの変更トークンと統計をグループ化クエリでまとめて取得
+
+    変更トークンはプロジェクト行、ORDERのステータス別件数と最新の
+    updated_at / created_at、タスク・バックログのステータス別件数から作る。
+    ページに表示される統計はこのクエリ結果そのものなので、
+    トークンが一致すればページを再構築する必要はない。
 
     Args:
         conn: データベース接続
-        project_id: プロジェクトID
+        project_ids: プロジェクトIDのリスト（Noneの場合は全プロジェクト）
 
     Returns:
-        タスク統計の辞書
+        プロジェクトID -> {"token", "project", "task_stats", "backlog_stats"}
     """
-    row = fetch_one(
-        conn,
-        """
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN status = 'COMPLETED' THEN 1 ELSE 0 END) as completed,
-            SUM(CASE WHEN status = 'IN_PROGRESS' THEN 1 ELSE 0 END) as in_progress,
-            SUM(CASE WHEN status = 'PENDING' THEN 1 ELSE 0 END) as pending,
-            SUM(CASE WHEN status = 'REJECTED' THEN 1 ELSE 0 END) as rejected
-        FROM tasks WHERE project_id = ?
-        """,
-        (project_id,)
-    )
-    if row:
-        return {
-            "total": row["total"] or 0,
-            "completed": row["completed"] or 0,
-            "in_progress": row["in_progress"] or 0,
-            "pending": row["pending"] or 0,
-            "rejected": row["rejected"] or 0,
+    projects = _get_project_infos(conn, project_ids)
+    orders = _get_status_groups(conn, "orders", project_ids, ("updated_at", "created_at"))
+    tasks = _get_status_groups(conn, "tasks", project_ids)
+    backlog = _get_status_groups(conn, "backlog_items", project_ids, ("updated_at",))
+
+    states = {}
+    for project_id, project in projects.items():
+        groups = {
+            "orders": orders.get(project_id, {}),
+            "tasks": tasks.get(project_id, {}),
+            "backlog": backlog.get(project_id, {}),
+        }
+        token_source = json.dumps([project, groups], sort_keys=True, default=str)
+        states[project_id] = {
+            "token": hashlib.sha256(token_source.encode("utf-8")).hexdigest(),
+            "project": project,
+            "task_stats": _task_stats(groups["tasks"]),
+            "backlog_stats": _backlog_stats(groups["backlog"]),
         }
-    return {"total": 0, "completed": 0, "in_progress": 0, "pending": 0, "rejected": 0}
+    return states
 
 
-def _get_backlog_stats(conn, project_id: str) -> Dict[str, int]:
+def _get_order_summaries(
+    conn, project_ids: Sequence[str]
+) -> Dict[str, List[Dict[str, Any]]]:
     """
-    バックログ統計を取得
+    ORDER一覧のサマリ（プロジェクトごとに最新 ORDER_LIST_LIMIT 件）をまとめて取得
 
     Args:
         conn: データベース接続
-        project_id: プロジェクトID
+        project_ids: プロジェクトIDのリスト
 
     Returns:
-        バックログ統計の辞書
+        プロジェクトID -> ORDER情報のリスト
     """
-    row = fetch_one(
+    summaries: Dict[str, List[Dict[str, Any]]] = {project_id: [] for project_id in project_ids}
+    if not project_ids:
+        return summaries
+
+    where, params = _in_filter("project_id", project_ids)
+    rows = fetch_all(
         conn,
-        """
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN status = 'TODO' THEN 1 ELSE 0 END) as todo,
-            SUM(CASE WHEN status = 'IN_PROGRESS' THEN 1 ELSE 0 END) as in_progress,
-            SUM(CASE WHEN status = 'DONE' THEN 1 ELSE 0 END) as done
-        FROM backlog_items WHERE project_id = ?
+        f"""
+        SELECT project_id, id, title, status, created_at, updated_at
+        FROM (
+            SELECT project_id, id, title, status, created_at, updated_at,
+                ROW_NUMBER() OVER (
+                    PARTITION BY project_id
+                    ORDER BY
+                        CASE status
+                            WHEN 'IN_PROGRESS' THEN 0
+                            WHEN 'REVIEW' THEN 1
+                            WHEN 'PLANNING' THEN 2
+                            WHEN 'COMPLETED' THEN 3
+                            ELSE 4
+                        END,
+                        created_at DESC,
+                        id DESC
+                ) AS rank
+            FROM orders {where}
+        )
+        WHERE rank <= ?
+        ORDER BY project_id, rank
         """,
-        (project_id,)
+        params + (ORDER_LIST_LIMIT,)
     )
-    if row:
-        return {
-            "total": row["total"] or 0,
-            "todo": row["todo"] or 0,
-            "in_progress": row["in_progress"] or 0,
-            "done": row["done"] or 0,
-        }
-    return {"total": 0, "todo": 0, "in_progress": 0, "done": 0}
+    for row in rows:
+        order = dict(row)
+        summaries[order.pop("project_id")].append(order)
+    return summaries
 
 
 def _escape(text: Any) -> str:
@@ -206,6 +286,7 @@ def _build_html(
     orders: List[Dict[str, Any]],
     task_stats: Dict[str, int],
     backlog_stats: Dict[str, int],
+    generated_at: Optional[str] = None,
 ) -> str:
     """
     HTMLページを構築
@@ -215,6 +296,7 @@ def _build_html(
         orders: ORDER一覧
         task_stats: タスク統計
         backlog_stats: バックログ統計
+        generated_at: フッターに表示する生成日時（Noneの場合は現在時刻）
 
     Returns:
         HTML文字列
@@ -223,7 +305,6 @@ def _build_html(
     project_id = _escape(project.get("id", ""))
     project_status = project.get("status", "UNKNOWN")
     created_at = _escape(project.get("created_at", ""))
-    updated_at = _escape(project.get("updated_at", ""))
 
     # タスク進捗率
     task_total = task_stats["total"]
@@ -231,17 +312,19 @@ def _build_html(
     progress_pct = round((task_completed / task_total) * 100) if task_total > 0 else 0
 
     # ORDER一覧のHTML
-    order_rows = ""
-    for o in orders:
-        order_rows += f"""
+    order_rows = "".join(
+        f"""
         <tr>
             <td>{_escape(o.get('id', ''))}</td>
             <td>{_escape(o.get('title', ''))}</td>
             <td>{_status_badge(o.get('status', ''))}</td>
             <td>{_escape(o.get('created_at', ''))}</td>
         </tr>"""
+        for o in orders
+    )
 
-    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if generated_at is None:
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     return f"""<!DOCTYPE html>
 <html lang="ja">
@@ -325,7 +408,7 @@ def _build_html(
             </div>
         </div>
 
-        <h2>ORDER一覧（最新20件）</h2>
+        <h2>ORDER一覧（最新{ORDER_LIST_LIMIT}件）</h2>
         <div class="card">
             <table>
                 <thead>
@@ -350,20 +433,147 @@ def _build_html(
 </html>"""
 
 
+def _default_page_dir(db_path: Optional[Path] = None) -> Path:
+    """ページ・スナップショットの既定の保存先（DBファイルと同じディレクトリ配下）"""
+    if db_path is None:
+        from config.db_config import get_db_path
+        db_path = get_db_path()
+    return Path(db_path).resolve().parent / PAGE_DIRNAME
+
+
+def _snapshot_path(page_dir: Path, project_id: str) -> Path:
+    return page_dir / f"{project_id}.snapshot.json"
+
+
+def _load_snapshot(path: Path) -> Optional[Dict[str, Any]]:
+    """スナップショットを読み込む（存在しない・破損・バージョン不一致の場合はNone）"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _write_atomic(path: Path, text: str) -> bool:
+    """
+    ファイルをアトミックに書き込む
+
+    Returns:
+        書き込めた場合True
+    """
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".tmp_{path.name}_")
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        os.replace(tmp_path, str(path))
+        tmp_path = None
+        return True
+    except OSError as e:
+        logger.warning(f"ファイルの書き込みに失敗: {path}: {e}")
+        return False
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """
+    内容ハッシュが変わった場合のみファイルを書き込む
+
+    Returns:
+        書き込んだ場合True
+    """
+    data = text.encode("utf-8")
+    try:
+        if hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(data).digest():
+            return False
+    except OSError:
+        pass
+    return _write_atomic(path, text)
+
+
+def _build_snapshot(
+    state: Dict[str, Any],
+    orders: List[Dict[str, Any]],
+    previous: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    データスナップショットからページを構築
+
+    トークンが変わっても表示内容が前回と同じ場合（表示しない列の更新など）は
+    前回のHTMLと生成日時をそのまま使い、ページの内容ハッシュを変えない。
+
+    Args:
+        state: _get_project_states() の要素
+        orders: ORDER一覧
+        previous: 前回のスナップショット
+
+    Returns:
+        スナップショット {"version", "token", "generated_at", "data", "html"}
+    """
+    project = state["project"]
+    data = json.loads(json.dumps({
+        "project": {key: project.get(key) for key in ("id", "name", "status", "created_at")},
+        "orders": [
+            {key: order.get(key) for key in ("id", "title", "status", "created_at")}
+            for order in orders
+        ],
+        "task_stats": state["task_stats"],
+        "backlog_stats": state["backlog_stats"],
+    }, default=str))
+
+    if previous is not None and previous.get("data") == data and previous.get("html"):
+        generated_at = previous["generated_at"]
+        page_html = previous["html"]
+    else:
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        page_html = _build_html(
+            data["project"], data["orders"], data["task_stats"], data["backlog_stats"],
+            generated_at=generated_at,
+        )
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "token": state["token"],
+        "generated_at": generated_at,
+        "data": data,
+        "html": page_html,
+    }
+
+
+def _is_fresh(snapshot: Optional[Dict[str, Any]], state: Dict[str, Any]) -> bool:
+    return snapshot is not None and snapshot.get("token") == state["token"] and bool(snapshot.get("html"))
+
+
 def generate_project_page(
     project_id: str,
     *,
     db_path: Optional[Path] = None,
+    use_cache: bool = True,
+    page_dir: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """
     プロジェクト紹介ページを生成
 
+    変更トークンが前回のスナップショットと一致する場合は
+    ORDER一覧の取得とHTML構築を行わずにキャッシュ済みのページを返す。
+
     Args:
         project_id: プロジェクトID
         db_path: データベースパス（テスト用）
+        use_cache: スナップショットを使用・保存するか
+        page_dir: スナップショットの保存先（Noneの場合はDBと同じディレクトリの project_pages/）
 
     Returns:
-        生成結果の辞書 {"success": bool, "html"?: str, "error"?: str}
+        生成結果の辞書 {"success": bool, "html"?: str, "cached"?: bool, "error"?: str}
     """
     try:
         validate_project_name(project_id)
@@ -376,26 +586,35 @@ def generate_project_page(
                     "error": f"プロジェクトが見つかりません: {project_id}",
                 }
 
-            project = _get_project_info(conn, project_id)
-            if project is None:
+            state = _get_project_states(conn, [project_id]).get(project_id)
+            if state is None:
                 return {
                     "success": False,
                     "error": f"プロジェクト情報の取得に失敗しました: {project_id}",
                 }
 
-            orders = _get_order_summary(conn, project_id)
-            task_stats = _get_task_stats(conn, project_id)
-            backlog_stats = _get_backlog_stats(conn, project_id)
+            snapshot_path = None
+            previous = None
+            if use_cache:
+                snapshot_path = _snapshot_path(page_dir or _default_page_dir(db_path), project_id)
+                previous = _load_snapshot(snapshot_path)
+                if _is_fresh(previous, state):
+                    return {"success": True, "html": previous["html"], "cached": True}
 
-            page_html = _build_html(project, orders, task_stats, backlog_stats)
-
-            return {
-                "success": True,
-                "html": page_html,
-            }
+            orders = _get_order_summaries(conn, [project_id])[project_id]
         finally:
             conn.close()
 
+        snapshot = _build_snapshot(state, orders, previous)
+        if snapshot_path is not None:
+            _write_atomic(snapshot_path, json.dumps(snapshot, ensure_ascii=False))
+
+        return {
+            "success": True,
+            "html": snapshot["html"],
+            "cached": False,
+        }
+
     except ValidationError as e:
         return {"success": False, "error": f"入力検証エラー: {e}"}
     except DatabaseError as e:
@@ -404,6 +623,90 @@ def generate_project_page(
         return {"success": False, "error": f"予期しないエラー: {e}"}
 
 
+def generate_all_pages(
+    *,
+    db_path: Optional[Path] = None,
+    output_dir: Optional[Path] = None,
+    project_ids: Optional[Sequence[str]] = None,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    全プロジェクト（または指定プロジェクト）のページを一括生成
+
+    変更トークン・統計・ORDER一覧をプロジェクト横断のグループ化クエリで取得し、
+    トークンが変わったプロジェクトだけページを再構築する。
+    {project_id}.html は内容ハッシュが変わった場合のみ書き込む。
+
+    Args:
+        db_path: データベースパス（テスト用）
+        output_dir: 出力先（Noneの場合はDBと同じディレクトリの project_pages/）
+        project_ids: 対象プロジェクトID（Noneの場合は全プロジェクト）
+        use_cache: スナップショットを使用するか（Falseの場合は全ページを再構築）
+
+    Returns:
+        {"success": bool, "output_dir": str, "total": int,
+         "regenerated": [...], "written": [...], "errors": [...]}
+    """
+    page_dir = Path(output_dir) if output_dir is not None else _default_page_dir(db_path)
+    result: Dict[str, Any] = {
+        "success": True,
+        "output_dir": str(page_dir),
+        "total": 0,
+        "regenerated": [],
+        "written": [],
+        "errors": [],
+    }
+
+    try:
+        conn = get_connection(db_path=db_path)
+        try:
+            states = _get_project_states(conn, project_ids)
+            for project_id in project_ids or ():
+                if project_id not in states:
+                    result["errors"].append({
+                        "project_id": project_id,
+                        "error": f"プロジェクトが見つかりません: {project_id}",
+                    })
+
+            # ID はファイル名になるため検証する
+            for project_id in list(states):
+                try:
+                    validate_project_name(project_id)
+                except ValidationError as e:
+                    del states[project_id]
+                    result["errors"].append({"project_id": project_id, "error": f"入力検証エラー: {e}"})
+
+            previous = {
+                project_id: _load_snapshot(_snapshot_path(page_dir, project_id)) if use_cache else None
+                for project_id in states
+            }
+            stale = [
+                project_id for project_id, state in states.items()
+                if not _is_fresh(previous[project_id], state)
+            ]
+            orders = _get_order_summaries(conn, stale)
+        finally:
+            conn.close()
+    except DatabaseError as e:
+        return {**result, "success": False, "error": f"データベースエラー: {e}"}
+    except Exception as e:
+        return {**result, "success": False, "error": f"予期しないエラー: {e}"}
+
+    for project_id, state in states.items():
+        snapshot = previous[project_id]
+        if project_id in orders:
+            snapshot = _build_snapshot(state, orders[project_id], snapshot)
+            _write_atomic(_snapshot_path(page_dir, project_id), json.dumps(snapshot, ensure_ascii=False))
+            result["regenerated"].append(project_id)
+        if _write_if_changed(page_dir / f"{project_id}.html", snapshot["html"]):
+            result["written"].append(project_id)
+
+    result["total"] = len(states)
+    if result["errors"]:
+        result["success"] = False
+    return result
+
+
 def main():
     """コマンドライン実行"""
     # Windows環境でのUTF-8出力設定
@@ -424,13 +727,31 @@ def main():
 
   # テキスト形式で確認
   python generate_page.py ai_pm_manager_v2
+
+  # 全プロジェクトのページを一括生成（変更があったファイルのみ書き込み）
+  python generate_page.py --all --output-dir ./pages --json
 """
     )
 
     parser.add_argument(
         "project_id",
+        nargs="?",
         help="プロジェクトID（例: ai_pm_manager_v2）"
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="全プロジェクトのページを一括生成"
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="一括生成時の出力先（デフォルト: DBと同じディレクトリの project_pages/）"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="スナップショットを使わずに再構築"
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -439,6 +760,8 @@ def main():
 
     try:
         args = parser.parse_args()
+        if not args.all and not args.project_id:
+            parser.error("PROJECT_ID または --all を指定してください")
     except (SystemExit, argparse.ArgumentError) as e:
         error_msg = str(e) if str(e) else "引数エラー"
         print(json.dumps({
@@ -447,7 +770,28 @@ def main():
         }, ensure_ascii=False))
         sys.exit(1)
 
-    result = generate_project_page(project_id=args.project_id)
+    if args.all:
+        result = generate_all_pages(
+            output_dir=Path(args.output_dir) if args.output_dir else None,
+            project_ids=[args.project_id] if args.project_id else None,
+            use_cache=not args.no_cache,
+        )
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        else:
+            print(
+                f"{result['total']}件中 再構築 {len(result['regenerated'])}件 / "
+                f"書き込み {len(result['written'])}件 -> {result['output_dir']}"
+            )
+            for error in result["errors"]:
+                print(f"[ERROR] {error['project_id']}: {error['error']}", file=sys.stderr)
+            if "error" in result:
+                print(f"[ERROR] {result['error']}", file=sys.stderr)
+        if not result["success"]:
+            sys.exit(1)
+        return
+
+    result = generate_project_page(project_id=args.project_id, use_cache=not args.no_cache)
 
     if args.json:
         print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -6,8 +6,17 @@ AI PM Framework - プロジェクト情報最新化スクリプト
 およびファイルから収集し、AIへプロンプトを送信してPROJECT_INFO.md
 の内容を再生成・上書き保存する。
 
+収集した入力のダイジェストを PROJECTS/{project_id}/.project_info_refresh.json に
+保存し、前回の最新化から入力が変わっておらず PROJECT_INFO.md も前回の出力のままで
+あればAI呼び出しをスキップする。
+
+複数プロジェクト（または --all で全アクティブプロジェクト）を指定した場合は、
+DBコンテキストをプロジェクト横断のグループ化クエリでまとめて収集し、
+RESULTファイルの走査とAI呼び出しを並列数を制限したスレッドプールで実行する。
+
 Usage:
-    python backend/project/refresh_info.py PROJECT_ID [options]
+    python backend/project/refresh_info.py PROJECT_ID [PROJECT_ID ...] [options]
+    python backend/project/refresh_info.py --all [options]
 
 Arguments:
     PROJECT_ID          プロジェクトID
@@ -16,20 +25,28 @@ Options:
     --model MODEL       AIモデル（haiku/sonnet/opus、デフォルト: sonnet）
     --timeout SEC       タイムアウト秒数（デフォルト: 600）
     --skip-ai           AI処理をスキップ（コンテキスト収集のみ）
+    --force             入力に変更がなくても再生成する
+    --all               全アクティブプロジェクトを最新化
+    --workers N         AI呼び出しの並列数（デフォルト: 3）
     --json              JSON形式で出力
 
 Example:
     python backend/project/refresh_info.py ai_pm_manager_v2
     python backend/project/refresh_info.py ai_pm_manager_v2 --model opus --json
+    python backend/project/refresh_info.py --all --workers 4 --json
 """
 
 import argparse
+import hashlib
 import json
 import logging
+import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 # パス設定
 _current_dir = Path(__file__).resolve().parent
@@ -52,9 +69,7 @@ try:
     from utils.db import (
         DatabaseError,
         fetch_all,
-        fetch_one,
         get_connection,
-        rows_to_dicts,
     )
     from utils.validation import ValidationError, project_exists, validate_project_name
 except ImportError as e:
@@ -71,11 +86,141 @@ except ImportError:
     logger.warning("claude_cli が利用できません。--skip-ai オプションのみ利用可能です。")
 
 
+# 一括最新化時のAI呼び出しの並列数
+DEFAULT_REFRESH_WORKERS = 3
+
+# 前回の最新化の入力ダイジェストを保存するファイル（PROJECTS/{project_id}/ 配下）
+STATE_FILENAME = ".project_info_refresh.json"
+STATE_VERSION = 1
+
+# 入力ダイジェストに含めないコンテキスト（PROJECT_INFO.md は出力ハッシュで比較する）
+_DIGEST_EXCLUDED_KEYS = (
+    "current_project_info",
+    "current_project_info_exists",
+    "current_project_info_truncated",
+)
+
+
 class RefreshInfoError(Exception):
     """プロジェクト情報最新化エラー"""
     pass
 
 
+def _sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """一時ファイルに書き込んでから置き換える"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".tmp_{path.name}_")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def collect_db_contexts(conn, project_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    複数プロジェクトのDBコンテキストをグループ化クエリでまとめて収集する
+
+    Args:
+        conn: データベース接続
+        project_ids: プロジェクトIDのリスト
+
+    Returns:
+        プロジェクトID -> {"project", "orders", "task_stats_by_order",
+        "total_task_count", "completed_task_count", "pending_backlog_count"}
+    """
+    contexts: Dict[str, Dict[str, Any]] = {
+        project_id: {
+            "project": {},
+            "orders": [],
+            "task_stats_by_order": [],
+            "total_task_count": 0,
+            "completed_task_count": 0,
+            "pending_backlog_count": 0,
+        }
+        for project_id in project_ids
+    }
+    if not project_ids:
+        return contexts
+
+    placeholders = ",".join("?" for _ in project_ids)
+    params = tuple(project_ids)
+
+    # プロジェクト基本情報
+    for row in fetch_all(
+        conn,
+        f"SELECT id, name, status, created_at, updated_at FROM projects WHERE id IN ({placeholders})",
+        params,
+    ):
+        contexts[row["id"]]["project"] = dict(row)
+
+    # ORDER履歴（全件）
+    for row in fetch_all(
+        conn,
+        f"""
+        SELECT project_id, id, title, priority, status, started_at, completed_at, created_at
+        FROM orders
+        WHERE project_id IN ({placeholders})
+        ORDER BY project_id, created_at ASC
+        """,
+        params,
+    ):
+        order = dict(row)
+        contexts[order.pop("project_id")]["orders"].append(order)
+
+    # タスク完了状況（ORDERごとの集計）。全タスク合計もここから求める
+    for row in fetch_all(
+        conn,
+        f"""
+        SELECT
+            project_id,
+            order_id,
+            COUNT(*) AS total,
+            SUM(CASE WHEN status = 'COMPLETED' THEN 1 ELSE 0 END) AS completed,
+            SUM(CASE WHEN status IN ('QUEUED', 'IN_PROGRESS', 'BLOCKED', 'REWORK') THEN 1 ELSE 0 END) AS in_progress
+        FROM tasks
+        WHERE project_id IN ({placeholders})
+        GROUP BY project_id, order_id
+        """,
+        params,
+    ):
+        stats = dict(row)
+        context = contexts[stats.pop("project_id")]
+        context["task_stats_by_order"].append(stats)
+        context["total_task_count"] += stats["total"]
+        context["completed_task_count"] += stats["completed"] or 0
+
+    # バックログ件数
+    for row in fetch_all(
+        conn,
+        f"""
+        SELECT project_id, COUNT(*) AS cnt FROM backlog_items
+        WHERE project_id IN ({placeholders}) AND status != 'DONE'
+        GROUP BY project_id
+        """,
+        params,
+    ):
+        contexts[row["project_id"]]["pending_backlog_count"] = row["cnt"]
+
+    return contexts
+
+
+def get_active_project_ids(conn) -> List[str]:
+    """アクティブなプロジェクトIDの一覧（is_active カラムがない古いDBでは全件）"""
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(projects)").fetchall()]
+    where = "WHERE is_active = 1" if "is_active" in columns else ""
+    return [row["id"] for row in fetch_all(conn, f"SELECT id FROM projects {where} ORDER BY id")]
+
+
 class ProjectInfoRefresher:
     """プロジェクト情報（PROJECT_INFO.md）を最新化するクラス"""
 
@@ -86,11 +231,13 @@ class ProjectInfoRefresher:
         model: str = "sonnet",
         timeout: int = 600,
         skip_ai: bool = False,
+        force: bool = False,
     ):
         self.project_id = project_id
         self.model = model
         self.timeout = timeout
         self.skip_ai = skip_ai
+        self.force = force
 
         # Roamingパスを使用（get_project_paths()経由）
         _paths = get_project_paths(project_id)
@@ -98,6 +245,7 @@ class ProjectInfoRefresher:
         self.orders_dir: Path = _paths["orders"]
         self.result_dir: Path = _paths["result"]
         self.project_info_path: Path = self.project_dir / "PROJECT_INFO.md"
+        self.state_path: Path = self.project_dir / STATE_FILENAME
 
         # 処理結果
         self.results: Dict[str, Any] = {
@@ -124,19 +272,24 @@ class ProjectInfoRefresher:
     # 公開メソッド
     # ------------------------------------------------------------------
 
-    def refresh(self) -> Dict[str, Any]:
+    def refresh(self, db_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         プロジェクト情報を最新化する
 
+        Args:
+            db_context: collect_db_contexts() で収集済みのDBコンテキスト
+                （指定時はプロジェクト存在確認とDBクエリを省略する）
+
         Returns:
             処理結果の辞書
         """
         try:
             # Step 1: プロジェクト存在確認
-            self._validate_project()
+            if db_context is None:
+                self._validate_project()
 
             # Step 2: コンテキスト収集
-            context = self._collect_context()
+            context = self._collect_context(db_context)
             self.results["context_summary"] = {
                 "order_count": len(context.get("orders", [])),
                 "completed_task_count": context.get("completed_task_count", 0),
@@ -151,6 +304,15 @@ class ProjectInfoRefresher:
                 self.results["skipped_ai"] = True
                 return self.results
 
+            # 入力が前回から変わっていなければAI呼び出しを省略
+            digest = self._context_digest(context)
+            self.results["context_digest"] = digest
+            if not self.force and self._is_unchanged(digest):
+                logger.info(f"入力に変更がないためスキップします: {self.project_id}")
+                self.results["success"] = True
+                self.results["skipped"] = True
+                return self.results
+
             # Step 3: プロンプト構築
             prompt = self._build_prompt(context)
 
@@ -164,6 +326,7 @@ class ProjectInfoRefresher:
             # Step 5: PROJECT_INFO.md を生成・保存
             new_content = self._extract_markdown(result.result_text)
             self._save_project_info(new_content)
+            self._save_state(digest, new_content)
 
             self.results["success"] = True
             logger.info(f"PROJECT_INFO.md を更新しました: {self.project_info_path}")
@@ -197,74 +360,15 @@ class ProjectInfoRefresher:
     # 内部メソッド: コンテキスト収集
     # ------------------------------------------------------------------
 
-    def _collect_context(self) -> Dict[str, Any]:
+    def _collect_context(self, db_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """DBおよびファイルからコンテキストを収集する"""
-        context: Dict[str, Any] = {}
-
-        conn = get_connection()
-        try:
-            # プロジェクト基本情報
-            project_row = fetch_one(
-                conn,
-                "SELECT id, name, status, created_at, updated_at FROM projects WHERE id = ?",
-                (self.project_id,),
-            )
-            context["project"] = dict(project_row) if project_row else {}
-
-            # ORDER履歴（全件）
-            order_rows = fetch_all(
-                conn,
-                """
-                SELECT id, title, priority, status, started_at, completed_at, created_at
-                FROM orders
-                WHERE project_id = ?
-                ORDER BY created_at ASC
-                """,
-                (self.project_id,),
-            )
-            context["orders"] = rows_to_dicts(order_rows)
-
-            # タスク完了状況（ORDERごとの集計）
-            task_stats_rows = fetch_all(
-                conn,
-                """
-                SELECT
-                    order_id,
-                    COUNT(*) AS total,
-                    SUM(CASE WHEN status = 'COMPLETED' THEN 1 ELSE 0 END) AS completed,
-                    SUM(CASE WHEN status IN ('QUEUED', 'IN_PROGRESS', 'BLOCKED', 'REWORK') THEN 1 ELSE 0 END) AS in_progress
-                FROM tasks
-                WHERE project_id = ?
-                GROUP BY order_id
-                """,
-                (self.project_id,),
-            )
-            context["task_stats_by_order"] = rows_to_dicts(task_stats_rows)
-
-            # 全タスク合計
-            total_row = fetch_one(
-                conn,
-                "SELECT COUNT(*) AS total FROM tasks WHERE project_id = ?",
-                (self.project_id,),
-            )
-            completed_row = fetch_one(
-                conn,
-                "SELECT COUNT(*) AS cnt FROM tasks WHERE project_id = ? AND status = 'COMPLETED'",
-                (self.project_id,),
-            )
-            context["total_task_count"] = total_row["total"] if total_row else 0
-            context["completed_task_count"] = completed_row["cnt"] if completed_row else 0
-
-            # バックログ件数
-            backlog_row = fetch_one(
-                conn,
-                "SELECT COUNT(*) AS cnt FROM backlog_items WHERE project_id = ? AND status != 'DONE'",
-                (self.project_id,),
-            )
-            context["pending_backlog_count"] = backlog_row["cnt"] if backlog_row else 0
-
-        finally:
-            conn.close()
+        if db_context is None:
+            conn = get_connection()
+            try:
+                db_context = collect_db_contexts(conn, [self.project_id])[self.project_id]
+            finally:
+                conn.close()
+        context: Dict[str, Any] = dict(db_context)
 
         # RESULTディレクトリのファイル一覧収集
         result_files = self._collect_result_files()
@@ -289,6 +393,46 @@ class ProjectInfoRefresher:
 
         return context
 
+    def _context_digest(self, context: Dict[str, Any]) -> str:
+        """PROJECT_INFO.md 以外の入力のダイジェスト"""
+        inputs = {k: v for k, v in context.items() if k not in _DIGEST_EXCLUDED_KEYS}
+        return _sha256_text(json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str))
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        """前回の最新化の状態を読み込む（存在しない・破損時はNone）"""
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+            return None
+        return state
+
+    def _is_unchanged(self, digest: str) -> bool:
+        """入力ダイジェストが前回と同じで、PROJECT_INFO.md も前回の出力のままか"""
+        state = self._load_state()
+        if state is None or state.get("context_digest") != digest:
+            return False
+        try:
+            current = self.project_info_path.read_text(encoding="utf-8")
+        except OSError:
+            return False
+        return _sha256_text(current) == state.get("output_digest")
+
+    def _save_state(self, digest: str, content: str) -> None:
+        """今回の入力ダイジェストと出力ハッシュを保存する"""
+        state = {
+            "version": STATE_VERSION,
+            "context_digest": digest,
+            "output_digest": _sha256_text(content),
+            "model": self.model,
+            "refreshed_at": datetime.now().isoformat(),
+        }
+        try:
+            _write_atomic(self.state_path, json.dumps(state, ensure_ascii=False, indent=2))
+        except OSError as e:
+            logger.warning(f"最新化状態の保存に失敗（次回は再生成されます）: {e}")
+
     def _collect_result_files(self) -> List[Dict[str, str]]:
         """RESULTディレクトリ配下の主要ファイル一覧を収集"""
         files = []
@@ -466,8 +610,8 @@ class ProjectInfoRefresher:
             except Exception as e:
                 logger.warning(f"バックアップ作成失敗（処理を継続）: {e}")
 
-        # 上書き保存
-        self.project_info_path.write_text(content, encoding="utf-8")
+        # 上書き保存（一時ファイル経由で置き換え）
+        _write_atomic(self.project_info_path, content)
         logger.info(f"PROJECT_INFO.md 保存完了: {len(content)} bytes")
 
 
@@ -481,6 +625,7 @@ def refresh_project_info(
     model: str = "sonnet",
     timeout: int = 600,
     skip_ai: bool = False,
+    force: bool = False,
 ) -> Dict[str, Any]:
     """
     プロジェクト情報を最新化する（Python API）
@@ -490,6 +635,7 @@ def refresh_project_info(
         model: AIモデル
         timeout: タイムアウト秒数
         skip_ai: AI処理をスキップするか
+        force: 入力に変更がなくても再生成するか
 
     Returns:
         処理結果の辞書
@@ -499,10 +645,95 @@ def refresh_project_info(
         model=model,
         timeout=timeout,
         skip_ai=skip_ai,
+        force=force,
     )
     return refresher.refresh()
 
 
+def refresh_projects(
+    project_ids: Optional[Sequence[str]] = None,
+    *,
+    model: str = "sonnet",
+    timeout: int = 600,
+    skip_ai: bool = False,
+    force: bool = False,
+    max_workers: int = DEFAULT_REFRESH_WORKERS,
+) -> Dict[str, Any]:
+    """
+    複数プロジェクトの情報をまとめて最新化する（Python API）
+
+    DBコンテキストは1つの接続でグループ化クエリにより収集し、
+    各プロジェクトのRESULT走査・AI呼び出しは max_workers 並列で実行する。
+
+    Args:
+        project_ids: プロジェクトIDのリスト（Noneの場合は全アクティブプロジェクト）
+        model: AIモデル
+        timeout: タイムアウト秒数（プロジェクトごと）
+        skip_ai: AI処理をスキップするか
+        force: 入力に変更がなくても再生成するか
+        max_workers: 並列数
+
+    Returns:
+        {"success": bool, "total": int, "refreshed": [...], "skipped": [...],
+         "failed": [...], "projects": [各プロジェクトの処理結果]}
+    """
+    conn = get_connection()
+    try:
+        if project_ids is None:
+            project_ids = get_active_project_ids(conn)
+        project_ids = list(dict.fromkeys(project_ids))
+
+        errors: Dict[str, str] = {}
+        for project_id in project_ids:
+            try:
+                validate_project_name(project_id)
+            except ValidationError as e:
+                errors[project_id] = f"入力検証エラー: {e}"
+
+        db_contexts = collect_db_contexts(
+            conn, [project_id for project_id in project_ids if project_id not in errors]
+        )
+    finally:
+        conn.close()
+
+    for project_id, context in db_contexts.items():
+        if not context["project"]:
+            errors[project_id] = f"プロジェクトが見つかりません: {project_id}"
+    valid = [project_id for project_id in project_ids if project_id not in errors]
+
+    refreshers = [
+        ProjectInfoRefresher(project_id, model=model, timeout=timeout, skip_ai=skip_ai, force=force)
+        for project_id in valid
+    ]
+    outcomes: Dict[str, Dict[str, Any]] = {}
+    if refreshers:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(refreshers)))) as executor:
+            for refresher, outcome in zip(
+                refreshers,
+                executor.map(lambda r: r.refresh(db_context=db_contexts[r.project_id]), refreshers),
+            ):
+                outcomes[refresher.project_id] = outcome
+
+    projects = []
+    for project_id in project_ids:
+        if project_id in errors:
+            projects.append({"project_id": project_id, "success": False, "error": errors[project_id]})
+        else:
+            projects.append(outcomes[project_id])
+
+    return {
+        "success": all(p["success"] for p in projects),
+        "total": len(projects),
+        "refreshed": [
+            p["project_id"] for p in projects
+            if p["success"] and not p.get("skipped") and not p.get("skipped_ai")
+        ],
+        "skipped": [p["project_id"] for p in projects if p.get("skipped")],
+        "failed": [p["project_id"] for p in projects if not p["success"]],
+        "projects": projects,
+    }
+
+
 def main():
     """CLI エントリーポイント"""
     setup_utf8_output()
@@ -513,7 +744,7 @@ def main():
         epilog=__doc__,
     )
 
-    parser.add_argument("project_id", help="プロジェクトID")
+    parser.add_argument("project_ids", nargs="*", metavar="project_id", help="プロジェクトID（複数指定可）")
     parser.add_argument(
         "--model",
         default="sonnet",
@@ -530,27 +761,71 @@ def main():
         action="store_true",
         help="AI処理をスキップ（コンテキスト収集のみ）",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="入力に変更がなくても再生成する",
+    )
+    parser.add_argument("--all", action="store_true", help="全アクティブプロジェクトを最新化")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_REFRESH_WORKERS,
+        help=f"AI呼び出しの並列数（デフォルト: {DEFAULT_REFRESH_WORKERS}）",
+    )
     parser.add_argument("--json", action="store_true", help="JSON形式で出力")
     parser.add_argument("--verbose", "-v", action="store_true", help="詳細ログ出力")
 
     args = parser.parse_args()
+    if not args.all and not args.project_ids:
+        parser.error("PROJECT_ID または --all を指定してください")
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     try:
+        if args.all or len(args.project_ids) > 1:
+            batch = refresh_projects(
+                None if args.all else args.project_ids,
+                model=args.model,
+                timeout=args.timeout,
+                skip_ai=args.skip_ai,
+                force=args.force,
+                max_workers=args.workers,
+            )
+            if args.json:
+                print(json.dumps(batch, ensure_ascii=False, indent=2, default=str))
+            else:
+                print(
+                    f"[OK] {batch['total']}件中 最新化 {len(batch['refreshed'])}件 / "
+                    f"変更なし {len(batch['skipped'])}件 / 失敗 {len(batch['failed'])}件"
+                )
+                for project in batch["projects"]:
+                    if not project["success"]:
+                        print(
+                            f"[ERROR] {project['project_id']}: {project.get('error', '不明')}",
+                            file=sys.stderr,
+                        )
+            if not batch["success"]:
+                sys.exit(1)
+            return
+
         result = refresh_project_info(
-            args.project_id,
+            args.project_ids[0],
             model=args.model,
             timeout=args.timeout,
             skip_ai=args.skip_ai,
+            force=args.force,
         )
 
         if args.json:
             print(json.dumps(result, ensure_ascii=False, indent=2, default=str))
         else:
             if result["success"]:
-                print(f"[OK] プロジェクト情報を最新化しました: {result['project_id']}")
+                if result.get("skipped"):
+                    print(f"[OK] 入力に変更がないため最新化をスキップしました: {result['project_id']}")
+                else:
+                    print(f"[OK] プロジェクト情報を最新化しました: {result['project_id']}")
                 print(f"  PROJECT_INFO.md: {result.get('project_info_path', '')}")
                 summary = result.get("context_summary", {})
                 print(f"  収集したORDER数: {summary.get('order_count', 0)}件")
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Static Analysis Result Cache
+
+静的解析の結果を static_analysis_cache テーブルにキャッシュするモジュール。
+キーは (ツール, 内容ハッシュ, ツールバージョン, 設定ハッシュ) で、
+前回の解析から変更されていないファイルはツールを再実行せずに結果を再利用する。
+
+内容ハッシュ:
+    - ファイル単位のツール（ruff, eslint）: 対象ファイル内容の SHA-256
+    - ファイル横断のツール（mypy, tsc）: 解析対象ファイル群（パスと内容ハッシュ）の SHA-256
+
+ツール検出結果（利用可否・コマンド・バージョン）は static_analysis_tools テーブルに
+プロジェクトルートごとに保存し、Worker プロセス間で共有する。
+
+Usage:
+    from quality.analysis_cache import AnalysisCache
+
+    cache = AnalysisCache()  # DB・テーブルがなければ無効（常にミス）
+    hit = cache.get_many("ruff", "0.4.0", config_hash, [content_hash])
+    cache.put_many("ruff", "0.4.0", config_hash, [(content_hash, "src/a.py", issues)])
+    env = cache.get_environment("/path/to/project", fingerprint, max_age_seconds=600)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# パス設定
+_package_root = Path(__file__).resolve().parent.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils.db import get_connection, table_exists
+
+logger = logging.getLogger(__name__)
+
+# 最終利用からこの日数を過ぎたエントリは put_many() 時に削除する
+CACHE_MAX_AGE_DAYS = 30
+
+# IN 句1回あたりのキー数（SQLite の変数上限対策）
+_LOOKUP_CHUNK = 500
+
+
+def hash_bytes(data: bytes) -> str:
+    """バイト列の SHA-256 を返す。"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: Path) -> Optional[str]:
+    """ファイル内容の SHA-256 を返す。
+
+    Args:
+        path: ファイルパス
+
+    Returns:
+        16進ダイジェスト。読み込めない場合None（キャッシュ対象外）
+    """
+    try:
+        return hash_bytes(path.read_bytes())
+    except OSError:
+        return None
+
+
+def hash_files(paths: Iterable[Path]) -> str:
+    """設定ファイル群のハッシュを返す。
+
+    存在しないファイルも「存在しない」ことをハッシュに含めるため、
+    設定ファイルの追加・削除でもハッシュが変わる。
+
+    Args:
+        paths: 設定ファイルパス
+
+    Returns:
+        16進ダイジェスト
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((hash_file(path) or "-").encode("ascii"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """static_analysis_cache テーブルへのアクセス。
+
+    DBファイルまたはテーブルが存在しない場合は無効になり、
+    get_many() は常に空、put_many() は何もしない（DBを新規作成しない）。
+
+    Attributes:
+        db_path: DBファイルパス（Noneの場合はデフォルト）
+        enabled: キャッシュが利用可能か
+        tools_enabled: ツール検出結果テーブル（static_analysis_tools）が利用可能か
+    """
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        """DBとテーブルの存在を確認する。
+
+        Args:
+            db_path: DBファイルパス（Noneの場合は config のデフォルトパス）
+        """
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.tools_enabled = False
+        self.enabled = self._probe()
+
+    def _probe(self) -> bool:
+        """キャッシュテーブルが利用可能か確認する。"""
+        try:
+            if self.db_path is None:
+                from config.db_config import get_db_path
+                path = get_db_path()
+            else:
+                path = self.db_path
+            if not path.exists():
+                return False
+            conn = get_connection(path)
+            try:
+                self.tools_enabled = table_exists(conn, "static_analysis_tools")
+                return table_exists(conn, "static_analysis_cache")
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.debug("static analysis cache unavailable: %s", e)
+            return False
+
+    def get_many(
+        self,
+        tool: str,
+        tool_version: str,
+        config_hash: str,
+        content_hashes: Sequence[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """キャッシュ済みの解析結果を取得する。
+
+        Args:
+            tool: ツール名
+            tool_version: ツールバージョン
+            config_hash: 設定ハッシュ
+            content_hashes: 内容ハッシュのリスト
+
+        Returns:
+            内容ハッシュ -> 問題（AnalysisIssue.to_dict() 形式）のリスト
+        """
+        if not self.enabled or not content_hashes:
+            return {}
+
+        keys = list(dict.fromkeys(content_hashes))
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        try:
+            conn = get_connection(self.db_path)
+            try:
+                for start in range(0, len(keys), _LOOKUP_CHUNK):
+                    chunk = keys[start:start + _LOOKUP_CHUNK]
+                    rows = conn.execute(
+                        f"""
+                        SELECT content_hash, issues_json FROM static_analysis_cache
+                        WHERE tool = ? AND tool_version = ? AND config_hash = ?
+                        AND content_hash IN ({','.join('?' for _ in chunk)})
+                        """,
+                        (tool, tool_version, config_hash, *chunk),
+                    ).fetchall()
+                    for row in rows:
+                        found[row["content_hash"]] = json.loads(row["issues_json"])
+                if found:
+                    conn.execute(
+                        f"""
+                        UPDATE static_analysis_cache SET last_used_at = CURRENT_TIMESTAMP
+                        WHERE tool = ? AND tool_version = ? AND config_hash = ?
+                        AND content_hash IN ({','.join('?' for _ in found)})
+                        """,
+                        (tool, tool_version, config_hash, *found),
+                    )
+                    conn.commit()
+            finally:
+                conn.close()
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("static analysis cache lookup failed: %s", e)
+            return {}
+        return found
+
+    def put_many(
+        self,
+        tool: str,
+        tool_version: str,
+        config_hash: str,
+        entries: Sequence[Tuple[str, str, List[Dict[str, Any]]]],
+    ) -> int:
+        """解析結果を保存する。
+
+        Args:
+            tool: ツール名
+            tool_version: ツールバージョン
+            config_hash: 設定ハッシュ
+            entries: (内容ハッシュ, ファイルパス, 問題リスト) のリスト
+
+        Returns:
+            保存した件数
+        """
+        if not self.enabled or not entries:
+            return 0
+
+        try:
+            conn = get_connection(self.db_path)
+            try:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO static_analysis_cache
+                        (tool, content_hash, tool_version, config_hash, file_path, issues_json,
+                         created_at, last_used_at)
+                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                    """,
+                    [
+                        (tool, content_hash, tool_version, config_hash, file_path,
+                         json.dumps(issues, ensure_ascii=False))
+                        for content_hash, file_path, issues in entries
+                    ],
+                )
+                conn.execute(
+                    "DELETE FROM static_analysis_cache WHERE last_used_at < datetime('now', ?)",
+                    (f"-{CACHE_MAX_AGE_DAYS} days",),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("static analysis cache store failed: %s", e)
+            return 0
+        return len(entries)
+
+    def get_environment(
+        self,
+        project_root: str,
+        fingerprint: str,
+        max_age_seconds: float,
+    ) -> Optional[Dict[str, Any]]:
+        """保存済みのツール検出結果を取得する。
+
+        Args:
+            project_root: プロジェクトルート
+            fingerprint: 検出結果に影響する環境のハッシュ
+            max_age_seconds: 有効期間（秒）
+
+        Returns:
+            {"tools", "commands", "versions", "age_seconds"} の辞書。
+            未保存・フィンガープリント不一致・期限切れの場合None
+        """
+        if not self.tools_enabled:
+            return None
+
+        try:
+            conn = get_connection(self.db_path)
+            try:
+                row = conn.execute(
+                    """
+                    SELECT tools_json, commands_json, versions_json,
+                           (julianday('now') - julianday(detected_at)) * 86400 AS age_seconds
+                    FROM static_analysis_tools
+                    WHERE project_root = ? AND fingerprint = ?
+                    """,
+                    (project_root, fingerprint),
+                ).fetchone()
+            finally:
+                conn.close()
+            if row is None or not 0 <= row["age_seconds"] < max_age_seconds:
+                return None
+            return {
+                "tools": json.loads(row["tools_json"]),
+                "commands": json.loads(row["commands_json"]),
+                "versions": json.loads(row["versions_json"]),
+                "age_seconds": row["age_seconds"],
+            }
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("static analysis tool lookup failed: %s", e)
+            return None
+
+    def put_environment(
+        self,
+        project_root: str,
+        fingerprint: str,
+        tools: Dict[str, bool],
+        commands: Dict[str, List[str]],
+    ) -> bool:
+        """ツール検出結果を保存する（バージョンはリセットされる）。
+
+        Args:
+            project_root: プロジェクトルート
+            fingerprint: 検出結果に影響する環境のハッシュ
+            tools: ツール名 -> 利用可否
+            commands: ツール名 -> 実行コマンド
+
+        Returns:
+            保存できたか
+        """
+        if not self.tools_enabled:
+            return False
+
+        try:
+            conn = get_connection(self.db_path)
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO static_analysis_tools
+                        (project_root, fingerprint, tools_json, commands_json, versions_json,
+                         detected_at)
+                    VALUES (?, ?, ?, ?, '{}', CURRENT_TIMESTAMP)
+                    """,
+                    (project_root, fingerprint, json.dumps(tools), json.dumps(commands)),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("static analysis tool store failed: %s", e)
+            return False
+        return True
+
+    def put_tool_version(
+        self,
+        project_root: str,
+        fingerprint: str,
+        tool: str,
+        version: Optional[str],
+    ) -> bool:
+        """ツールバージョンを検出結果に追記する。
+
+        ツールは並列に実行されるため、行全体ではなく json_set で1ツール分だけ更新する。
+        フィンガープリントが変わっている（別プロセスが再検出した）場合は何もしない。
+
+        Args:
+            project_root: プロジェクトルート
+            fingerprint: 検出結果に影響する環境のハッシュ
+            tool: ツール名
+            version: バージョン（取得できなかった場合None）
+
+        Returns:
+            更新できたか
+        """
+        if not self.tools_enabled:
+            return False
+
+        try:
+            conn = get_connection(self.db_path)
+            try:
+                cursor = conn.execute(
+                    """
+                    UPDATE static_analysis_tools
+                    SET versions_json = json_set(versions_json, '$.' || ?, ?)
+                    WHERE project_root = ? AND fingerprint = ?
+                    """,
+                    (tool, version, project_root, fingerprint),
+                )
+                conn.commit()
+                return cursor.rowcount > 0
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("static analysis tool version store failed: %s", e)
+            return False
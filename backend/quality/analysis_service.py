@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Project Analysis Service
+
+プロジェクト単位で ruff / mypy の実行を引き受ける解析サービス。
+並列Workerがそれぞれ mypy をコールドに起動して状態を作り直すのを避けるため、
+mypy は常駐デーモン（dmypy）で実行し、同一プロジェクトへの同時要求は直列化する。
+
+実行方式:
+    - mypy: dmypy があれば `dmypy run` で常駐デーモンを使う（フラグの組ごとに1デーモン、
+      DAEMON_IDLE_TIMEOUT_SECONDS 無操作で終了）。なければ `--cache-dir` を
+      プロジェクト単位で共有したインクリメンタル mypy で実行する。
+      いずれもプロセス内ロック + プロセス間ロックファイルで直列化する。
+    - ruff: 常駐モードはないため、`--cache-dir` をプロジェクト単位で共有して実行する。
+
+結果は static_analyzer の AnalysisIssue に変換して返す。
+static_analyzer.StaticAnalyzer と worker/self_verification.SelfVerificationRunner から使用する。
+
+Usage:
+    from quality.analysis_service import get_service
+
+    service = get_service("/path/to/project")
+    result = service.run_mypy(["--show-column-numbers"], ["src/main.py"])
+    print(result.mode, result.issues)
+
+    # コールド / ウォームのレイテンシ比較
+    python backend/quality/analysis_service.py --benchmark --project-root /path/to/project src/main.py
+    # 常駐デーモンの停止
+    python backend/quality/analysis_service.py --stop --project-root /path/to/project
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# パス設定
+_package_root = Path(__file__).resolve().parent.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from quality.static_analyzer import (
+    TOOL_ARGS,
+    TOOL_TIMEOUT_SECONDS,
+    AnalysisIssue,
+    parse_mypy_output,
+    parse_ruff_json,
+    parse_ruff_text,
+)
+
+logger = logging.getLogger(__name__)
+
+# dmypy デーモンの無操作タイムアウト（秒）
+DAEMON_IDLE_TIMEOUT_SECONDS = 1800
+
+# 直列化ロックの待機上限（秒）
+LOCK_TIMEOUT_SECONDS = 300
+
+# ロック待機のポーリング間隔（秒）
+_LOCK_POLL_SECONDS = 0.05
+
+Runner = Callable[[List[str]], subprocess.CompletedProcess]
+
+
+@dataclass
+class ServiceResult:
+    """解析サービスの実行結果。
+
+    Attributes:
+        tool: "ruff" or "mypy"
+        mode: "daemon"（常駐 dmypy）/ "incremental"（共有キャッシュの mypy）/ "cached"（ruff）
+        process: ツールの実行結果
+        issues: 出力をパースした AnalysisIssue のリスト
+        duration_seconds: ロック待ちを除く実行時間
+        lock_wait_seconds: 直列化ロックの待ち時間
+    """
+
+    tool: str
+    mode: str
+    process: subprocess.CompletedProcess
+    issues: List[AnalysisIssue] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    lock_wait_seconds: float = 0.0
+
+    @property
+    def returncode(self) -> int:
+        return self.process.returncode
+
+    @property
+    def output(self) -> str:
+        return (self.process.stdout or "") + (self.process.stderr or "")
+
+
+class _InterProcessLock:
+    """ロックファイルによるプロセス間排他（POSIX: fcntl, Windows: msvcrt）。"""
+
+    def __init__(self, path: Path, timeout: float = LOCK_TIMEOUT_SECONDS) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._handle = None
+
+    def __enter__(self) -> "_InterProcessLock":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(self.path, "a+b")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._try_lock(handle)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    handle.close()
+                    raise TimeoutError(f"analysis service lock timed out: {self.path}")
+                time.sleep(_LOCK_POLL_SECONDS)
+        self._handle = handle
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        handle, self._handle = self._handle, None
+        if handle is None:
+            return
+        try:
+            if os.name == "nt":
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            handle.close()
+
+    @staticmethod
+    def _try_lock(handle) -> None:
+        if os.name == "nt":
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class AnalysisService:
+    """プロジェクト単位の解析サービス。
+
+    Attributes:
+        project_root: ツールを実行するディレクトリ（デーモン・キャッシュの単位）
+        use_daemon: dmypy が使える場合に常駐デーモンを使うか
+        idle_timeout: dmypy デーモンの無操作タイムアウト（秒）
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        use_daemon: bool = True,
+        idle_timeout: int = DAEMON_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        self.project_root = Path(project_root).resolve()
+        self.use_daemon = use_daemon
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._key = _digest(str(self.project_root))
+        self._lock_path = Path(tempfile.gettempdir()) / f"aipm_analysis_{self._key}.lock"
+        self._status_files: Dict[str, Path] = {}
+
+    @property
+    def daemon_available(self) -> bool:
+        """dmypy を使えるか。"""
+        return self.use_daemon and shutil.which("dmypy") is not None
+
+    @property
+    def mypy_cache_dir(self) -> Path:
+        """共有する mypy インクリメンタルキャッシュ。"""
+        return self.project_root / ".mypy_cache"
+
+    @property
+    def ruff_cache_dir(self) -> Path:
+        """共有する ruff キャッシュ。"""
+        return self.project_root / ".ruff_cache"
+
+    def status_file(self, flags: List[str]) -> Path:
+        """フラグの組に対応する dmypy ステータスファイル（プロジェクト外の一時ディレクトリ）。"""
+        key = json.dumps(flags)
+        if key not in self._status_files:
+            name = f"aipm_dmypy_{self._key}_{_digest(key)}.json"
+            self._status_files[key] = Path(tempfile.gettempdir()) / name
+        return self._status_files[key]
+
+    def mypy_command(self, flags: List[str], paths: List[str]) -> List[str]:
+        """mypy 要求を実行するコマンド。"""
+        if self.daemon_available:
+            return [
+                "dmypy", "--status-file", str(self.status_file(flags)),
+                "run", "--timeout", str(self.idle_timeout), "--",
+            ] + flags + paths
+        return ["mypy", "--cache-dir", str(self.mypy_cache_dir)] + flags + paths
+
+    def run_mypy(
+        self,
+        flags: List[str],
+        paths: List[str],
+        runner: Optional[Runner] = None,
+    ) -> ServiceResult:
+        """mypy 要求を直列化して実行する。
+
+        dmypy が異常終了（exit code 2 以上）した場合は、その要求だけ共有キャッシュの
+        mypy で実行し直す。
+
+        Args:
+            flags: mypy のフラグ
+            paths: 対象ファイル・ディレクトリ
+            runner: コマンド実行関数（Noneの場合 project_root で subprocess.run）
+
+        Returns:
+            ServiceResult
+        """
+        runner = runner or self._default_runner
+        requested = time.monotonic()
+        with self._lock, _InterProcessLock(self._lock_path):
+            started = time.monotonic()
+            cmd = self.mypy_command(flags, paths)
+            mode = "daemon" if cmd[0] == "dmypy" else "incremental"
+            logger.debug("Running %s: %s", mode, " ".join(cmd))
+            proc = runner(cmd)
+            if mode == "daemon" and proc.returncode not in (0, 1):
+                logger.warning(
+                    "dmypy failed with exit code %d, falling back to mypy: %s",
+                    proc.returncode, (proc.stderr or proc.stdout or "").strip()[:200],
+                )
+                mode = "incremental"
+                proc = runner(["mypy", "--cache-dir", str(self.mypy_cache_dir)] + flags + paths)
+            finished = time.monotonic()
+        return ServiceResult(
+            tool="mypy",
+            mode=mode,
+            process=proc,
+            issues=parse_mypy_output(proc.stdout or ""),
+            duration_seconds=finished - started,
+            lock_wait_seconds=started - requested,
+        )
+
+    def run_ruff(self, args: List[str], runner: Optional[Runner] = None) -> ServiceResult:
+        """ruff をプロジェクト共有のキャッシュで実行する（ruff 自体が並行実行に安全なため直列化しない）。
+
+        Args:
+            args: ruff の引数（例: ["check", "--output-format", "json", "src/a.py"]）
+            runner: コマンド実行関数
+
+        Returns:
+            ServiceResult
+        """
+        runner = runner or self._default_runner
+        cmd = ["ruff"] + args[:1] + ["--cache-dir", str(self.ruff_cache_dir)] + args[1:]
+        started = time.monotonic()
+        proc = runner(cmd)
+        stdout = proc.stdout or ""
+        is_json = "--output-format" in args[:-1] and args[args.index("--output-format") + 1] == "json"
+        issues = parse_ruff_json(stdout) if is_json else parse_ruff_text(stdout)
+        return ServiceResult(
+            tool="ruff",
+            mode="cached",
+            process=proc,
+            issues=issues,
+            duration_seconds=time.monotonic() - started,
+        )
+
+    def stop(self) -> List[str]:
+        """このプロジェクトの dmypy デーモン（全フラグの組）を停止する。
+
+        Returns:
+            停止したステータスファイルのパス
+        """
+        stopped = []
+        if shutil.which("dmypy") is None:
+            return stopped
+        pattern = f"aipm_dmypy_{self._key}_*.json"
+        for status_file in sorted(Path(tempfile.gettempdir()).glob(pattern)):
+            try:
+                subprocess.run(
+                    ["dmypy", "--status-file", str(status_file), "stop"],
+                    capture_output=True, text=True, timeout=30, cwd=str(self.project_root),
+                )
+                stopped.append(str(status_file))
+            except (subprocess.TimeoutExpired, OSError) as e:
+                logger.warning("dmypy stop failed: %s", e)
+        return stopped
+
+    def _default_runner(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=TOOL_TIMEOUT_SECONDS,
+            cwd=str(self.project_root),
+        )
+
+
+_services: Dict[str, AnalysisService] = {}
+_services_lock = threading.Lock()
+
+
+def get_service(project_root) -> AnalysisService:
+    """プロジェクトルートごとの解析サービス（プロセス内で共有）。"""
+    key = str(Path(project_root).resolve())
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = AnalysisService(Path(key))
+        return service
+
+
+def stop_all() -> List[str]:
+    """プロセス内の全サービスの dmypy デーモンを停止する。"""
+    with _services_lock:
+        services = list(_services.values())
+    stopped = []
+    for service in services:
+        stopped.extend(service.stop())
+    return stopped
+
+
+def benchmark(
+    project_root: Path,
+    files: List[str],
+    runs: int = 3,
+    flags: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """コールド実行（Workerごとの mypy 起動）と常駐サービスのレイテンシを比較する。
+
+    Args:
+        project_root: プロジェクトルート
+        files: 解析対象ファイル
+        runs: 各方式の計測回数
+        flags: mypy フラグ（Noneの場合 StaticAnalyzer と同じ）
+
+    Returns:
+        計測結果（ミリ秒）と、両方式の解析結果が一致したか
+    """
+    flags = list(TOOL_ARGS["mypy"] if flags is None else flags)
+    root = Path(project_root).resolve()
+
+    def run(cmd: List[str]) -> subprocess.CompletedProcess:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=TOOL_TIMEOUT_SECONDS, cwd=str(root))
+
+    cold_ms = []
+    cold_issues = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        proc = run(["mypy"] + flags + files)
+        cold_ms.append((time.perf_counter() - started) * 1000)
+        cold_issues = parse_mypy_output(proc.stdout or "")
+
+    service = AnalysisService(root)
+    warm_ms = []
+    warm_result = None
+    try:
+        # 1回目はデーモン起動を含む
+        started = time.perf_counter()
+        warm_result = service.run_mypy(flags, files, run)
+        first_ms = (time.perf_counter() - started) * 1000
+        for _ in range(runs):
+            started = time.perf_counter()
+            warm_result = service.run_mypy(flags, files, run)
+            warm_ms.append((time.perf_counter() - started) * 1000)
+    finally:
+        service.stop()
+
+    cold_median = statistics.median(cold_ms)
+    warm_median = statistics.median(warm_ms)
+    return {
+        "files": len(files),
+        "runs": runs,
+        "mode": warm_result.mode,
+        "cold_ms": round(cold_median, 1),
+        "warm_first_ms": round(first_ms, 1),
+        "warm_ms": round(warm_median, 1),
+        "speedup": round(cold_median / warm_median, 2) if warm_median > 0 else None,
+        "results_match": [i.to_dict() for i in cold_issues] == [i.to_dict() for i in warm_result.issues],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="プロジェクト単位の ruff / mypy 解析サービス")
+    parser.add_argument("files", nargs="*", help="解析対象ファイル")
+    parser.add_argument("--project-root", default=".", help="プロジェクトルート")
+    parser.add_argument("--benchmark", action="store_true", help="コールド / ウォームのレイテンシを比較")
+    parser.add_argument("--runs", type=int, default=3, help="ベンチマークの計測回数")
+    parser.add_argument("--stop", action="store_true", help="常駐 dmypy デーモンを停止")
+    parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+    args = parser.parse_args()
+
+    service = get_service(args.project_root)
+    if args.stop:
+        print(json.dumps({"stopped": service.stop()}, ensure_ascii=False))
+        return
+
+    if not args.files:
+        parser.error("解析対象ファイルを指定してください")
+
+    if args.benchmark:
+        result = benchmark(Path(args.project_root), args.files, runs=args.runs)
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        else:
+            print(f"mode: {result['mode']}  files: {result['files']}  runs: {result['runs']}")
+            print(f"cold (mypy per request): {result['cold_ms']:.1f} ms")
+            print(f"warm first request:      {result['warm_first_ms']:.1f} ms")
+            print(f"warm (service):          {result['warm_ms']:.1f} ms")
+            print(f"speedup: {result['speedup']}x  results match: {result['results_match']}")
+        return
+
+    result = service.run_mypy(list(TOOL_ARGS["mypy"]), args.files)
+    if args.json:
+        print(json.dumps({
+            "mode": result.mode,
+            "returncode": result.returncode,
+            "duration_seconds": round(result.duration_seconds, 3),
+            "issues": [issue.to_dict() for issue in result.issues],
+        }, ensure_ascii=False, indent=2))
+    else:
+        print(result.output, end="")
+    sys.exit(result.returncode)
+
+
+if __name__ == "__main__":
+    main()
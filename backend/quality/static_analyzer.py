@@ -6,6 +6,13 @@ Worker完了後に成果物ファイルに対して静的解析を自動実行
 利用可能なツール（ruff, mypy, tsc, eslint）を自動検出し、
 検出されたツールで解析を実行する。
 
+高速化:
+    - ツールは並列に実行する（結果の順序はツール順で固定）
+    - ツール検出結果とツールバージョンはプロジェクトルートごとに static_analysis_tools テーブルへ
+      保存し、Worker プロセス間で共有する（DETECTION_CACHE_TTL_SECONDS）
+    - 解析結果は static_analysis_cache テーブルに (内容ハッシュ, ツールバージョン, 設定ハッシュ)
+      をキーにキャッシュし、変更されたファイルだけを再解析する（quality/analysis_cache.py）
+
 Usage:
     from quality.static_analyzer import StaticAnalyzer
 
@@ -23,17 +30,98 @@ import logging
 import os
 import platform
 import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from quality.analysis_cache import AnalysisCache, hash_bytes, hash_file, hash_files
 
 logger = logging.getLogger(__name__)
 
 # ツール実行タイムアウト（秒）
 TOOL_TIMEOUT_SECONDS = 60
 
+# バージョン確認のタイムアウト（秒）
+VERSION_TIMEOUT_SECONDS = 15
+
+# ツール検出結果のキャッシュ有効期間（秒）
+DETECTION_CACHE_TTL_SECONDS = 600
+
+# 並列実行するツール数
+ANALYSIS_MAX_WORKERS = 4
+
+# ツールの実行順（結果の並び順）
+TOOL_ORDER = ("ruff", "mypy", "tsc", "eslint")
+
+# ファイル横断で解析するツール（対象ファイル群をまとめてキャッシュする）
+CROSS_FILE_TOOLS = frozenset({"mypy", "tsc"})
+
+# コマンド引数（設定ハッシュにも含める）
+TOOL_ARGS: Dict[str, List[str]] = {
+    "ruff": ["check", "--output-format", "json"],
+    "mypy": [
+        "--no-color-output",
+        "--show-column-numbers",
+        "--no-error-summary",
+        "--ignore-missing-imports",
+    ],
+    "tsc": ["--noEmit", "--pretty", "false"],
+    "eslint": ["--format", "json"],
+}
+
+ESLINT_CONFIG_FILES = (
+    ".eslintrc",
+    ".eslintrc.js",
+    ".eslintrc.cjs",
+    ".eslintrc.json",
+    ".eslintrc.yml",
+    ".eslintrc.yaml",
+    "eslint.config.js",
+    "eslint.config.mjs",
+    "eslint.config.cjs",
+    "eslint.config.ts",
+)
+
+# ツールごとの設定ファイル（プロジェクトルート直下、設定ハッシュの対象）
+TOOL_CONFIG_FILES: Dict[str, Tuple[str, ...]] = {
+    "ruff": ("pyproject.toml", "ruff.toml", ".ruff.toml"),
+    "mypy": ("mypy.ini", ".mypy.ini", "setup.cfg", "pyproject.toml"),
+    "tsc": ("tsconfig.json", "package.json"),
+    "eslint": ESLINT_CONFIG_FILES + ("package.json",),
+}
+
+
+@dataclass
+class _ToolEnvironment:
+    """プロジェクトルートごとのツール検出結果（キャッシュエントリ）。"""
+
+    tools: Dict[str, bool]
+    commands: Dict[str, List[str]]
+    fingerprint: Tuple[Any, ...]
+    detected_at: float
+    versions: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+_detection_cache: Dict[str, _ToolEnvironment] = {}
+_detection_lock = threading.Lock()
+
+
+def clear_detection_cache() -> None:
+    """ツール検出結果のキャッシュ（プロセス内）を破棄する。"""
+    with _detection_lock:
+        _detection_cache.clear()
+
+
+def _fingerprint_hash(fingerprint: Tuple[Any, ...]) -> str:
+    """検出フィンガープリントのハッシュ（static_analysis_tools のキー）。"""
+    return hash_bytes(json.dumps(list(fingerprint)).encode("utf-8"))
+
 
 @dataclass
 class AnalysisIssue:
@@ -70,6 +158,128 @@ class AnalysisResult:
         return asdict(self)
 
 
+# mypy 出力形式: file.py:line:col: severity: message
+# 例: src/main.py:10:5: error: Incompatible types in assignment
+_MYPY_LINE = re.compile(r"^(.+?):(\d+):(\d+):\s*(error|warning|note):\s*(.+)$")
+
+# ruff テキスト出力形式: file.py:line:col: CODE message
+# 例: src/main.py:1:8: F401 [*] `os` imported but unused
+_RUFF_TEXT_LINE = re.compile(r"^(.+?):(\d+):(\d+):\s*([A-Z]+[0-9]+)\s+(.+)$")
+
+
+def ruff_severity(code: str) -> str:
+    """ruff のルールコードから severity を判定する。
+
+    Args:
+        code: ruff ルールコード (例: "F401", "E501", "W291")
+
+    Returns:
+        "error" or "warning"
+    """
+    # E: pycodestyle error, F: Pyflakes, W: pycodestyle warning
+    # I: isort, D: pydocstyle, N: pep8-naming
+    if code.startswith("W") or code.startswith("D") or code.startswith("I"):
+        return "warning"
+    return "error"
+
+
+def parse_ruff_json(stdout: str) -> List[AnalysisIssue]:
+    """ruff check --output-format json の出力を AnalysisIssue に変換する。
+
+    Args:
+        stdout: ruff の標準出力
+
+    Returns:
+        AnalysisIssue のリスト
+    """
+    issues: List[AnalysisIssue] = []
+
+    if not stdout.strip():
+        return issues
+
+    try:
+        ruff_results = json.loads(stdout)
+    except json.JSONDecodeError as e:
+        logger.warning("Failed to parse ruff JSON output: %s", e)
+        return issues
+
+    for entry in ruff_results:
+        # ruff JSON format: {"code": "F401", "message": "...",
+        #   "location": {"row": 1, "column": 1}, "filename": "...", ...}
+        issue = AnalysisIssue(
+            file=entry.get("filename", ""),
+            line=entry.get("location", {}).get("row", 0),
+            col=entry.get("location", {}).get("column", 0),
+            tool="ruff",
+            severity=ruff_severity(entry.get("code", "")),
+            message=f"[{entry.get('code', '')}] {entry.get('message', '')}",
+        )
+        issues.append(issue)
+
+    return issues
+
+
+def parse_ruff_text(stdout: str) -> List[AnalysisIssue]:
+    """ruff check のテキスト出力（デフォルト / concise）を AnalysisIssue に変換する。
+
+    Args:
+        stdout: ruff の標準出力
+
+    Returns:
+        AnalysisIssue のリスト（問題行以外は無視）
+    """
+    issues: List[AnalysisIssue] = []
+    for line in stdout.splitlines():
+        match = _RUFF_TEXT_LINE.match(line.strip())
+        if not match:
+            continue
+        filepath, line_no, col_no, code, message = match.groups()
+        issues.append(AnalysisIssue(
+            file=filepath,
+            line=int(line_no),
+            col=int(col_no),
+            tool="ruff",
+            severity=ruff_severity(code),
+            message=f"[{code}] {message}",
+        ))
+    return issues
+
+
+def parse_mypy_output(stdout: str) -> List[AnalysisIssue]:
+    """mypy / dmypy の出力を AnalysisIssue に変換する。
+
+    Args:
+        stdout: mypy の標準出力
+
+    Returns:
+        AnalysisIssue のリスト（note 行は無視）
+    """
+    issues: List[AnalysisIssue] = []
+
+    for line in stdout.splitlines():
+        match = _MYPY_LINE.match(line.strip())
+        if not match:
+            continue
+
+        filepath, line_no, col_no, severity_str, message = match.groups()
+
+        # note は無視（情報提供のみ）
+        if severity_str == "note":
+            continue
+
+        severity = "error" if severity_str == "error" else "warning"
+        issues.append(AnalysisIssue(
+            file=filepath,
+            line=int(line_no),
+            col=int(col_no),
+            tool="mypy",
+            severity=severity,
+            message=message,
+        ))
+
+    return issues
+
+
 class StaticAnalyzer:
     """静的解析エンジン本体。
 
@@ -78,37 +288,125 @@ class StaticAnalyzer:
 
     Attributes:
         project_root: プロジェクトルートディレクトリのパス
+        max_workers: 並列実行するツール数（1で逐次実行）
         _is_windows: Windows環境かどうか
         _detected_tools: detect_tools() の結果キャッシュ
+        _environment: プロジェクトルート単位のツール検出結果（コマンド・バージョン）
     """
 
-    def __init__(self, project_root: str) -> None:
+    def __init__(
+        self,
+        project_root: str,
+        cache: Optional[AnalysisCache] = None,
+        use_cache: bool = True,
+        max_workers: int = ANALYSIS_MAX_WORKERS,
+        use_service: bool = True,
+    ) -> None:
         """プロジェクトルートを受け取り、利用可能なツールを自動検出する。
 
         Args:
             project_root: プロジェクトルートディレクトリの絶対パス
+            cache: 解析結果キャッシュ（Noneの場合はデフォルトDBを初回解析時に確認）
+            use_cache: 解析結果キャッシュを使うか
+            max_workers: 並列実行するツール数
+            use_service: ruff / mypy をプロジェクト単位の解析サービス経由で実行するか
+                         （quality/analysis_service.py）
         """
         self.project_root = Path(project_root).resolve()
+        self.max_workers = max_workers
         self._is_windows = platform.system() == "Windows"
         self._detected_tools: Optional[Dict[str, bool]] = None
+        self._environment: Optional[_ToolEnvironment] = None
+        self._versions: Dict[str, Optional[str]] = {}
+        self._cache = cache
+        self._use_cache = use_cache
+        self._use_service = use_service
         logger.info(
             "StaticAnalyzer initialized: project_root=%s, platform=%s",
             self.project_root,
             platform.system(),
         )
 
-    def detect_tools(self) -> Dict[str, bool]:
+    def detect_tools(self, refresh: bool = False) -> Dict[str, bool]:
         """利用可能な解析ツールを検出する。
 
         各ツールのコマンド存在確認と、プロジェクト内の設定ファイル存在チェックを行う。
+        結果はプロジェクトルートごとにプロセス内と static_analysis_tools テーブルに
+        キャッシュし、有効期間内で設定ファイルの有無と PATH が変わっていなければ
+        別の Worker プロセスからも npx 等の再確認を行わない。
+
+        Args:
+            refresh: キャッシュを使わずに再検出する
 
         Returns:
             ツール名をキー、利用可否をbool値とした辞書。
             例: {"ruff": True, "mypy": False, "tsc": True, "eslint": False}
         """
-        if self._detected_tools is not None:
+        if self._detected_tools is not None and not refresh:
             return self._detected_tools
 
+        key = str(self.project_root)
+        fingerprint = self._detection_fingerprint()
+        if not refresh:
+            with _detection_lock:
+                cached = _detection_cache.get(key)
+            if (
+                cached is not None
+                and cached.fingerprint == fingerprint
+                and time.monotonic() - cached.detected_at < DETECTION_CACHE_TTL_SECONDS
+            ):
+                logger.debug("Using cached tool detection for %s", key)
+                self._environment = cached
+                self._detected_tools = cached.tools
+                return cached.tools
+
+        store = self._tool_store()
+        environment = None
+        if store is not None and not refresh:
+            environment = self._load_environment(store, fingerprint)
+        if environment is None:
+            environment = self._probe_tools(fingerprint)
+            if store is not None:
+                store.put_environment(
+                    key, _fingerprint_hash(fingerprint),
+                    environment.tools, environment.commands,
+                )
+        with _detection_lock:
+            _detection_cache[key] = environment
+        self._environment = environment
+        self._detected_tools = environment.tools
+        logger.info("Detected tools: %s", environment.tools)
+        return environment.tools
+
+    def _load_environment(
+        self, store: AnalysisCache, fingerprint: Tuple[Any, ...]
+    ) -> Optional[_ToolEnvironment]:
+        """他の Worker プロセスが保存した検出結果を読み込む（なければNone）。"""
+        stored = store.get_environment(
+            str(self.project_root), _fingerprint_hash(fingerprint), DETECTION_CACHE_TTL_SECONDS
+        )
+        if stored is None:
+            return None
+        logger.debug("Using stored tool detection for %s", self.project_root)
+        return _ToolEnvironment(
+            tools=stored["tools"],
+            commands=stored["commands"],
+            fingerprint=fingerprint,
+            detected_at=time.monotonic() - stored["age_seconds"],
+            versions=stored["versions"],
+        )
+
+    def _detection_fingerprint(self) -> Tuple[Any, ...]:
+        """検出結果に影響する環境（設定ファイルの有無・PATH）。"""
+        return (
+            (self.project_root / "tsconfig.json").exists(),
+            self._has_eslint_config(),
+            os.environ.get("PATH", ""),
+        )
+
+    def _probe_tools(self, fingerprint: Tuple[Any, ...]) -> _ToolEnvironment:
+        """ツールのコマンド・npx を確認して検出結果を作る。"""
+        commands: Dict[str, List[str]] = {"ruff": ["ruff"], "mypy": ["mypy"]}
         tools: Dict[str, bool] = {
             "ruff": False,
             "mypy": False,
@@ -124,32 +422,27 @@ class StaticAnalyzer:
         tools["mypy"] = self._command_exists("mypy")
         logger.debug("mypy available: %s", tools["mypy"])
 
-        # tsc: tsconfig.json の存在確認 + コマンド確認
-        tsconfig_exists = (self.project_root / "tsconfig.json").exists()
-        if tsconfig_exists:
-            tsc_available = self._command_exists("tsc") or self._npx_available("tsc")
-            tools["tsc"] = tsc_available
-        else:
-            tools["tsc"] = False
-        logger.debug(
-            "tsc available: %s (tsconfig=%s)", tools["tsc"], tsconfig_exists
-        )
-
-        # eslint: 設定ファイルの存在確認
-        eslint_config_exists = self._has_eslint_config()
-        if eslint_config_exists:
-            tools["eslint"] = self._command_exists("eslint") or self._npx_available(
-                "eslint"
+        # tsc / eslint: 設定ファイルの存在確認 + コマンド確認（なければ npx 経由）
+        tsconfig_exists, eslint_config_exists = fingerprint[0], fingerprint[1]
+        for tool, config_exists in (("tsc", tsconfig_exists), ("eslint", eslint_config_exists)):
+            if not config_exists:
+                tools[tool] = False
+            elif self._command_exists(tool):
+                tools[tool] = True
+                commands[tool] = [tool]
+            else:
+                tools[tool] = self._npx_available(tool)
+                commands[tool] = ["npx", tool]
+            logger.debug(
+                "%s available: %s (config=%s)", tool, tools[tool], config_exists
             )
-        else:
-            tools["eslint"] = False
-        logger.debug(
-            "eslint available: %s (config=%s)", tools["eslint"], eslint_config_exists
-        )
 
-        self._detected_tools = tools
-        logger.info("Detected tools: %s", tools)
-        return tools
+        return _ToolEnvironment(
+            tools=tools,
+            commands=commands,
+            fingerprint=fingerprint,
+            detected_at=time.monotonic(),
+        )
 
     def analyze(self, files: Optional[List[str]] = None) -> Dict[str, Any]:
         """指定ファイルに対して静的解析を実行する。
@@ -184,62 +477,33 @@ class StaticAnalyzer:
             for f in files
             if f.endswith((".ts", ".tsx", ".js", ".jsx"))
         ]
+        targets = {"ruff": py_files, "mypy": py_files, "tsc": ts_files, "eslint": ts_files}
 
         # ツール検出
         tools = self.detect_tools()
 
-        # ruff: Pythonファイルが対象にある場合のみ
-        if tools["ruff"] and py_files:
-            try:
-                issues = self._run_ruff_check(py_files)
-                self._categorize_issues(issues, result)
-                result.tools_used.append("ruff")
-                logger.info("ruff: %d issues found", len(issues))
-            except Exception as e:
-                logger.warning("ruff execution failed, skipping: %s", e)
-                result.skipped_tools.append("ruff")
-        elif not tools["ruff"] and py_files:
-            result.skipped_tools.append("ruff")
-        # py_files が空なら ruff はスキップ対象にすら入れない
-
-        # mypy: Pythonファイルが対象にある場合のみ
-        if tools["mypy"] and py_files:
-            try:
-                issues = self._run_mypy(py_files)
-                self._categorize_issues(issues, result)
-                result.tools_used.append("mypy")
-                logger.info("mypy: %d issues found", len(issues))
-            except Exception as e:
-                logger.warning("mypy execution failed, skipping: %s", e)
-                result.skipped_tools.append("mypy")
-        elif not tools["mypy"] and py_files:
-            result.skipped_tools.append("mypy")
-
-        # tsc: TypeScript/JSファイルが対象にある場合のみ
-        if tools["tsc"] and ts_files:
-            try:
-                issues = self._run_tsc(ts_files)
-                self._categorize_issues(issues, result)
-                result.tools_used.append("tsc")
-                logger.info("tsc: %d issues found", len(issues))
-            except Exception as e:
-                logger.warning("tsc execution failed, skipping: %s", e)
-                result.skipped_tools.append("tsc")
-        elif not tools["tsc"] and ts_files:
-            result.skipped_tools.append("tsc")
-
-        # eslint: TypeScript/JSファイルが対象にある場合のみ
-        if tools["eslint"] and ts_files:
-            try:
-                issues = self._run_eslint(ts_files)
-                self._categorize_issues(issues, result)
-                result.tools_used.append("eslint")
-                logger.info("eslint: %d issues found", len(issues))
-            except Exception as e:
-                logger.warning("eslint execution failed, skipping: %s", e)
-                result.skipped_tools.append("eslint")
-        elif not tools["eslint"] and ts_files:
-            result.skipped_tools.append("eslint")
+        # 対象ファイルがないツールはスキップ対象にすら入れない
+        planned = [tool for tool in TOOL_ORDER if targets[tool]]
+        runnable = [tool for tool in planned if tools[tool]]
+
+        # ツールを並列実行し、結果はツール順に統合する
+        if self.max_workers <= 1 or len(runnable) <= 1:
+            outcomes = [self._analyze_tool(tool, targets[tool]) for tool in runnable]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(runnable))) as pool:
+                outcomes = list(
+                    pool.map(lambda tool: self._analyze_tool(tool, targets[tool]), runnable)
+                )
+        issues_by_tool = dict(zip(runnable, outcomes))
+
+        for tool in planned:
+            issues = issues_by_tool.get(tool)
+            if issues is None:
+                result.skipped_tools.append(tool)
+                continue
+            self._categorize_issues(issues, result)
+            result.tools_used.append(tool)
+            logger.info("%s: %d issues found", tool, len(issues))
 
         # スコア計算
         result.score = self._calculate_score(
@@ -257,6 +521,154 @@ class StaticAnalyzer:
 
         return result.to_dict()
 
+    # ------------------------------------------------------------------
+    # Private: キャッシュ付きツール実行
+    # ------------------------------------------------------------------
+
+    def _analyze_tool(self, tool: str, files: List[str]) -> Optional[List[AnalysisIssue]]:
+        """1ツールを実行する（キャッシュ済みのファイルは再解析しない）。
+
+        Args:
+            tool: ツール名
+            files: 解析対象ファイルパスのリスト
+
+        Returns:
+            AnalysisIssue のリスト。ツール実行に失敗した場合None（スキップ扱い）
+        """
+        runner = {
+            "ruff": self._run_ruff_check,
+            "mypy": self._run_mypy,
+            "tsc": self._run_tsc,
+            "eslint": self._run_eslint,
+        }[tool]
+        try:
+            cache = self._result_cache()
+            version = self._tool_version(tool) if cache is not None else None
+            if version is None:
+                return runner(files)
+            config_hash = self._config_hash(tool)
+            if tool in CROSS_FILE_TOOLS:
+                return self._analyze_file_set(tool, files, runner, cache, version, config_hash)
+            return self._analyze_per_file(tool, files, runner, cache, version, config_hash)
+        except Exception as e:
+            logger.warning("%s execution failed, skipping: %s", tool, e)
+            return None
+
+    def _analyze_per_file(self, tool, files, runner, cache, version, config_hash) -> List[AnalysisIssue]:
+        """ファイル単位のツール: 内容ハッシュがキャッシュにないファイルだけを解析する。"""
+        paths = {f: self._absolute_path(f) for f in dict.fromkeys(files)}
+        hashes = {f: hash_file(Path(path)) for f, path in paths.items()}
+        cached = cache.get_many(tool, version, config_hash, [h for h in hashes.values() if h])
+        misses = [f for f in paths if hashes[f] not in cached]
+
+        fresh: Dict[str, List[AnalysisIssue]] = {f: [] for f in misses}
+        unmatched: List[AnalysisIssue] = []
+        if misses:
+            by_path = {paths[f]: f for f in misses}
+            for issue in runner(misses):
+                owner = by_path.get(self._absolute_path(issue.file))
+                if owner is None:
+                    unmatched.append(issue)
+                else:
+                    fresh[owner].append(issue)
+            cache.put_many(tool, version, config_hash, [
+                (hashes[f], f, [issue.to_dict() for issue in fresh[f]])
+                for f in misses if hashes[f]
+            ])
+        logger.debug("%s: %d cached, %d analyzed", tool, len(paths) - len(misses), len(misses))
+
+        issues: List[AnalysisIssue] = []
+        for f, path in paths.items():
+            if f in fresh:
+                issues.extend(fresh[f])
+            else:
+                # 同じ内容の別パスの結果も再利用できるよう、ファイルパスは現在のものに置き換える
+                issues.extend(
+                    AnalysisIssue(**{**entry, "file": path}) for entry in cached[hashes[f]]
+                )
+        return issues + unmatched
+
+    def _analyze_file_set(self, tool, files, runner, cache, version, config_hash) -> List[AnalysisIssue]:
+        """ファイル横断のツール: 対象ファイル群が前回と同じ内容ならキャッシュを使う。"""
+        hashes = [(f, hash_file(Path(self._absolute_path(f)))) for f in files]
+        if any(h is None for _, h in hashes):
+            return runner(files)
+        set_hash = hash_bytes(json.dumps(hashes).encode("utf-8"))
+        cached = cache.get_many(tool, version, config_hash, [set_hash])
+        if set_hash in cached:
+            logger.debug("%s: file set cached", tool)
+            return [AnalysisIssue(**entry) for entry in cached[set_hash]]
+        issues = runner(files)
+        cache.put_many(tool, version, config_hash, [
+            (set_hash, ",".join(files), [issue.to_dict() for issue in issues])
+        ])
+        return issues
+
+    def _result_cache(self) -> Optional[AnalysisCache]:
+        """解析結果キャッシュ（利用できない場合None）。"""
+        if not self._use_cache:
+            return None
+        if self._cache is None:
+            self._cache = AnalysisCache()
+        return self._cache if self._cache.enabled else None
+
+    def _tool_store(self) -> Optional[AnalysisCache]:
+        """ツール検出結果の保存先（利用できない場合None）。"""
+        if not self._use_cache:
+            return None
+        if self._cache is None:
+            self._cache = AnalysisCache()
+        return self._cache if self._cache.tools_enabled else None
+
+    def _analysis_service(self):
+        """プロジェクト単位の解析サービス（無効の場合None）。"""
+        if not self._use_service:
+            return None
+        from quality.analysis_service import get_service
+        return get_service(self.project_root)
+
+    def _tool_command(self, tool: str) -> List[str]:
+        """ツールの実行コマンド（npx 経由の場合 ["npx", tool]）。"""
+        if self._environment is not None:
+            return list(self._environment.commands.get(tool, [tool]))
+        if tool in ("tsc", "eslint") and not self._command_exists(tool):
+            return ["npx", tool]
+        return [tool]
+
+    def _tool_version(self, tool: str) -> Optional[str]:
+        """ツールバージョン（取得できない場合None。検出結果と一緒にキャッシュする）。"""
+        environment = self._environment
+        versions = environment.versions if environment is not None else self._versions
+        if tool not in versions:
+            try:
+                proc = subprocess.run(
+                    self._tool_command(tool) + ["--version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=VERSION_TIMEOUT_SECONDS,
+                    cwd=str(self.project_root),
+                )
+                output = proc.stdout.strip() or proc.stderr.strip()
+                versions[tool] = output.splitlines()[0] if proc.returncode == 0 and output else None
+            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+                versions[tool] = None
+            store = self._tool_store() if environment is not None else None
+            if store is not None:
+                store.put_tool_version(
+                    str(self.project_root), _fingerprint_hash(environment.fingerprint),
+                    tool, versions[tool],
+                )
+        return versions[tool]
+
+    def _config_hash(self, tool: str) -> str:
+        """コマンド引数と設定ファイル内容のハッシュ。"""
+        files_hash = hash_files(self.project_root / name for name in TOOL_CONFIG_FILES[tool])
+        return hash_bytes(json.dumps([TOOL_ARGS[tool], files_hash]).encode("utf-8"))
+
+    def _absolute_path(self, path: str) -> str:
+        """プロジェクトルート基準の絶対パス（ruff / eslint の出力と同じ形式）。"""
+        return os.path.normpath(os.path.join(str(self.project_root), path))
+
     # ------------------------------------------------------------------
     # Private: ツール実行メソッド
     # ------------------------------------------------------------------
@@ -274,10 +686,14 @@ class StaticAnalyzer:
             RuntimeError: ツール実行が想定外の失敗をした場合
         """
         # ruff check --output-format json で構造化出力を取得
-        cmd = ["ruff", "check", "--output-format", "json"] + files
-        logger.debug("Running ruff: %s", " ".join(cmd))
-
-        proc = self._run_subprocess(cmd)
+        service = self._analysis_service()
+        if service is not None:
+            # キャッシュディレクトリをプロジェクト単位で共有
+            proc = service.run_ruff(TOOL_ARGS["ruff"] + files, self._run_subprocess).process
+        else:
+            cmd = ["ruff"] + TOOL_ARGS["ruff"] + files
+            logger.debug("Running ruff: %s", " ".join(cmd))
+            proc = self._run_subprocess(cmd)
 
         # ruff は問題検出時に exit code 1 を返す（正常動作）
         if proc.returncode not in (0, 1):
@@ -286,32 +702,7 @@ class StaticAnalyzer:
                 f"{proc.stderr}"
             )
 
-        issues: List[AnalysisIssue] = []
-
-        if not proc.stdout.strip():
-            return issues
-
-        try:
-            ruff_results = json.loads(proc.stdout)
-        except json.JSONDecodeError as e:
-            logger.warning("Failed to parse ruff JSON output: %s", e)
-            return issues
-
-        for entry in ruff_results:
-            # ruff JSON format: {"code": "F401", "message": "...",
-            #   "location": {"row": 1, "column": 1}, "filename": "...", ...}
-            severity = self._ruff_severity(entry.get("code", ""))
-            issue = AnalysisIssue(
-                file=entry.get("filename", ""),
-                line=entry.get("location", {}).get("row", 0),
-                col=entry.get("location", {}).get("column", 0),
-                tool="ruff",
-                severity=severity,
-                message=f"[{entry.get('code', '')}] {entry.get('message', '')}",
-            )
-            issues.append(issue)
-
-        return issues
+        return parse_ruff_json(proc.stdout)
 
     def _run_mypy(self, files: List[str]) -> List[AnalysisIssue]:
         """mypy を実行し、検出された問題を返す。
@@ -326,16 +717,14 @@ class StaticAnalyzer:
             RuntimeError: ツール実行が想定外の失敗をした場合
         """
         # mypy --no-color-output --show-column-numbers --no-error-summary
-        cmd = [
-            "mypy",
-            "--no-color-output",
-            "--show-column-numbers",
-            "--no-error-summary",
-            "--ignore-missing-imports",
-        ] + files
-        logger.debug("Running mypy: %s", " ".join(cmd))
-
-        proc = self._run_subprocess(cmd)
+        service = self._analysis_service()
+        if service is not None:
+            # 常駐 dmypy（なければ共有キャッシュの mypy）で、同時要求は直列化される
+            proc = service.run_mypy(TOOL_ARGS["mypy"], files, self._run_subprocess).process
+        else:
+            cmd = ["mypy"] + TOOL_ARGS["mypy"] + files
+            logger.debug("Running mypy: %s", " ".join(cmd))
+            proc = self._run_subprocess(cmd)
 
         # mypy は問題検出時に exit code 1 を返す（正常動作）
         if proc.returncode not in (0, 1):
@@ -343,41 +732,7 @@ class StaticAnalyzer:
                 f"mypy failed with exit code {proc.returncode}: {proc.stderr}"
             )
 
-        issues: List[AnalysisIssue] = []
-
-        if not proc.stdout.strip():
-            return issues
-
-        # mypy 出力形式: file.py:line:col: severity: message
-        # 例: src/main.py:10:5: error: Incompatible types in assignment
-        pattern = re.compile(
-            r"^(.+?):(\d+):(\d+):\s*(error|warning|note):\s*(.+)$"
-        )
-
-        for line in proc.stdout.splitlines():
-            line = line.strip()
-            match = pattern.match(line)
-            if not match:
-                continue
-
-            filepath, line_no, col_no, severity_str, message = match.groups()
-
-            # note は無視（情報提供のみ）
-            if severity_str == "note":
-                continue
-
-            severity = "error" if severity_str == "error" else "warning"
-            issue = AnalysisIssue(
-                file=filepath,
-                line=int(line_no),
-                col=int(col_no),
-                tool="mypy",
-                severity=severity,
-                message=message,
-            )
-            issues.append(issue)
-
-        return issues
+        return parse_mypy_output(proc.stdout)
 
     def _run_tsc(self, files: List[str]) -> List[AnalysisIssue]:
         """tsc (TypeScript Compiler) を実行し、検出された問題を返す。
@@ -392,11 +747,8 @@ class StaticAnalyzer:
             RuntimeError: ツール実行が想定外の失敗をした場合
         """
         # tsc --noEmit でコンパイルエラーのみチェック
-        # npx 経由で実行を試みる
-        if self._command_exists("tsc"):
-            cmd = ["tsc", "--noEmit", "--pretty", "false"] + files
-        else:
-            cmd = ["npx", "tsc", "--noEmit", "--pretty", "false"] + files
+        # コマンドがなければ npx 経由（detect_tools() の結果を使う）
+        cmd = self._tool_command("tsc") + TOOL_ARGS["tsc"] + files
 
         logger.debug("Running tsc: %s", " ".join(cmd))
 
@@ -455,10 +807,7 @@ class StaticAnalyzer:
             RuntimeError: ツール実行が想定外の失敗をした場合
         """
         # eslint --format json で構造化出力を取得
-        if self._command_exists("eslint"):
-            cmd = ["eslint", "--format", "json"] + files
-        else:
-            cmd = ["npx", "eslint", "--format", "json"] + files
+        cmd = self._tool_command("eslint") + TOOL_ARGS["eslint"] + files
 
         logger.debug("Running eslint: %s", " ".join(cmd))
 
@@ -512,7 +861,8 @@ class StaticAnalyzer:
     def _command_exists(self, command: str) -> bool:
         """コマンドがシステムに存在するか確認する。
 
-        Windows では `where`、Unix系では `which` を使用する。
+        PATH を直接探索する（`where` / `which` のサブプロセスは起動しない）。
+        Windows では PATHEXT の拡張子（.exe, .cmd 等）も対象になる。
 
         Args:
             command: 確認するコマンド名
@@ -520,17 +870,7 @@ class StaticAnalyzer:
         Returns:
             コマンドが存在すれば True
         """
-        check_cmd = "where" if self._is_windows else "which"
-        try:
-            proc = subprocess.run(
-                [check_cmd, command],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            return proc.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            return False
+        return shutil.which(command) is not None
 
     def _npx_available(self, package: str) -> bool:
         """npx 経由でパッケージが利用可能か確認する。
@@ -559,19 +899,7 @@ class StaticAnalyzer:
         Returns:
             eslint設定ファイルが存在すれば True
         """
-        config_patterns = [
-            ".eslintrc",
-            ".eslintrc.js",
-            ".eslintrc.cjs",
-            ".eslintrc.json",
-            ".eslintrc.yml",
-            ".eslintrc.yaml",
-            "eslint.config.js",
-            "eslint.config.mjs",
-            "eslint.config.cjs",
-            "eslint.config.ts",
-        ]
-        for pattern in config_patterns:
+        for pattern in ESLINT_CONFIG_FILES:
             if (self.project_root / pattern).exists():
                 return True
         return False
@@ -613,11 +941,7 @@ class StaticAnalyzer:
         Returns:
             "error" or "warning"
         """
-        # E: pycodestyle error, F: Pyflakes, W: pycodestyle warning
-        # I: isort, D: pydocstyle, N: pep8-naming
-        if code.startswith("W") or code.startswith("D") or code.startswith("I"):
-            return "warning"
-        return "error"
+        return ruff_severity(code)
 
     def _categorize_issues(
         self, issues: List[AnalysisIssue], result: AnalysisResult
@@ -15,12 +15,18 @@ ORDER完了時にDEV配下のリリース対象ファイルを自動検出する
     python detect.py AI_PM_PJ --order ORDER_060 --json
     python detect.py AI_PM_PJ --all-dev --json
     python detect.py AI_PM_PJ --no-diff  # 差分表示を省略
+    python detect.py AI_PM_PJ --no-manifest  # 指紋マニフェストを使わず全比較
 """
 
 import argparse
 import difflib
+import hashlib
 import json
+import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
@@ -48,6 +54,138 @@ BINARY_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.ico', '.pdf', '.zip', '.
 # 差分プレビューの最大行数
 DIFF_PREVIEW_LINES = 10
 
+# ファイル指紋マニフェスト（プロジェクトベース直下に保存）
+MANIFEST_FILENAME = ".release_manifest.json"
+MANIFEST_VERSION = 1
+
+# mtimeがこの範囲内（現在時刻基準）のファイルは同一tick内で更新され得るため
+# マニフェストにキャッシュしない（gitの "racy clean" 対策と同じ考え方）
+MANIFEST_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+# ハッシュ計算時の読み込みチャンクサイズ
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 差分プレビュー計算の並列度
+DIFF_MAX_WORKERS = 8
+
+
+class ReleaseManifest:
+    """
+    DEV/本番ツリーのファイル指紋 (size, mtime_ns, sha256) を永続化するキャッシュ
+
+    size と mtime_ns が前回記録と一致するファイルは内容を読まずに
+    記録済みのハッシュを返す。変更のあったファイルのみ再ハッシュする。
+    """
+
+    TREES = ("dev", "prod")
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Dict[str, Any]]] = {tree: {} for tree in self.TREES}
+        self.hits = 0
+        self.hashed = 0
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "ReleaseManifest":
+        """マニフェストを読み込む（存在しない・破損時は空で開始）"""
+        manifest = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return manifest
+
+        for tree in cls.TREES:
+            tree_entries = data.get(tree)
+            if isinstance(tree_entries, dict):
+                manifest.entries[tree] = tree_entries
+        return manifest
+
+    def digest(self, tree: str, rel_path: str, abs_path: Path, size: int, mtime_ns: int) -> str:
+        """
+        ファイルのSHA256を取得（size/mtime_nsが一致すればキャッシュを使用）
+
+        Raises:
+            OSError: ファイル読み込みに失敗した場合
+        """
+        entry = self.entries[tree].get(rel_path)
+        if entry and entry.get("size") == size and entry.get("mtime_ns") == mtime_ns:
+            self.hits += 1
+            return entry["sha256"]
+
+        sha256 = hashlib.sha256()
+        with open(abs_path, "rb") as f:
+            while True:
+                chunk = f.read(HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                sha256.update(chunk)
+        file_hash = sha256.hexdigest()
+        self.hashed += 1
+
+        if time.time_ns() - mtime_ns > MANIFEST_RACY_WINDOW_NS:
+            self.entries[tree][rel_path] = {
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "sha256": file_hash,
+            }
+            self._dirty = True
+        elif rel_path in self.entries[tree]:
+            del self.entries[tree][rel_path]
+            self._dirty = True
+        return file_hash
+
+    def prune(self, tree: str, live_paths: set) -> None:
+        """ツリーに存在しなくなったファイルのエントリを削除"""
+        stale = [p for p in self.entries[tree] if p not in live_paths]
+        for rel_path in stale:
+            del self.entries[tree][rel_path]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> bool:
+        """
+        マニフェストをアトミックに書き込む（変更がない場合は何もしない）
+
+        Returns:
+            書き込んだ場合True
+        """
+        if self.path is None or not self._dirty:
+            return False
+
+        payload = {"version": MANIFEST_VERSION}
+        payload.update(self.entries)
+
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.path.parent),
+                prefix=".tmp_manifest_",
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, str(self.path))
+            tmp_path = None
+            self._dirty = False
+            return True
+        except OSError:
+            return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict[str, int]:
+        """キャッシュ利用状況"""
+        return {"hits": self.hits, "hashed": self.hashed}
+
 
 def calculate_diff(source_path: Path, target_path: Path) -> Dict[str, Any]:
     """
@@ -122,6 +260,50 @@ def calculate_diff(source_path: Path, target_path: Path) -> Dict[str, Any]:
     return diff_info
 
 
+def calculate_diffs(pairs: List[Tuple[Path, Path]], max_workers: int = DIFF_MAX_WORKERS) -> List[Dict[str, Any]]:
+    """
+    複数ファイルの差分をスレッドプールで並列計算
+
+    Args:
+        pairs: (DEV側パス, 本番側パス) のリスト
+        max_workers: 最大並列数
+
+    Returns:
+        pairs と同じ順序の差分情報リスト
+    """
+    if not pairs:
+        return []
+    if len(pairs) == 1 or max_workers <= 1:
+        return [calculate_diff(src, dst) for src, dst in pairs]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+        return list(executor.map(lambda pair: calculate_diff(*pair), pairs))
+
+
+def _scan_files(root: Path):
+    """
+    ディレクトリを再帰走査し、(パス, stat結果) を返す
+
+    os.scandir を使い、ファイルごとのstat呼び出しを1回に抑える。
+    シンボリックリンクのディレクトリは辿らない。
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                        elif entry.is_file():
+                            yield Path(entry.path), entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
 def get_dev_files(dev_path: Path) -> List[Dict[str, Any]]:
     """
     DEV配下のリリース対象ファイルを全て取得
@@ -136,22 +318,23 @@ def get_dev_files(dev_path: Path) -> List[Dict[str, Any]]:
 
     for dev_dir, prod_dir in RELEASE_DIRS.items():
         source_path = dev_path / dev_dir
-        if not source_path.exists():
+        if not source_path.is_dir():
             continue
 
-        for file_path in source_path.rglob("*"):
-            if file_path.is_file():
-                rel_to_dev_dir = file_path.relative_to(source_path)
-                prod_rel_path = Path(prod_dir) / rel_to_dev_dir
+        for file_path, st in _scan_files(source_path):
+            rel_to_dev_dir = file_path.relative_to(source_path)
+            prod_rel_path = Path(prod_dir) / rel_to_dev_dir
 
-                files.append({
-                    "source": str(file_path.relative_to(dev_path)),
-                    "target": str(prod_rel_path),
-                    "source_abs": str(file_path),
-                    "mtime": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
-                    "size": file_path.stat().st_size,
-                })
+            files.append({
+                "source": str(file_path.relative_to(dev_path)),
+                "target": str(prod_rel_path),
+                "source_abs": str(file_path),
+                "mtime": datetime.fromtimestamp(st.st_mtime).isoformat(),
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+            })
 
+    files.sort(key=lambda f: f["source"])
     return files
 
 
@@ -160,15 +343,22 @@ def detect_release_targets(
     order_id: Optional[str] = None,
     all_dev: bool = False,
     include_diff: bool = True,
+    use_manifest: bool = True,
 ) -> Dict[str, Any]:
     """
     リリース対象ファイルを検出
 
+    ファイル指紋マニフェストを用いて、前回から size/mtime が変わっていない
+    ファイルは内容を読まずに比較する。サイズが異なるファイルは読まずに
+    MODIFIED と判定する。差分プレビューは include_diff 指定時のみ、
+    変更ファイルに対して並列計算する。
+
     Args:
         project_id: プロジェクトID
         order_id: ORDER ID（指定時は成果物パスから検出）
         all_dev: DEV配下全てを検出
         include_diff: 差分情報を含めるか（デフォルト: True）
+        use_manifest: ファイル指紋マニフェストを使用するか（デフォルト: True）
 
     Returns:
         検出結果の辞書
@@ -196,26 +386,44 @@ def detect_release_targets(
             "message": "リリース対象ファイルがありません",
         }
 
+    if use_manifest:
+        manifest = ReleaseManifest.load(base_path / MANIFEST_FILENAME)
+    else:
+        manifest = ReleaseManifest()
+
     # 本番環境との比較で変更種別を判定
     targets = []
     for file_info in dev_files:
         prod_file = base_path / file_info["target"]
         source_file = dev_path / file_info["source"]
 
-        if not prod_file.exists():
+        try:
+            prod_stat = prod_file.stat()
+        except OSError:
+            prod_stat = None
+
+        if prod_stat is None:
             change_type = "NEW"
+        elif prod_stat.st_size != file_info["size"]:
+            change_type = "MODIFIED"  # サイズ相違 - 内容を読むまでもない
         else:
-            # ファイル内容を比較
+            # ファイル指紋を比較（未変更ファイルはマニフェストから取得）
             try:
-                source_content = source_file.read_bytes()
-                prod_content = prod_file.read_bytes()
-                if source_content == prod_content:
+                source_hash = manifest.digest(
+                    "dev", file_info["source"], source_file,
+                    file_info["size"], file_info["mtime_ns"],
+                )
+                prod_hash = manifest.digest(
+                    "prod", file_info["target"], prod_file,
+                    prod_stat.st_size, prod_stat.st_mtime_ns,
+                )
+                if source_hash == prod_hash:
                     continue  # 変更なし - スキップ
                 change_type = "MODIFIED"
             except Exception:
                 change_type = "MODIFIED"  # 比較エラー時は変更扱い
 
-        target_info = {
+        targets.append({
             "source": file_info["source"],
             "target": file_info["target"],
             "source_abs": file_info["source_abs"],
@@ -223,14 +431,20 @@ def detect_release_targets(
             "change_type": change_type,
             "mtime": file_info["mtime"],
             "size": file_info["size"],
-        }
+        })
 
-        # 差分情報を追加
-        if include_diff:
-            diff_info = calculate_diff(source_file, prod_file)
-            target_info["diff"] = diff_info
+    if use_manifest:
+        manifest.prune("dev", {f["source"] for f in dev_files})
+        manifest.prune("prod", {f["target"] for f in dev_files})
+        manifest.save()
 
-        targets.append(target_info)
+    # 差分情報を追加（変更ファイルのみ・並列計算）
+    if include_diff:
+        diffs = calculate_diffs([
+            (Path(t["source_abs"]), Path(t["target_abs"])) for t in targets
+        ])
+        for target_info, diff_info in zip(targets, diffs):
+            target_info["diff"] = diff_info
 
     # ORDER指定時は成果物パスでフィルタリング
     if order_id and not all_dev:
@@ -248,7 +462,8 @@ def detect_release_targets(
         "summary": {
             "new": len([t for t in targets if t["change_type"] == "NEW"]),
             "modified": len([t for t in targets if t["change_type"] == "MODIFIED"]),
-        }
+        },
+        "manifest": manifest.stats(),
     }
 
 
@@ -373,6 +588,11 @@ def main():
         action="store_true",
         help="差分表示を省略（デフォルトは差分表示あり）"
     )
+    parser.add_argument(
+        "--no-manifest",
+        action="store_true",
+        help="ファイル指紋マニフェストを使わず全ファイルを読み込んで比較"
+    )
 
     args = parser.parse_args()
 
@@ -384,6 +604,7 @@ def main():
             order_id=args.order_id,
             all_dev=args.all_dev,
             include_diff=include_diff,
+            use_manifest=not args.no_manifest,
         )
 
         output = format_output(result, json_output=args.json, show_diff=include_diff)
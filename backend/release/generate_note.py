@@ -5,26 +5,39 @@ AI PM Framework - リリースノート生成スクリプト
 指定ORDERの全タスクREPORTを集約してリリースノートMarkdownを生成し、
 RESULT/ORDER_XXX/RELEASE_NOTE.md として保存する。
 
+複数ORDERを指定した場合は、ORDER・タスクを1回のクエリでまとめて取得し、
+全ORDERのREPORTファイルをスレッドプールで読み込み・パースする。
+パース結果はファイルの mtime・サイズをキーにプロセス内でキャッシュする。
+リリースノートは1行ずつファイルへストリーム書き込みする。
+
 Usage:
-    python backend/release/generate_note.py PROJECT_ID ORDER_ID [OPTIONS]
+    python backend/release/generate_note.py PROJECT_ID ORDER_ID [ORDER_ID ...] [OPTIONS]
 
 Options:
-    --json          JSON形式で出力
+    --json          JSON形式で出力（複数ORDER時は {"success", "notes": [...]}）
     --dry-run       ファイルに保存せず内容をプレビューのみ
     --verbose       詳細ログ出力
+    --workers N     REPORT読み込みの並列数（デフォルト: 8）
 
 Example:
     python backend/release/generate_note.py ai_pm_manager_v2 ORDER_017
     python backend/release/generate_note.py ai_pm_manager_v2 ORDER_017 --json
     python backend/release/generate_note.py ai_pm_manager_v2 ORDER_017 --dry-run
+    python backend/release/generate_note.py ai_pm_manager_v2 ORDER_017 ORDER_018 --json
 """
 
 import argparse
+import io
 import json
+import os
+import re
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
 
 # バックエンドルートをパスに追加
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -35,6 +48,18 @@ from utils.db import get_connection, fetch_one, fetch_all
 
 setup_utf8_output()
 
+# REPORT読み込み・パースの並列数（I/O待ちが主体のためCPU数より多めにする）
+DEFAULT_REPORT_WORKERS = 8
+
+# パースキャッシュの最大エントリ数（超えた場合は古いものから削除）
+REPORT_CACHE_MAX_ENTRIES = 4096
+
+_REPORT_JSON_BLOCK = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+
+# 解決済みパス -> ((mtime_ns, size), REPORT辞書)
+_report_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_report_cache_lock = threading.Lock()
+
 
 # ============================================================================
 # タスク情報取得
@@ -77,20 +102,68 @@ def get_tasks_for_order(project_id: str, order_id: str) -> List[Dict[str, Any]]:
     """
     conn = get_connection()
     try:
-        tasks = fetch_all(
-            conn,
-            """SELECT id, title, description, status, priority, assignee,
-                      started_at, completed_at, created_at
-               FROM tasks
-               WHERE order_id = ? AND project_id = ?
-               ORDER BY created_at""",
-            (order_id, project_id),
-        )
-        return [dict(t) for t in tasks]
+        return get_tasks_for_orders(conn, project_id, [order_id])[order_id]
     finally:
         conn.close()
 
 
+def get_orders_info(conn, project_id: str, order_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    複数ORDERの情報を1回のクエリで取得
+
+    Args:
+        conn: データベース接続
+        project_id: プロジェクトID
+        order_ids: ORDER IDのリスト
+
+    Returns:
+        ORDER ID -> ORDERの辞書（見つからないORDERは含まない）
+    """
+    if not order_ids:
+        return {}
+    placeholders = ",".join("?" for _ in order_ids)
+    rows = fetch_all(
+        conn,
+        "SELECT id, project_id, title, priority, status, created_at, completed_at "
+        f"FROM orders WHERE project_id = ? AND id IN ({placeholders})",
+        (project_id, *order_ids),
+    )
+    return {row["id"]: dict(row) for row in rows}
+
+
+def get_tasks_for_orders(
+    conn, project_id: str, order_ids: Sequence[str]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    複数ORDER配下の全タスクを1回のクエリで取得
+
+    Args:
+        conn: データベース接続
+        project_id: プロジェクトID
+        order_ids: ORDER IDのリスト
+
+    Returns:
+        ORDER ID -> タスクの辞書リスト（作成日時順）
+    """
+    tasks: Dict[str, List[Dict[str, Any]]] = {order_id: [] for order_id in order_ids}
+    if not order_ids:
+        return tasks
+    placeholders = ",".join("?" for _ in order_ids)
+    rows = fetch_all(
+        conn,
+        f"""SELECT order_id, id, title, description, status, priority, assignee,
+                   started_at, completed_at, created_at
+            FROM tasks
+            WHERE project_id = ? AND order_id IN ({placeholders})
+            ORDER BY order_id, created_at""",
+        (project_id, *order_ids),
+    )
+    for row in rows:
+        task = dict(row)
+        tasks[task.pop("order_id")].append(task)
+    return tasks
+
+
 # ============================================================================
 # REPORTファイル読み込み
 # ============================================================================
@@ -105,30 +178,97 @@ def read_report_files(result_order_dir: Path) -> List[Dict[str, Any]]:
     Returns:
         [{"filename": str, "task_id": str, "content": str}, ...]
     """
-    report_dir = result_order_dir / "05_REPORT"
-    reports = []
+    return read_reports_for_orders([result_order_dir], max_workers=1)[0]
 
+
+def list_report_files(result_order_dir: Path) -> List[Path]:
+    """RESULT/ORDER_XXX/05_REPORT/ 配下のREPORTファイルをファイル名順に返す"""
+    report_dir = result_order_dir / "05_REPORT"
     if not report_dir.exists():
-        return reports
+        return []
+    return sorted(report_dir.glob("REPORT_*.md"))
 
-    for report_file in sorted(report_dir.glob("REPORT_*.md")):
-        try:
-            content = report_file.read_text(encoding="utf-8")
-            # ファイル名からTASK IDを抽出 (REPORT_042.md → TASK_042)
-            stem = report_file.stem  # "REPORT_042"
-            task_id = stem.replace("REPORT_", "TASK_")
-            reports.append({
-                "filename": report_file.name,
-                "task_id": task_id,
-                "content": content,
-            })
-        except Exception as e:
-            reports.append({
-                "filename": report_file.name,
-                "task_id": "UNKNOWN",
-                "content": f"[REPORTファイル読み込みエラー: {e}]",
-            })
 
+def load_report(report_file: Path) -> Dict[str, Any]:
+    """
+    REPORTファイルを読み込んでパースする（mtime・サイズが同じならキャッシュを返す）
+
+    Args:
+        report_file: REPORTファイルのパス
+
+    Returns:
+        {"filename": str, "task_id": str, "content": str, "parsed": dict}
+        読み込みエラーの場合は task_id="UNKNOWN"（キャッシュしない）
+    """
+    key = str(report_file.resolve())
+    try:
+        stat = report_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with _report_cache_lock:
+            cached = _report_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        content = report_file.read_text(encoding="utf-8")
+    except Exception as e:
+        content = f"[REPORTファイル読み込みエラー: {e}]"
+        return {
+            "filename": report_file.name,
+            "task_id": "UNKNOWN",
+            "content": content,
+            "parsed": parse_report_summary(content),
+        }
+
+    # ファイル名からTASK IDを抽出 (REPORT_042.md → TASK_042)
+    stem = report_file.stem  # "REPORT_042"
+    report = {
+        "filename": report_file.name,
+        "task_id": stem.replace("REPORT_", "TASK_"),
+        "content": content,
+        "parsed": parse_report_summary(content),
+    }
+    with _report_cache_lock:
+        _report_cache.pop(key, None)
+        _report_cache[key] = (stamp, report)
+        while len(_report_cache) > REPORT_CACHE_MAX_ENTRIES:
+            del _report_cache[next(iter(_report_cache))]
+    return report
+
+
+def clear_report_cache() -> None:
+    """REPORTパースキャッシュを破棄する"""
+    with _report_cache_lock:
+        _report_cache.clear()
+
+
+def read_reports_for_orders(
+    result_order_dirs: Sequence[Path],
+    max_workers: int = DEFAULT_REPORT_WORKERS,
+) -> List[List[Dict[str, Any]]]:
+    """
+    複数ORDERのREPORTファイルをまとめてスレッドプールで読み込み・パースする
+
+    Args:
+        result_order_dirs: RESULT/ORDER_XXX/ のパスのリスト
+        max_workers: 並列数（1以下の場合は逐次）
+
+    Returns:
+        result_order_dirs と同じ順のREPORTリスト（各ORDER内はファイル名順）
+    """
+    files = [list_report_files(order_dir) for order_dir in result_order_dirs]
+    flat = [report_file for order_files in files for report_file in order_files]
+
+    if max_workers <= 1 or len(flat) <= 1:
+        loaded = [load_report(report_file) for report_file in flat]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(flat))) as executor:
+            loaded = list(executor.map(load_report, flat))
+
+    reports = []
+    start = 0
+    for order_files in files:
+        reports.append(loaded[start:start + len(order_files)])
+        start += len(order_files)
     return reports
 
 
@@ -150,8 +290,7 @@ def parse_report_summary(report_content: str) -> Dict[str, Any]:
     }
 
     # コードブロック内のJSONを抽出
-    import re
-    json_match = re.search(r"```json\s*(\{.*?\})\s*```", report_content, re.DOTALL)
+    json_match = _REPORT_JSON_BLOCK.search(report_content)
     if not json_match:
         # フォールバック: REPORTの内容をそのまま使用
         result["summary"] = report_content[:500] if len(report_content) > 500 else report_content
@@ -173,6 +312,37 @@ def parse_report_summary(report_content: str) -> Dict[str, Any]:
 # リリースノートMarkdown生成
 # ============================================================================
 
+class _LineWriter:
+    """行単位でストリームへ書き込む（"\n".join と同じく末尾に改行を付けない）"""
+
+    def __init__(self, out: TextIO):
+        self._out = out
+        self._first = True
+
+    def __call__(self, text: str) -> None:
+        if not self._first:
+            self._out.write("\n")
+        self._out.write(text)
+        self._first = False
+
+
+class _Tee:
+    """複数のストリームへ同時に書き込む"""
+
+    def __init__(self, *streams: TextIO):
+        self._streams = streams
+
+    def write(self, text: str) -> None:
+        for stream in self._streams:
+            stream.write(text)
+
+
+def _parsed(report: Dict[str, Any]) -> Dict[str, Any]:
+    """load_report() のパース結果（なければその場でパース）"""
+    parsed = report.get("parsed")
+    return parsed if parsed is not None else parse_report_summary(report["content"])
+
+
 def generate_release_note_markdown(
     project_id: str,
     order_id: str,
@@ -193,6 +363,30 @@ def generate_release_note_markdown(
     Returns:
         リリースノートのMarkdown文字列
     """
+    buffer = io.StringIO()
+    write_release_note(buffer, project_id, order_id, order_info, tasks, reports)
+    return buffer.getvalue()
+
+
+def write_release_note(
+    out: TextIO,
+    project_id: str,
+    order_id: str,
+    order_info: Dict[str, Any],
+    tasks: List[Dict[str, Any]],
+    reports: List[Dict[str, Any]],
+) -> None:
+    """
+    リリースノートMarkdownをストリームへ1行ずつ書き込む
+
+    Args:
+        out: 書き込み先（write() を持つオブジェクト）
+        project_id: プロジェクトID
+        order_id: ORDER ID
+        order_info: ORDERのメタデータ
+        tasks: タスクのリスト
+        reports: REPORTファイルのリスト（load_report() の結果ならパース済みを使う）
+    """
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
     order_title = order_info.get("title", order_id)
     order_status = order_info.get("status", "UNKNOWN")
@@ -206,217 +400,290 @@ def generate_release_note_markdown(
     # REPORTをTASK IDでインデックス化
     report_by_task = {r["task_id"]: r for r in reports}
 
-    lines = []
+    line = _LineWriter(out)
 
     # ヘッダー
-    lines.append(f"# リリースノート - {order_id}")
-    lines.append("")
-    lines.append(f"**ORDER**: {order_id} - {order_title}")
-    lines.append(f"**プロジェクト**: {project_id}")
-    lines.append(f"**ステータス**: {order_status}")
-    lines.append(f"**完了日時**: {order_completed or '-'}")
-    lines.append(f"**生成日時**: {generated_at}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    line(f"# リリースノート - {order_id}")
+    line("")
+    line(f"**ORDER**: {order_id} - {order_title}")
+    line(f"**プロジェクト**: {project_id}")
+    line(f"**ステータス**: {order_status}")
+    line(f"**完了日時**: {order_completed or '-'}")
+    line(f"**生成日時**: {generated_at}")
+    line("")
+    line("---")
+    line("")
 
     # サマリー
-    lines.append("## サマリー")
-    lines.append("")
+    line("## サマリー")
+    line("")
     if order_info.get("description"):
-        lines.append(order_info["description"])
-        lines.append("")
+        line(order_info["description"])
+        line("")
     if order_info.get("priority"):
-        lines.append(f"- **優先度**: {order_info['priority']}")
-    lines.append(f"- **タスク数**: {total_tasks}件（完了: {completed_count}件）")
-    lines.append(f"- **REPORTファイル数**: {len(reports)}件")
-    lines.append("")
+        line(f"- **優先度**: {order_info['priority']}")
+    line(f"- **タスク数**: {total_tasks}件（完了: {completed_count}件）")
+    line(f"- **REPORTファイル数**: {len(reports)}件")
+    line("")
 
     # タスク一覧
-    lines.append("## タスク一覧")
-    lines.append("")
-    lines.append("| タスクID | タイトル | 優先度 | ステータス | 担当 |")
-    lines.append("|---------|----------|--------|------------|------|")
+    line("## タスク一覧")
+    line("")
+    line("| タスクID | タイトル | 優先度 | ステータス | 担当 |")
+    line("|---------|----------|--------|------------|------|")
     for task in tasks:
         task_id = task.get("id", "-")
         title = task.get("title", "-")
         priority = task.get("priority", "-")
         status = task.get("status", "-")
         assignee = task.get("assignee") or "-"
-        lines.append(f"| {task_id} | {title} | {priority} | {status} | {assignee} |")
-    lines.append("")
+        line(f"| {task_id} | {title} | {priority} | {status} | {assignee} |")
+    line("")
 
     # 各タスクの実施内容
-    lines.append("## 実施内容")
-    lines.append("")
+    line("## 実施内容")
+    line("")
 
     for task in tasks:
         task_id = task.get("id", "UNKNOWN")
         task_title = task.get("title", "-")
         task_status = task.get("status", "-")
 
-        lines.append(f"### {task_id}: {task_title}")
-        lines.append("")
-        lines.append(f"**ステータス**: {task_status}")
+        line(f"### {task_id}: {task_title}")
+        line("")
+        line(f"**ステータス**: {task_status}")
         if task.get("completed_at"):
-            lines.append(f"**完了日時**: {task['completed_at']}")
-        lines.append("")
+            line(f"**完了日時**: {task['completed_at']}")
+        line("")
 
         if task_id in report_by_task:
             report = report_by_task[task_id]
-            parsed = parse_report_summary(report["content"])
+            parsed = _parsed(report)
 
             if parsed["summary"]:
-                lines.append(f"**概要**: {parsed['summary']}")
-                lines.append("")
+                line(f"**概要**: {parsed['summary']}")
+                line("")
 
             if parsed["details"]:
-                lines.append("**詳細**:")
+                line("**詳細**:")
                 for detail in parsed["details"]:
-                    lines.append(f"- {detail}")
-                lines.append("")
+                    line(f"- {detail}")
+                line("")
 
             if parsed["artifacts"]:
-                lines.append("**成果物**:")
+                line("**成果物**:")
                 for artifact in parsed["artifacts"]:
-                    lines.append(f"- `{artifact}`")
-                lines.append("")
+                    line(f"- `{artifact}`")
+                line("")
 
             if parsed["issues"]:
-                lines.append("**発生した問題**:")
+                line("**発生した問題**:")
                 for issue in parsed["issues"]:
-                    lines.append(f"- {issue}")
-                lines.append("")
+                    line(f"- {issue}")
+                line("")
         else:
-            lines.append("*REPORTファイルなし*")
-            lines.append("")
+            line("*REPORTファイルなし*")
+            line("")
 
     # 変更ファイル集計
     all_artifacts = []
     for report in reports:
-        parsed = parse_report_summary(report["content"])
-        all_artifacts.extend(parsed["artifacts"])
+        all_artifacts.extend(_parsed(report)["artifacts"])
 
     if all_artifacts:
-        lines.append("## 変更ファイル一覧")
-        lines.append("")
+        line("## 変更ファイル一覧")
+        line("")
         seen = set()
         for artifact in all_artifacts:
             if artifact not in seen:
                 seen.add(artifact)
-                lines.append(f"- `{artifact}`")
-        lines.append("")
+                line(f"- `{artifact}`")
+        line("")
 
     # フッター
-    lines.append("---")
-    lines.append("")
-    lines.append(f"*このリリースノートは AI PM Framework によって自動生成されました（{generated_at}）*")
-
-    return "\n".join(lines)
+    line("---")
+    line("")
+    line(f"*このリリースノートは AI PM Framework によって自動生成されました（{generated_at}）*")
 
 
 # ============================================================================
 # メイン処理
 # ============================================================================
 
-def generate_release_note(
+def _save_streamed(
+    note_path: Path,
+    render,
+    include_content: bool,
+) -> Optional[str]:
+    """
+    リリースノートを一時ファイルへストリーム書き込みしてから置き換える
+
+    Args:
+        note_path: 保存先パス
+        render: 書き込み先ストリームを受け取る関数
+        include_content: 書き込んだ内容を文字列としても返すか
+
+    Returns:
+        include_content の場合は内容、それ以外はNone
+    """
+    note_path.parent.mkdir(parents=True, exist_ok=True)
+    buffer = io.StringIO() if include_content else None
+    fd, tmp_path = tempfile.mkstemp(dir=str(note_path.parent), prefix=".tmp_RELEASE_NOTE_")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            render(_Tee(f, buffer) if buffer is not None else f)
+        os.replace(tmp_path, str(note_path))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return buffer.getvalue() if buffer is not None else None
+
+
+def generate_release_notes(
     project_id: str,
-    order_id: str,
+    order_ids: Sequence[str],
     *,
     dry_run: bool = False,
     verbose: bool = False,
+    max_workers: int = DEFAULT_REPORT_WORKERS,
+    include_content: bool = True,
 ) -> Dict[str, Any]:
     """
-    リリースノートを生成してRELEASE_NOTE.mdに保存
+    複数ORDERのリリースノートをまとめて生成して各RELEASE_NOTE.mdに保存
+
+    ORDER・タスクはそれぞれ1回のクエリで取得し、全ORDERのREPORTファイルを
+    1つのスレッドプールで読み込む。
 
     Args:
         project_id: プロジェクトID
-        order_id: ORDER ID
+        order_ids: ORDER IDのリスト
         dry_run: Trueの場合はファイルに保存しない
         verbose: 詳細ログ出力
+        max_workers: REPORT読み込みの並列数
+        include_content: 各結果に note_content を含めるか
 
     Returns:
         {
-            "success": bool,
-            "note_path": str,       # 保存先パス（dry_run時はNone）
-            "note_content": str,    # 生成されたMarkdown
-            "task_count": int,
-            "report_count": int,
-            "error": str,           # エラー時のみ
+            "success": bool,        # 全ORDERが成功した場合True
+            "notes": [...],         # ORDERごとの generate_release_note() 形式の結果
         }
     """
-    result: Dict[str, Any] = {
-        "success": False,
-        "note_path": None,
-        "note_content": "",
-        "task_count": 0,
-        "report_count": 0,
-    }
+    order_ids = list(dict.fromkeys(order_ids))
 
-    # ORDER情報取得
     if verbose:
-        print(f"[INFO] ORDER情報を取得中: {order_id}")
-    order_info = get_order_info(project_id, order_id)
-    if not order_info:
-        result["error"] = f"ORDER {order_id} が見つかりません（project: {project_id}）"
-        return result
-
-    # タスク一覧取得
-    if verbose:
-        print(f"[INFO] タスク一覧を取得中")
-    tasks = get_tasks_for_order(project_id, order_id)
-    result["task_count"] = len(tasks)
-
-    if verbose:
-        print(f"[INFO] {len(tasks)}件のタスクを取得")
+        print(f"[INFO] ORDER情報・タスク一覧を取得中: {', '.join(order_ids)}")
+    conn = get_connection()
+    try:
+        orders = get_orders_info(conn, project_id, order_ids)
+        tasks_by_order = get_tasks_for_orders(conn, project_id, list(orders))
+    finally:
+        conn.close()
 
     # Roamingパスを取得
     paths = get_project_paths(project_id)
-    result_order_dir = paths["result"] / order_id
+    found = [order_id for order_id in order_ids if order_id in orders]
+    result_dirs = {order_id: paths["result"] / order_id for order_id in found}
+
+    # REPORTファイル読み込み（全ORDER分をまとめて並列に）
+    reports_by_order = dict(zip(
+        found,
+        read_reports_for_orders([result_dirs[order_id] for order_id in found], max_workers=max_workers),
+    ))
+
+    notes = []
+    for order_id in order_ids:
+        result: Dict[str, Any] = {
+            "success": False,
+            "note_path": None,
+            "note_content": "",
+            "task_count": 0,
+            "report_count": 0,
+        }
+        notes.append(result)
 
-    if verbose:
-        print(f"[INFO] RESULTディレクトリ: {result_order_dir}")
+        order_info = orders.get(order_id)
+        if not order_info:
+            result["error"] = f"ORDER {order_id} が見つかりません（project: {project_id}）"
+            continue
 
-    # REPORTファイル読み込み
-    reports = read_report_files(result_order_dir)
-    result["report_count"] = len(reports)
+        tasks = tasks_by_order[order_id]
+        reports = reports_by_order[order_id]
+        result_order_dir = result_dirs[order_id]
+        result["task_count"] = len(tasks)
+        result["report_count"] = len(reports)
 
-    if verbose:
-        print(f"[INFO] {len(reports)}件のREPORTファイルを読み込み")
-        for r in reports:
-            print(f"  - {r['filename']}")
-
-    # Markdown生成
-    markdown_content = generate_release_note_markdown(
-        project_id=project_id,
-        order_id=order_id,
-        order_info=order_info,
-        tasks=tasks,
-        reports=reports,
-    )
-    result["note_content"] = markdown_content
+        if verbose:
+            print(f"[INFO] {order_id}: {len(tasks)}件のタスクを取得")
+            print(f"[INFO] RESULTディレクトリ: {result_order_dir}")
+            print(f"[INFO] {len(reports)}件のREPORTファイルを読み込み")
+            for r in reports:
+                print(f"  - {r['filename']}")
 
-    # ファイル保存
-    note_path = result_order_dir / "RELEASE_NOTE.md"
-    result["note_path"] = str(note_path)
+        def render(out, order_id=order_id, order_info=order_info, tasks=tasks, reports=reports):
+            write_release_note(out, project_id, order_id, order_info, tasks, reports)
 
-    if not dry_run:
-        # ディレクトリが存在しない場合は作成
-        result_order_dir.mkdir(parents=True, exist_ok=True)
+        # ファイル保存
+        note_path = result_order_dir / "RELEASE_NOTE.md"
+        result["note_path"] = str(note_path)
 
-        if verbose:
-            print(f"[INFO] RELEASE_NOTE.md を保存中: {note_path}")
+        if not dry_run:
+            if verbose:
+                print(f"[INFO] RELEASE_NOTE.md を保存中: {note_path}")
 
-        note_path.write_text(markdown_content, encoding="utf-8")
+            content = _save_streamed(note_path, render, include_content)
+            if content is not None:
+                result["note_content"] = content
 
-        if verbose:
-            print(f"[INFO] 保存完了: {note_path}")
-    else:
-        if verbose:
-            print(f"[INFO] DRY RUN: ファイルへの保存はスキップ")
+            if verbose:
+                print(f"[INFO] 保存完了: {note_path}")
+        else:
+            if include_content:
+                buffer = io.StringIO()
+                render(buffer)
+                result["note_content"] = buffer.getvalue()
+            if verbose:
+                print(f"[INFO] DRY RUN: ファイルへの保存はスキップ")
+
+        result["success"] = True
+
+    return {
+        "success": all(note["success"] for note in notes),
+        "notes": notes,
+    }
 
-    result["success"] = True
-    return result
+
+def generate_release_note(
+    project_id: str,
+    order_id: str,
+    *,
+    dry_run: bool = False,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    リリースノートを生成してRELEASE_NOTE.mdに保存
+
+    Args:
+        project_id: プロジェクトID
+        order_id: ORDER ID
+        dry_run: Trueの場合はファイルに保存しない
+        verbose: 詳細ログ出力
+
+    Returns:
+        {
+            "success": bool,
+            "note_path": str,       # 保存先パス（dry_run時はNone）
+            "note_content": str,    # 生成されたMarkdown
+            "task_count": int,
+            "report_count": int,
+            "error": str,           # エラー時のみ
+        }
+    """
+    return generate_release_notes(
+        project_id, [order_id], dry_run=dry_run, verbose=verbose,
+    )["notes"][0]
 
 
 # ============================================================================
@@ -431,39 +698,46 @@ def main():
     )
 
     parser.add_argument("project_id", help="プロジェクトID")
-    parser.add_argument("order_id", help="ORDER ID（例: ORDER_017）")
+    parser.add_argument("order_ids", nargs="+", metavar="order_id",
+                        help="ORDER ID（例: ORDER_017）。複数指定可")
     parser.add_argument("--dry-run", action="store_true",
                         help="ファイルに保存せずプレビューのみ")
     parser.add_argument("--json", action="store_true", help="JSON形式で出力")
     parser.add_argument("--verbose", "-v", action="store_true",
                         help="詳細ログ出力")
+    parser.add_argument("--workers", type=int, default=DEFAULT_REPORT_WORKERS,
+                        help=f"REPORT読み込みの並列数（デフォルト: {DEFAULT_REPORT_WORKERS}）")
 
     args = parser.parse_args()
 
     try:
-        result = generate_release_note(
+        batch = generate_release_notes(
             project_id=args.project_id,
-            order_id=args.order_id,
+            order_ids=args.order_ids,
             dry_run=args.dry_run,
             verbose=args.verbose,
+            max_workers=args.workers,
         )
+        # 単一ORDERの場合は従来どおりの形式で出力する
+        result = batch["notes"][0] if len(batch["notes"]) == 1 else batch
 
         if args.json:
             # Electron UIがnote_contentを表示するため、常に含める
             print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
         else:
-            if result.get("success"):
-                if args.dry_run:
-                    print("=== リリースノートプレビュー ===")
-                    print(result.get("note_content", ""))
-                    print("=== プレビュー終了 ===")
+            for note in batch["notes"]:
+                if note.get("success"):
+                    if args.dry_run:
+                        print("=== リリースノートプレビュー ===")
+                        print(note.get("note_content", ""))
+                        print("=== プレビュー終了 ===")
+                    else:
+                        print(f"リリースノートを生成しました: {note.get('note_path')}")
+                        print(f"タスク数: {note.get('task_count')}, REPORTファイル数: {note.get('report_count')}")
                 else:
-                    print(f"リリースノートを生成しました: {result.get('note_path')}")
-                    print(f"タスク数: {result.get('task_count')}, REPORTファイル数: {result.get('report_count')}")
-            else:
-                print(f"エラー: {result.get('error', '不明なエラー')}", file=sys.stderr)
+                    print(f"エラー: {note.get('error', '不明なエラー')}", file=sys.stderr)
 
-        sys.exit(0 if result.get("success") else 1)
+        sys.exit(0 if batch.get("success") else 1)
 
     except Exception as e:
         if args.json:
@@ -36,12 +36,16 @@ Workflow:
 import argparse
 import fnmatch
 import json
+import os
 import re
 import subprocess
 import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # 親パッケージからインポート
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -119,35 +123,67 @@ INVALID_PATH_PATTERNS = [
 # ファイルパターンマッチング
 # ============================================================================
 
+class _PatternMatcher:
+    """
+    globパターンリストを1つの正規表現にまとめたマッチャー
+
+    判定ルールは従来の逐次fnmatchと同一:
+        - パス全体がパターンにマッチ（** は * として扱う）
+        - ** パターンは "prefix/" で始まるパスにもマッチ
+        - パスの末尾コンポーネントがパターンにマッチ
+    """
+
+    def __init__(self, patterns: Tuple[str, ...]):
+        # fnmatch.fnmatch は os.path.normcase を通すため Windows では大小文字を区別しない
+        flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+        full_alternatives = []
+        for pattern in patterns:
+            if "**" in pattern:
+                full_alternatives.append(fnmatch.translate(pattern.replace("**", "*")))
+                prefix = pattern.split("**")[0].rstrip("/")
+                if prefix:
+                    full_alternatives.append(re.escape(prefix + "/"))
+            else:
+                full_alternatives.append(fnmatch.translate(pattern))
+        base_alternatives = [fnmatch.translate(pattern) for pattern in patterns]
+
+        self._full = self._compile(full_alternatives, flags)
+        self._base = self._compile(base_alternatives, flags)
+
+    @staticmethod
+    def _compile(alternatives: List[str], flags: int) -> Optional["re.Pattern[str]"]:
+        if not alternatives:
+            return None
+        return re.compile("|".join(f"(?:{alt})" for alt in alternatives), flags)
+
+    def matches(self, filepath: str) -> bool:
+        filepath_posix = filepath.replace("\\", "/")
+        if self._full is not None and self._full.match(filepath_posix):
+            return True
+        basename = filepath_posix.rsplit("/", 1)[-1]
+        return self._base is not None and self._base.match(basename) is not None
+
+
+@lru_cache(maxsize=16)
+def _get_matcher(patterns: Tuple[str, ...]) -> _PatternMatcher:
+    """パターンタプルに対応するコンパイル済みマッチャーを取得"""
+    return _PatternMatcher(patterns)
+
+
 def _matches_any_pattern(filepath: str, patterns: List[str]) -> bool:
     """ファイルパスがパターンリストのいずれかにマッチするか判定"""
-    filepath_posix = filepath.replace("\\", "/")
-    for pattern in patterns:
-        # ** を含むパターン
-        if "**" in pattern:
-            # fnmatch は ** を直接サポートしないので段階的にチェック
-            base_pattern = pattern.replace("**", "*")
-            if fnmatch.fnmatch(filepath_posix, base_pattern):
-                return True
-            # ディレクトリプレフィックスでもチェック
-            prefix = pattern.split("**")[0].rstrip("/")
-            if prefix and filepath_posix.startswith(prefix + "/"):
-                return True
-        elif fnmatch.fnmatch(filepath_posix, pattern):
-            return True
-        # パスの末尾コンポーネントでもチェック
-        basename = filepath_posix.split("/")[-1]
-        if fnmatch.fnmatch(basename, pattern):
-            return True
-    return False
+    return _get_matcher(tuple(patterns)).matches(filepath)
+
+
+_INVALID_PATH_RE = re.compile("|".join(f"(?:{p})" for p in INVALID_PATH_PATTERNS))
 
 
 def should_stage_file(filepath: str) -> bool:
     """ファイルをステージング対象にすべきか判定"""
     # 不正パターンに一致 → 対象外（ドライブレター、オクタルエスケープ等）
-    for pattern in INVALID_PATH_PATTERNS:
-        if re.search(pattern, filepath):
-            return False
+    if _INVALID_PATH_RE.search(filepath):
+        return False
     # 除外パターンに一致 → 対象外
     if _matches_any_pattern(filepath, EXCLUDE_PATTERNS):
         return False
@@ -167,6 +203,31 @@ def _get_ai_pm_root() -> Path:
     return Path(__file__).resolve().parent.parent.parent
 
 
+def parse_status_z(output: bytes) -> List[Tuple[str, str]]:
+    """
+    `git status --porcelain -z` の出力を (ステータスコード, パス) のリストに変換
+
+    -z 形式ではパスはクォートされず NUL 区切りで出力される。
+    リネーム/コピー（X または Y が R/C）は "XY 新パス\\0旧パス\\0" となるため、
+    旧パスのエントリは読み飛ばす。パスは surrogateescape でデコードし、
+    非UTF-8のバイト列も git add にそのまま戻せるようにする。
+    """
+    entries = []
+    fields = output.split(b"\0")
+    i = 0
+    while i < len(fields):
+        field = fields[i]
+        i += 1
+        if len(field) < 4:
+            continue
+        status_code = field[:2].decode("ascii", errors="replace")
+        filepath = field[3:].decode("utf-8", errors="surrogateescape")
+        if "R" in status_code or "C" in status_code:
+            i += 1  # 旧パスをスキップ
+        entries.append((status_code, filepath))
+    return entries
+
+
 def collect_stageable_files(ai_pm_root: Optional[Path] = None) -> Dict[str, Any]:
     """
     git statusから変更ファイルを取得し、ステージング対象をフィルタリング
@@ -178,48 +239,17 @@ def collect_stageable_files(ai_pm_root: Optional[Path] = None) -> Dict[str, Any]
         ai_pm_root = _get_ai_pm_root()
 
     result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True, text=True,
+        ["git", "status", "--porcelain", "-z"],
+        capture_output=True,
         cwd=str(ai_pm_root),
-        encoding="utf-8",
-        errors="replace",
     )
 
     if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace")
         return {"files": [], "excluded": [], "total_changed": 0,
-                "error": f"git status failed: {result.stderr}"}
+                "error": f"git status failed: {stderr}"}
 
-    def _decode_git_quoted_path(quoted_path: str) -> str:
-        """gitのクォートされたパス内のオクタルエスケープ(\\NNN)をデコード"""
-        def _octal_replace(m):
-            return bytes([int(m.group(1), 8)])
-        try:
-            raw = re.sub(
-                rb"\\([0-3][0-7]{2})",
-                _octal_replace,
-                quoted_path.encode("latin-1"),
-            )
-            return raw.decode("utf-8", errors="replace")
-        except Exception:
-            return quoted_path  # デコード失敗時は元のパスを使用
-
-    all_files = []
-    for line in result.stdout.strip().split("\n"):
-        if not line.strip():
-            continue
-        # git status --porcelain: XY PATH (XY=2 chars, then space + path)
-        # X=staged, Y=unstaged, ?? = untracked
-        status_code = line[:2]
-        # XY の後のパスを取得（XY後のスペース区切りを考慮）
-        filepath = line[2:].lstrip(" ")
-        # リネームの場合 "old -> new" 形式
-        if " -> " in filepath:
-            filepath = filepath.split(" -> ")[1]
-        # クォートされたパスの処理（git は特殊文字を含むパスを
-        # "\357\200\272path" のようにオクタルエスケープで出力する）
-        if filepath.startswith('"') and filepath.endswith('"'):
-            filepath = _decode_git_quoted_path(filepath[1:-1])
-        all_files.append((status_code, filepath))
+    all_files = parse_status_z(result.stdout)
 
     staged = []
     excluded = []
@@ -237,15 +267,8 @@ def collect_stageable_files(ai_pm_root: Optional[Path] = None) -> Dict[str, Any]
     }
 
 
-def run_git_add(files: List[str], ai_pm_root: Optional[Path] = None) -> Dict[str, Any]:
-    """git add を実行"""
-    if ai_pm_root is None:
-        ai_pm_root = _get_ai_pm_root()
-
-    if not files:
-        return {"success": True, "added": 0, "message": "No files to stage"}
-
-    # バッチでgit add（一度に多すぎる場合は分割）
+def _run_git_add_batched(files: List[str], ai_pm_root: Path) -> Dict[str, Any]:
+    """git add を引数バッチで実行（--pathspec-from-file 非対応のgit向け）"""
     batch_size = 50
     total_added = 0
 
@@ -256,7 +279,7 @@ def run_git_add(files: List[str], ai_pm_root: Optional[Path] = None) -> Dict[str
             capture_output=True, text=True,
             cwd=str(ai_pm_root),
             encoding="utf-8",
-            errors="replace",
+            errors="surrogateescape",
         )
         if result.returncode != 0:
             return {
@@ -266,7 +289,44 @@ def run_git_add(files: List[str], ai_pm_root: Optional[Path] = None) -> Dict[str
             }
         total_added += len(batch)
 
-    return {"success": True, "added": total_added}
+    return {"success": True, "added": total_added, "invocations": -(-len(files) // batch_size)}
+
+
+def run_git_add(files: List[str], ai_pm_root: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    git add を実行
+
+    パス一覧を NUL 区切りで標準入力に渡し、1回の
+    `git add --pathspec-from-file=- --pathspec-file-nul` でステージングする。
+    git 2.25 以前など同オプション非対応の場合はバッチ実行にフォールバックする。
+    """
+    if ai_pm_root is None:
+        ai_pm_root = _get_ai_pm_root()
+
+    if not files:
+        return {"success": True, "added": 0, "message": "No files to stage"}
+
+    pathspec = b"".join(
+        f.encode("utf-8", errors="surrogateescape") + b"\0" for f in files
+    )
+    result = subprocess.run(
+        ["git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+        input=pathspec,
+        capture_output=True,
+        cwd=str(ai_pm_root),
+    )
+
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        if "pathspec-from-file" in stderr or "pathspec-file-nul" in stderr:
+            return _run_git_add_batched(files, ai_pm_root)
+        return {
+            "success": False,
+            "error": f"git add failed: {stderr}",
+            "added": 0,
+        }
+
+    return {"success": True, "added": len(files), "invocations": 1}
 
 
 def run_git_commit(message: str, ai_pm_root: Optional[Path] = None) -> Dict[str, Any]:
@@ -671,6 +731,16 @@ def _record_release_logs(
 # メイン実行
 # ============================================================================
 
+@contextmanager
+def _timed_step(timings: Dict[str, float], name: str) -> Iterator[None]:
+    """ステップの所要時間（秒）を timings[name] に記録"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round(time.perf_counter() - start, 4)
+
+
 def execute_git_release(
     project_id: str,
     order_ids: List[str],
@@ -692,17 +762,20 @@ def execute_git_release(
         実行結果の辞書
     """
     ai_pm_root = _get_ai_pm_root()
+    timings: Dict[str, float] = {}
     result: Dict[str, Any] = {
         "success": True,
         "project_id": project_id,
         "order_ids": order_ids,
         "dry_run": dry_run,
         "steps": {},
+        "timings": timings,
         "executed_at": datetime.now().isoformat(),
     }
 
     # Step 1: ORDER検証
-    validation = _validate_orders(project_id, order_ids)
+    with _timed_step(timings, "validate"):
+        validation = _validate_orders(project_id, order_ids)
     result["steps"]["validate"] = validation
     if not validation["success"]:
         result["success"] = False
@@ -714,7 +787,8 @@ def execute_git_release(
 
     if dry_run:
         # ドライランの場合はステージング対象のみ表示
-        staging = collect_stageable_files(ai_pm_root)
+        with _timed_step(timings, "staging"):
+            staging = collect_stageable_files(ai_pm_root)
         result["steps"]["staging_preview"] = staging
 
         msg = custom_message or generate_commit_message(
@@ -723,7 +797,8 @@ def execute_git_release(
         result["steps"]["commit_message_preview"] = msg
 
         # 破壊的DB変更チェック（プレビュー）
-        destructive_check = _check_destructive_db_changes(project_id, order_ids)
+        with _timed_step(timings, "migration_check"):
+            destructive_check = _check_destructive_db_changes(project_id, order_ids)
         if destructive_check.get("has_migrations"):
             result["steps"]["migration_preview"] = destructive_check
 
@@ -732,7 +807,8 @@ def execute_git_release(
 
     # Step 2: マイグレーション実行（破壊的DB変更を含む場合）
     if not skip_migration:
-        migration_result = _execute_migrations(project_id, order_ids, ai_pm_root)
+        with _timed_step(timings, "migrations"):
+            migration_result = _execute_migrations(project_id, order_ids, ai_pm_root)
         result["steps"]["migrations"] = migration_result
 
         if not migration_result["success"]:
@@ -742,48 +818,53 @@ def execute_git_release(
 
     # Step 3: ORDER完了
     if not skip_complete:
-        completed = _complete_orders(project_id, order_ids)
+        with _timed_step(timings, "complete_orders"):
+            completed = _complete_orders(project_id, order_ids)
         result["steps"]["complete_orders"] = completed
 
     # Step 3.5: PROJECT_INFO.md自動更新（ORDER完了後・BACKLOG更新前）
     project_info_updates = []
-    for order_id_item in order_ids:
-        try:
-            from pm.process_order import PMProcessor
-            processor = PMProcessor(project_id, order_id_item, skip_ai=True)
-            update_result = processor.update_project_info_from_learnings(order_id_item)
-            project_info_updates.append({
-                "order_id": order_id_item,
-                "updated": update_result.get("updated", False),
-                "added_count": update_result.get("added_count", 0),
-            })
-        except Exception as e:
-            # PROJECT_INFO更新失敗は警告のみ（リリースは継続）
-            project_info_updates.append({
-                "order_id": order_id_item,
-                "updated": False,
-                "error": str(e),
-            })
+    with _timed_step(timings, "project_info_updates"):
+        for order_id_item in order_ids:
+            try:
+                from pm.process_order import PMProcessor
+                processor = PMProcessor(project_id, order_id_item, skip_ai=True)
+                update_result = processor.update_project_info_from_learnings(order_id_item)
+                project_info_updates.append({
+                    "order_id": order_id_item,
+                    "updated": update_result.get("updated", False),
+                    "added_count": update_result.get("added_count", 0),
+                })
+            except Exception as e:
+                # PROJECT_INFO更新失敗は警告のみ（リリースは継続）
+                project_info_updates.append({
+                    "order_id": order_id_item,
+                    "updated": False,
+                    "error": str(e),
+                })
     result["steps"]["project_info_updates"] = project_info_updates
 
     # Step 4: BACKLOG更新
     backlog_ids = []
     if not skip_backlog:
-        updated_backlogs = _complete_backlogs(project_id, order_ids)
+        with _timed_step(timings, "backlog_updates"):
+            updated_backlogs = _complete_backlogs(project_id, order_ids)
         result["steps"]["backlog_updates"] = updated_backlogs
         backlog_ids = [bl["id"] for bl in updated_backlogs]
 
     # Step 5: RELEASE_LOG記録
     if not skip_log:
-        log_results = _record_release_logs(
-            project_id, order_ids, order_titles, backlog_ids or None,
-        )
+        with _timed_step(timings, "release_logs"):
+            log_results = _record_release_logs(
+                project_id, order_ids, order_titles, backlog_ids or None,
+            )
         result["steps"]["release_logs"] = log_results
 
     # Step 6: git add & commit
     if not skip_git:
         # ステージング対象収集
-        staging = collect_stageable_files(ai_pm_root)
+        with _timed_step(timings, "staging"):
+            staging = collect_stageable_files(ai_pm_root)
         result["steps"]["staging"] = staging
 
         files_to_add = staging["files"]
@@ -797,7 +878,8 @@ def execute_git_release(
             return result
 
         # git add
-        add_result = run_git_add(files_to_add, ai_pm_root)
+        with _timed_step(timings, "git_add"):
+            add_result = run_git_add(files_to_add, ai_pm_root)
         result["steps"]["git_add"] = add_result
 
         if not add_result["success"]:
@@ -811,7 +893,8 @@ def execute_git_release(
         )
 
         # git commit
-        commit_result = run_git_commit(commit_msg, ai_pm_root)
+        with _timed_step(timings, "git_commit"):
+            commit_result = run_git_commit(commit_msg, ai_pm_root)
         result["steps"]["git_commit"] = commit_result
 
         if not commit_result["success"]:
@@ -824,7 +907,8 @@ def execute_git_release(
 
     # Step 7: ビルド実行（Electronアプリ等）
     if not skip_build:
-        build_result = _execute_build(project_id, order_ids)
+        with _timed_step(timings, "build"):
+            build_result = _execute_build(project_id, order_ids)
         result["steps"]["build"] = build_result
 
         # ビルド失敗は警告のみ（リリースは継続）
@@ -918,6 +1002,12 @@ def format_output(result: Dict[str, Any], json_output: bool = False) -> str:
         elif not build.get("success") and not build.get("skipped"):
             lines.append(f"  Build: FAILED - {build.get('error', 'unknown')}")
 
+        timings = result.get("timings", {})
+        if timings:
+            lines.append("  Timings: " + ", ".join(
+                f"{name}={sec:.2f}s" for name, sec in timings.items()
+            ))
+
         # 警告表示
         warnings = result.get("warnings", [])
         if warnings:
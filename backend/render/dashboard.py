@@ -63,6 +63,9 @@ class ProjectHealthData:
     open_escalations: int = 0      # 未解決エスカレーション数
     blocked_ratio: float = 0.0     # ブロック率 (0.0-1.0)
 
+    # 現在ORDERの完了見込み（タスク予測モデルによる残り所要時間、秒）
+    current_order_eta_seconds: Optional[float] = None
+
     # 最終更新
     last_activity: Optional[str] = None
 
@@ -276,6 +279,7 @@ class DashboardRenderContext:
                     "open_escalations": p.open_escalations,
                     "blocked_ratio": p.blocked_ratio,
                     "blocked_ratio_percent": int(p.blocked_ratio * 100),
+                    "current_order_eta": format_eta(p.current_order_eta_seconds),
                     "last_activity": p.last_activity,
                 }
                 for p in self.projects
@@ -400,6 +404,46 @@ def detect_stagnant_tasks(
     return stagnant_tasks
 
 
+def format_eta(seconds: Optional[float]) -> Optional[str]:
+    """
+    残り所要時間を表示用文字列に変換（例: "約2時間15分"）
+
+    Args:
+        seconds: 残り秒数（Noneの場合はNone）
+    """
+    if seconds is None:
+        return None
+    minutes = int(round(seconds / 60))
+    if minutes < 1:
+        return "1分未満"
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"約{hours}時間{minutes}分" if minutes else f"約{hours}時間"
+    return f"約{minutes}分"
+
+
+def estimate_current_order_eta(conn, project_id: str, order_id: str) -> Optional[float]:
+    """
+    現在ORDERの残り所要時間をタスク予測モデルで見積もる
+
+    task_prediction_models に保存済みのモデル（`task_duration.py train` で学習）の予測値で
+    未完了タスクを並列実行シミュレーションする。描画のたびに履歴から学習し直さないよう、
+    保存済みモデル・関連テーブルがない場合はNone（ダッシュボード生成は継続）。
+    """
+    try:
+        from config.worker_config import get_worker_config
+        from worker.schedule_simulator import estimate_order_eta
+        from worker.task_duration import load_stored_model
+
+        model = load_stored_model(conn, project_id)
+        if model is None:
+            return None
+        max_workers = get_worker_config().max_concurrent_workers
+        return estimate_order_eta(conn, project_id, order_id, max_workers, model=model)["eta_seconds"]
+    except Exception:
+        return None
+
+
 def load_dashboard_context(
     db_path: Optional[Path] = None,
     include_inactive_projects: bool = False,
@@ -568,6 +612,11 @@ def load_dashboard_context(
                 last_activity=proj_row["project_updated_at"],
             )
 
+            if current_order and current_order["status"] == "IN_PROGRESS":
+                project_health.current_order_eta_seconds = estimate_current_order_eta(
+                    conn, project_id, current_order["id"]
+                )
+
             # 健康状態を計算
             project_health.status = calculate_health(
                 escalation_count=project_health.open_escalations,
@@ -2,12 +2,20 @@
 AI PM Framework - タスク管理モジュール
 
 タスクの作成、更新、一覧取得、詳細取得機能を提供。
+
+公開関数は属性アクセス時に遅延インポートする（utils/lazy_import.py）。
 """
 
-from .create import create_task
-from .update import update_task, update_task_status
-from .list import list_tasks
-from .get import get_task
+from utils.lazy_import import lazy_exports
+
+# 公開名 → 定義元サブモジュール
+_LAZY_EXPORTS = {
+    "create_task": ".create",
+    "update_task": ".update",
+    "update_task_status": ".update",
+    "list_tasks": ".list",
+    "get_task": ".get",
+}
 
 __all__ = [
     "create_task",
@@ -16,3 +24,5 @@ __all__ = [
     "list_tasks",
     "get_task",
 ]
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Project Analysis Service Tests
+
+quality/analysis_service.py (fake dmypy / mypy / ruff on PATH):
+- dmypy stays warm after the first request; results are parsed into AnalysisIssue
+- Concurrent mypy requests for one project are serialized
+- Falls back to incremental mypy with a shared cache dir when dmypy is missing or fails
+- StaticAnalyzer and SelfVerificationRunner are served by it
+- benchmark() reports cold vs warm latency
+"""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quality.analysis_service import AnalysisService, benchmark
+from quality.static_analyzer import TOOL_ARGS, AnalysisIssue, StaticAnalyzer
+from worker.self_verification import SelfVerificationRunner
+
+
+COLD_START_SECONDS = 0.4
+
+_FAKE_DMYPY = """
+args = sys.argv[1:]
+status = args[args.index("--status-file") + 1]
+if "stop" in args:
+    if os.path.exists(status):
+        os.remove(status)
+    sys.exit(0)
+if os.environ.get("FAKE_DMYPY_CRASH"):
+    print("Daemon crashed", file=sys.stderr)
+    sys.exit(2)
+started = time.time()
+if not os.path.exists(status):
+    time.sleep(COLD)
+    with open(status, "w") as fh:
+        fh.write("{}")
+    print("Daemon started")
+time.sleep(0.05)
+report(args[args.index("--") + 1:], started)
+"""
+
+_FAKE_MYPY = """
+started = time.time()
+time.sleep(COLD)
+report(sys.argv[1:], started)
+"""
+
+_FAKE_RUFF = """
+with open(os.environ["FAKE_TOOL_LOG"], "a") as fh:
+    fh.write(json.dumps(["ruff", sys.argv[1:]]) + "\\n")
+print("src/a.py:1:8: F401 [*] `os` imported but unused")
+print("Found 1 error.")
+sys.exit(1)
+"""
+
+_PRELUDE = """
+import json, os, sys, time
+COLD = {cold}
+def report(args, started):
+    paths = [a for a in args if not a.startswith("-") and not a.startswith("/")]
+    for path in paths:
+        print(f"{{path}}:1:1: error: fake error")
+    with open(os.environ["FAKE_TOOL_LOG"], "a") as fh:
+        fh.write(json.dumps([os.path.basename(sys.argv[0]), args, started, time.time()]) + "\\n")
+    sys.exit(1 if paths else 0)
+"""
+
+
+@pytest.fixture
+def fake_tools(tmp_path):
+    if os.name == "nt":
+        pytest.skip("shell stub")
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    project = tmp_path / "project"
+    project.mkdir()
+    log = tmp_path / "tools.log"
+    log.touch()
+
+    def install(name, body):
+        path = bin_dir / name
+        prelude = _PRELUDE.format(cold=COLD_START_SECONDS)
+        path.write_text(f"#!{sys.executable}\n{prelude}\n{body}\n", encoding="utf-8")
+        path.chmod(0o755)
+
+    install("dmypy", _FAKE_DMYPY)
+    install("mypy", _FAKE_MYPY)
+    install("ruff", _FAKE_RUFF)
+
+    env = {"PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}", "FAKE_TOOL_LOG": str(log)}
+    with mock.patch.dict(os.environ, env):
+        service = AnalysisService(project)
+        yield service, bin_dir, log
+        service.stop()
+
+
+def _log_entries(log):
+    return [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+
+def test_daemon_stays_warm(fake_tools):
+    service, _, log = fake_tools
+    flags = list(TOOL_ARGS["mypy"])
+
+    first = service.run_mypy(flags, ["src/a.py"])
+    assert first.mode == "daemon"
+    assert first.returncode == 1
+    assert first.issues == [AnalysisIssue("src/a.py", 1, 1, "mypy", "error", "fake error")]
+    assert first.duration_seconds >= COLD_START_SECONDS
+
+    second = service.run_mypy(flags, ["src/a.py", "src/b.py"])
+    assert second.duration_seconds < COLD_START_SECONDS
+    assert [i.file for i in second.issues] == ["src/a.py", "src/b.py"]
+
+    # フラグの組ごとに別デーモン
+    assert service.run_mypy([], ["."]).duration_seconds >= COLD_START_SECONDS
+    assert [entry[0] for entry in _log_entries(log)] == ["dmypy"] * 3
+
+    assert len(service.stop()) == 2
+    assert not service.status_file(flags).exists()
+
+
+def test_concurrent_requests_are_serialized(fake_tools):
+    service, _, log = fake_tools
+    service.run_mypy([], ["warmup.py"])
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda i=i: results.append(service.run_mypy([], [f"src/m{i}.py"])))
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4
+    intervals = sorted((entry[2], entry[3]) for entry in _log_entries(log)[1:])
+    assert len(intervals) == 4
+    for (_, end), (start, _) in zip(intervals, intervals[1:]):
+        assert start >= end
+    assert max(r.lock_wait_seconds for r in results) > 0
+
+
+def test_falls_back_to_shared_incremental_cache(fake_tools):
+    service, bin_dir, log = fake_tools
+
+    # dmypy が異常終了した要求は mypy で実行し直す
+    with mock.patch.dict(os.environ, {"FAKE_DMYPY_CRASH": "1"}):
+        crashed = service.run_mypy([], ["src/a.py"])
+    assert crashed.mode == "incremental"
+    assert crashed.issues[0].file == "src/a.py"
+
+    (bin_dir / "dmypy").unlink()
+    result = service.run_mypy([], ["src/a.py"])
+    assert result.mode == "incremental"
+    name, args = _log_entries(log)[-1][:2]
+    assert name == "mypy"
+    assert args[:2] == ["--cache-dir", str(service.mypy_cache_dir)]
+
+
+def test_static_analyzer_and_self_verification_are_served(fake_tools):
+    service, _, log = fake_tools
+    root = service.project_root
+
+    analyzer = StaticAnalyzer(str(root), use_cache=False)
+    issues = analyzer._run_mypy(["src/a.py"])
+    assert issues == [AnalysisIssue("src/a.py", 1, 1, "mypy", "error", "fake error")]
+    assert _log_entries(log)[-1][0] == "dmypy"
+
+    runner = SelfVerificationRunner(project_dir=root)
+    typecheck = runner._run_check("typecheck", "mypy .")
+    assert not typecheck.passed
+    assert "fake error" in typecheck.output
+
+    lint = runner._run_check("lint", "ruff check .")
+    assert not lint.passed
+    assert "F401" in lint.output
+    assert _log_entries(log)[-1] == ["ruff", ["check", "--cache-dir", str(root / ".ruff_cache"), "."]]
+
+    served = service.run_ruff(["check", "."])
+    assert served.issues[0].message.startswith("[F401]")
+    assert served.issues[0].line == 1 and served.issues[0].col == 8
+
+    # サービスを使わない場合は従来どおりシェルで実行する
+    cold = SelfVerificationRunner(project_dir=root, use_service=False)._run_check("lint", "ruff check .")
+    assert "F401" in cold.output
+    assert _log_entries(log)[-1] == ["ruff", ["check", "."]]
+
+
+def test_benchmark_reports_cold_and_warm_latency(fake_tools):
+    service, _, _ = fake_tools
+    (service.project_root / "src").mkdir()
+    result = benchmark(service.project_root, ["src/a.py"], runs=2)
+    assert result["mode"] == "daemon"
+    assert result["results_match"] is True
+    assert result["warm_first_ms"] >= COLD_START_SECONDS * 1000
+    assert result["warm_ms"] < result["cold_ms"]
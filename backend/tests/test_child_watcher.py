@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Child Exit Watcher Tests
+
+worker/child_watcher.py:
+- pidfd / thread backends notify exits of registered children
+- ParallelWorkerLauncher reaps only notified workers between full sweeps,
+  wakes from its sleep on exit, and records per-worker exit latency
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.worker_config import WorkerResourceConfig
+from worker.child_watcher import (
+    BACKEND_PIDFD,
+    BACKEND_THREAD,
+    ChildExitWatcher,
+    pidfd_supported,
+)
+from worker.parallel_launcher import ParallelWorkerLauncher, summarize_latencies
+
+
+BACKENDS = [
+    BACKEND_THREAD,
+    pytest.param(
+        BACKEND_PIDFD,
+        marks=pytest.mark.skipif(not pidfd_supported(), reason="pidfd_open unavailable"),
+    ),
+]
+
+
+def _spawn(code):
+    return subprocess.Popen([sys.executable, "-c", code])
+
+
+def _wait_for(watcher, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if watcher.wait(0.5):
+            return True
+    return False
+
+
+@pytest.fixture(params=BACKENDS)
+def watcher(request):
+    w = ChildExitWatcher(backend=request.param)
+    yield w
+    w.close()
+
+
+def test_exit_invokes_callback(watcher):
+    exits = []
+    proc = _spawn("pass")
+    watcher.watch(proc, lambda exited_at: exits.append((proc.pid, exited_at)))
+    assert watcher.is_watching(proc.pid)
+
+    assert _wait_for(watcher)
+    assert [pid for pid, _ in exits] == [proc.pid]
+    assert proc.wait(timeout=5) == 0
+    assert not watcher.is_watching(proc.pid)
+    assert watcher.watched_count == 0
+
+
+def test_running_child_times_out(watcher):
+    proc = _spawn("import time; time.sleep(30)")
+    try:
+        watcher.watch(proc, lambda exited_at: None)
+        started = time.monotonic()
+        assert watcher.wait(0.2) == 0
+        assert time.monotonic() - started < 5
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_unwatch_suppresses_callback(watcher):
+    exits = []
+    proc = _spawn("pass")
+    watcher.watch(proc, lambda exited_at: exits.append(exited_at))
+    watcher.unwatch(proc.pid)
+    proc.wait(timeout=5)
+    watcher.wait(0.2)
+    assert exits == []
+
+
+def test_already_reaped_child_is_reported():
+    if not pidfd_supported():
+        pytest.skip("pidfd_open unavailable")
+    watcher = ChildExitWatcher(backend=BACKEND_PIDFD)
+    try:
+        proc = _spawn("pass")
+        proc.wait(timeout=5)
+        exits = []
+        watcher.watch(proc, lambda exited_at: exits.append(exited_at))
+        assert watcher.wait(0) == 1
+        assert len(exits) == 1
+    finally:
+        watcher.close()
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        ChildExitWatcher(backend="sigchld")
+
+
+def test_summarize_latencies():
+    summary = summarize_latencies([
+        {"task_id": "A", "latency_ms": 10.0},
+        {"task_id": "B", "latency_ms": 30.0},
+        {"task_id": "C", "latency_ms": None},
+    ])
+    assert summary == {"count": 3, "measured": 2, "avg_ms": 20.0, "max_ms": 30.0}
+    assert summarize_latencies([])["avg_ms"] is None
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_launcher_reaps_on_exit_notification(backend):
+    launcher = ParallelWorkerLauncher(
+        "PJ", "ORDER_001",
+        worker_config=WorkerResourceConfig(enable_resource_monitoring=False),
+    )
+    launcher._child_watcher = ChildExitWatcher(backend=backend)
+    running = _spawn("import time; time.sleep(30)")
+    failing = _spawn("import sys, time; time.sleep(0.3); sys.exit(3)")
+    try:
+        for task_id, proc in (("TASK_RUN", running), ("TASK_FAIL", failing)):
+            launcher._running_workers[task_id] = {
+                "process": proc,
+                "pid": proc.pid,
+                "log_file": None,
+                "launched_at": None,
+                "watched": launcher._watch_worker(task_id, proc),
+            }
+
+        # 通知がなければ監視中の Worker は poll しない
+        with mock.patch.object(running, "poll", wraps=running.poll) as poll_spy:
+            launcher._reap_finished_workers(full_sweep=False)
+            launcher._check_worker_health()
+        assert poll_spy.call_count == 0
+        assert set(launcher._running_workers) == {"TASK_RUN", "TASK_FAIL"}
+
+        # 終了通知でスリープが打ち切られる
+        started = time.monotonic()
+        launcher._interruptible_sleep_float(20.0)
+        assert time.monotonic() - started < 10
+
+        launcher._reap_finished_workers(full_sweep=False)
+        launcher._record_exit_latencies()
+        assert set(launcher._running_workers) == {"TASK_RUN"}
+        assert launcher.results["failed_tasks"] == [{"task_id": "TASK_FAIL", "reason": "exit_code_3"}]
+        [entry] = launcher.results["worker_exit_latency"]
+        assert entry["task_id"] == "TASK_FAIL"
+        assert entry["exit_code"] == 3
+        assert entry["detected_by"] == backend
+        assert entry["latency_ms"] >= 0
+    finally:
+        running.kill()
+        running.wait()
+        launcher._child_watcher.close()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Cost Daily Rollup Tests
+
+cost/cost_rollup.py and its use from cost_report / cost_tracker:
+- Reports built from rollups + today's raw tasks match a raw full scan
+- Writes to tasks on rolled-up days (cost records, reclassification, late
+  inserts, deletes) keep the buckets in sync via triggers
+- backfill / consistency check
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cost.cost_report import report_by_model, report_by_order, report_by_project, generate_summary_report
+from cost.cost_rollup import backfill_rollups, check_consistency, get_rolled_through
+from cost.cost_tracker import record_cost
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+TASKS = [
+    # id, order, model, complexity, tokens, cost, created_at modifier
+    ("TASK_1", "ORDER_001", "Opus", 40, 1000, 0.5, "-3 days"),
+    ("TASK_2", "ORDER_001", "Sonnet", None, None, None, "-3 days"),
+    ("TASK_3", "ORDER_002", None, 80, 2000, 1.25, "-1 day"),
+    ("TASK_4", "ORDER_002", "Opus", 10, 500, 0.25, "+0 days"),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "aipm.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ', 'PJ', '/pj')")
+    for order_id in ("ORDER_001", "ORDER_002"):
+        conn.execute(
+            "INSERT INTO orders (id, project_id, title) VALUES (?, 'PJ', ?)",
+            (order_id, order_id),
+        )
+    for task_id, order_id, model, complexity, tokens, cost, modifier in TASKS:
+        conn.execute(
+            """INSERT INTO tasks (id, order_id, project_id, title, recommended_model,
+                   complexity_score, actual_tokens, cost_usd, created_at)
+               VALUES (?, ?, 'PJ', ?, ?, ?, ?, ?, DATETIME('now', ?))""",
+            (task_id, order_id, task_id, model, complexity, tokens, cost, modifier),
+        )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _execute(db_path, sql):
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(sql)
+    conn.commit()
+    conn.close()
+
+
+def _raw_totals(db_path):
+    conn = sqlite3.connect(str(db_path))
+    row = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(cost_usd), 0), COALESCE(SUM(actual_tokens), 0), "
+        "COALESCE(AVG(complexity_score), 0), COALESCE(AVG(cost_usd), 0) FROM tasks"
+    ).fetchone()
+    conn.close()
+    return row
+
+
+class TestReports:
+
+    def test_reports_match_raw_scan(self, db_path):
+        tasks, cost, tokens, avg_complexity, avg_cost = _raw_totals(db_path)
+
+        result = report_by_project(db_path=db_path)
+        assert result["success"] is True
+        assert result["summary"]["total_tasks"] == tasks
+        assert result["summary"]["total_cost_usd"] == pytest.approx(cost)
+        assert result["summary"]["total_tokens"] == tokens
+        assert result["data"][0]["avg_complexity"] == pytest.approx(avg_complexity)
+
+        summary = generate_summary_report(db_path=db_path)["data"]["overview"]
+        assert summary["total_tasks"] == tasks
+        assert summary["total_orders"] == 2
+        assert summary["avg_cost_per_task"] == pytest.approx(avg_cost)
+
+    def test_first_report_materializes_closed_days(self, db_path):
+        report_by_project(db_path=db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        conn.row_factory = sqlite3.Row
+        rolled = get_rolled_through(conn)
+        yesterday = conn.execute("SELECT DATE('now', '-1 day')").fetchone()[0]
+        buckets = conn.execute("SELECT COUNT(*) FROM cost_daily_rollups").fetchone()[0]
+        conn.close()
+
+        assert rolled == yesterday
+        assert buckets == 3  # TASK_4 (today) stays in the raw bucket
+
+    def test_by_order_and_model(self, db_path):
+        orders = {r["order_id"]: r for r in report_by_order("PJ", db_path=db_path)["data"]}
+        assert orders["ORDER_001"]["task_count"] == 2
+        assert orders["ORDER_002"]["total_cost_usd"] == pytest.approx(1.5)
+
+        models = {r["model"]: r for r in report_by_model(db_path=db_path)["data"]}
+        assert models["Opus"]["task_count"] == 2
+        assert models["Unknown"]["total_tokens"] == 2000
+
+    def test_date_filter(self, db_path):
+        conn = sqlite3.connect(str(db_path))
+        day = conn.execute("SELECT DATE('now', '-1 day')").fetchone()[0]
+        conn.close()
+
+        result = report_by_project(db_path=db_path, from_date=day)
+        assert result["summary"]["total_tasks"] == 2
+
+
+class TestIncrementalMaintenance:
+
+    def test_record_cost_updates_rolled_up_bucket(self, db_path):
+        report_by_project(db_path=db_path)  # materialize
+
+        record_cost(str(db_path), "PJ", "TASK_2", "Sonnet", 1000, 1000)
+
+        check = check_consistency(db_path)
+        assert check["consistent"] is True, check["mismatches"]
+        _, cost, _, _, _ = _raw_totals(db_path)
+        assert report_by_project(db_path=db_path)["summary"]["total_cost_usd"] == pytest.approx(cost)
+
+    def test_reclassified_task_moves_bucket(self, db_path):
+        report_by_project(db_path=db_path)
+
+        _execute(
+            db_path,
+            "UPDATE tasks SET recommended_model = 'Sonnet', complexity_score = 20 WHERE id = 'TASK_1'",
+        )
+        _execute(db_path, "UPDATE tasks SET order_id = 'ORDER_002' WHERE id = 'TASK_2'")
+
+        assert check_consistency(db_path)["consistent"] is True
+        models = {r["model"]: r for r in report_by_model(db_path=db_path)["data"]}
+        assert models["Opus"]["task_count"] == 1
+        assert models["Sonnet"]["task_count"] == 2
+        assert models["Sonnet"]["total_cost_usd"] == pytest.approx(0.5)
+        orders = {r["order_id"]: r for r in report_by_order("PJ", db_path=db_path)["data"]}
+        assert orders["ORDER_001"]["task_count"] == 1
+        assert orders["ORDER_002"]["task_count"] == 3
+
+    def test_late_insert_and_delete_on_rolled_up_day(self, db_path):
+        report_by_project(db_path=db_path)
+
+        # created_at を別の時計（ローカル時刻など）で書いたタスクは、集計後でも
+        # 集計済みの日に入ることがある
+        _execute(
+            db_path,
+            "INSERT INTO tasks (id, order_id, project_id, title, recommended_model, cost_usd, created_at) "
+            "VALUES ('TASK_5', 'ORDER_001', 'PJ', 'late', 'Opus', 2.0, "
+            "(SELECT rolled_through FROM cost_rollup_state) || 'T23:30:00')",
+        )
+        _execute(db_path, "DELETE FROM tasks WHERE id = 'TASK_3'")
+
+        assert check_consistency(db_path)["consistent"] is True
+        tasks, cost, tokens, _, _ = _raw_totals(db_path)
+        summary = report_by_project(db_path=db_path)["summary"]
+        assert summary["total_tasks"] == tasks == 4
+        assert summary["total_cost_usd"] == pytest.approx(cost)
+        assert summary["total_tokens"] == tokens
+
+    def test_check_detects_drift_and_backfill_repairs(self, db_path):
+        report_by_project(db_path=db_path)
+        _execute(db_path, "UPDATE cost_daily_rollups SET total_cost_usd = 9.0 WHERE model = 'Opus'")
+
+        check = check_consistency(db_path)
+        assert check["consistent"] is False
+        assert "total_cost_usd" in check["mismatches"][0]["diffs"]
+
+        backfill_rollups(db_path)
+        assert check_consistency(db_path)["consistent"] is True
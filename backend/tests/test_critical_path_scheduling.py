@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Critical-Path Scheduling Tests
+
+- DependencyGraph.get_remaining_path_lengths / weighted get_critical_path
+- worker/task_duration.py: durations from change_history
+- ParallelTaskDetector: launch order by remaining weighted path
+- worker/schedule_simulator.py: critical_path makespan vs FIFO
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import get_connection
+from utils import file_lock
+from worker import dependency_resolver, parallel_detector, task_duration
+from worker.dependency_resolver import DependencyGraph
+from worker.parallel_detector import ORDERING_PRIORITY, ParallelTaskDetector
+from worker.schedule_simulator import (
+    POLICY_CRITICAL_PATH,
+    POLICY_FIFO,
+    SimTask,
+    replay,
+    simulate,
+)
+from worker.task_duration import fetch_task_durations
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+
+def _chain_graph():
+    # A -> B -> C (long chain), D, E (independent)
+    graph = DependencyGraph()
+    for task_id in ("A", "B", "C", "D", "E"):
+        graph.add_task(task_id)
+    graph.add_dependency("B", "A").add_dependency("C", "B")
+    return graph
+
+
+class TestRemainingPathLengths:
+    def test_bottom_levels(self):
+        graph = _chain_graph()
+        ranks = graph.get_remaining_path_lengths({"A": 1, "B": 2, "C": 3, "D": 5, "E": 1})
+        assert ranks == {"A": 6, "B": 5, "C": 3, "D": 5, "E": 1}
+
+    def test_finished_tasks_weigh_nothing(self):
+        graph = _chain_graph()
+        graph.add_task("A", "COMPLETED")
+        ranks = graph.get_remaining_path_lengths({"A": 10, "B": 2, "C": 3})
+        assert ranks["A"] == 5
+        assert ranks["D"] == 1  # default_weight
+
+    def test_weighted_critical_path(self):
+        graph = _chain_graph()
+        assert graph.get_critical_path({"A": 1, "B": 1, "C": 1, "D": 10, "E": 1}) == ["D"]
+        assert graph.get_critical_path({"A": 1, "B": 2, "C": 3, "D": 5, "E": 1}) == ["A", "B", "C"]
+        # 重みなしは従来どおり辺の数で最長
+        assert graph.get_critical_path() == ["A", "B", "C"]
+
+
+class TestWorkingSeconds:
+    def test_working_seconds_excludes_review_wait(self):
+        transitions = [
+            ("IN_PROGRESS", "2026-01-01 10:00:00"),
+            ("DONE", "2026-01-01 10:10:00"),
+            ("REWORK", "2026-01-01 12:00:00"),
+            ("IN_PROGRESS", "2026-01-01 12:00:00"),
+            ("DONE", "2026-01-01 12:05:00"),
+        ]
+        assert task_duration._working_seconds(transitions) == 900
+        assert task_duration._working_seconds([("IN_PROGRESS", "2026-01-01 10:00:00")]) is None
+
+
+class TestSimulator:
+    def test_critical_path_beats_fifo(self):
+        # FIFO は短い独立タスクを先に起動し、長いチェーンの開始が遅れる
+        tasks = [
+            SimTask("S1", 10, 10, created_at="1"),
+            SimTask("S2", 10, 10, created_at="2"),
+            SimTask("A", 10, 10, created_at="3"),
+            SimTask("B", 10, 10, created_at="4", depends_on={"A"}),
+            SimTask("C", 10, 10, created_at="5", depends_on={"B"}),
+        ]
+        fifo = simulate(tasks, 2, POLICY_FIFO)
+        critical = simulate(tasks, 2, POLICY_CRITICAL_PATH)
+        assert fifo["makespan"] == 40
+        assert critical["makespan"] == 30
+        assert critical["schedule"][0]["task_id"] == "A"
+
+    def test_file_conflicts_serialize(self):
+        tasks = [
+            SimTask("A", 10, 10, target_files={"x.py"}),
+            SimTask("B", 10, 10, target_files={"x.py"}),
+        ]
+        assert simulate(tasks, 4, POLICY_FIFO)["makespan"] == 20
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            simulate([], 1, "random")
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "aipm.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ', 'PJ', '/pj')")
+    conn.execute(
+        "INSERT INTO orders (id, project_id, title, status) "
+        "VALUES ('ORDER_001', 'PJ', 'done', 'COMPLETED')"
+    )
+    conn.execute(
+        "INSERT INTO orders (id, project_id, title, status) "
+        "VALUES ('ORDER_002', 'PJ', 'active', 'IN_PROGRESS')"
+    )
+    tasks = [
+        # ORDER_001: 実績つき (S1, S2 は短い独立タスク、A -> B は長いチェーン)
+        ("TASK_001", "ORDER_001", "COMPLETED", 10, "2026-01-01 00:00:01"),
+        ("TASK_002", "ORDER_001", "COMPLETED", 10, "2026-01-01 00:00:02"),
+        ("TASK_003", "ORDER_001", "COMPLETED", 90, "2026-01-01 00:00:03"),
+        ("TASK_004", "ORDER_001", "COMPLETED", 90, "2026-01-01 00:00:04"),
+        # ORDER_002: 起動待ち
+        ("TASK_011", "ORDER_002", "QUEUED", 10, "2026-01-02 00:00:01"),
+        ("TASK_012", "ORDER_002", "QUEUED", 10, "2026-01-02 00:00:02"),
+        ("TASK_013", "ORDER_002", "QUEUED", 90, "2026-01-02 00:00:03"),
+        ("TASK_014", "ORDER_002", "BLOCKED", 90, "2026-01-02 00:00:04"),
+    ]
+    for task_id, order_id, status, complexity, created_at in tasks:
+        conn.execute(
+            "INSERT INTO tasks (id, order_id, project_id, title, status, priority, "
+            "complexity_score, created_at) VALUES (?, ?, 'PJ', ?, ?, 'P1', ?, ?)",
+            (task_id, order_id, task_id, status, complexity, created_at),
+        )
+    for task_id, depends_on in (("TASK_004", "TASK_003"), ("TASK_014", "TASK_013")):
+        conn.execute(
+            "INSERT INTO task_dependencies (task_id, depends_on_task_id, project_id) "
+            "VALUES (?, ?, 'PJ')",
+            (task_id, depends_on),
+        )
+    history = [
+        ("TASK_001", "10:00:00", "10:01:00"),
+        ("TASK_002", "10:00:00", "10:01:00"),
+        ("TASK_003", "10:00:00", "10:30:00"),
+        ("TASK_004", "10:30:00", "11:00:00"),
+    ]
+    for task_id, start, end in history:
+        for status, ts in (("IN_PROGRESS", start), ("DONE", end)):
+            conn.execute(
+                "INSERT INTO change_history (entity_type, entity_id, field_name, "
+                "new_value, changed_by, changed_at) VALUES ('task', ?, 'status', ?, 'test', ?)",
+                (task_id, status, f"2026-01-01 {ts}"),
+            )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def patched_db(db_path):
+    def _conn(*args, **kwargs):
+        return get_connection(db_path)
+
+    task_duration.clear_model_cache()
+    with mock.patch.object(parallel_detector, "get_connection", _conn), \
+            mock.patch.object(dependency_resolver, "get_connection", _conn), \
+            mock.patch.object(task_duration, "get_connection", _conn), \
+            mock.patch.object(file_lock, "get_connection", _conn), \
+            mock.patch("worker.schedule_simulator.get_connection", _conn):
+        yield db_path
+    task_duration.clear_model_cache()
+
+
+def test_fetch_task_durations(patched_db):
+    conn = get_connection(patched_db)
+    try:
+        durations = {d["task_id"]: d["seconds"] for d in fetch_task_durations(conn, "PJ")}
+    finally:
+        conn.close()
+    assert durations == {"TASK_001": 60, "TASK_002": 60, "TASK_003": 1800, "TASK_004": 1800}
+
+
+def test_detector_launches_chain_head_first(patched_db):
+    launchable = ParallelTaskDetector.find_parallel_launchable_tasks("PJ", "ORDER_002", max_tasks=2)
+    assert [t["id"] for t in launchable] == ["TASK_013", "TASK_011"]
+    assert launchable[0]["critical_path_rank"] > launchable[1]["critical_path_rank"]
+
+    legacy = ParallelTaskDetector.find_parallel_launchable_tasks(
+        "PJ", "ORDER_002", max_tasks=2, ordering=ORDERING_PRIORITY
+    )
+    assert [t["id"] for t in legacy] == ["TASK_011", "TASK_012"]
+
+
+def test_replay_compares_policies(patched_db):
+    result = replay("PJ", max_workers=2)
+    assert [r["order_id"] for r in result["orders"]] == ["ORDER_001"]
+    makespan = result["orders"][0]["makespan"]
+    assert makespan[POLICY_FIFO] == 3660
+    assert makespan[POLICY_CRITICAL_PATH] == 3600
+    assert result["improvement_pct"] > 0
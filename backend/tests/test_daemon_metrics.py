@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Daemon Metrics Tests
+
+worker/daemon_metrics.py:
+- Counter / Gauge / Histogram with labels, Prometheus text and JSON snapshot
+- MetricsServer serves /metrics and /metrics.json on 127.0.0.1
+- DaemonMetrics: per-poll SQL statement counts, event-to-launch delay,
+  worker step spans
+- WorkerExecutor._log_step records step spans
+"""
+
+import json
+import sqlite3
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import get_connection
+from worker.daemon_metrics import (
+    DaemonMetrics,
+    MetricsRegistry,
+    MetricsServer,
+    read_step_spans,
+    write_step_spans,
+)
+from worker.execute_task import WorkerExecutor
+
+
+def test_counter_gauge_and_labels():
+    registry = MetricsRegistry()
+    launches = registry.counter("launches_total", "Launches", ("mode",))
+    launches.inc(mode="warm")
+    launches.inc(2, mode="cold")
+    assert launches.value(mode="cold") == 2
+    with pytest.raises(ValueError):
+        launches.inc(kind="x")
+    with pytest.raises(ValueError):
+        launches.inc(-1, mode="warm")
+
+    gauge = registry.gauge("running", "Running")
+    gauge.set(3)
+    gauge.dec()
+    assert gauge.value() == 2
+
+    # 同名の再登録は同じインスタンス、種別違いはエラー
+    assert registry.counter("launches_total", "Launches", ("mode",)) is launches
+    with pytest.raises(ValueError):
+        registry.gauge("launches_total", "Launches")
+
+
+def test_histogram_text_exposition():
+    registry = MetricsRegistry()
+    hist = registry.histogram("poll_seconds", "Poll", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        hist.observe(value)
+    assert hist.count() == 4
+    assert hist.total() == pytest.approx(4.25)
+
+    text = registry.render_text()
+    assert "# TYPE poll_seconds histogram" in text
+    assert 'poll_seconds_bucket{le="0.1"} 1' in text
+    assert 'poll_seconds_bucket{le="1"} 3' in text
+    assert 'poll_seconds_bucket{le="+Inf"} 4' in text
+    assert "poll_seconds_count 4" in text
+
+    [sample] = registry.snapshot()["metrics"]["poll_seconds"]["samples"]
+    assert sample["count"] == 4
+    assert sample["p50"] == 1.0
+    assert sample["p90"] is None  # 最上位バケットを超える
+    assert sample["buckets"] == [1, 2, 1]
+
+
+def test_metrics_server_endpoints():
+    registry = MetricsRegistry()
+    registry.counter("aipm_test_total", "Test", ("order",)).inc(order='ORDER_"1"')
+    server = MetricsServer(registry, port=0).start()
+    try:
+        with urllib.request.urlopen(server.url, timeout=10) as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain")
+            body = resp.read().decode("utf-8")
+        assert 'aipm_test_total{order="ORDER_\\"1\\""} 1' in body
+
+        with urllib.request.urlopen(server.url + ".json", timeout=10) as resp:
+            data = json.loads(resp.read())
+        assert data["metrics"]["aipm_test_total"]["samples"][0]["value"] == 1
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(server.url.replace("/metrics", "/other"), timeout=10)
+    finally:
+        server.close()
+
+
+def test_poll_counts_sql_statements(tmp_path):
+    db_path = tmp_path / "m.db"
+    sqlite3.connect(str(db_path)).close()
+    metrics = DaemonMetrics()
+    metrics.install()
+    try:
+        metrics.begin_poll()
+        conn = get_connection(db_path)
+        try:
+            conn.execute("SELECT 1")
+            conn.execute("SELECT 2")
+        finally:
+            conn.close()
+        metrics.end_poll()
+        metrics.end_poll()  # begin_poll なしでは記録しない
+    finally:
+        metrics.uninstall()
+
+    assert metrics.polls.value() == 1
+    # 接続時の PRAGMA はトレース設定前なので数えない
+    assert metrics.db_statements.value() == 2
+    assert metrics.poll_queries.total() == 2
+
+    # 解除後の接続は数えない
+    conn = get_connection(db_path)
+    conn.execute("SELECT 1")
+    conn.close()
+    assert metrics.db_statements.value() == 2
+
+
+def test_event_to_launch_and_slots():
+    metrics = DaemonMetrics()
+    now = time.time()
+    metrics.mark_ready(["TASK_2"], event_time=now - 2.0)
+    metrics.mark_ready(["TASK_3"], event_time="not-a-timestamp")
+    metrics.record_launch("TASK_2", "worker", "cold", now)
+    metrics.record_launch("TASK_9", "worker", "warm", now)  # 初期QUEUEDは対象外
+    assert metrics.event_to_launch.count() == 1
+    assert metrics.event_to_launch.total() == pytest.approx(2.0, abs=0.01)
+    assert metrics.launches.value(kind="worker", mode="cold") == 1
+
+    metrics.record_slots(3, 4)
+    assert metrics.slot_utilization.value() == 0.75
+    metrics.record_task_counts("PJ", "ORDER_001", {"QUEUED": 2})
+    assert metrics.tasks.value(project="PJ", order="ORDER_001", status="QUEUED") == 2
+    assert metrics.tasks.value(project="PJ", order="ORDER_001", status="BLOCKED") == 0
+    metrics.forget_order("PJ", "ORDER_001")
+    assert 'order="ORDER_001"' not in metrics.registry.render_text()
+
+    summary = metrics.summary()
+    assert summary["aipm_worker_slot_utilization"] == {"value": 0.75}
+    assert summary["aipm_event_to_launch_delay_seconds"]["count"] == 1
+
+
+def test_step_spans_round_trip(tmp_path):
+    path = tmp_path / "worker_TASK_1.spans.json"
+    write_step_spans(path, "TASK_1", [
+        {"step": "execute_task", "status": "success", "duration_ms": 1500.0},
+        {"step": "create_report", "status": "error", "duration_ms": 20.0},
+    ])
+    spans = read_step_spans(path)
+    assert len(spans) == 2
+    assert read_step_spans(tmp_path / "missing.json") == []
+
+    metrics = DaemonMetrics()
+    assert metrics.record_step_spans(spans + [{"step": "x"}]) == 2
+    assert metrics.step_duration.total(step="execute_task", status="success") == 1.5
+
+
+def test_worker_executor_records_step_spans():
+    executor = WorkerExecutor.__new__(WorkerExecutor)
+    executor.verbose = False
+    executor.results = {"steps": [], "step_spans": []}
+    executor._step_started = {}
+
+    executor._log_step("create_report", "start")
+    time.sleep(0.01)
+    executor._log_step("create_report", "success", "ok")
+    executor._log_step("next_task", "none")
+
+    report_end = executor.results["steps"][1]
+    assert report_end["duration_ms"] >= 10
+    assert "duration_ms" not in executor.results["steps"][2]
+    assert executor.results["step_spans"] == [
+        {"step": "create_report", "status": "success", "duration_ms": report_end["duration_ms"]}
+    ]
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Daemon Lease Registry Tests
+
+worker/daemon_registry.py:
+- Lease acquire / renew / release and takeover of an expired lease
+- Liveness queries (live_daemons, order_daemon, task_owners)
+- reclaim_stale removes expired leases in one transaction
+- ParallelWorkerLauncher orphan detection skips tasks of live daemons
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import get_connection
+from worker import daemon_registry, parallel_launcher
+from worker.daemon_registry import (
+    DaemonLease,
+    live_daemons,
+    order_daemon,
+    order_daemon_id,
+    reclaim_stale,
+    task_owners,
+)
+from worker.global_scheduler import GlobalScheduler
+from worker.parallel_launcher import ParallelWorkerLauncher
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+
+@pytest.fixture
+def registry_db(tmp_path):
+    db_path = tmp_path / "registry.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.commit()
+    conn.close()
+
+    def _conn():
+        return get_connection(db_path)
+
+    with mock.patch.object(daemon_registry, "get_connection", _conn), \
+         mock.patch.object(parallel_launcher, "get_connection", _conn):
+        yield db_path
+
+
+def _expire(db_path, daemon_id):
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "UPDATE daemons SET lease_expires_at = datetime('now', '-1 seconds') WHERE daemon_id = ?",
+        (daemon_id,),
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_lease_is_exclusive_until_it_expires(registry_db):
+    first = DaemonLease.for_order("PJ", "ORDER_001", pid=1001)
+    second = DaemonLease.for_order("PJ", "ORDER_001", pid=1002)
+    assert first.acquire()
+    assert not second.acquire()
+    assert first.heartbeat([{"project_id": "PJ", "order_id": "ORDER_001", "task_id": "TASK_1", "pid": 5}])
+
+    _expire(registry_db, order_daemon_id("PJ", "ORDER_001"))
+    assert second.acquire()
+    # 旧所有者の更新は拒否される
+    assert not first.heartbeat()
+
+    row = order_daemon("PJ", "ORDER_001")
+    assert row["pid"] == 1002
+    assert row["is_alive"] is True
+    assert row["owned_tasks"] == []
+
+    first.release()  # 他人の行は消さない
+    assert order_daemon("PJ", "ORDER_001") is not None
+    second.release()
+    assert order_daemon("PJ", "ORDER_001") is None
+
+
+def test_liveness_queries(registry_db):
+    DaemonLease.for_order("PJ", "ORDER_001", pid=2001).heartbeat(
+        [{"project_id": "PJ", "order_id": "ORDER_001", "task_id": "TASK_1", "pid": 11}],
+        info={"metrics_url": "http://127.0.0.1:9/metrics"},
+    )
+    DaemonLease.for_scheduler(pid=2002).heartbeat(
+        [
+            {"project_id": "PJ", "order_id": "ORDER_002", "task_id": "TASK_2", "pid": 12},
+            {"project_id": "OTHER", "order_id": "ORDER_009", "task_id": "TASK_9", "pid": 13},
+        ],
+        info={"orders": ["PJ/ORDER_002", "OTHER/ORDER_009"]},
+    )
+
+    assert [d["daemon_id"] for d in live_daemons()] == [order_daemon_id("PJ", "ORDER_001"), "scheduler"]
+    assert order_daemon("PJ", "ORDER_002")["kind"] == "scheduler"
+    assert order_daemon("PJ", "ORDER_003") is None
+
+    owners = task_owners("PJ")
+    assert set(owners) == {"TASK_1", "TASK_2"}
+    assert owners["TASK_2"] == {"daemon_id": "scheduler", "pid": 2002, "worker_pid": 12}
+
+    heartbeat = ParallelWorkerLauncher.read_heartbeat("PJ", "ORDER_001")
+    assert heartbeat["pid"] == 2001
+    assert heartbeat["active_worker_pids"] == [11]
+    assert heartbeat["metrics_url"] == "http://127.0.0.1:9/metrics"
+    assert ParallelWorkerLauncher.read_heartbeat("PJ", "ORDER_002")["scheduler"] is True
+
+    # 期限切れのデーモンはタスクを所有しない
+    _expire(registry_db, "scheduler")
+    assert set(task_owners("PJ")) == {"TASK_1"}
+    assert ParallelWorkerLauncher.read_heartbeat("PJ", "ORDER_002")["is_alive"] is False
+    assert GlobalScheduler.read_heartbeat()["orders"][0]["active_worker_pids"] == [12]
+
+
+def test_reclaim_stale(registry_db):
+    DaemonLease.for_order("PJ", "ORDER_001", pid=3001).heartbeat(
+        [{"project_id": "PJ", "order_id": "ORDER_001", "task_id": "TASK_1", "pid": 21}]
+    )
+    DaemonLease.for_order("PJ", "ORDER_002", pid=3002).acquire()
+    _expire(registry_db, order_daemon_id("PJ", "ORDER_001"))
+
+    reclaimed = reclaim_stale()
+    assert [r["daemon_id"] for r in reclaimed] == [order_daemon_id("PJ", "ORDER_001")]
+    assert reclaimed[0]["owned_tasks"][0]["task_id"] == "TASK_1"
+    assert [d["daemon_id"] for d in live_daemons(include_expired=True)] == [order_daemon_id("PJ", "ORDER_002")]
+    assert reclaim_stale() == []
+
+
+def test_orphan_detection_skips_tasks_of_live_daemons(registry_db):
+    conn = sqlite3.connect(str(registry_db))
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ', 'PJ', '/tmp/pj')")
+    conn.execute("INSERT INTO orders (id, project_id, title, status) VALUES ('ORDER_001', 'PJ', 't', 'IN_PROGRESS')")
+    for task_id in ("TASK_1", "TASK_2"):
+        conn.execute(
+            "INSERT INTO tasks (id, project_id, order_id, title, status) VALUES (?, 'PJ', 'ORDER_001', 't', 'IN_PROGRESS')",
+            (task_id,),
+        )
+    conn.commit()
+    conn.close()
+
+    DaemonLease.for_order("PJ", "ORDER_001", pid=4001).heartbeat(
+        [{"project_id": "PJ", "order_id": "ORDER_001", "task_id": "TASK_1", "pid": 31}]
+    )
+
+    launcher = ParallelWorkerLauncher.__new__(ParallelWorkerLauncher)
+    launcher.project_id = "PJ"
+    launcher.order_id = "ORDER_001"
+    launcher._running_workers = {}
+    launcher._event_notifier = None
+    launcher.results = {}
+
+    recovered = []
+    with mock.patch.object(parallel_launcher, "_HAS_RECOVER_CRASHED", True), \
+         mock.patch.object(
+             parallel_launcher, "recover_crashed_task", create=True,
+             side_effect=lambda project_id, task_id, reason: recovered.append(task_id) or {"success": True},
+         ):
+        launcher._detect_orphaned_in_progress_tasks()
+        assert recovered == ["TASK_2"]
+
+        # リースが切れると TASK_1 も孤児として回収される
+        _expire(registry_db, order_daemon_id("PJ", "ORDER_001"))
+        launcher._detect_orphaned_in_progress_tasks()
+        assert recovered == ["TASK_2", "TASK_1", "TASK_2"]
+    assert [r["task_id"] for r in launcher.results["recovered_tasks"]] == ["TASK_2", "TASK_1", "TASK_2"]
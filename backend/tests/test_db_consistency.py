@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - DB Consistency Checker Tests
+
+utils/verify_db_consistency.py:
+- Set-based checks report the expected issues, in the same order for any worker count
+- The artifact check scans each ORDER directory once through FileStatCache
+- --since only verifies entities changed after the cursor
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils import verify_db_consistency
+from utils.db import get_connection
+from utils.verify_db_consistency import DBConsistencyChecker, FileStatCache
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+OLD = "2026-01-01 00:00:00"
+CURSOR = "2026-06-01T00:00:00"
+NEW = "2026-09-01 12:00:00"
+
+
+@pytest.fixture
+def consistency_db(tmp_path):
+    project_dir = tmp_path / "PJ1"
+    # ORDER_001: TASK_1 は成果物・REPORTあり、TASK_2 はREPORTなし
+    (project_dir / "RESULT" / "ORDER_001" / "06_ARTIFACTS").mkdir(parents=True)
+    (project_dir / "RESULT" / "ORDER_001" / "06_ARTIFACTS" / "out.txt").write_text("x", encoding="utf-8")
+    (project_dir / "RESULT" / "ORDER_001" / "05_REPORT").mkdir()
+    (project_dir / "RESULT" / "ORDER_001" / "05_REPORT" / "REPORT_1.md").write_text("ok", encoding="utf-8")
+    # ORDER_002: 成果物ディレクトリは空、REPORTディレクトリなし
+    (project_dir / "RESULT" / "ORDER_002" / "06_ARTIFACTS").mkdir(parents=True)
+
+    db_path = tmp_path / "consistency.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.execute("PRAGMA foreign_keys = OFF")
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ1', 'PJ1', ?)", (str(project_dir),))
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ2', 'PJ2', ?)", (str(tmp_path / "PJ2"),))
+    orders = [
+        ("ORDER_001", "PJ1", "IN_PROGRESS", OLD),
+        ("ORDER_002", "PJ1", "COMPLETED", NEW),
+        ("ORDER_001", "PJ2", "IN_PROGRESS", OLD),
+        ("ORDER_009", "GHOST", "IN_PROGRESS", OLD),  # 存在しないプロジェクト
+    ]
+    conn.executemany(
+        "INSERT INTO orders (id, project_id, title, status, updated_at) VALUES (?, ?, 't', ?, ?)", orders
+    )
+    tasks = [
+        ("TASK_1", "PJ1", "ORDER_001", "DONE", OLD),
+        ("TASK_2", "PJ1", "ORDER_001", "COMPLETED", NEW),
+        ("TASK_3", "PJ1", "ORDER_002", "DONE", OLD),
+        ("TASK_4", "PJ1", "ORDER_001", "BLOCKED", OLD),        # 依存は全て完了
+        ("TASK_5", "PJ1", "ORDER_001", "IN_PROGRESS", OLD),    # 未完了の依存あり
+        ("TASK_6", "PJ1", "ORDER_001", "QUEUED", NEW),
+        ("TASK_7", "PJ2", "ORDER_404", "QUEUED", OLD),         # 存在しないORDER
+    ]
+    conn.executemany(
+        "INSERT INTO tasks (id, project_id, order_id, title, status, updated_at) VALUES (?, ?, ?, 't', ?, ?)",
+        tasks,
+    )
+    conn.executemany(
+        "INSERT INTO task_dependencies (task_id, depends_on_task_id, project_id, created_at) VALUES (?, ?, 'PJ1', ?)",
+        [("TASK_4", "TASK_1", OLD), ("TASK_5", "TASK_6", OLD), ("TASK_5", "TASK_99", OLD)],
+    )
+    conn.executemany(
+        "INSERT INTO backlog_items (id, project_id, title, status, related_order_id, updated_at) "
+        "VALUES (?, 'PJ1', 't', ?, ?, ?)",
+        [("BACKLOG_1", "IN_PROGRESS", "ORDER_002", OLD), ("BACKLOG_2", "TODO", "ORDER_404", OLD)],
+    )
+    conn.executemany(
+        "INSERT INTO change_history (entity_type, entity_id, project_id, field_name, old_value, new_value, "
+        "changed_by, changed_at) VALUES ('task', ?, 'PJ1', 'status', ?, ?, 'test', ?)",
+        [
+            ("TASK_1", None, "QUEUED", OLD),
+            ("TASK_1", "QUEUED", "DONE", OLD),                   # IN_PROGRESS を経ない完了は不正
+            ("TASK_2", "None", "QUEUED", NEW),                   # 'None' は初期状態
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    def _conn():
+        return get_connection(db_path)
+
+    with mock.patch.object(verify_db_consistency, "get_connection", _conn):
+        yield db_path
+
+
+def _messages(result):
+    return [(issue["category"], issue["severity"], issue["message"]) for issue in result["issues"]]
+
+
+def test_check_all_reports_issues_for_any_worker_count(consistency_db):
+    sequential = DBConsistencyChecker(max_workers=1).check_all()
+    parallel = DBConsistencyChecker(max_workers=4).check_all()
+    assert _messages(parallel) == _messages(sequential)
+    assert parallel["stats"] == sequential["stats"]
+    assert sequential["stats"]["total_checks"] == 7
+    assert not sequential["success"]
+
+    messages = [m for _, _, m in _messages(sequential)]
+    assert "ORDER ORDER_009 が存在しないプロジェクト GHOST を参照" in messages
+    assert "TASK TASK_7 が存在しないORDER ORDER_404 を参照" in messages
+    assert "TASK TASK_5 が存在しない依存タスク TASK_99 を参照" in messages
+    assert "task TASK_1 に不正な状態遷移履歴: QUEUED → DONE" in messages
+    assert "TASK TASK_4 がBLOCKEDだが依存タスクは全て完了済み" in messages
+    assert "TASK TASK_5 (status=IN_PROGRESS) に未完了の依存があるがBLOCKEDでない" in messages
+    assert "BACKLOG BACKLOG_2 が存在しないORDER ORDER_404 を参照" in messages
+    assert any(m.startswith("BACKLOG BACKLOG_1 に関連するORDER ORDER_002") for m in messages)
+    # 初期状態からの遷移は from_status IS NULL のルールと照合される
+    assert not any("TASK_2 に不正な状態遷移" in m for m in messages)
+
+
+def test_artifact_check_scans_each_order_once(consistency_db):
+    checker = DBConsistencyChecker(project_id="PJ1", max_workers=1)
+    conn = get_connection(consistency_db)
+    try:
+        checker._check_artifact_files(conn)
+    finally:
+        conn.close()
+
+    assert [(i.severity, i.message) for i in checker.issues] == [
+        ("INFO", "TASK TASK_3 (status=DONE) のアーティファクトディレクトリが空です"),
+        ("WARNING", "TASK TASK_2 のREPORTファイルが存在しません"),
+        ("WARNING", "TASK TASK_3 のREPORTディレクトリが存在しません"),
+    ]
+    # RESULT/ORDER_001, RESULT/ORDER_002, 06_ARTIFACTS x2, 05_REPORT x1
+    assert checker.stat_cache.scans == 5
+
+
+def test_file_stat_cache(tmp_path):
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "dir" / ".hidden").write_text("", encoding="utf-8")
+    cache = FileStatCache()
+    assert cache.exists(tmp_path / "dir")
+    # Path.glob("*") と同じく隠しファイルもエントリとして数える
+    assert not cache.is_empty(tmp_path / "dir")
+    assert cache.is_empty(tmp_path / "empty")
+    assert cache.entries(tmp_path / "missing") is None
+    assert cache.is_empty(tmp_path / "missing")
+    assert not cache.exists(tmp_path / "missing" / "file")
+    scans = cache.scans
+    cache.prefetch([tmp_path, tmp_path / "dir"], max_workers=2)
+    assert cache.scans == scans
+
+
+def test_since_only_checks_changed_entities(consistency_db):
+    result = DBConsistencyChecker(since=CURSOR).check_all()
+    assert result["since"] == CURSOR
+    assert result["next_cursor"]
+
+    messages = [m for _, _, m in _messages(result)]
+    # 変更されたのは ORDER_002 / TASK_2 / TASK_6 と TASK_2 の履歴のみ
+    assert "TASK TASK_2 のREPORTファイルが存在しません" in messages
+    # TASK_6 に依存する TASK_5 も再検証される
+    assert "TASK TASK_5 (status=IN_PROGRESS) に未完了の依存があるがBLOCKEDでない" in messages
+    # ORDER_002 の変更で関連BACKLOGも再検証される
+    assert any(m.startswith("BACKLOG BACKLOG_1 に関連するORDER ORDER_002") for m in messages)
+    assert not any("TASK_1" in m or "TASK_3" in m or "TASK_4" in m for m in messages)
+    assert not any("GHOST" in m or "ORDER_404" in m for m in messages)
+
+    later = DBConsistencyChecker(since=result["next_cursor"]).check_all()
+    assert later["issues"] == []
+    assert later["success"]
+
+
+def test_cursor_covers_rows_stamped_in_utc(consistency_db, monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available")
+    # UTC より進んだタイムゾーンでも、トリガー（CURRENT_TIMESTAMP）で
+    # 更新日時が付いた行を次回の差分検証で取りこぼさない
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    try:
+        cursor = DBConsistencyChecker(since=CURSOR).check_all()["next_cursor"]
+
+        conn = sqlite3.connect(str(consistency_db))
+        conn.execute("UPDATE backlog_items SET title = 'changed' WHERE id = 'BACKLOG_2'")
+        conn.commit()
+        conn.close()
+
+        result = DBConsistencyChecker(since=cursor).check_all()
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    messages = [m for _, _, m in _messages(result)]
+    assert "BACKLOG BACKLOG_2 が存在しないORDER ORDER_404 を参照" in messages
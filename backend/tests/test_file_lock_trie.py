@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - File Lock Index Tests
+
+utils/file_lock.py:
+- normalize_lock_path: separators, ./.., trailing "/" for directory locks
+- PathLockTrie: file / directory / glob conflicts without a linear scan
+- FileLockManager stores normalized keys and resolves conflicts via the trie
+- ParallelTaskDetector loads the index once per pass
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import get_connection
+from utils import file_lock
+from utils.file_lock import (
+    FileLockManager,
+    PathLockTrie,
+    benchmark,
+    normalize_lock_path,
+)
+from worker import dependency_resolver, parallel_detector, task_duration
+from worker.parallel_detector import ParallelTaskDetector
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+
+@pytest.mark.parametrize("raw, key", [
+    ("src/a.ts", "src/a.ts"),
+    ("./src/a.ts", "src/a.ts"),
+    ("src\\a.ts", "src/a.ts"),
+    (".\\src\\\\lib\\..\\a.ts", "src/a.ts"),
+    ("src/", "src/"),
+    ("src\\lib\\", "src/lib/"),
+    ("src/lib/../", "src/"),
+    ("  src/*.ts ", "src/*.ts"),
+    ("", ""),
+    ("./", ""),
+])
+def test_normalize_lock_path(raw, key):
+    assert normalize_lock_path(raw) == key
+
+
+def _index(*locks):
+    index = PathLockTrie()
+    for task_id, path in locks:
+        index.add(task_id, path)
+    return index
+
+
+def test_file_locks_match_after_normalization():
+    index = _index(("TASK_A", "./src/a.ts"))
+    assert index.blocking_tasks(["src\\a.ts"]) == ["TASK_A"]
+    assert index.blocking_tasks(["src/b.ts"]) == []
+    assert index.blocking_tasks(["src/a.tsx"]) == []
+
+
+def test_directory_lock_covers_descendants():
+    index = _index(("TASK_A", "src/"))
+    assert index.blocking_tasks(["src/a.ts"]) == ["TASK_A"]
+    assert index.blocking_tasks(["src/lib/deep/b.ts"]) == ["TASK_A"]
+    assert index.blocking_tasks(["srcx/a.ts"]) == []
+    assert index.blocking_tasks(["lib/src/a.ts"]) == []
+
+
+def test_directory_request_conflicts_with_locks_below():
+    index = _index(("TASK_A", "src/lib/a.ts"), ("TASK_B", "docs/readme.md"))
+    assert index.blocking_tasks(["src/"]) == ["TASK_A"]
+    assert index.blocking_tasks(["src/lib/"]) == ["TASK_A"]
+    assert index.blocking_tasks(["src/app/"]) == []
+
+
+def test_glob_locks():
+    index = _index(("TASK_A", "src/*.ts"), ("TASK_B", "tests/**/test_*.py"))
+    assert index.blocking_tasks(["src/a.ts"]) == ["TASK_A"]
+    assert index.blocking_tasks(["src/a.py"]) == []
+    assert index.blocking_tasks(["src/lib/a.ts"]) == []
+    assert index.blocking_tasks(["tests/test_x.py"]) == ["TASK_B"]
+    assert index.blocking_tasks(["tests/unit/deep/test_x.py"]) == ["TASK_B"]
+    assert index.blocking_tasks(["tests/unit/helper.py"]) == []
+    # ディレクトリ要求: 配下に一致しうるものがあれば競合
+    assert index.blocking_tasks(["tests/unit/"]) == ["TASK_B"]
+    assert index.blocking_tasks(["src/"]) == ["TASK_A"]
+
+
+def test_glob_request_and_glob_against_glob():
+    index = _index(("TASK_A", "src/lib/a.ts"), ("TASK_B", "src/*.css"))
+    assert index.blocking_tasks(["src/**/*.ts"]) == ["TASK_A", "TASK_B"]
+    assert index.blocking_tasks(["src/lib/*.py"]) == ["TASK_B"]  # glob 同士は保守的に競合
+    assert index.blocking_tasks(["src/app/*.py"]) == ["TASK_B"]
+    assert index.blocking_tasks(["src/app/*.py", "./src/lib/a.ts"]) == ["TASK_A", "TASK_B"]
+    assert index.blocking_tasks(["docs/*.md"]) == []
+
+
+def test_bracketed_directory_names_are_literal():
+    index = _index(("TASK_A", "app/[id]/page.tsx"), ("TASK_B", "app/[slug]/"))
+    assert index.blocking_tasks(["app/[id]/page.tsx"]) == ["TASK_A"]
+    assert index.blocking_tasks(["app/[slug]/layout.tsx"]) == ["TASK_B"]
+    assert index.blocking_tasks(["app/i/page.tsx"]) == []
+    assert index.blocking_tasks(["app/[id]/layout.tsx"]) == []
+    assert index.blocking_tasks(["app/[id]/*.tsx"]) == ["TASK_A"]
+    assert index.blocking_tasks(["app/"]) == ["TASK_A", "TASK_B"]
+
+    # glob: を付けた場合のみ [...] を文字クラスとして扱う
+    assert index.blocking_tasks(["glob:app/[abc]/page.tsx"]) == []
+    index.add("TASK_C", "glob:app/[xy]/*.tsx")
+    assert index.blocking_tasks(["app/x/page.tsx"]) == ["TASK_C"]
+    assert index.blocking_tasks(["app/[xy]/page.tsx"]) == []
+    assert normalize_lock_path("glob:.\\app\\[xy]\\") == "glob:app/[xy]/"
+
+
+def test_exclude_task_and_conflict_dicts():
+    index = PathLockTrie()
+    index.add("TASK_A", "src/", "2026-01-01T00:00:00")
+    index.add("TASK_B", "src/a.ts")
+    assert index.blocking_tasks(["src/a.ts"], exclude_task_id="TASK_B") == ["TASK_A"]
+    conflicts = index.find_conflicts(["src/a.ts", "./src/a.ts"], exclude_task_id="TASK_B")
+    assert conflicts == [
+        {"task_id": "TASK_A", "file_path": "src/", "locked_at": "2026-01-01T00:00:00"}
+    ]
+    assert len(index) == 2
+    assert index.task_ids == {"TASK_A", "TASK_B"}
+
+
+def test_benchmark_thousands_of_locks():
+    result = benchmark(lock_count=3000, query_count=200)
+    assert result["results_match"] is True
+    assert result["conflicting_queries"] > 0
+    assert result["trie_ms"] < result["scan_ms"]
+
+
+@pytest.fixture
+def patched_db(tmp_path):
+    path = tmp_path / "aipm.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ', 'PJ', '/pj')")
+    conn.execute(
+        "INSERT INTO orders (id, project_id, title, status) "
+        "VALUES ('ORDER_001', 'PJ', 'active', 'IN_PROGRESS')"
+    )
+    tasks = [
+        ("TASK_RUN", "IN_PROGRESS", ["src/"]),
+        ("TASK_DONE", "DONE", ["docs/"]),
+        ("TASK_1", "QUEUED", ["src\\app\\main.ts"]),
+        ("TASK_2", "QUEUED", ["./docs/guide.md"]),
+        ("TASK_3", "QUEUED", ["docs/*.md"]),
+        ("TASK_4", "QUEUED", ["lib/util.py"]),
+    ]
+    for task_id, status, target_files in tasks:
+        conn.execute(
+            "INSERT INTO tasks (id, order_id, project_id, title, status, priority, "
+            "target_files, created_at) VALUES (?, 'ORDER_001', 'PJ', ?, ?, 'P1', ?, ?)",
+            (task_id, task_id, status, json.dumps(target_files), f"2026-01-01 00:00:0{len(task_id)}"),
+        )
+    conn.execute(
+        "INSERT INTO file_locks (project_id, task_id, file_path) VALUES "
+        "('PJ', 'TASK_RUN', 'src/'), ('PJ', 'TASK_DONE', 'docs/')"
+    )
+    conn.commit()
+    conn.close()
+
+    def _conn(*args, **kwargs):
+        return get_connection(path)
+
+    task_duration.clear_model_cache()
+    with mock.patch.object(parallel_detector, "get_connection", _conn), \
+            mock.patch.object(dependency_resolver, "get_connection", _conn), \
+            mock.patch.object(task_duration, "get_connection", _conn), \
+            mock.patch.object(file_lock, "get_connection", _conn):
+        yield path
+    task_duration.clear_model_cache()
+
+
+def test_manager_stores_normalized_keys(patched_db):
+    assert FileLockManager.acquire_locks("PJ", "TASK_4", [".\\lib\\util.py", "lib/util.py"]) is True
+    assert FileLockManager.get_locked_files("PJ", "TASK_4") == ["lib/util.py"]
+
+    # ディレクトリロック配下のファイルは取得できない
+    assert FileLockManager.acquire_locks("PJ", "TASK_1", ["src/app/main.ts"]) is False
+    conflicts = FileLockManager.check_conflicts("PJ", ["src\\app\\main.ts"])
+    assert [(c["task_id"], c["file_path"]) for c in conflicts] == [("TASK_RUN", "src/")]
+    assert FileLockManager.can_task_start("PJ", "TASK_1") == (False, ["TASK_RUN"])
+
+    # DONE タスクのロックは自動解放される
+    assert FileLockManager.acquire_locks("PJ", "TASK_2", ["docs/guide.md"]) is True
+
+
+def test_detector_uses_lock_index_once_per_pass(patched_db):
+    with mock.patch.object(
+        PathLockTrie, "load", wraps=PathLockTrie.load
+    ) as load_spy, mock.patch.object(FileLockManager, "can_task_start") as per_task:
+        launchable = ParallelTaskDetector.find_parallel_launchable_tasks(
+            "PJ", "ORDER_001", max_tasks=10
+        )
+    assert load_spy.call_count == 1
+    assert per_task.call_count == 0
+    # TASK_1: src/ ロック中, TASK_3: TASK_2 の docs/guide.md と glob が競合
+    assert sorted(t["id"] for t in launchable) == ["TASK_2", "TASK_4"]
+
+    summary = ParallelTaskDetector.get_parallel_launch_summary("PJ", "ORDER_001")
+    assert sorted(summary["blocked_by_locks"]) == ["TASK_1", "TASK_3"]
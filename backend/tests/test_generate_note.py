@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Release Note Generation Tests
+
+release/generate_note.py:
+- Multi-ORDER generation fetches ORDERs and tasks in one query each
+- REPORT files are read in a thread pool, in file order, with an mtime-keyed parse cache
+- The streamed note matches the in-memory rendering
+"""
+
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import add_statement_observer, get_connection, remove_statement_observer
+from release import generate_note
+from release.generate_note import (
+    clear_report_cache,
+    generate_release_note,
+    generate_release_note_markdown,
+    generate_release_notes,
+    load_report,
+    read_reports_for_orders,
+)
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+
+def _report(summary, artifacts):
+    return (
+        "# REPORT\n\n```json\n"
+        f'{{"summary": "{summary}", "details": ["d1"], "artifacts": {artifacts}, "issues": []}}'
+        "\n```\n"
+    )
+
+
+@pytest.fixture
+def note_env(tmp_path):
+    db_path = tmp_path / "notes.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ', 'PJ', '/tmp')")
+    conn.executemany(
+        "INSERT INTO orders (id, project_id, title, status) VALUES (?, 'PJ', ?, 'COMPLETED')",
+        [("ORDER_001", "first"), ("ORDER_002", "second")],
+    )
+    conn.executemany(
+        "INSERT INTO tasks (id, project_id, order_id, title, status, created_at) VALUES (?, 'PJ', ?, ?, ?, ?)",
+        [
+            ("TASK_002", "ORDER_001", "b", "DONE", "2026-01-02"),
+            ("TASK_001", "ORDER_001", "a", "COMPLETED", "2026-01-01"),
+            ("TASK_003", "ORDER_002", "c", "IN_PROGRESS", "2026-01-03"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    result_dir = tmp_path / "RESULT"
+    reports = result_dir / "ORDER_001" / "05_REPORT"
+    reports.mkdir(parents=True)
+    (reports / "REPORT_001.md").write_text(_report("one", '["src/a.py", "src/b.py"]'), encoding="utf-8")
+    (reports / "REPORT_002.md").write_text(_report("two", '["src/a.py"]'), encoding="utf-8")
+    (reports / "REPORT_002_retry.md").write_text("plain report", encoding="utf-8")
+    (result_dir / "ORDER_002").mkdir()
+
+    clear_report_cache()
+    with mock.patch.object(generate_note, "get_connection", lambda: get_connection(db_path)), \
+            mock.patch.object(generate_note, "get_project_paths", lambda project_id: {"result": result_dir}):
+        yield result_dir
+    clear_report_cache()
+
+
+def _strip_time(text):
+    return re.sub(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}", "<time>", text)
+
+
+def test_batch_uses_one_query_per_table(note_env):
+    statements = []
+    add_statement_observer(statements.append)
+    try:
+        batch = generate_release_notes("PJ", ["ORDER_001", "ORDER_002", "ORDER_404"], max_workers=4)
+    finally:
+        remove_statement_observer(statements.append)
+
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 2
+    assert not batch["success"]
+    first, second, missing = batch["notes"]
+    assert missing["error"] == "ORDER ORDER_404 が見つかりません（project: PJ）"
+    assert (first["task_count"], first["report_count"]) == (2, 3)
+    assert (second["task_count"], second["report_count"]) == (1, 0)
+
+    written = (note_env / "ORDER_001" / "RELEASE_NOTE.md").read_text(encoding="utf-8")
+    assert written == first["note_content"]
+    assert written.index("### TASK_001: a") < written.index("### TASK_002: b")
+    assert "**概要**: one" in written and "**概要**: two" in written
+    assert written.count("- `src/a.py`") == 3  # TASK_001, TASK_002, 変更ファイル一覧
+    assert not written.endswith("\n")
+    assert not list((note_env / "ORDER_001").glob(".tmp_*"))
+    assert "*REPORTファイルなし*" in second["note_content"]
+
+
+def test_single_order_matches_in_memory_rendering(note_env):
+    result = generate_release_note("PJ", "ORDER_001", dry_run=True)
+    assert result["success"]
+    assert not (note_env / "ORDER_001" / "RELEASE_NOTE.md").exists()
+
+    order = generate_note.get_order_info("PJ", "ORDER_001")
+    tasks = generate_note.get_tasks_for_order("PJ", "ORDER_001")
+    reports = generate_note.read_report_files(note_env / "ORDER_001")
+    expected = generate_release_note_markdown("PJ", "ORDER_001", order, tasks, reports)
+    assert _strip_time(result["note_content"]) == _strip_time(expected)
+
+
+def test_reports_are_parsed_once_per_mtime(note_env):
+    dirs = [note_env / "ORDER_001", note_env / "ORDER_002"]
+    with mock.patch.object(generate_note, "parse_report_summary", wraps=generate_note.parse_report_summary) as parse:
+        parallel = read_reports_for_orders(dirs, max_workers=4)
+        assert parse.call_count == 3
+        sequential = read_reports_for_orders(dirs, max_workers=1)
+        assert parse.call_count == 3
+
+        assert parallel == sequential
+        assert [r["filename"] for r in parallel[0]] == ["REPORT_001.md", "REPORT_002.md", "REPORT_002_retry.md"]
+        assert parallel[1] == []
+        assert parallel[0][2]["parsed"]["summary"] == "plain report"
+
+        report_file = dirs[0] / "05_REPORT" / "REPORT_002.md"
+        report_file.write_text(_report("changed", "[]"), encoding="utf-8")
+        assert load_report(report_file)["parsed"]["summary"] == "changed"
+        assert parse.call_count == 4
+
+    missing = load_report(dirs[0] / "05_REPORT" / "REPORT_999.md")
+    assert missing["task_id"] == "UNKNOWN"
+    assert missing["content"].startswith("[REPORTファイル読み込みエラー")
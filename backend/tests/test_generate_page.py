@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Project Page Generation Tests
+
+project/generate_page.py:
+- Unchanged projects return the cached page; changed projects are rebuilt
+- Changes that are not rendered keep the page (and its content hash) as is
+- Batch mode uses a fixed number of grouped queries and writes only changed files
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import add_statement_observer, remove_statement_observer
+from project.generate_page import generate_all_pages, generate_project_page
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+
+@pytest.fixture
+def page_db(tmp_path):
+    db_path = tmp_path / "pages.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    for project_id in ("PJ_A", "PJ_B", "PJ_C"):
+        conn.execute(
+            "INSERT INTO projects (id, name, path, status) VALUES (?, ?, '/tmp', 'IN_PROGRESS')",
+            (project_id, f"Project {project_id}"),
+        )
+    # PJ_A: 25 ORDER（表示は20件）
+    conn.executemany(
+        "INSERT INTO orders (id, project_id, title, status, created_at) VALUES (?, 'PJ_A', ?, ?, ?)",
+        [
+            (f"ORDER_{i:03d}", f"order {i}", "IN_PROGRESS" if i % 5 == 0 else "COMPLETED",
+             f"2026-01-{i:02d} 00:00:00")
+            for i in range(1, 26)
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO tasks (id, project_id, order_id, title, status) VALUES (?, 'PJ_A', 'ORDER_001', 't', ?)",
+        [("TASK_1", "COMPLETED"), ("TASK_2", "COMPLETED"), ("TASK_3", "IN_PROGRESS"), ("TASK_4", "QUEUED")],
+    )
+    conn.executemany(
+        "INSERT INTO backlog_items (id, project_id, title, status) VALUES (?, 'PJ_B', 't', ?)",
+        [("BACKLOG_1", "TODO"), ("BACKLOG_2", "DONE")],
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def _execute(db_path, sql, params=()):
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+def test_single_page_uses_snapshot(page_db, tmp_path):
+    page_dir = tmp_path / "pages"
+    first = generate_project_page("PJ_A", db_path=page_db, page_dir=page_dir)
+    assert first["success"] and first["cached"] is False
+    html = first["html"]
+    assert html.count("<tr>\n            <td>ORDER_") == 20
+    # 優先度順: IN_PROGRESS が先頭、同じステータス内は作成日の新しい順
+    assert html.index("ORDER_025") < html.index("ORDER_020") < html.index("ORDER_024")
+    assert "ORDER_001" not in html
+    assert '<div class="stat-value">50%</div>' in html
+    assert (page_dir / "PJ_A.snapshot.json").exists()
+
+    second = generate_project_page("PJ_A", db_path=page_db, page_dir=page_dir)
+    assert second == {"success": True, "html": html, "cached": True}
+
+    # 表示しない列の更新はトークンを変えるがページは同一のまま
+    _execute(page_db, "UPDATE projects SET path = '/other' WHERE id = 'PJ_A'")
+    touched = generate_project_page("PJ_A", db_path=page_db, page_dir=page_dir)
+    assert touched["cached"] is False
+    assert touched["html"] == html
+
+    _execute(page_db, "UPDATE tasks SET status = 'COMPLETED' WHERE id = 'TASK_3'")
+    changed = generate_project_page("PJ_A", db_path=page_db, page_dir=page_dir)
+    assert changed["cached"] is False
+    assert '<div class="stat-value">75%</div>' in changed["html"]
+
+    uncached = generate_project_page("PJ_A", db_path=page_db, use_cache=False, page_dir=page_dir)
+    assert uncached["cached"] is False
+    assert uncached["html"].split("生成日時")[0] == changed["html"].split("生成日時")[0]
+
+    missing = generate_project_page("PJ_Z", db_path=page_db, page_dir=page_dir)
+    assert not missing["success"]
+
+
+def test_batch_writes_only_changed_pages(page_db, tmp_path):
+    out = tmp_path / "out"
+    statements = []
+    add_statement_observer(statements.append)
+    try:
+        first = generate_all_pages(db_path=page_db, output_dir=out)
+    finally:
+        remove_statement_observer(statements.append)
+
+    assert first["success"] and first["total"] == 3
+    assert first["regenerated"] == first["written"] == ["PJ_A", "PJ_B", "PJ_C"]
+    # プロジェクト数に関係なく: projects + orders/tasks/backlog 集計 + ORDER一覧
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 5
+
+    # 単体生成と同じページになる（スナップショットも共有）
+    single = generate_project_page("PJ_B", db_path=page_db, page_dir=out)
+    assert single["cached"] is True
+    assert (out / "PJ_B.html").read_text(encoding="utf-8") == single["html"]
+
+    again = generate_all_pages(db_path=page_db, output_dir=out)
+    assert again["regenerated"] == [] and again["written"] == []
+
+    _execute(page_db, "UPDATE backlog_items SET status = 'DONE' WHERE id = 'BACKLOG_1'")
+    _execute(page_db, "UPDATE projects SET path = '/other' WHERE id = 'PJ_C'")
+    (out / "PJ_A.html").unlink()
+    changed = generate_all_pages(db_path=page_db, output_dir=out)
+    assert changed["regenerated"] == ["PJ_B", "PJ_C"]
+    assert changed["written"] == ["PJ_A", "PJ_B"]
+
+    subset = generate_all_pages(db_path=page_db, output_dir=out, project_ids=["PJ_A", "PJ_Z"])
+    assert subset["total"] == 1 and not subset["success"]
+    assert [e["project_id"] for e in subset["errors"]] == ["PJ_Z"]
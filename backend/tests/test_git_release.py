@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - release.git_release Tests
+
+Staging helpers:
+    1. Compiled pattern matcher agrees with per-pattern fnmatch rules
+    2. `git status --porcelain -z` parsing (renames, non-ASCII paths)
+    3. Single-invocation `git add --pathspec-from-file`
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_test_dir = Path(__file__).resolve().parent
+_package_root = _test_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from release.git_release import (
+    EXCLUDE_PATTERNS,
+    INCLUDE_PATTERNS,
+    _matches_any_pattern,
+    collect_stageable_files,
+    parse_status_z,
+    run_git_add,
+    should_stage_file,
+)
+
+
+class TestPatternMatching:
+
+    @pytest.mark.parametrize("path,expected", [
+        ("backend/utils/db.py", True),
+        ("backend\\utils\\db.py", True),
+        ("PROJECTS/PJ/RESULT/ORDER_001/05_REPORT/REPORT_TASK_1.md", True),
+        ("PROJECTS/PJ/RESULT/ORDER_001/01_GOAL/GOAL.md", True),
+        ("PROJECTS/PJ/DEV/src/main.py", False),
+        ("PROJECTS/PJ/RESULT/ORDER_001/04_QUEUE/TASK_1.md", False),
+        ("backend/__pycache__/db.cpython-311.pyc", False),
+        ("backend/tmp_scratch.py", False),
+        ("data/aipm.db", False),
+        ("README.md", False),
+        ("PROJECTS/PJ/CLAUDE.md", True),
+        ("D:/outside/file.py", False),
+    ])
+    def test_should_stage_file(self, path, expected):
+        assert should_stage_file(path) is expected
+
+    def test_basename_matches(self):
+        assert _matches_any_pattern("nested/dir/CLAUDE.md", ["CLAUDE.md"])
+        assert _matches_any_pattern("a/b/.env.local", EXCLUDE_PATTERNS)
+        assert not _matches_any_pattern("a/b/c.txt", INCLUDE_PATTERNS)
+
+
+class TestParseStatusZ:
+
+    def test_plain_and_untracked(self):
+        out = b" M backend/a.py\0?? PROJECTS/PJ/ORDERS/\0"
+        assert parse_status_z(out) == [
+            (" M", "backend/a.py"),
+            ("??", "PROJECTS/PJ/ORDERS/"),
+        ]
+
+    def test_rename_skips_old_path(self):
+        out = b"R  backend/new.py\0backend/old.py\0 D backend/gone.py\0"
+        assert parse_status_z(out) == [
+            ("R ", "backend/new.py"),
+            (" D", "backend/gone.py"),
+        ]
+
+    def test_non_ascii_path_is_not_quoted(self):
+        name = "backend/日本語.md"
+        out = b"?? " + name.encode("utf-8") + b"\0"
+        assert parse_status_z(out) == [("??", name)]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitStaging:
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / "backend").mkdir()
+        (tmp_path / "backend" / "a.py").write_text("a\n", encoding="utf-8")
+        (tmp_path / "backend" / "スペース 名.py").write_text("b\n", encoding="utf-8")
+        (tmp_path / "data").mkdir()
+        (tmp_path / "data" / "aipm.db").write_text("db", encoding="utf-8")
+        return tmp_path
+
+    def test_collect_and_add_in_one_invocation(self, repo):
+        staging = collect_stageable_files(repo)
+        assert staging["files"] == ["backend/"]
+        assert staging["excluded"] == ["data/"]
+
+        files = ["backend/a.py", "backend/スペース 名.py"]
+        result = run_git_add(files, repo)
+
+        assert result == {"success": True, "added": 2, "invocations": 1}
+        staged = subprocess.run(
+            ["git", "diff", "--cached", "--name-only", "-z"],
+            cwd=repo, capture_output=True, check=True,
+        ).stdout.decode("utf-8").strip("\0").split("\0")
+        assert sorted(staged) == sorted(files)
+
+    def test_add_failure_is_reported(self, repo):
+        result = run_git_add(["backend/missing.py"], repo)
+        assert result["success"] is False
+        assert "git add failed" in result["error"]
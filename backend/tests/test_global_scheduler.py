@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Global Scheduler Tests
+
+worker/global_scheduler.py:
+- SlotPool: global capacity, per-project / per-priority quotas, fairness across ORDERs
+- poll_active_orders: one query covering every active ORDER
+- plan(): allocation over several projects without launching
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.worker_config import WorkerPriorityConfig, WorkerResourceConfig
+from utils.db import get_connection
+from utils import file_lock
+from worker import global_scheduler, parallel_detector
+from worker.global_scheduler import GlobalScheduler, SlotPool, is_order_settled, poll_active_orders
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+
+def _tasks(prefix, n, priority="P1"):
+    return [{"id": f"{prefix}_{i}", "priority": priority} for i in range(n)]
+
+
+def _ids(allocation, key):
+    return [t["id"] for t in allocation.get(key, [])]
+
+
+class TestSlotPool:
+    def test_round_robin_across_orders(self):
+        pool = SlotPool(4)
+        a, b = ("PJ1", "ORDER_A"), ("PJ2", "ORDER_B")
+        allocation = pool.allocate({}, {a: _tasks("A", 5), b: _tasks("B", 5)})
+        assert len(_ids(allocation, a)) == 2
+        assert len(_ids(allocation, b)) == 2
+
+    def test_order_with_fewer_running_workers_goes_first(self):
+        pool = SlotPool(4)
+        a, b = ("PJ1", "ORDER_A"), ("PJ1", "ORDER_B")
+        allocation = pool.allocate({a: ["P1", "P1", "P1"]}, {a: _tasks("A", 3), b: _tasks("B", 3)})
+        assert _ids(allocation, a) == []
+        assert _ids(allocation, b) == ["B_0"]
+
+    def test_last_served_breaks_ties_between_cycles(self):
+        pool = SlotPool(1)
+        a, b = ("PJ", "ORDER_A"), ("PJ", "ORDER_B")
+        candidates = {a: _tasks("A", 2), b: _tasks("B", 2)}
+        first = pool.allocate({}, candidates)
+        second = pool.allocate({}, candidates)
+        assert set(first) | set(second) == {a, b}
+
+    def test_per_project_quota(self):
+        pool = SlotPool(10, per_project_max=2)
+        a, b, c = ("PJ1", "ORDER_A"), ("PJ1", "ORDER_B"), ("PJ2", "ORDER_C")
+        allocation = pool.allocate(
+            {a: ["P1"]},
+            {a: _tasks("A", 3), b: _tasks("B", 3), c: _tasks("C", 3)},
+        )
+        assert len(_ids(allocation, a)) + len(_ids(allocation, b)) == 1
+        assert len(_ids(allocation, c)) == 2
+
+    def test_per_priority_quota_skips_to_next_admissible_task(self):
+        pool = SlotPool(10, priority_config=WorkerPriorityConfig(max_p0_workers=1))
+        a = ("PJ", "ORDER_A")
+        tasks = _tasks("HOT", 3, "P0") + _tasks("NORMAL", 2, "P1")
+        allocation = pool.allocate({a: ["P0"]}, {a: tasks})
+        assert _ids(allocation, a) == ["NORMAL_0", "NORMAL_1"]
+
+    def test_capacity_limits_launches(self):
+        pool = SlotPool(5)
+        a = ("PJ", "ORDER_A")
+        assert pool.allocate({a: ["P1"] * 5}, {a: _tasks("A", 3)}) == {}
+        assert len(_ids(pool.allocate({}, {a: _tasks("A", 3)}, capacity=2), a)) == 2
+
+    def test_order_priority_first(self):
+        pool = SlotPool(1)
+        low, high = ("PJ", "ORDER_LOW"), ("PJ", "ORDER_HIGH")
+        allocation = pool.allocate(
+            {},
+            {low: _tasks("L", 1), high: _tasks("H", 1)},
+            {low: "P2", high: "P0"},
+        )
+        assert list(allocation) == [high]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "aipm.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    for project_id in ("PJ1", "PJ2"):
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (?, ?, '/pj')", (project_id, project_id))
+    orders = [
+        ("ORDER_A", "PJ1", "IN_PROGRESS", "P1"),
+        ("ORDER_B", "PJ2", "IN_PROGRESS", "P0"),
+        ("ORDER_C", "PJ2", "PLANNING", "P1"),
+        ("ORDER_D", "PJ1", "IN_PROGRESS", "P1"),
+    ]
+    for order_id, project_id, status, priority in orders:
+        conn.execute(
+            "INSERT INTO orders (id, project_id, title, status, priority) VALUES (?, ?, ?, ?, ?)",
+            (order_id, project_id, order_id, status, priority),
+        )
+    tasks = [
+        ("TASK_A1", "ORDER_A", "PJ1", "QUEUED"),
+        ("TASK_A2", "ORDER_A", "PJ1", "QUEUED"),
+        ("TASK_A3", "ORDER_A", "PJ1", "COMPLETED"),
+        ("TASK_B1", "ORDER_B", "PJ2", "QUEUED"),
+        ("TASK_B2", "ORDER_B", "PJ2", "QUEUED"),
+        ("TASK_C1", "ORDER_C", "PJ2", "QUEUED"),
+        ("TASK_D1", "ORDER_D", "PJ1", "COMPLETED"),
+    ]
+    for task_id, order_id, project_id, status in tasks:
+        conn.execute(
+            "INSERT INTO tasks (id, order_id, project_id, title, status) VALUES (?, ?, ?, ?, ?)",
+            (task_id, order_id, project_id, task_id, status),
+        )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def patched_db(db_path):
+    def _conn(*args, **kwargs):
+        return get_connection(db_path)
+
+    with mock.patch.object(global_scheduler, "get_connection", _conn), \
+            mock.patch.object(parallel_detector, "get_connection", _conn), \
+            mock.patch.object(file_lock, "get_connection", _conn):
+        yield db_path
+
+
+def test_poll_active_orders_single_query(patched_db):
+    orders = poll_active_orders()
+    assert set(orders) == {("PJ1", "ORDER_A"), ("PJ2", "ORDER_B"), ("PJ1", "ORDER_D")}
+    assert orders[("PJ1", "ORDER_A")]["counts"] == {"QUEUED": 2, "COMPLETED": 1}
+    assert orders[("PJ2", "ORDER_B")]["order_priority"] == "P0"
+    assert is_order_settled(orders[("PJ1", "ORDER_D")]["counts"])
+    assert set(poll_active_orders(["PJ2"])) == {("PJ2", "ORDER_B")}
+
+
+def test_plan_spans_projects(patched_db):
+    scheduler = GlobalScheduler(
+        max_workers=3,
+        worker_config=WorkerResourceConfig(enable_resource_monitoring=False),
+        priority_config=WorkerPriorityConfig(),
+    )
+    with mock.patch.object(GlobalScheduler, "_is_managed_elsewhere", return_value=False):
+        plan = scheduler.plan_once()
+
+    planned = {
+        (o["project_id"], o["order_id"]): [t["task_id"] for t in o["planned_tasks"]]
+        for o in plan["orders"]
+    }
+    # P0 ORDER first, then round-robin: B gets 2 of 3 slots, A gets 1
+    assert planned[("PJ2", "ORDER_B")] == ["TASK_B1", "TASK_B2"]
+    assert planned[("PJ1", "ORDER_A")] == ["TASK_A1"]
+    assert planned[("PJ1", "ORDER_D")] == []
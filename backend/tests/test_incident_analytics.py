@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Incident Analytics Tests
+
+incident/analyze_patterns.py:
+- IncidentFrame: columnar incidents loaded by one windowed scan, group-bys
+- IncidentPatternAnalyzer statistics computed from the frame
+- benchmark() agrees with the per-category query path
+"""
+
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+_backend = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_backend))
+sys.path.insert(0, str(_backend / "incident"))
+
+from utils import incident_logger
+from utils.db import get_connection
+import analyze_patterns
+from analyze_patterns import IncidentFrame, IncidentPatternAnalyzer, benchmark
+
+
+SCHEMA_PATH = _backend.parent / "data" / "schema_v2.sql"
+
+NOW = datetime.now()
+
+
+def _ago(days, hours=0):
+    return (NOW - timedelta(days=days, hours=hours)).isoformat()
+
+
+@pytest.fixture
+def incident_db(tmp_path):
+    db_path = tmp_path / "incidents.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    rows = [
+        # (id, timestamp, project, category, severity, resolution)
+        ("INC_001", _ago(1), "PJ1", "WORKER_FAILURE", "HIGH", "restarted"),
+        ("INC_002", _ago(2), "PJ1", "WORKER_FAILURE", "LOW", None),
+        ("INC_003", _ago(3), "PJ2", "WORKER_FAILURE", "HIGH", ""),
+        ("INC_004", _ago(20), "PJ1", "WORKER_FAILURE", "MEDIUM", None),
+        ("INC_005", _ago(10), "PJ1", "FILE_LOCK_ERROR", "LOW", "released"),
+        ("INC_006", _ago(25), "PJ1", "FILE_LOCK_ERROR", "HIGH", None),
+        ("INC_007", _ago(26), "PJ1", "FILE_LOCK_ERROR", "HIGH", None),
+        # Outside the 30-day window, but inside the previous period
+        ("INC_008", _ago(40), "PJ1", "WORKER_FAILURE", "HIGH", None),
+        ("INC_009", _ago(45), "PJ1", "WORKER_FAILURE", "HIGH", None),
+        # SQLite CURRENT_TIMESTAMP style is windowed by time, not by string order
+        ("INC_010", (NOW - timedelta(hours=5)).strftime("%Y-%m-%d %H:%M:%S"), "PJ1", "SYSTEM_ERROR", "LOW", None),
+    ]
+    conn.executemany(
+        "INSERT INTO incidents (incident_id, timestamp, project_id, category, severity, resolution) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+    def _conn():
+        return get_connection(db_path)
+
+    with mock.patch.object(analyze_patterns, "get_connection", _conn), \
+         mock.patch.object(incident_logger, "get_connection", _conn):
+        yield db_path
+
+
+def test_frame_group_by():
+    frame = IncidentFrame().extend([
+        ("WORKER_FAILURE", "HIGH", "PJ1", 100.0, True),
+        ("WORKER_FAILURE", "HIGH", "PJ2", 200.0, False),
+        ("OTHER", "LOW", "PJ1", 300.0, False),
+        ("NEW_CATEGORY", "Medium", None, None, False),
+    ])
+    assert len(frame) == 4
+    assert frame.group_by(("category",)) == {
+        ("WORKER_FAILURE",): 2, ("OTHER",): 1, ("NEW_CATEGORY",): 1,
+    }
+    assert frame.group_by(("category", "resolved")) == {
+        ("WORKER_FAILURE", True): 1, ("WORKER_FAILURE", False): 1,
+        ("OTHER", False): 1, ("NEW_CATEGORY", False): 1,
+    }
+    # Missing timestamps sort after every bound
+    assert frame.group_by(("period",), bounds=[150.0, 300.0]) == {(0,): 1, (1,): 1, (2,): 2}
+    assert frame.group_by(()) == {(): 4}
+    assert IncidentFrame().group_by(("category",)) == {}
+
+    with pytest.raises(ValueError):
+        frame.group_by(("task",))
+    with pytest.raises(ValueError):
+        frame.group_by(("period",))
+
+
+def test_frame_load_is_windowed(incident_db):
+    conn = get_connection(incident_db)
+    try:
+        frame = IncidentFrame.load(NOW - timedelta(days=30), conn=conn)
+        assert len(frame) == 8
+        assert len(IncidentFrame.load(NOW - timedelta(days=30), project_id="PJ2", conn=conn)) == 1
+        previous = IncidentFrame.load(
+            NOW - timedelta(days=60), end=NOW - timedelta(days=30), category="WORKER_FAILURE", conn=conn
+        )
+        assert len(previous) == 2
+    finally:
+        conn.close()
+
+
+def test_analyze_all_categories(incident_db):
+    results = IncidentPatternAnalyzer.analyze_all_categories(days=30)
+    by_category = {r["category"]: r for r in results}
+    assert set(by_category) == {"WORKER_FAILURE", "FILE_LOCK_ERROR", "SYSTEM_ERROR"}
+
+    worker = by_category["WORKER_FAILURE"]
+    assert worker["incident_count"] == 4
+    assert worker["recurrence_stats"]["first_half_count"] == 1
+    assert worker["recurrence_stats"]["second_half_count"] == 3
+    assert worker["recurrence_stats"]["trend"] == "increasing"
+    assert worker["recurrence_stats"]["recurrence_rate"] == 0.13
+    assert worker["severity_distribution"] == {"HIGH": 2, "MEDIUM": 1, "LOW": 1}
+    assert worker["resolution_rate"] == 25.0
+    assert [i["incident_id"] for i in worker["incidents"]] == ["INC_001", "INC_002", "INC_003", "INC_004"]
+
+    lock = by_category["FILE_LOCK_ERROR"]
+    assert lock["recurrence_stats"]["trend"] == "decreasing"
+    assert results[0]["category"] == "WORKER_FAILURE"
+
+    light = IncidentPatternAnalyzer.analyze_all_categories(days=30, include_incidents=False)
+    assert all(r["incidents"] == [] for r in light)
+    assert [r["incident_count"] for r in light] == [r["incident_count"] for r in results]
+
+
+def test_category_and_period_comparison(incident_db):
+    analysis = IncidentPatternAnalyzer.analyze_category_patterns("WORKER_FAILURE", days=30, project_id="PJ1")
+    assert analysis["incident_count"] == 3
+    assert analysis["resolution_rate"] == 33.3
+    assert len(analysis["incidents"]) == 3
+
+    comparison = IncidentPatternAnalyzer.compare_periods("WORKER_FAILURE", current_days=30, previous_days=30)
+    assert comparison["current_period"]["count"] == 4
+    assert comparison["previous_period"]["count"] == 2
+    assert comparison["change_pct"] == 100.0
+    assert comparison["status"] == "WORSENING"
+
+    high_risk = IncidentPatternAnalyzer.identify_high_risk_patterns(days=30, recurrence_threshold=0.12)
+    assert [r["category"] for r in high_risk["high_risk_categories"]] == ["WORKER_FAILURE"]
+
+
+def test_benchmark_matches_legacy_path():
+    result = benchmark(incident_count=5000, days=30)
+    assert result["results_match"] is True
+    assert 0 < result["window_incidents"] < 5000
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Interaction Timeout Tests
+
+interaction/timeout.py:
+- get_due_interactions agrees with is_timed_out, with and without the deadline index
+- check_timeouts updates interactions / tasks set-based (escalation, dry run, project filter)
+- The due query is an index range search once deadline_at exists
+- TimeoutWatcher sleeps until the next deadline
+"""
+
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import get_connection
+from interaction.timeout import (
+    TimeoutWatcher,
+    add_deadline_column,
+    check_timeouts,
+    get_due_interactions,
+    get_pending_interactions,
+    has_deadline_column,
+    is_timed_out,
+    next_deadline,
+)
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+# interactions は schema_v2.sql になく、migrations/002 で作成される
+INTERACTIONS_DDL = """
+CREATE TABLE interactions (
+    id TEXT PRIMARY KEY,
+    session_id TEXT,
+    task_id TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    question_text TEXT NOT NULL,
+    answer_text TEXT,
+    status TEXT NOT NULL DEFAULT 'PENDING',
+    context_snapshot TEXT,
+    question_type TEXT DEFAULT 'GENERAL',
+    options_json TEXT,
+    timeout_at DATETIME,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    answered_at DATETIME,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (task_id, project_id) REFERENCES tasks(id, project_id) ON DELETE CASCADE,
+    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+    CHECK (status IN ('PENDING', 'ANSWERED', 'TIMEOUT', 'CANCELLED', 'SKIPPED'))
+);
+"""
+
+NOW = datetime.now()
+
+
+def _iso(delta_minutes):
+    return (NOW + timedelta(minutes=delta_minutes)).isoformat()
+
+
+@pytest.fixture
+def timeout_db(tmp_path):
+    db_path = tmp_path / "interactions.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.executescript(INTERACTIONS_DDL)
+    for project_id in ("PJ1", "PJ2"):
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (?, ?, '/tmp')", (project_id, project_id))
+        conn.execute(
+            "INSERT INTO orders (id, project_id, title, status) VALUES ('ORDER_001', ?, 't', 'IN_PROGRESS')",
+            (project_id,),
+        )
+    tasks = [("TASK_1", "PJ1", "WAITING_INPUT"), ("TASK_2", "PJ1", "IN_PROGRESS"), ("TASK_3", "PJ2", "WAITING_INPUT")]
+    for task_id, project_id, status in tasks:
+        conn.execute(
+            "INSERT INTO tasks (id, project_id, order_id, title, status) VALUES (?, ?, 'ORDER_001', ?, ?)",
+            (task_id, project_id, f"title {task_id}", status),
+        )
+    rows = [
+        # (id, task, project, status, timeout_at, created_at)
+        ("INT_001", "TASK_1", "PJ1", "PENDING", _iso(-5), _iso(-60)),                 # 期限切れ
+        ("INT_002", "TASK_2", "PJ1", "PENDING", _iso(30), _iso(-3000)),               # timeout_at 優先
+        ("INT_003", "TASK_2", "PJ1", "PENDING", None, _iso(-2000)),                   # created_at 基準で期限切れ
+        ("INT_004", "TASK_2", "PJ1", "PENDING", None,
+         (NOW - timedelta(minutes=60)).strftime("%Y-%m-%d %H:%M:%S")),                # CURRENT_TIMESTAMP 形式
+        ("INT_005", "TASK_1", "PJ1", "PENDING", "invalid", _iso(-2000)),              # 解釈不能 → created_at
+        ("INT_006", "TASK_1", "PJ1", "ANSWERED", _iso(-5), _iso(-60)),                # PENDING 以外
+        ("INT_007", "TASK_3", "PJ2", "PENDING", _iso(-1), _iso(-60)),                 # 別プロジェクト
+    ]
+    conn.executemany(
+        "INSERT INTO interactions (id, task_id, project_id, question_text, status, timeout_at, created_at) "
+        "VALUES (?, ?, ?, 'question?', ?, ?, ?)",
+        [(i, t, p, s, to, c) for i, t, p, s, to, c in rows],
+    )
+    conn.commit()
+    conn.close()
+    yield db_path
+
+
+def _due_ids(db_path, **kwargs):
+    conn = get_connection(db_path)
+    try:
+        return [row["id"] for row in get_due_interactions(conn, **kwargs)]
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_due_interactions_match_is_timed_out(timeout_db, indexed):
+    conn = get_connection(timeout_db)
+    try:
+        if indexed:
+            assert add_deadline_column(conn)
+            conn.commit()
+            assert not add_deadline_column(conn)
+        assert has_deadline_column(conn) is indexed
+        expected = [i["id"] for i in get_pending_interactions(conn) if is_timed_out(i)]
+    finally:
+        conn.close()
+
+    assert sorted(_due_ids(timeout_db)) == sorted(expected) == ["INT_001", "INT_003", "INT_005", "INT_007"]
+    assert sorted(_due_ids(timeout_db, project_id="PJ2")) == ["INT_007"]
+    assert sorted(_due_ids(timeout_db, timeout_minutes=30)) == ["INT_001", "INT_003", "INT_004", "INT_005", "INT_007"]
+
+
+def test_due_query_uses_deadline_index(timeout_db):
+    conn = get_connection(timeout_db)
+    try:
+        add_deadline_column(conn)
+        conn.commit()
+        plan = " ".join(
+            row["detail"] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM interactions WHERE status = 'PENDING' AND deadline_at < ?",
+                (NOW.isoformat(),),
+            )
+        )
+        assert "idx_interactions_deadline" in plan
+        assert next_deadline(conn, "PJ1").isoformat(timespec="seconds") == (
+            NOW - timedelta(minutes=2000) + timedelta(minutes=1440)
+        ).isoformat(timespec="seconds")
+    finally:
+        conn.close()
+
+
+def test_check_timeouts_is_set_based(timeout_db):
+    dry = check_timeouts(escalate=True, dry_run=True, db_path=timeout_db)
+    assert dry.success and dry.timed_out_count == 4 and dry.checked_count == 6
+    assert sorted(_due_ids(timeout_db)) == ["INT_001", "INT_003", "INT_005", "INT_007"]
+
+    result = check_timeouts("PJ1", escalate=True, db_path=timeout_db)
+    assert result.success, result.error
+    assert [i["id"] for i in result.timed_out_interactions] == ["INT_003", "INT_005", "INT_001"]
+    # TASK_1 には期限切れ Interaction が2件（件数は Interaction 単位）
+    assert result.escalated_count == 2
+    assert {t["task_id"] for t in result.escalated_tasks} == {"TASK_1"}
+
+    conn = get_connection(timeout_db)
+    try:
+        statuses = dict(conn.execute("SELECT id, status FROM interactions").fetchall())
+        assert statuses["INT_001"] == "TIMEOUT" and statuses["INT_002"] == "PENDING"
+        assert statuses["INT_007"] == "PENDING"
+        tasks = dict(conn.execute("SELECT id, status FROM tasks").fetchall())
+        assert tasks == {"TASK_1": "ESCALATED", "TASK_2": "IN_PROGRESS", "TASK_3": "WAITING_INPUT"}
+        history = conn.execute(
+            "SELECT entity_id, project_id, old_value, new_value FROM change_history WHERE entity_type = 'task'"
+        ).fetchall()
+        assert [tuple(h) for h in history] == [("TASK_1", "PJ1", "WAITING_INPUT", "ESCALATED")]
+    finally:
+        conn.close()
+
+    again = check_timeouts("PJ1", escalate=True, db_path=timeout_db)
+    assert again.timed_out_count == 0 and again.checked_count == 2
+
+
+def test_watcher_sleeps_until_next_deadline(timeout_db):
+    conn = get_connection(timeout_db)
+    try:
+        add_deadline_column(conn)
+        conn.execute("UPDATE interactions SET status = 'ANSWERED'")
+        conn.execute(
+            "UPDATE interactions SET status = 'PENDING', timeout_at = ? WHERE id = 'INT_002'",
+            ((datetime.now() + timedelta(seconds=0.5)).isoformat(),),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    watcher = TimeoutWatcher(max_sleep=10, db_path=timeout_db)
+    assert 0 < watcher.seconds_until_next() <= 0.5
+
+    results = []
+    started = time.monotonic()
+    watcher.run(max_cycles=1, on_result=results.append)
+    elapsed = time.monotonic() - started
+    assert 0.3 < elapsed < 5
+    assert [i["id"] for i in results[0].timed_out_interactions] == ["INT_002"]
+
+    # 期限がなければ max_sleep まで待機し、stop() で即座に終わる
+    assert watcher.seconds_until_next() == 10
+    timer = threading.Timer(0.2, watcher.stop)
+    timer.start()
+    started = time.monotonic()
+    watcher.run()
+    assert time.monotonic() - started < 5
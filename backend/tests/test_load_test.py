@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Launcher Load Test Harness Tests
+
+worker/load_test.py:
+- Synthetic ORDER generation (DAG shapes, file overlap)
+- Fake claude CLI latency / failure sampling
+- End-to-end daemon run with a JSON report
+"""
+
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from worker.load_test import (
+    DIST_EXPONENTIAL,
+    DIST_FIXED,
+    DIST_LOGNORMAL,
+    DIST_UNIFORM,
+    ENV_FAKE_CLAUDE,
+    SHAPE_CHAIN,
+    SHAPE_DIAMOND,
+    SHAPE_INDEPENDENT,
+    SHAPE_LAYERED,
+    SHAPE_RANDOM,
+    LoadTestSpec,
+    generate_order,
+    install_fake_claude,
+    run_load_test,
+    sample_latency,
+)
+
+
+def _deps(tasks):
+    return {t["id"]: t["depends_on"] for t in tasks}
+
+
+def test_generate_order_shapes():
+    chain = _deps(generate_order(LoadTestSpec(tasks=4, shape=SHAPE_CHAIN)))
+    assert chain == {
+        "TASK_001": [], "TASK_002": ["TASK_001"],
+        "TASK_003": ["TASK_002"], "TASK_004": ["TASK_003"],
+    }
+
+    diamond = _deps(generate_order(LoadTestSpec(tasks=5, shape=SHAPE_DIAMOND)))
+    assert diamond["TASK_001"] == []
+    assert diamond["TASK_003"] == ["TASK_001"]
+    assert diamond["TASK_005"] == ["TASK_002", "TASK_003", "TASK_004"]
+
+    layered = generate_order(LoadTestSpec(tasks=9, shape=SHAPE_LAYERED, width=3, fan_in=2))
+    for index, task in enumerate(layered):
+        if index < 3:
+            assert task["depends_on"] == []
+        else:
+            layer = index // 3
+            allowed = {f"TASK_{i + 1:03d}" for i in range((layer - 1) * 3, layer * 3)}
+            assert len(task["depends_on"]) == 2
+            assert set(task["depends_on"]) <= allowed
+
+    assert all(not d for d in _deps(generate_order(LoadTestSpec(tasks=5, shape=SHAPE_INDEPENDENT))).values())
+
+    order = generate_order(LoadTestSpec(tasks=30, shape=SHAPE_RANDOM, edge_probability=0.5, fan_in=3))
+    seen = set()
+    for task in order:
+        assert len(task["depends_on"]) <= 3
+        assert set(task["depends_on"]) <= seen
+        seen.add(task["id"])
+
+
+def test_generate_order_overlap_and_seed():
+    disjoint = generate_order(LoadTestSpec(tasks=20, overlap_ratio=0.0))
+    files = [f for t in disjoint for f in t["target_files"]]
+    assert len(set(files)) == 20
+
+    shared = generate_order(LoadTestSpec(tasks=20, overlap_ratio=1.0))
+    assert all(t["target_files"][0].startswith("src/shared/") for t in shared)
+    assert len({t["target_files"][0] for t in shared}) <= 2
+
+    assert generate_order(LoadTestSpec(tasks=20, shape=SHAPE_RANDOM, seed=7)) == \
+        generate_order(LoadTestSpec(tasks=20, shape=SHAPE_RANDOM, seed=7))
+
+
+def test_spec_validation():
+    with pytest.raises(ValueError):
+        LoadTestSpec(shape="star")
+    with pytest.raises(ValueError):
+        LoadTestSpec(latency_dist="pareto")
+    with pytest.raises(ValueError):
+        LoadTestSpec(failure_rate=1.5)
+    spec = LoadTestSpec(tasks=3, seed=4)
+    assert LoadTestSpec.from_dict({**spec.to_dict(), "unknown": 1}) == spec
+
+
+@pytest.mark.parametrize("dist", [DIST_FIXED, DIST_UNIFORM, DIST_EXPONENTIAL, DIST_LOGNORMAL])
+def test_sample_latency_mean(dist):
+    rng = random.Random(1)
+    values = [sample_latency(rng, dist, 2.0, 0.5) for _ in range(20000)]
+    assert all(v >= 0 for v in values)
+    assert sum(values) / len(values) == pytest.approx(2.0, rel=0.05)
+
+
+def test_fake_claude_accepts_cli_arguments(tmp_path):
+    stub = install_fake_claude(tmp_path / "bin")
+    env = dict(os.environ)
+    env[ENV_FAKE_CLAUDE] = '{"latency_dist": "fixed", "latency_mean": 0, "failure_rate": 0}'
+    ok = subprocess.run(
+        [str(stub), "-p", "--dangerously-skip-permissions", "--model=sonnet"],
+        input="prompt", capture_output=True, text=True, env=env, timeout=60,
+    )
+    assert ok.returncode == 0
+    assert "実施内容" in ok.stdout
+
+    env[ENV_FAKE_CLAUDE] = '{"failure_rate": 1.0}'
+    failed = subprocess.run(
+        [str(stub), "-p"], input="prompt", capture_output=True, text=True, env=env, timeout=60,
+    )
+    assert failed.returncode == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX fake claude script")
+def test_end_to_end_run_reports_metrics():
+    spec = LoadTestSpec(
+        tasks=5, shape=SHAPE_DIAMOND, max_workers=3,
+        latency_dist=DIST_FIXED, latency_mean=0.05, max_seconds=120,
+    )
+    report = run_load_test(spec)
+
+    assert report["timed_out"] is False
+    assert report["stalled"] is False
+    assert report["tasks"]["completed"] == 5
+    assert report["attempts"] == 5
+    assert report["makespan_seconds"] > 0
+    assert report["throughput_tasks_per_minute"] > 0
+    assert 0 < report["slot_utilization"] <= 1
+    daemon = report["daemon"]
+    assert daemon["polls"] >= 1
+    assert daemon["db_statements"] > 0
+    assert daemon["db_statements_per_poll"]["count"] == daemon["polls"]
+    assert daemon["poll_overhead_ms"]["max"] is not None
+
+    metrics = report["metrics"]
+    assert metrics["aipm_daemon_polls_total"]["value"] >= 1
+    assert metrics["aipm_worker_wall_seconds"][0]["count"] == 5
+    # ダイヤモンドの後続は先行タスク完了イベントから起動される
+    assert metrics["aipm_event_to_launch_delay_seconds"]["count"] >= 1
+    steps = {s["labels"]["step"] for s in metrics["aipm_worker_step_seconds"]}
+    assert steps == {"execute_task", "update_status_done"}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX fake claude script")
+def test_failures_escalate_and_stall_successors():
+    spec = LoadTestSpec(
+        tasks=2, shape=SHAPE_CHAIN, max_workers=1,
+        latency_dist=DIST_FIXED, latency_mean=0.0, failure_rate=1.0, max_seconds=120,
+    )
+    report = run_load_test(spec)
+
+    assert report["timed_out"] is False
+    assert report["stalled"] is True
+    assert report["tasks"]["by_status"] == {"REJECTED": 1, "BLOCKED": 1}
+    # 連続5回失敗で ESCALATED -> escalated_timeout=0 で REJECTED
+    assert report["attempts"] == report["failed_attempts"] == 5
@@ -0,0 +1,131 @@
+"""
+Tests for utils/log_stream.py - tail reader and log following
+"""
+
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_test_dir = Path(__file__).resolve().parent
+_package_root = _test_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils import log_stream
+from utils.log_stream import (
+    _FollowedFile,
+    _task_label_for_log,
+    read_tail_lines,
+    stream_order_logs,
+)
+
+
+class TestReadTailLines:
+
+    @pytest.mark.parametrize("block_size", [3, 16, 8192])
+    def test_returns_last_lines(self, tmp_path, monkeypatch, block_size):
+        monkeypatch.setattr(log_stream, "TAIL_BLOCK_SIZE", block_size)
+        log = tmp_path / "a.log"
+        log.write_bytes(b"".join(f"line {i}\n".encode() for i in range(100)))
+
+        assert read_tail_lines(log, 3) == ["line 97", "line 98", "line 99"]
+
+    def test_without_trailing_newline(self, tmp_path):
+        log = tmp_path / "a.log"
+        log.write_bytes(b"one\r\ntwo\r\nthree")
+
+        assert read_tail_lines(log, 2) == ["two", "three"]
+
+    def test_fewer_lines_than_requested(self, tmp_path):
+        log = tmp_path / "a.log"
+        log.write_text("only\n", encoding="utf-8")
+
+        assert read_tail_lines(log, 10) == ["only"]
+        assert read_tail_lines(log, 0) == []
+
+
+class TestFollowedFile:
+
+    def test_partial_lines_are_buffered(self, tmp_path):
+        log = tmp_path / "a.log"
+        log.write_text("old\n", encoding="utf-8")
+        followed = _FollowedFile(log)
+        assert followed.open(5) == ["old"]
+
+        with open(log, "a", encoding="utf-8") as f:
+            f.write("new 1\nnew")
+        assert followed.read_new_lines() == ["new 1"]
+
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(" 2\n")
+        assert followed.read_new_lines() == ["new 2"]
+        followed.close()
+
+    def test_truncation_restarts_from_top(self, tmp_path):
+        log = tmp_path / "a.log"
+        log.write_text("aaaaaaaa\nbbbbbbbb\n", encoding="utf-8")
+        followed = _FollowedFile(log)
+        followed.open(0)
+
+        log.write_text("c\n", encoding="utf-8")
+        assert followed.read_new_lines() == ["c"]
+        followed.close()
+
+    def test_rotation_drains_old_then_reads_new(self, tmp_path):
+        log = tmp_path / "a.log"
+        log.write_text("first\n", encoding="utf-8")
+        followed = _FollowedFile(log)
+        followed.open(0)
+
+        with open(log, "a", encoding="utf-8") as f:
+            f.write("tail of old\n")
+        os.replace(log, tmp_path / "a.log.1")
+        log.write_text("fresh\n", encoding="utf-8")
+
+        assert followed.read_new_lines() == ["tail of old", "fresh"]
+        followed.close()
+
+
+class TestOrderLogs:
+
+    def test_task_labels(self):
+        assert _task_label_for_log("worker_TASK_12_20260101_120000.log") == "TASK_12"
+        assert _task_label_for_log("TASK_12_review.log") == "TASK_12:review"
+        assert _task_label_for_log("daemon_heartbeat.json") is None
+
+    def test_no_follow_prefixes_each_worker(self, tmp_path):
+        (tmp_path / "worker_TASK_1_20260101_000000.log").write_text("a\nb\n", encoding="utf-8")
+        (tmp_path / "worker_TASK_2_20260101_000001.log").write_text("c\n", encoding="utf-8")
+        (tmp_path / "daemon.log").write_text("ignored\n", encoding="utf-8")
+        out = io.StringIO()
+
+        stream_order_logs(tmp_path, initial_lines=1, follow=False, out=out)
+
+        assert sorted(out.getvalue().splitlines()) == ["[TASK_1] b", "[TASK_2] c"]
+
+    def test_follow_picks_up_new_worker(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(log_stream, "WATCH_FALLBACK_TIMEOUT", 0.05)
+        (tmp_path / "worker_TASK_1_20260101_000000.log").write_text("", encoding="utf-8")
+        out = io.StringIO()
+        calls = {"n": 0}
+        original = log_stream._scan_worker_logs
+
+        def _scan(log_dir):
+            calls["n"] += 1
+            if calls["n"] == 3:
+                (tmp_path / "worker_TASK_2_20260101_000001.log").write_text(
+                    "hello\n", encoding="utf-8")
+            if calls["n"] >= 6:
+                raise KeyboardInterrupt
+            return original(log_dir)
+
+        monkeypatch.setattr(log_stream, "_scan_worker_logs", _scan)
+        monkeypatch.setattr(log_stream, "_create_watcher",
+                            lambda interval: log_stream._PollingWatcher(0.01))
+
+        stream_order_logs(tmp_path, initial_lines=0, follow=True, out=out)
+
+        assert "[TASK_2] hello" in out.getvalue().splitlines()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Worker Prompt Context Cache Tests
+
+worker/prompt_context_cache.py and its use from WorkerExecutor:
+- Sections are rebuilt only when their version key changes
+- bugs table version is bumped only by rendered columns
+- Known-bugs section is shared across executors; injections are still recorded per task
+- Migration 006 (trigger bodies) applies through run_migrations
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import _split_sql_statements, get_connection, run_migrations
+from worker.prompt_context_cache import (
+    CACHE_FILENAME,
+    PromptContextCache,
+    get_bugs_version,
+    is_racy,
+)
+from worker import execute_task
+from project import docs_selector
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "aipm.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ', 'PJ', '/pj')")
+    conn.execute(
+        "INSERT INTO bugs (id, project_id, title, description, severity) "
+        "VALUES ('BUG_001', NULL, 'Row.get', 'sqlite3.Row has no get()', 'High')"
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _make_executor(project_dir):
+    executor = object.__new__(execute_task.WorkerExecutor)
+    executor.project_id = "PJ"
+    executor.task_id = "TASK_1"
+    executor.project_dir = project_dir
+    executor._prompt_cache = None
+    executor.results = {"steps": [], "step_spans": []}
+    executor._step_started = {}
+    executor.verbose = False
+    return executor
+
+
+def test_cache_hit_miss_and_persist(tmp_path):
+    path = tmp_path / CACHE_FILENAME
+    calls = []
+
+    cache = PromptContextCache.load(path)
+    assert cache.get("s", {"v": 1}, lambda: calls.append(1) or "A") == "A"
+    assert cache.save()
+
+    cache = PromptContextCache.load(path)
+    assert cache.get("s", {"v": 1}, lambda: calls.append(1) or "B") == "A"
+    assert cache.get("s", {"v": 2}, lambda: calls.append(1) or "C") == "C"
+    assert cache.get("t", None, lambda: "D") == "D"
+    assert len(calls) == 2
+    assert cache.summary() == "s=hit, s=miss(inputs changed), t=miss(no version key)"
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    path = tmp_path / CACHE_FILENAME
+    path.write_text("{broken", encoding="utf-8")
+    cache = PromptContextCache.load(path)
+    assert cache.get("s", 1, lambda: "X") == "X"
+    assert cache.events[0][1] == "miss"
+    assert "unreadable" in cache.events[0][2]
+
+
+def test_bugs_version_ignores_injection_counters(db_path):
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    try:
+        before = get_bugs_version(conn)
+        conn.execute("UPDATE bugs SET total_injections = total_injections + 1")
+        assert get_bugs_version(conn) == before
+        conn.execute("UPDATE bugs SET solution = 'use row[\"x\"]'")
+        assert get_bugs_version(conn) == before + 1
+    finally:
+        conn.close()
+
+
+def test_split_keeps_trigger_bodies_whole():
+    statements = _split_sql_statements(
+        "CREATE TABLE t (x);\n"
+        "-- comment; with semicolon\n"
+        "CREATE TRIGGER tr AFTER INSERT ON t\n"
+        "BEGIN\n"
+        "    UPDATE t SET x = 1;\n"
+        "    DELETE FROM t WHERE x = 2;\n"
+        "END;\n"
+    )
+    assert len(statements) == 2
+    assert statements[1].startswith("CREATE TRIGGER tr")
+    assert statements[1].endswith("END")
+
+
+def test_migration_006_applies_via_run_migrations(tmp_path, db_path):
+    migration = SCHEMA_PATH.parent / "migrations" / "006_add_table_versions.sql"
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    (migrations_dir / migration.name).write_text(
+        migration.read_text(encoding="utf-8"), encoding="utf-8"
+    )
+
+    # 006 適用前の DB を再現する
+    conn = sqlite3.connect(str(db_path))
+    for trigger in ("insert", "delete", "update"):
+        conn.execute(f"DROP TRIGGER trigger_bugs_version_{trigger}")
+    conn.execute("DROP TABLE table_versions")
+    conn.commit()
+    conn.close()
+
+    assert run_migrations(db_path, migrations_dir, verbose=False) == ["006"]
+
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    try:
+        before = get_bugs_version(conn)
+        conn.execute("UPDATE bugs SET solution = 'use row[\"x\"]'")
+        assert get_bugs_version(conn) == before + 1
+    finally:
+        conn.close()
+
+
+def test_known_bugs_shared_across_executors(tmp_path, db_path):
+    project_dir = tmp_path / "PJ"
+    project_dir.mkdir()
+
+    def _conn():
+        return get_connection(db_path)
+
+    injections = []
+    with mock.patch.object(execute_task, "get_connection", _conn), \
+            mock.patch.object(execute_task.WorkerExecutor, "_record_bug_injections",
+                              lambda self, ids: injections.append(list(ids))):
+        first = _make_executor(project_dir)
+        text = first._get_known_bugs()
+        first._flush_prompt_cache()
+        assert "BUG_001" in text
+        assert (project_dir / CACHE_FILENAME).exists()
+
+        second = _make_executor(project_dir)
+        with mock.patch.object(execute_task.WorkerExecutor, "_render_known_bugs",
+                               side_effect=AssertionError("should be cached")):
+            assert second._get_known_bugs() == text
+        assert second._prompt_cache.events == [("known_bugs", "hit", "")]
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("UPDATE bugs SET description = 'changed'")
+        conn.commit()
+        conn.close()
+
+        third = _make_executor(project_dir)
+        assert "changed" in third._get_known_bugs()
+
+    # 注入記録はキャッシュヒット時もタスクごとに行われる
+    assert injections == [["BUG_001"]] * 3
+
+
+def test_docs_fingerprint_and_cached_contents(tmp_path):
+    docs_path = tmp_path / "docs"
+    docs_path.mkdir()
+    (docs_path / "INDEX.md").write_text("index", encoding="utf-8")
+    (docs_path / "db_schema.md").write_text("schema", encoding="utf-8")
+    old = time.time() - 60
+    for f in docs_path.iterdir():
+        os.utime(f, (old, old))
+
+    fingerprint = docs_selector.docs_fingerprint(docs_path)
+    assert [entry[0] for entry in fingerprint] == ["INDEX.md", "db_schema.md"]
+    assert not is_racy(fingerprint)
+    assert docs_selector.load_doc_contents(docs_path) == {"INDEX.md": "index", "db_schema.md": "schema"}
+
+    (docs_path / "db_schema.md").write_text("schema v2", encoding="utf-8")
+    new_fingerprint = docs_selector.docs_fingerprint(docs_path)
+    assert new_fingerprint != fingerprint
+    assert is_racy(new_fingerprint)
+    assert docs_selector.docs_fingerprint(tmp_path / "missing") is None
+
+    with mock.patch.object(docs_selector, "get_project_paths", return_value={"docs": docs_path}):
+        selected = docs_selector.select_docs(
+            "PJ", "DB スキーマ変更", "",
+            doc_contents={"INDEX.md": "cached index", "db_schema.md": "cached schema"},
+        )
+    assert [(d["filename"], d["content"]) for d in selected] == [
+        ("INDEX.md", "cached index"),
+        ("db_schema.md", "cached schema"),
+    ]
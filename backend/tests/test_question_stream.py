@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Streaming Question Detection Tests
+
+interaction/detect.py + utils/claude_cli.py:
+- StreamingQuestionDetector detects AskUserQuestion while output streams
+- finish() matches QuestionDetector.analyze_output on the whole output
+- ClaudeRunner.run(on_output=...) stops claude -p when the callback asks
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from interaction.detect import QuestionDetector, StreamingQuestionDetector
+from utils import claude_cli
+
+
+ASK_EVENT = json.dumps({
+    "type": "assistant",
+    "message": {"content": [{
+        "type": "tool_use",
+        "name": "AskUserQuestion",
+        "input": {"questions": [{
+            "question": "どのDBを使いますか？",
+            "header": "DB",
+            "options": [{"label": "SQLite"}, {"label": "PostgreSQL"}],
+            "multiSelect": False,
+        }]},
+    }]},
+}, ensure_ascii=False)
+
+
+def test_detects_ask_user_question_mid_stream():
+    stream = StreamingQuestionDetector()
+    assert stream.feed('{"type":"system"}\n作業を開始します\n') is None
+
+    # 行の途中で分割されたチャンクは行が完結するまで判定しない
+    half = len(ASK_EVENT) // 2
+    assert stream.feed(ASK_EVENT[:half]) is None
+    early = stream.feed(ASK_EVENT[half:] + "\n")
+    assert early is not None
+    assert early.detected and early.confidence == 1.0
+    assert early.question_type == "CHOICE"
+    assert early.question_text == "どのDBを使いますか？"
+    assert early.options == ["SQLite", "PostgreSQL"]
+    assert early.context["streaming"] is True
+
+    # 早期検知は一度だけ
+    assert stream.feed(ASK_EVENT + "\n") is None
+    assert stream.early_result is early
+
+
+def test_finish_matches_analyze_output():
+    output = "\n\n".join([
+        "  準備しています",
+        '{"questions": [{"question": "続けますか", "options": [{"label": "はい"}]}]}',
+        "AskUserQuestion",
+        "続行しますか？",
+        "please enter the name",
+        "[y/n]  ",
+        "",
+    ])
+    expected = QuestionDetector("PJ", "TASK_1").analyze_output(output)
+
+    stream = StreamingQuestionDetector()
+    for i in range(0, len(output), 7):
+        stream.feed(output[i:i + 7])
+    assert stream.finish() == expected
+    assert expected.question_text == "続けますか"
+    assert expected.question_type == "INPUT"
+    assert "question: [？?]$" in expected.matched_patterns
+
+    plain = QuestionDetector("PJ", "TASK_1").analyze_output("作業完了\nすべてのテストが通りました")
+    assert not plain.detected
+    assert QuestionDetector("PJ", "TASK_1").analyze_output("  \n ") == StreamingQuestionDetector().finish()
+
+
+def test_ring_buffer_is_bounded():
+    stream = StreamingQuestionDetector(max_lines=50)
+    stream.feed("ログ出力\n" * 1000)
+    stream.feed("AskUserQuestion\n")
+    result = stream.finish()
+    assert len(stream._ring) == 50
+    assert result.detected and result.question_type == "CHOICE"
+    assert result.context["total_lines"] == 1001
+    assert result.context["analyzed_lines"] == 10
+
+
+@pytest.fixture
+def fake_claude(tmp_path):
+    if os.name == "nt":
+        pytest.skip("shell stub")
+
+    def install(body):
+        path = tmp_path / "claude"
+        path.write_text(f"#!{sys.executable}\nimport sys, time\nsys.stdin.read()\n{body}\n", encoding="utf-8")
+        path.chmod(0o755)
+        env = {"PATH": f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}"}
+        with mock.patch.dict(os.environ, env):
+            return claude_cli.create_runner(timeout_seconds=20)
+
+    return install
+
+
+def test_runner_stops_when_question_is_detected(fake_claude):
+    runner = fake_claude(
+        f"print({ASK_EVENT!r}, flush=True)\n"
+        "time.sleep(30)\n"
+        "print('{\"type\": \"result\", \"result\": \"late\"}')"
+    )
+    stream = StreamingQuestionDetector()
+    started = time.monotonic()
+    result = runner.run("prompt", on_output=stream.feed)
+    assert time.monotonic() - started < 15
+    assert result.interrupted and not result.success
+    assert stream.early_result.options == ["SQLite", "PostgreSQL"]
+
+
+def test_runner_streaming_reads_result_event(fake_claude):
+    runner = fake_claude(
+        "print('{\"type\": \"system\"}', flush=True)\n"
+        "print('{\"type\": \"result\", \"is_error\": false, \"result\": \"完了\", \"total_cost_usd\": 0.25}')"
+    )
+    lines = []
+    result = runner.run("prompt", on_output=lines.append)
+    assert result.success and not result.interrupted
+    assert result.result_text == "完了"
+    assert result.cost_usd == 0.25
+    assert len(lines) == 2
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Project Info Refresh Tests
+
+project/refresh_info.py (fake ClaudeRunner):
+- Batch refresh collects DB context in a fixed number of grouped queries
+- AI calls run concurrently, bounded by max_workers
+- Projects whose inputs and PROJECT_INFO.md are unchanged are skipped
+- PROJECT_INFO.md and the refresh state are written atomically
+"""
+
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.claude_cli import ClaudeResult
+from utils.db import add_statement_observer, get_connection, remove_statement_observer
+from project import refresh_info
+from project.refresh_info import STATE_FILENAME, refresh_project_info, refresh_projects
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+AI_SECONDS = 0.4
+
+
+class FakeRunner:
+    """AI呼び出しの同時実行数を記録する"""
+
+    active = 0
+    peak = 0
+    calls = []
+    lock = threading.Lock()
+
+    def __init__(self, **kwargs):
+        pass
+
+    def run(self, prompt):
+        cls = FakeRunner
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+            cls.calls.append(prompt)
+        time.sleep(AI_SECONDS)
+        with cls.lock:
+            cls.active -= 1
+        project_id = prompt.split("プロジェクトID: ")[1].split("\n")[0]
+        return ClaudeResult(success=True, result_text=f"```markdown\n# {project_id}\n```")
+
+
+@pytest.fixture
+def refresh_env(tmp_path):
+    db_path = tmp_path / "refresh.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.executemany(
+        "INSERT INTO projects (id, name, path, is_active) VALUES (?, ?, '/tmp', ?)",
+        [("PJ_A", "A", 1), ("PJ_B", "B", 1), ("PJ_OFF", "off", 0)],
+    )
+    conn.executemany(
+        "INSERT INTO orders (id, project_id, title, status) VALUES ('ORDER_001', ?, 'o', 'IN_PROGRESS')",
+        [("PJ_A",), ("PJ_B",)],
+    )
+    conn.executemany(
+        "INSERT INTO tasks (id, project_id, order_id, title, status) VALUES (?, ?, 'ORDER_001', 't', ?)",
+        [("TASK_1", "PJ_A", "COMPLETED"), ("TASK_2", "PJ_A", "QUEUED"), ("TASK_1", "PJ_B", "COMPLETED")],
+    )
+    conn.execute("INSERT INTO backlog_items (id, project_id, title, status) VALUES ('BACKLOG_1', 'PJ_A', 'b', 'TODO')")
+    conn.commit()
+    conn.close()
+
+    projects = tmp_path / "PROJECTS"
+    (projects / "PJ_A" / "RESULT" / "ORDER_001").mkdir(parents=True)
+    (projects / "PJ_A" / "RESULT" / "ORDER_001" / "REPORT_1.md").write_text("r", encoding="utf-8")
+
+    def paths(project_id):
+        base = projects / project_id
+        return {"base": base, "orders": base / "ORDERS", "result": base / "RESULT"}
+
+    FakeRunner.active = FakeRunner.peak = 0
+    FakeRunner.calls = []
+    with mock.patch.object(refresh_info, "get_connection", lambda: get_connection(db_path)), \
+            mock.patch.object(refresh_info, "get_project_paths", paths), \
+            mock.patch.object(refresh_info, "create_runner", FakeRunner), \
+            mock.patch.object(refresh_info, "CLAUDE_RUNNER_AVAILABLE", True):
+        yield db_path, projects
+
+
+def test_batch_refresh_runs_concurrently_and_skips_unchanged(refresh_env):
+    db_path, projects = refresh_env
+
+    statements = []
+    add_statement_observer(statements.append)
+    try:
+        started = time.monotonic()
+        batch = refresh_projects(max_workers=3)
+        elapsed = time.monotonic() - started
+    finally:
+        remove_statement_observer(statements.append)
+
+    assert batch["success"]
+    assert batch["refreshed"] == ["PJ_A", "PJ_B"]
+    assert FakeRunner.peak == 2
+    assert elapsed < AI_SECONDS * 2
+    # アクティブプロジェクト一覧 + projects / orders / tasks / backlog
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 5
+
+    info = projects / "PJ_A" / "PROJECT_INFO.md"
+    assert info.read_text(encoding="utf-8") == "# PJ_A"
+    assert (projects / "PJ_A" / STATE_FILENAME).exists()
+    assert not list((projects / "PJ_A").glob(".tmp_*"))
+    summary = batch["projects"][0]["context_summary"]
+    assert (summary["order_count"], summary["completed_task_count"], summary["total_task_count"]) == (1, 1, 2)
+    assert summary["result_files_count"] == 1
+
+    again = refresh_projects(max_workers=3)
+    assert again["skipped"] == ["PJ_A", "PJ_B"] and again["refreshed"] == []
+    assert len(FakeRunner.calls) == 2
+
+    # DBの入力が変わったプロジェクトと、PROJECT_INFO.md が手で編集されたプロジェクトは再生成
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("UPDATE tasks SET status = 'COMPLETED' WHERE id = 'TASK_2' AND project_id = 'PJ_A'")
+    conn.commit()
+    conn.close()
+    (projects / "PJ_B" / "PROJECT_INFO.md").write_text("# edited", encoding="utf-8")
+    changed = refresh_projects(["PJ_A", "PJ_B", "PJ_C", "bad-id"], max_workers=1)
+    assert changed["refreshed"] == ["PJ_A", "PJ_B"]
+    assert changed["failed"] == ["PJ_C", "bad-id"]
+    assert not changed["success"]
+    assert FakeRunner.peak == 2
+    assert (projects / "PJ_B" / "PROJECT_INFO.md.bak").read_text(encoding="utf-8") == "# edited"
+
+    forced = refresh_projects(["PJ_A"], force=True)
+    assert forced["refreshed"] == ["PJ_A"]
+
+
+def test_single_refresh_uses_state(refresh_env):
+    _, projects = refresh_env
+    first = refresh_project_info("PJ_B")
+    assert first["success"] and not first.get("skipped")
+    second = refresh_project_info("PJ_B")
+    assert second["success"] and second["skipped"]
+    assert second["context_digest"] == first["context_digest"]
+
+    context_only = refresh_project_info("PJ_A", skip_ai=True)
+    assert context_only["skipped_ai"] and not (projects / "PJ_A" / STATE_FILENAME).exists()
+
+    missing = refresh_project_info("PJ_C")
+    assert not missing["success"]
+    assert "プロジェクトが見つかりません" in missing["error"]
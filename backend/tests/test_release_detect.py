@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - release.detect Tests
+
+Manifest-based release target detection:
+    1. Unchanged files are resolved from the manifest without being read
+    2. Size mismatches are classified as MODIFIED without hashing
+    3. Diff previews are only computed when requested
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+_test_dir = Path(__file__).resolve().parent
+_package_root = _test_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from release import detect
+from release.detect import MANIFEST_FILENAME, ReleaseManifest, detect_release_targets
+
+
+def _write_old(path: Path, content: str) -> None:
+    """Write a file and push its mtime outside the racy window."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    old = time.time() - 60
+    os.utime(path, (old, old))
+
+
+@pytest.fixture
+def project(tmp_path):
+    base = tmp_path / "PJ"
+    dev = base / "DEV"
+    _write_old(dev / "scripts" / "same.py", "print('same')\n")
+    _write_old(base / "scripts" / "same.py", "print('same')\n")
+    _write_old(dev / "scripts" / "changed.py", "print('new!')\n")
+    _write_old(base / "scripts" / "changed.py", "print('old')\n")
+    _write_old(dev / "scripts" / "edited.py", "value = 1\n")
+    _write_old(base / "scripts" / "edited.py", "value = 2\n")
+    _write_old(dev / "TEMPLATE" / "added.md", "# new\n")
+
+    paths = {"base": base, "dev": dev}
+    with mock.patch.object(detect, "get_project_paths", return_value=paths):
+        yield base
+
+
+class TestDetectReleaseTargets:
+
+    def test_classifies_targets(self, project):
+        result = detect_release_targets("PJ", include_diff=False)
+
+        assert result["success"] is True
+        by_source = {t["source"]: t["change_type"] for t in result["targets"]}
+        assert by_source == {
+            str(Path("TEMPLATE") / "added.md"): "NEW",
+            str(Path("scripts") / "changed.py"): "MODIFIED",
+            str(Path("scripts") / "edited.py"): "MODIFIED",
+        }
+        assert all("diff" not in t for t in result["targets"])
+
+    def test_size_mismatch_is_not_hashed(self, project):
+        result = detect_release_targets("PJ", include_diff=False)
+        # same.py (x2) and edited.py (x2) have equal sizes; changed.py does not
+        assert result["manifest"] == {"hits": 0, "hashed": 4}
+
+    def test_second_run_uses_manifest(self, project):
+        detect_release_targets("PJ", include_diff=False)
+        assert (project / MANIFEST_FILENAME).exists()
+
+        with mock.patch.object(detect.hashlib, "sha256", side_effect=AssertionError("re-hashed")):
+            result = detect_release_targets("PJ", include_diff=False)
+
+        assert result["manifest"] == {"hits": 4, "hashed": 0}
+        assert result["count"] == 3
+
+    def test_modified_file_is_rehashed(self, project):
+        detect_release_targets("PJ", include_diff=False)
+        _write_old(project / "DEV" / "scripts" / "same.py", "print('diff')\n")
+        later = time.time() - 30
+        os.utime(project / "DEV" / "scripts" / "same.py", (later, later))
+
+        result = detect_release_targets("PJ", include_diff=False)
+
+        sources = {t["source"] for t in result["targets"]}
+        assert str(Path("scripts") / "same.py") in sources
+        assert result["manifest"]["hashed"] == 1
+
+    def test_diff_only_when_requested(self, project):
+        result = detect_release_targets("PJ", include_diff=True)
+
+        for target in result["targets"]:
+            assert target["diff"]["has_diff"] is True
+        edited = next(t for t in result["targets"] if t["source"].endswith("edited.py"))
+        assert edited["diff"]["added_lines"] == 1
+        assert edited["diff"]["deleted_lines"] == 1
+
+
+class TestReleaseManifest:
+
+    def test_recent_files_are_not_cached(self, tmp_path):
+        path = tmp_path / "fresh.txt"
+        path.write_text("fresh", encoding="utf-8")
+        st = path.stat()
+
+        manifest = ReleaseManifest(tmp_path / MANIFEST_FILENAME)
+        manifest.digest("dev", "fresh.txt", path, st.st_size, st.st_mtime_ns)
+
+        assert "fresh.txt" not in manifest.entries["dev"]
+
+    def test_corrupt_manifest_starts_empty(self, tmp_path):
+        path = tmp_path / MANIFEST_FILENAME
+        path.write_text("{not json", encoding="utf-8")
+
+        manifest = ReleaseManifest.load(path)
+
+        assert manifest.entries == {"dev": {}, "prod": {}}
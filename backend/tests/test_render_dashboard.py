@@ -6,6 +6,7 @@ render/dashboard.py の単体テスト
 """
 
 import unittest
+from unittest import mock
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -26,6 +27,7 @@ from render.dashboard import (
     EscalationSummary,
     PendingReviewSummary,
     BacklogSummary,
+    estimate_current_order_eta,
 )
 
 
@@ -430,5 +432,26 @@ class TestDashboardRenderContext(unittest.TestCase):
         self.assertEqual(result["projects"][0]["completion_rate_percent"], 80)
 
 
+
+class TestEstimateCurrentOrderEta(unittest.TestCase):
+    """estimate_current_order_eta() は保存済みモデルだけを使う"""
+
+    def test_no_stored_model(self):
+        """保存済みモデルがなければ学習し直さずNone"""
+        with mock.patch("worker.task_duration.load_stored_model", return_value=None), \
+                mock.patch("worker.schedule_simulator.estimate_order_eta") as estimate:
+            self.assertIsNone(estimate_current_order_eta(mock.Mock(), "PJ", "ORDER_001"))
+        estimate.assert_not_called()
+
+    def test_uses_stored_model(self):
+        """保存済みモデルをシミュレーションに渡す"""
+        model = mock.Mock()
+        with mock.patch("worker.task_duration.load_stored_model", return_value=model), \
+                mock.patch("worker.schedule_simulator.estimate_order_eta",
+                           return_value={"eta_seconds": 1200.0, "remaining_tasks": 1}) as estimate:
+            self.assertEqual(estimate_current_order_eta(mock.Mock(), "PJ", "ORDER_001"), 1200.0)
+        self.assertIs(estimate.call_args.kwargs["model"], model)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Resident Dependency Graph Tests
+
+worker/dependency_resolver.py ResidentDependencyGraph:
+- Per-node unmet-predecessor counters (release: COMPLETED, launch: COMPLETED/DONE)
+- Completion events release successors in one batched UPDATE
+- Periodic reconcile picks up external edits
+- ParallelTaskDetector consults the resident graph
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import get_connection
+from utils import file_lock
+from worker import dependency_resolver, parallel_detector, task_duration
+from worker.dependency_resolver import ResidentDependencyGraph
+from worker.parallel_detector import ParallelTaskDetector
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    # A -> C, B -> C, C -> D, E (独立)
+    path = tmp_path / "aipm.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ', 'PJ', '/pj')")
+    conn.execute(
+        "INSERT INTO orders (id, project_id, title, status) "
+        "VALUES ('ORDER_001', 'PJ', 'active', 'IN_PROGRESS')"
+    )
+    tasks = [
+        ("TASK_A", "IN_PROGRESS"),
+        ("TASK_B", "IN_PROGRESS"),
+        ("TASK_C", "BLOCKED"),
+        ("TASK_D", "BLOCKED"),
+        ("TASK_E", "QUEUED"),
+    ]
+    for task_id, status in tasks:
+        conn.execute(
+            "INSERT INTO tasks (id, order_id, project_id, title, status, priority) "
+            "VALUES (?, 'ORDER_001', 'PJ', ?, ?, 'P1')",
+            (task_id, task_id, status),
+        )
+    for task_id, depends_on in (("TASK_C", "TASK_A"), ("TASK_C", "TASK_B"), ("TASK_D", "TASK_C")):
+        conn.execute(
+            "INSERT INTO task_dependencies (task_id, depends_on_task_id, project_id) "
+            "VALUES (?, ?, 'PJ')",
+            (task_id, depends_on),
+        )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def patched_db(db_path):
+    def _conn(*args, **kwargs):
+        return get_connection(db_path)
+
+    task_duration.clear_model_cache()
+    with mock.patch.object(parallel_detector, "get_connection", _conn), \
+            mock.patch.object(dependency_resolver, "get_connection", _conn), \
+            mock.patch.object(task_duration, "get_connection", _conn), \
+            mock.patch.object(file_lock, "get_connection", _conn):
+        yield db_path
+    task_duration.clear_model_cache()
+
+
+def _set_status(db_path, task_id, status):
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("UPDATE tasks SET status = ? WHERE id = ?", (status, task_id))
+    conn.commit()
+    conn.close()
+
+
+def _status(db_path, task_id):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute("SELECT status FROM tasks WHERE id = ?", (task_id,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_load_builds_counters(patched_db):
+    graph = ResidentDependencyGraph("PJ", "ORDER_001").load()
+    assert graph.node_count == 5
+    assert graph.unmet_count("TASK_C") == 2
+    assert graph.unmet_count("TASK_D") == 1
+    assert graph.dependencies_satisfied("TASK_E") is True
+    assert graph.dependencies_satisfied("TASK_C") is False
+    assert graph.dependencies_satisfied("TASK_X") is None
+
+
+def test_completion_decrements_and_releases(patched_db):
+    graph = ResidentDependencyGraph("PJ", "ORDER_001").load()
+
+    _set_status(patched_db, "TASK_A", "COMPLETED")
+    assert graph.on_task_completed("TASK_A") == []
+    assert graph.unmet_count("TASK_C") == 1
+    assert _status(patched_db, "TASK_C") == "BLOCKED"
+
+    _set_status(patched_db, "TASK_B", "COMPLETED")
+    assert graph.on_task_completed("TASK_B") == ["TASK_C"]
+    assert graph.unmet_count("TASK_C") == 0
+    assert _status(patched_db, "TASK_C") == "QUEUED"
+    assert _status(patched_db, "TASK_D") == "BLOCKED"
+
+    conn = sqlite3.connect(str(patched_db))
+    rows = conn.execute(
+        "SELECT entity_id, old_value, new_value, project_id FROM change_history"
+    ).fetchall()
+    conn.close()
+    assert rows == [("TASK_C", "BLOCKED", "QUEUED", "PJ")]
+
+
+def test_orphan_dependency_is_ignored(patched_db):
+    # tasks に行のない先行タスクへの依存（resolve_on_completion の JOIN と同じく無視）
+    conn = sqlite3.connect(str(patched_db))
+    conn.execute(
+        "INSERT INTO task_dependencies (task_id, depends_on_task_id, project_id) "
+        "VALUES ('TASK_C', 'TASK_GONE', 'PJ')"
+    )
+    conn.commit()
+    conn.close()
+
+    graph = ResidentDependencyGraph("PJ", "ORDER_001").load()
+    assert graph.unmet_count("TASK_C") == 2
+
+    _set_status(patched_db, "TASK_A", "COMPLETED")
+    _set_status(patched_db, "TASK_B", "COMPLETED")
+    graph.on_task_completed("TASK_A")
+    assert graph.on_task_completed("TASK_B") == ["TASK_C"]
+    assert _status(patched_db, "TASK_C") == "QUEUED"
+
+    # 後から行が作られた場合は未充足として数える
+    graph.set_status("TASK_GONE", "QUEUED")
+    assert graph.unmet_count("TASK_C") == 1
+
+
+def test_done_satisfies_launch_but_not_release(patched_db):
+    graph = ResidentDependencyGraph("PJ", "ORDER_001").load()
+    _set_status(patched_db, "TASK_A", "DONE")
+    _set_status(patched_db, "TASK_B", "DONE")
+    assert graph.on_task_completed("TASK_A") == []
+    assert graph.on_task_completed("TASK_B") == []
+    assert graph.dependencies_satisfied("TASK_C") is True
+    assert graph.unmet_count("TASK_C") == 2
+    assert _status(patched_db, "TASK_C") == "BLOCKED"
+
+    # 差し戻し (DONE -> REWORK) でカウンタが戻る
+    _set_status(patched_db, "TASK_A", "REWORK")
+    graph.on_task_completed("TASK_A")
+    assert graph.dependencies_satisfied("TASK_C") is False
+
+
+def test_batched_release_of_multiple_successors(patched_db):
+    conn = sqlite3.connect(str(patched_db))
+    conn.execute(
+        "INSERT INTO tasks (id, order_id, project_id, title, status, priority) "
+        "VALUES ('TASK_F', 'ORDER_001', 'PJ', 'TASK_F', 'BLOCKED', 'P1')"
+    )
+    conn.execute(
+        "INSERT INTO task_dependencies (task_id, depends_on_task_id, project_id) "
+        "VALUES ('TASK_F', 'TASK_E', 'PJ'), ('TASK_D', 'TASK_E', 'PJ')"
+    )
+    conn.execute("UPDATE tasks SET status = 'COMPLETED' WHERE id IN ('TASK_A', 'TASK_B', 'TASK_C')")
+    conn.execute("UPDATE tasks SET status = 'BLOCKED' WHERE id = 'TASK_D'")
+    conn.commit()
+    conn.close()
+
+    graph = ResidentDependencyGraph("PJ", "ORDER_001").load()
+    _set_status(patched_db, "TASK_E", "COMPLETED")
+    with mock.patch.object(
+        dependency_resolver, "execute_query", wraps=dependency_resolver.execute_query
+    ) as spy:
+        assert graph.on_task_completed("TASK_E") == ["TASK_D", "TASK_F"]
+    assert spy.call_count == 1
+    assert _status(patched_db, "TASK_D") == "QUEUED"
+    assert _status(patched_db, "TASK_F") == "QUEUED"
+
+
+def test_release_skips_tasks_changed_externally(patched_db):
+    graph = ResidentDependencyGraph("PJ", "ORDER_001").load()
+    _set_status(patched_db, "TASK_A", "COMPLETED")
+    _set_status(patched_db, "TASK_B", "COMPLETED")
+    _set_status(patched_db, "TASK_C", "CANCELLED")
+    graph.on_task_completed("TASK_A")
+    assert graph.on_task_completed("TASK_B") == []
+    assert _status(patched_db, "TASK_C") == "CANCELLED"
+
+
+def test_reconcile_picks_up_external_edits(patched_db):
+    graph = ResidentDependencyGraph("PJ", "ORDER_001", reconcile_interval=0).load()
+    assert graph.needs_reconcile()
+
+    # 別プロセスで承認され、イベントが届かなかったケース
+    _set_status(patched_db, "TASK_A", "COMPLETED")
+    _set_status(patched_db, "TASK_B", "COMPLETED")
+    # 外部で依存が追加されたケース
+    conn = sqlite3.connect(str(patched_db))
+    conn.execute(
+        "INSERT INTO task_dependencies (task_id, depends_on_task_id, project_id) "
+        "VALUES ('TASK_E', 'TASK_A', 'PJ')"
+    )
+    conn.commit()
+    conn.close()
+
+    assert graph.reconcile() == ["TASK_C"]
+    assert graph.unmet_count("TASK_E") == 0
+    assert "TASK_A" in graph.get_predecessors("TASK_E")
+    assert _status(patched_db, "TASK_C") == "QUEUED"
+
+
+def test_unknown_task_triggers_reconcile(patched_db):
+    graph = ResidentDependencyGraph("PJ", "ORDER_001").load()
+    conn = sqlite3.connect(str(patched_db))
+    conn.execute(
+        "INSERT INTO tasks (id, order_id, project_id, title, status, priority) "
+        "VALUES ('TASK_G', 'ORDER_001', 'PJ', 'TASK_G', 'COMPLETED', 'P1')"
+    )
+    conn.execute(
+        "INSERT INTO task_dependencies (task_id, depends_on_task_id, project_id) "
+        "VALUES ('TASK_D', 'TASK_G', 'PJ')"
+    )
+    conn.commit()
+    conn.close()
+    assert graph.on_task_completed("TASK_G") == []
+    assert "TASK_G" in graph.nodes
+    assert graph.unmet_count("TASK_D") == 1
+
+
+def test_detector_uses_resident_graph(patched_db):
+    graph = ResidentDependencyGraph("PJ", "ORDER_001").load()
+    _set_status(patched_db, "TASK_A", "DONE")
+    _set_status(patched_db, "TASK_B", "DONE")
+    _set_status(patched_db, "TASK_C", "QUEUED")
+
+    # グラフに未反映のためC はまだ起動不可
+    launchable = ParallelTaskDetector.find_parallel_launchable_tasks(
+        "PJ", "ORDER_001", max_tasks=5, dependency_graph=graph
+    )
+    assert [t["id"] for t in launchable] == ["TASK_E"]
+
+    graph.on_task_completed("TASK_A")
+    graph.on_task_completed("TASK_B")
+    launchable = ParallelTaskDetector.find_parallel_launchable_tasks(
+        "PJ", "ORDER_001", max_tasks=5, dependency_graph=graph
+    )
+    assert sorted(t["id"] for t in launchable) == ["TASK_C", "TASK_E"]
@@ -0,0 +1,72 @@
+"""
+CLI起動時間の回帰テスト
+
+- 遅延インポート化したモジュールが `--help` 起動時に読み込まれないこと
+- 各エントリポイントが起動時間予算内に収まること
+- パッケージ公開名が属性アクセス時に解決されること（utils/lazy_import.py）
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_package_root = Path(__file__).resolve().parent.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils.import_audit import (
+    DEFAULT_ENTRY_POINTS,
+    audit_entry_point,
+    parse_importtime,
+)
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _io\n"
+        "import time:       300 |       1500 | utils.db\n"
+        "some other line\n"
+    )
+    entries = parse_importtime(stderr)
+    assert [e["module"] for e in entries] == ["_io", "utils.db"]
+    assert entries[0]["depth"] == 1
+    assert entries[1]["depth"] == 0
+    assert entries[1]["cumulative_us"] == 1500
+
+
+@pytest.mark.parametrize("script,forbidden", [
+    # 失敗時の自己修復でのみ使う（rollback / snapshot_manager を連鎖インポート）
+    ("worker/execute_task.py", ["worker.auto_recovery", "rollback", "project.docs_selector"]),
+    # 未使用だった asyncio と、task パッケージ経由の create/list/get
+    ("worker/parallel_launcher.py", ["asyncio", "task.create", "task.list", "cost.cost_tracker"]),
+    ("task/update.py", ["task.create", "cost.model_selector"]),
+])
+def test_lazy_modules_not_loaded_on_help(script, forbidden):
+    result = audit_entry_point(script, runs=1, top=0)
+    assert result["returncode"] == 0
+    loaded = set(result["modules"])
+    assert loaded, "importtime 出力が取得できていない"
+    for module in forbidden:
+        assert module not in loaded, f"{script} の起動時に {module} が読み込まれている"
+
+
+@pytest.mark.parametrize("script", sorted(DEFAULT_ENTRY_POINTS))
+def test_entry_point_within_budget(script):
+    result = audit_entry_point(script, runs=3, top=5)
+    assert result["returncode"] == 0
+    assert result["wall_ms"] <= DEFAULT_ENTRY_POINTS[script], (
+        f"{script}: {result['wall_ms']}ms > budget {DEFAULT_ENTRY_POINTS[script]}ms\n"
+        f"top: {[e['module'] for e in result['top_cumulative']]}"
+    )
+
+
+def test_package_exports_resolve_lazily():
+    import task
+
+    create_task = task.create_task
+    assert "task.create" in sys.modules
+    assert vars(task)["create_task"] is create_task
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        task.missing
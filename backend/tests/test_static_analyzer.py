@@ -30,14 +30,18 @@ _package_root = _test_dir.parent
 if str(_package_root) not in sys.path:
     sys.path.insert(0, str(_package_root))
 
+from quality.analysis_cache import AnalysisCache
 from quality.static_analyzer import (
     AnalysisIssue,
     AnalysisResult,
     StaticAnalyzer,
     TOOL_TIMEOUT_SECONDS,
+    clear_detection_cache,
 )
 from quality.auto_fixer import AutoFixer
 
+SCHEMA_PATH = _package_root.parent / "data" / "schema_v2.sql"
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -221,6 +225,173 @@ class TestToolTimeout:
                 analyzer._run_subprocess(["ruff", "check", "src/main.py"])
 
 
+class TestDetectionCache:
+    """detect_tools() results are shared per project root."""
+
+    def test_detection_is_cached_per_project_root(self, tmp_project):
+        clear_detection_cache()
+        (tmp_project / "tsconfig.json").write_text("{}", encoding="utf-8")
+        npx = mock.Mock(return_value=True)
+        with mock.patch.object(StaticAnalyzer, "_command_exists", return_value=False), \
+             mock.patch.object(StaticAnalyzer, "_npx_available", npx):
+            first = StaticAnalyzer(str(tmp_project))
+            assert first.detect_tools()["tsc"] is True
+            assert first._tool_command("tsc") == ["npx", "tsc"]
+            assert StaticAnalyzer(str(tmp_project)).detect_tools()["tsc"] is True
+            assert npx.call_count == 1
+
+            # 設定ファイルが変わると再検出する
+            (tmp_project / "tsconfig.json").unlink()
+            assert StaticAnalyzer(str(tmp_project)).detect_tools()["tsc"] is False
+            StaticAnalyzer(str(tmp_project)).detect_tools(refresh=True)
+        clear_detection_cache()
+
+    def test_detection_and_versions_are_shared_across_processes(self, tmp_project, cache_db):
+        clear_detection_cache()
+        (tmp_project / "tsconfig.json").write_text("{}", encoding="utf-8")
+        npx = mock.Mock(return_value=True)
+        version = mock.Mock(return_value=subprocess.CompletedProcess([], 0, "Version 5.4.0\n", ""))
+        with mock.patch.object(StaticAnalyzer, "_command_exists", return_value=False), \
+             mock.patch.object(StaticAnalyzer, "_npx_available", npx), \
+             mock.patch("quality.static_analyzer.subprocess.run", version):
+            first = StaticAnalyzer(str(tmp_project), cache=AnalysisCache(cache_db))
+            assert first.detect_tools()["tsc"] is True
+            assert first._tool_version("tsc") == "Version 5.4.0"
+            assert npx.call_count == 1
+            assert version.call_count == 1
+
+            # 別の Worker プロセス（プロセス内キャッシュなし）は保存済みの結果を使う
+            clear_detection_cache()
+            second = StaticAnalyzer(str(tmp_project), cache=AnalysisCache(cache_db))
+            assert second.detect_tools()["tsc"] is True
+            assert second._tool_command("tsc") == ["npx", "tsc"]
+            assert second._tool_version("tsc") == "Version 5.4.0"
+            assert npx.call_count == 1
+            assert version.call_count == 1
+
+            # PATH が変わると再検出し、バージョンも取り直す
+            clear_detection_cache()
+            with mock.patch.dict(os.environ, {"PATH": "/opt/node/bin"}):
+                third = StaticAnalyzer(str(tmp_project), cache=AnalysisCache(cache_db))
+                third.detect_tools()
+                third._tool_version("tsc")
+            assert npx.call_count == 2
+            assert version.call_count == 2
+        clear_detection_cache()
+
+
+@pytest.fixture
+def cache_db(tmp_path):
+    db_path = tmp_path / "cache.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.close()
+    return db_path
+
+
+def _cached_analyzer(tmp_project, cache_db, **kwargs):
+    analyzer = StaticAnalyzer(str(tmp_project), cache=AnalysisCache(cache_db), **kwargs)
+    analyzer._detected_tools = {"ruff": True, "mypy": True, "tsc": False, "eslint": False}
+    analyzer.detect_tools = mock.Mock(return_value=analyzer._detected_tools)
+    analyzer._tool_command = lambda tool: [tool]
+    analyzer._tool_version = lambda tool: f"{tool} 1.0"
+    return analyzer
+
+
+def _fake_ruff(analyzer, calls):
+    def run(files):
+        calls.append(list(files))
+        return [
+            AnalysisIssue(str(analyzer.project_root / f), 1, 1, "ruff", "error", f"[F401] {f}")
+            for f in files
+        ]
+    return run
+
+
+class TestResultCache:
+    """Per-file results are cached by content hash, tool version and config hash."""
+
+    def test_cache_disabled_without_db(self, tmp_path):
+        cache = AnalysisCache(tmp_path / "missing.db")
+        assert cache.enabled is False
+        assert cache.get_many("ruff", "1", "c", ["h"]) == {}
+        assert not (tmp_path / "missing.db").exists()
+
+    def test_only_changed_files_are_reanalyzed(self, tmp_project, cache_db):
+        (tmp_project / "src" / "util.py").write_text("x = 1\n", encoding="utf-8")
+        files = ["src/main.py", "src/util.py"]
+        calls = []
+
+        def analyze():
+            analyzer = _cached_analyzer(tmp_project, cache_db)
+            analyzer._run_ruff_check = _fake_ruff(analyzer, calls)
+            analyzer._run_mypy = mock.Mock(return_value=[])
+            return analyzer.analyze(files)
+
+        first = analyze()
+        assert calls == [files]
+        assert first["score"] == StaticAnalyzer._calculate_score(2, 0)
+
+        assert analyze() == first
+        assert calls == [files]
+
+        (tmp_project / "src" / "util.py").write_text("x = 2\n", encoding="utf-8")
+        assert analyze() == first
+        assert calls[-1] == ["src/util.py"]
+
+        # 設定ファイルが変わると全ファイルを再解析する
+        (tmp_project / "ruff.toml").write_text("line-length = 100\n", encoding="utf-8")
+        analyze()
+        assert calls[-1] == files
+
+    def test_cross_file_tool_caches_the_file_set(self, tmp_project, cache_db):
+        (tmp_project / "src" / "util.py").write_text("x = 1\n", encoding="utf-8")
+        files = ["src/main.py", "src/util.py"]
+        mypy_issue = AnalysisIssue("src/main.py", 3, 1, "mypy", "warning", "Missing return type")
+        mypy = mock.Mock(return_value=[mypy_issue])
+
+        for _ in range(2):
+            analyzer = _cached_analyzer(tmp_project, cache_db)
+            analyzer._run_ruff_check = mock.Mock(return_value=[])
+            analyzer._run_mypy = mypy
+            result = analyzer.analyze(files)
+        assert mypy.call_count == 1
+        assert result["warnings"] == [mypy_issue.to_dict()]
+
+        # どれか1ファイルが変われば対象ファイル群全体を再解析する
+        (tmp_project / "src" / "util.py").write_text("x = 2\n", encoding="utf-8")
+        analyzer = _cached_analyzer(tmp_project, cache_db)
+        analyzer._run_ruff_check = mock.Mock(return_value=[])
+        analyzer._run_mypy = mypy
+        analyzer.analyze(files)
+        mypy.assert_called_with(files)
+
+
+class TestParallelAnalyze:
+    """Tools run concurrently; results keep the tool order."""
+
+    def test_parallel_matches_sequential(self, tmp_project):
+        def run(max_workers):
+            analyzer = StaticAnalyzer(str(tmp_project), use_cache=False, max_workers=max_workers)
+            analyzer._detected_tools = {"ruff": True, "mypy": True, "tsc": True, "eslint": False}
+            analyzer._run_ruff_check = mock.Mock(return_value=[
+                AnalysisIssue("src/main.py", 1, 1, "ruff", "error", "[F401] unused"),
+                AnalysisIssue("src/main.py", 2, 1, "ruff", "warning", "[W291] whitespace"),
+            ])
+            analyzer._run_mypy = mock.Mock(side_effect=RuntimeError("boom"))
+            analyzer._run_tsc = mock.Mock(return_value=[
+                AnalysisIssue("web/app.ts", 5, 10, "tsc", "error", "[TS2322] Type mismatch"),
+            ])
+            return analyzer.analyze(["src/main.py", "web/app.ts", "web/app.jsx"])
+
+        parallel = run(4)
+        assert parallel == run(1)
+        assert parallel["tools_used"] == ["ruff", "tsc"]
+        assert parallel["skipped_tools"] == ["mypy", "eslint"]
+        assert [e["tool"] for e in parallel["errors"]] == ["ruff", "tsc"]
+        assert parallel["score"] == StaticAnalyzer._calculate_score(2, 1) == 78
+
+
 # ===================================================================
 # AutoFixer Tests
 # ===================================================================
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Task Prediction Model Tests
+
+worker/task_duration.py:
+- Bucketed quantiles with back-off to coarser buckets and defaults
+- Training from change_history / actual_tokens, storage in task_prediction_models
+- Consumers: cost_tracker.estimate_task_cost, schedule_simulator.estimate_order_eta
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.db import get_connection
+from worker import task_duration
+from worker.schedule_simulator import estimate_order_eta
+from worker.task_duration import (
+    DEFAULT_TASK_SECONDS,
+    DEFAULT_TASK_TOKENS,
+    GLOBAL_SCOPE,
+    TaskPredictionModel,
+    bucket_keys,
+    get_model,
+    load_model,
+    load_stored_model,
+    task_features,
+    train_models,
+)
+from cost import cost_tracker
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "schema_v2.sql"
+
+
+def _features(complexity=50, model="Opus", files=1, deps=0):
+    return {"complexity": complexity, "model": model, "files": files, "deps": deps}
+
+
+def _sample(seconds=None, tokens=None, **features):
+    return {"features": _features(**features), "seconds": seconds, "tokens": tokens}
+
+
+class TestTaskPredictionModel:
+    def test_finest_bucket_with_enough_samples(self):
+        samples = [_sample(seconds=s, complexity=10, model="Haiku") for s in (100, 200, 300)]
+        samples += [_sample(seconds=s, complexity=10, model="Opus") for s in (1000, 2000, 3000)]
+        model = TaskPredictionModel.fit(samples)
+        assert model.predict(_features(10, "Haiku"))["seconds"] == 200
+        assert model.predict(_features(10, "Opus"))["seconds"] == 2000
+        assert model.predict(_features(10, "Opus"))["seconds_p90"] == pytest.approx(2800)
+        assert model.predict(_features(10, "Opus"))["basis"]["seconds"] == bucket_keys(_features(10, "Opus"))[0]
+
+    def test_backs_off_to_coarser_bucket(self):
+        samples = [_sample(seconds=100, complexity=10, files=f) for f in (0, 1, 3)]
+        model = TaskPredictionModel.fit(samples)
+        prediction = model.predict(_features(10, files=8))
+        assert prediction["seconds"] == 100
+        assert prediction["basis"]["seconds"] == "c0|mOpus"
+
+    def test_overall_scaled_by_complexity_and_defaults(self):
+        model = TaskPredictionModel.fit([_sample(seconds=100, tokens=1000, complexity=50)])
+        assert model.predict(_features(100))["seconds"] == pytest.approx(150)
+        assert model.predict(_features(0))["tokens"] == 500
+
+        empty = TaskPredictionModel()
+        prediction = empty.predict(_features(50))
+        assert prediction["seconds"] == DEFAULT_TASK_SECONDS
+        assert prediction["tokens"] == DEFAULT_TASK_TOKENS
+        assert prediction["basis"] == {"seconds": "default", "tokens": "default"}
+
+    def test_targets_are_independent(self):
+        model = TaskPredictionModel.fit([_sample(tokens=5000)] * 3)
+        assert model.sample_count == 3
+        assert model.buckets["seconds"] == {}
+        assert model.predict(_features())["tokens"] == 5000
+
+    def test_json_round_trip_and_version_check(self):
+        model = TaskPredictionModel.fit([_sample(seconds=60, tokens=100)] * 3)
+        restored = TaskPredictionModel.from_json(model.to_json())
+        assert restored.predict(_features()) == model.predict(_features())
+        assert TaskPredictionModel.from_json('{"version": 999}') is None
+        assert TaskPredictionModel.from_json("{broken") is None
+
+    def test_features_compute_missing_complexity(self):
+        features = task_features({
+            "title": "Refactor authentication module",
+            "description": "",
+            "complexity_score": None,
+            "target_files": '["a.py", "b.py"]',
+            "recommended_model": None,
+            "dependency_count": 2,
+        })
+        assert features["files"] == 2
+        assert features["deps"] == 2
+        assert features["model"] == "Opus"
+        assert features["complexity"] > 0
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "aipm.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO projects (id, name, path) VALUES ('PJ', 'PJ', '/pj')")
+    conn.execute(
+        "INSERT INTO orders (id, project_id, title, status) VALUES ('ORDER_001', 'PJ', 'done', 'COMPLETED')"
+    )
+    conn.execute(
+        "INSERT INTO orders (id, project_id, title, status) VALUES ('ORDER_002', 'PJ', 'active', 'IN_PROGRESS')"
+    )
+    tasks = [
+        ("TASK_001", "ORDER_001", "COMPLETED", 8000),
+        ("TASK_002", "ORDER_001", "COMPLETED", 10000),
+        ("TASK_003", "ORDER_001", "COMPLETED", 12000),
+        ("TASK_011", "ORDER_002", "QUEUED", None),
+        ("TASK_012", "ORDER_002", "QUEUED", None),
+        ("TASK_013", "ORDER_002", "DONE", None),
+    ]
+    for task_id, order_id, status, tokens in tasks:
+        conn.execute(
+            "INSERT INTO tasks (id, order_id, project_id, title, status, recommended_model, "
+            "complexity_score, actual_tokens) VALUES (?, ?, 'PJ', ?, ?, 'Sonnet', 40, ?)",
+            (task_id, order_id, task_id, status, tokens),
+        )
+    conn.execute(
+        "INSERT INTO task_dependencies (task_id, depends_on_task_id, project_id) "
+        "VALUES ('TASK_012', 'TASK_011', 'PJ')"
+    )
+    for task_id, minutes in (("TASK_001", 10), ("TASK_002", 20), ("TASK_003", 30)):
+        for status, ts in (("IN_PROGRESS", "10:00:00"), ("DONE", f"10:{minutes}:00")):
+            conn.execute(
+                "INSERT INTO change_history (entity_type, entity_id, field_name, "
+                "new_value, changed_by, changed_at) VALUES ('task', ?, 'status', ?, 'test', ?)",
+                (task_id, status, f"2026-01-01 {ts}"),
+            )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def patched_db(db_path):
+    def _conn(*args, **kwargs):
+        return get_connection(db_path)
+
+    task_duration.clear_model_cache()
+    with mock.patch.object(task_duration, "get_connection", _conn), \
+            mock.patch("utils.db.get_connection", _conn), \
+            mock.patch.object(cost_tracker, "get_connection", _conn):
+        yield db_path
+    task_duration.clear_model_cache()
+
+
+def test_train_and_store(patched_db):
+    assert train_models(db_path=patched_db) == {"PJ": 3, GLOBAL_SCOPE: 3}
+
+    conn = get_connection(patched_db)
+    try:
+        stored = load_model(conn, "PJ")
+    finally:
+        conn.close()
+    prediction = stored.predict(_features(40, "Sonnet", files=0))
+    assert prediction["seconds"] == 1200
+    assert prediction["tokens"] == 10000
+
+    # 保存済みモデルが優先される（学習データを消しても同じ予測）
+    conn = sqlite3.connect(str(patched_db))
+    conn.execute("DELETE FROM change_history")
+    conn.commit()
+    conn.close()
+    assert get_model("PJ").predict(_features(40, "Sonnet", files=0))["seconds"] == 1200
+
+
+def test_load_stored_model_never_fits(patched_db):
+    conn = get_connection(patched_db)
+    try:
+        with mock.patch.object(TaskPredictionModel, "fit", side_effect=AssertionError("fit")):
+            assert load_stored_model(conn, "PJ") is None
+    finally:
+        conn.close()
+
+    train_models(db_path=patched_db)
+    conn = get_connection(patched_db)
+    try:
+        with mock.patch.object(TaskPredictionModel, "fit", side_effect=AssertionError("fit")):
+            assert load_stored_model(conn, "PJ").sample_count == 3
+            assert load_stored_model(conn, "PJ_OTHER").sample_count == 3  # 横断モデル
+    finally:
+        conn.close()
+
+
+def test_get_model_fits_on_the_fly_without_stored_model(patched_db):
+    model = get_model("PJ")
+    assert model.sample_count == 3
+    assert model.predict(_features(40, "Sonnet", files=0))["tokens"] == 10000
+
+
+def test_estimate_task_cost(patched_db):
+    result = cost_tracker.estimate_task_cost("PJ", "TASK_011")
+    assert result["model"] == "Sonnet"
+    assert result["estimated_tokens"] == 10000
+    assert result["estimated_cost_usd"] == cost_tracker.estimate_cost("Sonnet", 10000)["estimated_cost_usd"]
+    assert result["predicted_seconds"] == 1200
+    with pytest.raises(ValueError):
+        cost_tracker.estimate_task_cost("PJ", "TASK_999")
+
+
+def test_order_eta_follows_dependencies(patched_db):
+    conn = get_connection(patched_db)
+    try:
+        eta = estimate_order_eta(conn, "PJ", "ORDER_002", max_workers=4)
+    finally:
+        conn.close()
+    # TASK_011 -> TASK_012 は直列、TASK_013 (DONE) は完了済み
+    assert eta == {"eta_seconds": 2400, "remaining_tasks": 2}
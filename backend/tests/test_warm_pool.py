@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Warm Worker Pool Tests
+
+worker/warm_pool.py:
+- Spares run one job each with the script's own main() and exit code
+- Job output goes to the task log file
+- Dead / stale spares fall back to cold spawn
+- ParallelWorkerLauncher records launch-to-first-step latency of warm launches
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.worker_config import WorkerResourceConfig
+from worker.parallel_launcher import ParallelWorkerLauncher
+from worker.warm_pool import (
+    KIND_EXECUTE_TASK,
+    KIND_PROBE,
+    KIND_REVIEW_WORKER,
+    WarmWorkerPool,
+)
+
+
+@pytest.fixture
+def pool():
+    p = WarmWorkerPool(size=1).start()
+    yield p
+    p.close()
+
+
+def test_probe_acknowledges(pool, tmp_path):
+    requested = time.time()
+    proc = pool.launch(KIND_PROBE, [], tmp_path / "probe.log")
+    assert proc is not None
+    assert proc.wait(timeout=60) == 0
+    ack = WarmWorkerPool.read_ack(proc)
+    assert ack["pid"] == proc.pid
+    assert ack["started_at"] >= requested
+    # 使用済みの spare は補充される
+    assert pool.idle_count == 1
+    assert pool.stats["launched"] == 1
+
+
+def test_job_runs_main_with_log_and_exit_code(pool, tmp_path):
+    log_file = tmp_path / "task.log"
+    # 引数不足: execute_task.py の argparse がエラー終了する（クラッシュはこのジョブのみ）
+    proc = pool.launch(KIND_EXECUTE_TASK, [], log_file)
+    assert proc.wait(timeout=60) == 2
+    assert "task_id" in log_file.read_text(encoding="utf-8")
+
+    log_file = tmp_path / "review.log"
+    proc = pool.launch(KIND_REVIEW_WORKER, ["--help"], log_file)
+    assert proc.wait(timeout=60) == 0
+    assert "review_worker.py" in log_file.read_text(encoding="utf-8")
+
+
+def test_dead_spare_falls_back_to_cold(pool, tmp_path):
+    spare, _ = pool._spares[0]
+    spare.kill()
+    spare.wait()
+    assert pool.launch(KIND_PROBE, [], tmp_path / "x.log") is None
+    assert pool.stats["dead"] == 1
+    assert pool.stats["fallbacks"] == 1
+    assert pool.idle_count == 1
+
+
+def test_stale_spare_is_recycled(tmp_path):
+    pool = WarmWorkerPool(size=1, max_idle_seconds=0).start()
+    try:
+        time.sleep(0.01)
+        assert pool.launch(KIND_PROBE, [], tmp_path / "x.log") is None
+        assert pool.stats["recycled"] == 1
+    finally:
+        pool.close()
+
+
+def test_unknown_kind(pool, tmp_path):
+    with pytest.raises(ValueError):
+        pool.launch("shell", [], tmp_path / "x.log")
+
+
+def test_launcher_records_launch_latency(pool, tmp_path):
+    launcher = ParallelWorkerLauncher(
+        "PJ", "ORDER_001",
+        worker_config=WorkerResourceConfig(enable_resource_monitoring=False),
+    )
+    cmd = [sys.executable, "review_worker.py", "--help"]
+
+    launcher._warm_pool = pool
+    requested = time.time()
+    proc, mode = launcher._spawn_process(KIND_REVIEW_WORKER, cmd, tmp_path / "warm.log")
+    assert mode == "warm"
+    proc.wait(timeout=60)
+    launcher._record_launch_latency(
+        "TASK_1", {"process": proc, "launch_mode": mode, "launch_requested_at": requested}, kind="review"
+    )
+
+    launcher._warm_pool = None
+    requested = time.time()
+    proc, mode = launcher._spawn_process(KIND_REVIEW_WORKER, cmd, tmp_path / "cold.log")
+    assert mode == "cold"
+    proc.wait(timeout=60)
+    launcher._record_launch_latency(
+        "TASK_2", {"process": proc, "launch_mode": mode, "launch_requested_at": requested}
+    )
+    launcher._cleanup_log_handles()
+
+    warm, cold = launcher.results["worker_launch_latency"]
+    assert warm["mode"] == "warm" and warm["kind"] == "review"
+    assert warm["latency_ms"] is not None and warm["latency_ms"] >= 0
+    assert cold == {"task_id": "TASK_2", "kind": "worker", "mode": "cold", "latency_ms": None}
+    assert "review_worker.py" in (tmp_path / "cold.log").read_text(encoding="utf-8")
@@ -9,14 +9,20 @@ D案アーキテクチャ（ORDER_168）:
   Step 1: Python直接処理（バリデーション、コンテキスト準備）
   Step 2: subprocess で claude -p を呼び出し（AI処理）
   Step 3: Python直接処理（結果パース、DB登録）
+
+run(prompt, on_output=callback) を指定すると --output-format=stream-json で起動し、
+出力を1行（1イベント）ずつ callback に渡す。callback が真を返した時点で
+プロセスを終了し、interrupted=True の結果を返す（実行中の質問検知など）。
 """
 
+import json
 import logging
 import os
 import subprocess
 import shutil
+import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +34,7 @@ class ClaudeResult:
     result_text: str = ""
     error_message: Optional[str] = None
     cost_usd: Optional[float] = None
+    interrupted: bool = False  # on_output コールバックにより中断した
 
 
 class ClaudeRunner:
@@ -53,12 +60,18 @@ class ClaudeRunner:
                 "Claude Code をインストールしてください: https://docs.anthropic.com/en/docs/claude-code"
             )
 
-    def run(self, prompt: str) -> ClaudeResult:
+    def run(
+        self,
+        prompt: str,
+        on_output: Optional[Callable[[str], object]] = None,
+    ) -> ClaudeResult:
         """
         Claude CLIでプロンプトを実行
 
         Args:
             prompt: 実行するプロンプト
+            on_output: 出力行ごとに呼ばれるコールバック（stream-json の1イベント）。
+                真を返すとプロセスを終了して interrupted=True を返す
 
         Returns:
             ClaudeResult: 実行結果
@@ -78,11 +91,17 @@ class ClaudeRunner:
         if self.max_turns and self.max_turns > 0:
             cmd.append(f"--max-turns={self.max_turns}")
 
+        # ストリーミング時は1行1イベントの stream-json で受け取る
+        if on_output is not None:
+            cmd.extend(["--output-format=stream-json", "--verbose"])
+
         logger.info(f"[claude_cli] Executing: claude -p (model={self.model}, timeout={self.timeout_seconds}s)")
 
         try:
             # CLAUDECODE環境変数を除去してネストセッションエラーを防止
             env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+            if on_output is not None:
+                return self._run_streaming(cmd, prompt, env, on_output)
             result = subprocess.run(
                 cmd,
                 input=prompt,
@@ -139,6 +158,123 @@ class ClaudeRunner:
                 cost_usd=None,
             )
 
+    def _run_streaming(
+        self,
+        cmd: List[str],
+        prompt: str,
+        env: dict,
+        on_output: Callable[[str], object],
+    ) -> ClaudeResult:
+        """
+        claude -p を起動し、stdout を1行ずつ on_output に渡しながら実行
+
+        stdin への書き込みと stderr の読み取りは別スレッドで行い、
+        パイプ詰まりを防ぐ。タイムアウトはタイマーでプロセスを kill する。
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            env=env,
+        )
+
+        def _write_prompt() -> None:
+            try:
+                proc.stdin.write(prompt)
+                proc.stdin.close()
+            except (BrokenPipeError, OSError, ValueError):
+                pass
+
+        stderr_lines: List[str] = []
+        timed_out = threading.Event()
+
+        def _on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        threads = [
+            threading.Thread(target=_write_prompt, daemon=True),
+            threading.Thread(target=lambda: stderr_lines.extend(proc.stderr), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        timer = threading.Timer(self.timeout_seconds, _on_timeout)
+        timer.daemon = True
+        timer.start()
+
+        stdout_lines: List[str] = []
+        result_event: Optional[dict] = None
+        interrupted = False
+        try:
+            for line in proc.stdout:
+                stdout_lines.append(line)
+                event = _parse_event(line)
+                if event is not None and event.get("type") == "result":
+                    result_event = event
+                if on_output(line):
+                    interrupted = True
+                    logger.info("[claude_cli] Output callback requested stop; terminating claude -p")
+                    proc.terminate()
+                    break
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        finally:
+            timer.cancel()
+            for thread in threads:
+                thread.join(timeout=5)
+            proc.stdout.close()
+            proc.stderr.close()
+
+        output_text = "".join(stdout_lines).strip()
+        if interrupted:
+            return ClaudeResult(
+                success=False,
+                result_text=output_text,
+                error_message="claude -p を出力コールバックにより中断しました",
+                interrupted=True,
+            )
+        if timed_out.is_set():
+            error_msg = f"claude -p がタイムアウトしました ({self.timeout_seconds}秒)"
+            logger.error(f"[claude_cli] {error_msg}")
+            return ClaudeResult(success=False, result_text="", error_message=error_msg)
+
+        # 最終結果イベントから本文とコストを取り出す
+        result_text = output_text
+        cost_usd = None
+        is_error = False
+        if result_event is not None:
+            result_text = str(result_event.get("result") or "").strip()
+            cost_usd = result_event.get("total_cost_usd")
+            is_error = bool(result_event.get("is_error"))
+
+        if proc.returncode == 0 and not is_error:
+            return ClaudeResult(success=True, result_text=result_text, cost_usd=cost_usd)
+
+        error_msg = "".join(stderr_lines).strip() or f"claude -p exited with code {proc.returncode}"
+        if is_error and result_text:
+            error_msg = result_text
+        logger.error(f"[claude_cli] Error: {error_msg}")
+        return ClaudeResult(success=False, result_text=result_text, error_message=error_msg, cost_usd=cost_usd)
+
+
+def _parse_event(line: str) -> Optional[dict]:
+    """stream-json の1行をイベント辞書として解釈（JSONでなければNone）"""
+    line = line.strip()
+    if not line.startswith("{"):
+        return None
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) else None
+
 
 def create_runner(
     model: str = "sonnet",
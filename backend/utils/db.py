@@ -8,7 +8,7 @@ import sqlite3
 import re
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple, Union, Generator
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, Generator
 import threading
 
 # スレッドローカルなコネクション管理
@@ -20,6 +20,68 @@ class DatabaseError(Exception):
     pass
 
 
+# SQL文の観測フック（負荷試験・メトリクス計測用。空なら無効）
+_statement_observers: List[Callable[[str], None]] = []
+
+
+def add_statement_observer(observer: Callable[[str], None]) -> None:
+    """
+    get_connection() で以降に開く接続へ SQL トレースコールバックを追加
+
+    Args:
+        observer: 実行された SQL 文を受け取るコールバック
+    """
+    if observer not in _statement_observers:
+        _statement_observers.append(observer)
+
+
+def remove_statement_observer(observer: Callable[[str], None]) -> None:
+    """
+    add_statement_observer() で追加したコールバックを解除
+
+    Args:
+        observer: 解除するコールバック（未登録なら何もしない）
+    """
+    if observer in _statement_observers:
+        _statement_observers.remove(observer)
+
+
+def _notify_statement_observers(sql: str) -> None:
+    for observer in tuple(_statement_observers):
+        observer(sql)
+
+
+# ファイルパスから読み込んだ get_db_config（接続ごとに db_config.py を再実行しないようキャッシュ）
+_fallback_get_db_config = None
+
+
+def _resolve_get_db_config():
+    """
+    get_db_config 関数を解決して返す
+
+    configパッケージがインポートできない直接実行時は
+    backend/config/db_config.py をファイルパスから読み込む（初回のみ実行し、以降はキャッシュ）。
+    """
+    global _fallback_get_db_config
+    if _fallback_get_db_config is not None:
+        return _fallback_get_db_config
+
+    try:
+        from config import get_db_config
+        return get_db_config
+    except ImportError:
+        pass
+
+    # 直接実行の場合 - backend/config/db_config.pyを明示的にインポート
+    import importlib.util
+    config_path = Path(__file__).resolve().parent.parent / "config" / "db_config.py"
+    spec = importlib.util.spec_from_file_location("aipm_db_config", config_path)
+    config_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config_module)
+    _fallback_get_db_config = config_module.get_db_config
+    return _fallback_get_db_config
+
+
 def get_connection(
     db_path: Optional[Path] = None,
     *,
@@ -43,18 +105,7 @@ def get_connection(
     """
     if db_path is None:
         # デフォルトパスはconfigパッケージから取得（循環インポート回避のため遅延インポート）
-        try:
-            from config import get_db_config
-        except ImportError:
-            # 直接実行の場合 - backend/config/db_config.pyを明示的にインポート
-            import importlib.util
-            from pathlib import Path as P
-            config_path = P(__file__).resolve().parent.parent / "config" / "db_config.py"
-            spec = importlib.util.spec_from_file_location("aipm_db_config", config_path)
-            config_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(config_module)
-            get_db_config = config_module.get_db_config
-        db_path = get_db_config().db_path
+        db_path = _resolve_get_db_config()().db_path
 
     db_path = Path(db_path)
 
@@ -73,6 +124,9 @@ def get_connection(
     # 外部キー制約を有効化
     conn.execute("PRAGMA foreign_keys = ON")
 
+    if _statement_observers:
+        conn.set_trace_callback(_notify_statement_observers)
+
     return conn
 
 
@@ -292,18 +346,7 @@ def init_database(
     """
     if schema_path is None:
         # デフォルトスキーマパスを取得
-        try:
-            from config import get_db_config
-        except ImportError:
-            # 直接実行の場合 - backend/config/db_config.pyを明示的にインポート
-            import importlib.util
-            from pathlib import Path as P
-            config_path = P(__file__).resolve().parent.parent / "config" / "db_config.py"
-            spec = importlib.util.spec_from_file_location("aipm_db_config", config_path)
-            config_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(config_module)
-            get_db_config = config_module.get_db_config
-        config = get_db_config()
+        config = _resolve_get_db_config()()
         schema_path = config.schema_path
 
     schema_path = Path(schema_path)
@@ -431,7 +474,8 @@ def _split_sql_statements(sql_text: str) -> List[str]:
     Note:
         - コメント行（-- で始まる行）は除去
         - ブロックコメント（/* ... */）は除去
-        - セミコロンでステートメントを分割
+        - セミコロンでステートメントを分割（トリガー本体の BEGIN ... END は
+          sqlite3.complete_statement() で1文として扱う）
         - 空のステートメントは除去
     """
     # ブロックコメントを除去
@@ -446,12 +490,20 @@ def _split_sql_statements(sql_text: str) -> List[str]:
         lines.append(line)
     sql_text = '\n'.join(lines)
 
-    # セミコロンでステートメントを分割
+    # セミコロンでステートメントを分割（文として完結するまで連結する）
     statements = []
-    for stmt in sql_text.split(';'):
-        stmt = stmt.strip()
+    buffer = ""
+    for part in sql_text.split(';'):
+        buffer += part + ';'
+        if not sqlite3.complete_statement(buffer):
+            continue
+        stmt = buffer.strip()[:-1].strip()
         if stmt:
             statements.append(stmt)
+        buffer = ""
+
+    if buffer.strip()[:-1].strip():
+        statements.append(buffer.strip()[:-1].strip())
 
     return statements
 
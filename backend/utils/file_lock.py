@@ -2,12 +2,33 @@
 AI PM Framework - File Lock Management Utility
 
 Manages file locks for parallel task execution to prevent conflicts.
+
+Lock keys are normalized (``normalize_lock_path``) before they are stored in
+``file_locks.file_path`` and conflicts are resolved through ``PathLockTrie``:
+
+- ``src/a.ts``      file lock
+- ``src/``          directory lock (conflicts with everything below it)
+- ``src/**/*.ts``   glob lock (``*``/``?`` per segment, ``**`` any depth)
+- ``glob:src/[ab].ts``  explicit pattern (``[...]`` is a character class)
+
+``[...]`` is a character class only in segments that already contain ``*``/``?``
+or in paths marked with ``glob:``; elsewhere it is part of the name, so
+bracketed directories such as ``app/[id]/page.tsx`` are locked literally.
+
+Benchmark (from backend/):
+    python -m utils.file_lock --benchmark --locks 5000 --queries 2000
 """
 
+import argparse
+import fnmatch
 import json
+import posixpath
+import random
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Set
 
 from utils.db import (
     get_connection, execute_query, fetch_one, fetch_all,
@@ -20,6 +41,293 @@ class FileLockError(Exception):
     pass
 
 
+# Task statuses whose locks are stale (released lazily)
+STALE_LOCK_STATUSES = ("COMPLETED", "DONE", "REJECTED")
+
+# Marks a lock path as a pattern, so that ``[...]`` is a character class
+GLOB_PREFIX = "glob:"
+
+# Characters that make a segment a pattern by themselves
+_GLOB_CHARS = frozenset("*?")
+
+
+def normalize_lock_path(path: str) -> str:
+    """
+    Normalize a lock path to its stored key
+
+    Backslashes become ``/``, ``.``/``..`` segments and duplicate separators
+    are collapsed, and a trailing ``/`` is kept to mark a directory lock
+    (``./src\\a.ts`` -> ``src/a.ts``, ``src/lib/../`` -> ``src/``).
+
+    Args:
+        path: File, directory (trailing ``/``) or glob path
+
+    Returns:
+        Normalized key, or "" for paths that name no file (``""``, ``.``)
+    """
+    raw = str(path).strip().replace("\\", "/")
+    if raw.startswith(GLOB_PREFIX):
+        pattern = normalize_lock_path(raw[len(GLOB_PREFIX):])
+        return GLOB_PREFIX + pattern if pattern else ""
+    if not raw:
+        return ""
+    is_dir = raw.endswith("/")
+    norm = posixpath.normpath(raw)
+    if norm == ".":
+        return ""
+    if is_dir and not norm.endswith("/"):
+        norm += "/"
+    return norm
+
+
+def normalize_lock_paths(paths: Iterable[str]) -> List[str]:
+    """Normalize and de-duplicate lock paths, keeping their order"""
+    keys: List[str] = []
+    seen: Set[str] = set()
+    for path in paths:
+        key = normalize_lock_path(path)
+        if key and key not in seen:
+            seen.add(key)
+            keys.append(key)
+    return keys
+
+
+def _is_glob_segment(segment: str, pattern: bool = False) -> bool:
+    if any(c in _GLOB_CHARS for c in segment):
+        return True
+    return pattern and "[" in segment
+
+
+class _LockEntry:
+    """One lock (or lock request) split into path segments"""
+
+    __slots__ = ("key", "segments", "glob_mask", "is_dir", "is_glob", "task_id", "locked_at")
+
+    def __init__(self, key: str, task_id: Optional[str] = None, locked_at: Optional[str] = None):
+        self.key = key
+        pattern = key.startswith(GLOB_PREFIX)
+        path = key[len(GLOB_PREFIX):] if pattern else key
+        self.is_dir = path.endswith("/")
+        self.segments = path.rstrip("/").split("/") if path != "/" else [""]
+        self.glob_mask = [_is_glob_segment(s, pattern) for s in self.segments]
+        self.is_glob = any(self.glob_mask)
+        self.task_id = task_id
+        self.locked_at = locked_at
+
+    @property
+    def literal_prefix(self) -> List[str]:
+        """Leading segments without glob characters (the trie position)"""
+        if not self.is_glob:
+            return self.segments
+        return self.segments[:self.glob_mask.index(True)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"task_id": self.task_id, "file_path": self.key, "locked_at": self.locked_at}
+
+
+def _glob_overlaps(pattern: _LockEntry, path: _LockEntry) -> bool:
+    """
+    Whether a glob lock and a concrete path overlap
+
+    A directory path overlaps if the glob can match something below it; a
+    directory glob (trailing ``/``) covers everything below what it matches.
+    """
+    pat, segs = pattern.segments, path.segments
+    memo: Dict[tuple, bool] = {}
+
+    def match(i: int, j: int) -> bool:
+        if (i, j) in memo:
+            return memo[(i, j)]
+        if i == len(pat):
+            result = j == len(segs) or pattern.is_dir
+        elif j == len(segs):
+            result = path.is_dir or all(p == "**" for p in pat[i:])
+        elif pat[i] == "**":
+            result = match(i + 1, j) or match(i, j + 1)
+        elif pattern.glob_mask[i]:
+            result = fnmatch.fnmatchcase(segs[j], pat[i]) and match(i + 1, j + 1)
+        else:
+            result = segs[j] == pat[i] and match(i + 1, j + 1)
+        memo[(i, j)] = result
+        return result
+
+    return match(0, 0)
+
+
+def _entries_overlap(a: _LockEntry, b: _LockEntry) -> bool:
+    """Whether two locks cover a common path"""
+    if a.key == b.key:
+        return True
+    if a.is_glob and b.is_glob:
+        # Conservative: any two globs whose literal prefixes are nested
+        pa, pb = a.literal_prefix, b.literal_prefix
+        n = min(len(pa), len(pb))
+        return pa[:n] == pb[:n]
+    if a.is_glob:
+        return _glob_overlaps(a, b)
+    if b.is_glob:
+        return _glob_overlaps(b, a)
+    n = min(len(a.segments), len(b.segments))
+    if a.segments[:n] != b.segments[:n]:
+        return False
+    if len(a.segments) == len(b.segments):
+        return True
+    shorter = a if len(a.segments) < len(b.segments) else b
+    return shorter.is_dir
+
+
+class _TrieNode:
+    __slots__ = ("children", "entries", "size")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Locks whose literal prefix ends at this node (files, dirs, globs)
+        self.entries: List[_LockEntry] = []
+        # Number of locks in this subtree (including this node)
+        self.size = 0
+
+
+class PathLockTrie:
+    """
+    Path-trie index of file locks
+
+    Locks are placed at the node of their literal prefix, so a conflict check
+    walks one root-to-path chain (O(path depth)) and only descends into a
+    subtree when the request is a directory or glob that actually has locks
+    below it. Build it once per scheduling pass with ``load()`` and ``add()``
+    the locks of tasks picked earlier in the same pass.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._task_ids: Set[str] = set()
+
+    def __len__(self) -> int:
+        return self._root.size
+
+    @property
+    def task_ids(self) -> Set[str]:
+        """Task IDs that own at least one lock in the index"""
+        return set(self._task_ids)
+
+    @classmethod
+    def load(cls, conn, project_id: str) -> "PathLockTrie":
+        """
+        Build the index from ``file_locks`` (stale locks are skipped)
+
+        Args:
+            conn: Database connection
+            project_id: Project ID
+
+        Returns:
+            PathLockTrie with all live locks of the project
+        """
+        placeholders = ",".join(["?"] * len(STALE_LOCK_STATUSES))
+        rows = fetch_all(
+            conn,
+            f"""
+            SELECT fl.task_id, fl.file_path, fl.locked_at
+            FROM file_locks fl
+            LEFT JOIN tasks t ON t.id = fl.task_id AND t.project_id = fl.project_id
+            WHERE fl.project_id = ?
+              AND (t.status IS NULL OR t.status NOT IN ({placeholders}))
+            """,
+            (project_id, *STALE_LOCK_STATUSES)
+        )
+        index = cls()
+        for row in rows:
+            index.add(row["task_id"], row["file_path"], row["locked_at"])
+        return index
+
+    def add(self, task_id: str, path: str, locked_at: Optional[str] = None) -> str:
+        """
+        Add a lock
+
+        Args:
+            task_id: Owner task ID
+            path: File, directory or glob path (normalized here)
+            locked_at: Lock timestamp
+
+        Returns:
+            Normalized key ("" if the path was ignored)
+        """
+        key = normalize_lock_path(path)
+        if not key:
+            return ""
+        entry = _LockEntry(key, task_id, locked_at)
+        node = self._root
+        node.size += 1
+        for segment in entry.literal_prefix:
+            node = node.children.setdefault(segment, _TrieNode())
+            node.size += 1
+        node.entries.append(entry)
+        self._task_ids.add(task_id)
+        return key
+
+    def add_many(self, task_id: str, paths: Iterable[str], locked_at: Optional[str] = None) -> None:
+        """Add locks for all paths of a task"""
+        for path in paths:
+            self.add(task_id, path, locked_at)
+
+    def find_conflicts(
+        self,
+        paths: Iterable[str],
+        exclude_task_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find locks overlapping any of the given paths
+
+        Args:
+            paths: Requested file, directory or glob paths
+            exclude_task_id: Ignore locks owned by this task
+
+        Returns:
+            List of conflicting locks (each containing task_id, file_path, locked_at)
+        """
+        found: Dict[int, _LockEntry] = {}
+        for key in normalize_lock_paths(paths):
+            request = _LockEntry(key)
+            for entry in self._overlapping(request):
+                if entry.task_id != exclude_task_id:
+                    found[id(entry)] = entry
+        return [entry.to_dict() for entry in found.values()]
+
+    def blocking_tasks(
+        self,
+        paths: Iterable[str],
+        exclude_task_id: Optional[str] = None,
+    ) -> List[str]:
+        """Task IDs holding locks that overlap any of the given paths (sorted)"""
+        return sorted({c["task_id"] for c in self.find_conflicts(paths, exclude_task_id)})
+
+    def _overlapping(self, request: _LockEntry):
+        prefix = request.literal_prefix
+        node = self._root
+        # Locks on the chain root -> request prefix (ancestor dirs, globs, same path)
+        for depth in range(len(prefix) + 1):
+            for entry in node.entries:
+                if _entries_overlap(entry, request):
+                    yield entry
+            if depth == len(prefix):
+                break
+            node = node.children.get(prefix[depth])
+            if node is None:
+                return
+
+        # Locks below the request (only directories and globs reach there)
+        if not (request.is_dir or request.is_glob) or node.size == len(node.entries):
+            return
+        stack = list(node.children.values())
+        while stack:
+            child = stack.pop()
+            if child.size == 0:
+                continue
+            for entry in child.entries:
+                if _entries_overlap(entry, request):
+                    yield entry
+            stack.extend(child.children.values())
+
+
 class FileLockManager:
     """Manages file locks for parallel task execution"""
 
@@ -31,7 +339,7 @@ class FileLockManager:
         Args:
             project_id: Project ID
             task_id: Task ID that wants to acquire locks
-            file_paths: List of file paths to lock
+            file_paths: List of file, directory (trailing "/") or glob paths to lock
 
         Returns:
             True if all locks acquired successfully, False otherwise
@@ -39,27 +347,28 @@ class FileLockManager:
         Raises:
             FileLockError: If lock acquisition fails
         """
-        if not file_paths:
+        keys = normalize_lock_paths(file_paths)
+        if not keys:
             return True
 
         conn = get_connection()
         try:
             # Check for conflicts
-            conflicts = FileLockManager.check_conflicts(project_id, file_paths)
+            conflicts = FileLockManager.check_conflicts(project_id, keys)
             if conflicts:
                 # Locks are held by other tasks
                 return False
 
-            # Acquire all locks
+            # Acquire all locks (stored by normalized key)
             now = datetime.now().isoformat()
-            for file_path in file_paths:
+            for key in keys:
                 execute_query(
                     conn,
                     """
                     INSERT INTO file_locks (project_id, task_id, file_path, locked_at)
                     VALUES (?, ?, ?, ?)
                     """,
-                    (project_id, task_id, file_path, now)
+                    (project_id, task_id, key, now)
                 )
 
             conn.commit()
@@ -103,44 +412,38 @@ class FileLockManager:
         """
         Check if any of the specified files are locked by other tasks
 
+        Paths are normalized and matched through ``PathLockTrie``, so a
+        directory or glob lock conflicts with the files it covers.
+
         Args:
             project_id: Project ID
-            file_paths: List of file paths to check
+            file_paths: List of file, directory or glob paths to check
 
         Returns:
             List of conflicting locks (each containing task_id, file_path, locked_at)
         """
-        if not file_paths:
+        if not normalize_lock_paths(file_paths):
             return []
 
         conn = get_connection()
         try:
             # Auto-cleanup: remove stale locks from completed/done/rejected tasks
+            placeholders = ",".join(["?"] * len(STALE_LOCK_STATUSES))
             execute_query(
                 conn,
-                """
+                f"""
                 DELETE FROM file_locks
                 WHERE project_id = ? AND task_id IN (
                     SELECT t.id FROM tasks t
-                    WHERE t.status IN ('COMPLETED', 'DONE', 'REJECTED')
+                    WHERE t.status IN ({placeholders})
                     AND t.id IN (SELECT fl.task_id FROM file_locks fl WHERE fl.project_id = ?)
                 )
                 """,
-                (project_id, project_id)
+                (project_id, *STALE_LOCK_STATUSES, project_id)
             )
             conn.commit()
 
-            # Build query with multiple file paths
-            placeholders = ",".join(["?"] * len(file_paths))
-            query = f"""
-                SELECT task_id, file_path, locked_at
-                FROM file_locks
-                WHERE project_id = ? AND file_path IN ({placeholders})
-            """
-            params = [project_id] + file_paths
-
-            rows = fetch_all(conn, query, params)
-            return rows_to_dicts(rows)
+            return PathLockTrie.load(conn, project_id).find_conflicts(file_paths)
 
         finally:
             conn.close()
@@ -258,3 +561,91 @@ class FileLockManager:
 
         finally:
             conn.close()
+
+
+def benchmark(lock_count: int = 5000, query_count: int = 2000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Compare PathLockTrie against a linear scan over all locks
+
+    Locks are a mix of files, directories and globs spread over a synthetic
+    source tree, owned by ``lock_count // 4`` concurrent tasks.
+
+    Args:
+        lock_count: Number of locks in the index
+        query_count: Number of conflict checks (files, directories and globs)
+        seed: Random seed
+
+    Returns:
+        Dict with timings (ms), per-check averages (us) and conflict counts
+    """
+    rng = random.Random(seed)
+    dirs = [f"src/pkg{a}/mod{b}" for a in range(40) for b in range(25)]
+
+    def random_path() -> str:
+        roll = rng.random()
+        base = rng.choice(dirs)
+        if roll < 0.8:
+            return f"{base}/file{rng.randrange(50)}.py"
+        if roll < 0.95:
+            return f"./{base}/sub{rng.randrange(5)}/"
+        return f"{base}/sub{rng.randrange(5)}/*.ts"
+
+    tasks = max(1, lock_count // 4)
+    locks = [(f"TASK_{rng.randrange(tasks)}", random_path()) for _ in range(lock_count)]
+    queries = [random_path().replace("/", "\\") if rng.random() < 0.1 else random_path()
+               for _ in range(query_count)]
+
+    started = time.perf_counter()
+    index = PathLockTrie()
+    for task_id, path in locks:
+        index.add(task_id, path)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    trie_hits = [len(index.find_conflicts([q])) for q in queries]
+    trie_ms = (time.perf_counter() - started) * 1000
+
+    entries = [_LockEntry(normalize_lock_path(path), task_id) for task_id, path in locks]
+    started = time.perf_counter()
+    scan_hits = []
+    for q in queries:
+        request = _LockEntry(normalize_lock_path(q))
+        scan_hits.append(sum(1 for e in entries if _entries_overlap(e, request)))
+    scan_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "locks": lock_count,
+        "queries": query_count,
+        "build_ms": round(build_ms, 2),
+        "trie_ms": round(trie_ms, 2),
+        "scan_ms": round(scan_ms, 2),
+        "trie_us_per_check": round(trie_ms * 1000 / max(query_count, 1), 2),
+        "scan_us_per_check": round(scan_ms * 1000 / max(query_count, 1), 2),
+        "conflicting_queries": sum(1 for hits in trie_hits if hits),
+        "results_match": trie_hits == scan_hits,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="File lock index benchmark")
+    parser.add_argument("--benchmark", action="store_true", help="Run the lock index benchmark")
+    parser.add_argument("--locks", type=int, default=5000, help="Number of concurrent locks")
+    parser.add_argument("--queries", type=int, default=2000, help="Number of conflict checks")
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        return 0
+
+    result = benchmark(args.locks, args.queries)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        for key, value in result.items():
+            print(f"{key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - CLI起動時間監査スクリプト
+
+各CLIエントリポイントを `python -X importtime <script> --help` で起動し、
+起動時間（壁時計）とインポートコストの大きいモジュールを集計する。
+起動時間が予算を超えたエントリポイントがある場合は終了コード1を返す。
+
+Usage:
+    python backend/utils/import_audit.py [SCRIPT ...] [options]
+
+Options:
+    --top N         表示するモジュール数（デフォルト: 10）
+    --runs N        壁時計計測の試行回数（中央値を採用、デフォルト: 3）
+    --budget-ms MS  全エントリポイント共通の起動時間予算（ミリ秒）
+    --json          JSON形式で出力
+
+Example:
+    # 既定のエントリポイントを監査
+    python backend/utils/import_audit.py
+
+    # 特定スクリプトのみ、予算300msで監査
+    python backend/utils/import_audit.py worker/execute_task.py --budget-ms 300
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+
+# 監査対象のエントリポイント（backend/ からの相対パス） → 起動時間予算（ミリ秒）
+# 予算はインタプリタ起動を含む `--help` 実行全体の壁時計時間
+DEFAULT_ENTRY_POINTS: Dict[str, int] = {
+    "worker/execute_task.py": 1500,
+    "worker/parallel_launcher.py": 1500,
+    "task/update.py": 1000,
+    "order/list.py": 1000,
+    "review_worker.py": 1500,
+}
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    `-X importtime` の出力をパースする
+
+    Args:
+        stderr: `python -X importtime` の標準エラー出力
+
+    Returns:
+        [{"module", "self_us", "cumulative_us", "depth"}, ...]（出現順）
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        body = line[len("import time:"):]
+        parts = body.split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, name = parts
+        try:
+            self_val = int(self_us.strip())
+            cumulative_val = int(cumulative_us.strip())
+        except ValueError:
+            # ヘッダ行（"self [us] | cumulative | imported package"）
+            continue
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append({
+            "module": stripped.strip(),
+            "self_us": self_val,
+            "cumulative_us": cumulative_val,
+            "depth": max(depth, 0),
+        })
+    return entries
+
+
+def _run_entry(script: Path, extra_args: List[str], importtime: bool) -> subprocess.CompletedProcess:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += [str(script)] + extra_args
+    env = dict(os.environ)
+    # 既存の .pyc を使う通常の起動と同じ条件で計測する
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+        cwd=str(_package_root),
+    )
+
+
+def audit_entry_point(
+    script: str,
+    *,
+    runs: int = 3,
+    top: int = 10,
+    args: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    1つのエントリポイントの起動時間とインポート内訳を計測する
+
+    Args:
+        script: backend/ からの相対パス、または絶対パス
+        runs: 壁時計計測の試行回数（中央値を採用）
+        top: 結果に含める上位モジュール数
+        args: スクリプトに渡す引数（デフォルト: ["--help"]）
+
+    Returns:
+        {"script", "wall_ms", "returncode", "modules", "top_cumulative", "top_self"}
+    """
+    script_path = Path(script)
+    if not script_path.is_absolute():
+        script_path = _package_root / script_path
+    extra_args = args if args is not None else ["--help"]
+
+    # 1回目: importtime 付きで内訳を取得（.pyc の生成もここで済ませる）
+    proc = _run_entry(script_path, extra_args, importtime=True)
+    entries = parse_importtime(proc.stderr)
+
+    # 2回目以降: importtime のオーバーヘッドなしで壁時計を計測
+    samples = []
+    for _ in range(max(runs, 1)):
+        started = time.perf_counter()
+        _run_entry(script_path, extra_args, importtime=False)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    by_cumulative = sorted(entries, key=lambda e: e["cumulative_us"], reverse=True)
+    by_self = sorted(entries, key=lambda e: e["self_us"], reverse=True)
+
+    return {
+        "script": script,
+        "wall_ms": round(statistics.median(samples), 1),
+        "returncode": proc.returncode,
+        "modules": [e["module"] for e in entries],
+        "top_cumulative": by_cumulative[:top],
+        "top_self": by_self[:top],
+    }
+
+
+def run_audit(
+    entry_points: Dict[str, Optional[int]],
+    *,
+    runs: int = 3,
+    top: int = 10,
+) -> Dict[str, Any]:
+    """
+    複数エントリポイントを監査し、予算超過を判定する
+
+    Args:
+        entry_points: {スクリプト: 予算ミリ秒（Noneなら判定しない）}
+        runs: 壁時計計測の試行回数
+        top: 上位モジュール数
+
+    Returns:
+        {"results": [...], "over_budget": [スクリプト, ...]}
+    """
+    results = []
+    over_budget = []
+    for script, budget_ms in entry_points.items():
+        result = audit_entry_point(script, runs=runs, top=top)
+        result["budget_ms"] = budget_ms
+        result["within_budget"] = budget_ms is None or result["wall_ms"] <= budget_ms
+        if not result["within_budget"]:
+            over_budget.append(script)
+        results.append(result)
+    return {"results": results, "over_budget": over_budget}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """監査結果を人間向けテキストに整形"""
+    lines = []
+    for result in report["results"]:
+        budget = result["budget_ms"]
+        status = "OK" if result["within_budget"] else "OVER"
+        budget_label = f" / budget {budget}ms" if budget is not None else ""
+        lines.append(f"[{status}] {result['script']}: {result['wall_ms']:.1f}ms{budget_label}")
+        if result["returncode"] != 0:
+            lines.append(f"  (終了コード {result['returncode']})")
+        for entry in result["top_cumulative"]:
+            lines.append(
+                f"  {entry['cumulative_us'] / 1000:8.1f}ms cum  "
+                f"{entry['self_us'] / 1000:7.1f}ms self  {entry['module']}"
+            )
+        lines.append("")
+    if report["over_budget"]:
+        lines.append(f"予算超過: {', '.join(report['over_budget'])}")
+    else:
+        lines.append("全エントリポイントが予算内です")
+    return "\n".join(lines)
+
+
+def main():
+    """CLIエントリーポイント"""
+    try:
+        from config import setup_utf8_output
+        setup_utf8_output()
+    except ImportError:
+        pass
+
+    parser = argparse.ArgumentParser(
+        description="CLIエントリポイントの起動時間とインポートコストを監査",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("scripts", nargs="*", help="監査するスクリプト（backend/ からの相対パス）")
+    parser.add_argument("--top", type=int, default=10, help="表示するモジュール数（デフォルト: 10）")
+    parser.add_argument("--runs", type=int, default=3, help="壁時計計測の試行回数（デフォルト: 3）")
+    parser.add_argument("--budget-ms", type=int, help="起動時間予算（ミリ秒、全スクリプト共通）")
+    parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+
+    args = parser.parse_args()
+
+    if args.scripts:
+        entry_points = {
+            script: args.budget_ms if args.budget_ms is not None else DEFAULT_ENTRY_POINTS.get(script)
+            for script in args.scripts
+        }
+    else:
+        entry_points = {
+            script: args.budget_ms if args.budget_ms is not None else budget
+            for script, budget in DEFAULT_ENTRY_POINTS.items()
+        }
+
+    report = run_audit(entry_points, runs=args.runs, top=args.top)
+
+    if args.json:
+        for result in report["results"]:
+            result.pop("modules", None)
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(report))
+
+    sys.exit(1 if report["over_budget"] else 0)
+
+
+if __name__ == "__main__":
+    main()
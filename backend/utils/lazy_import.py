@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - パッケージ公開名の遅延インポート
+
+パッケージ __init__ の公開名を、属性アクセス時に定義元サブモジュールから
+インポートする（PEP 562 のモジュール __getattr__）。
+`from task.update import update_task` のようにサブモジュールだけを使う
+CLI エントリポイントが、パッケージ初期化で他のサブモジュールの依存まで
+読み込まないようにするため（起動時間は utils/import_audit.py で監査する）。
+
+Usage:
+    # task/__init__.py
+    from utils.lazy_import import lazy_exports
+
+    _LAZY_EXPORTS = {"create_task": ".create", "update_task": ".update"}
+    __all__ = list(_LAZY_EXPORTS)
+    __getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    パッケージ用のモジュール __getattr__ を作る
+
+    Args:
+        package: パッケージ名（__init__ の __name__）
+        exports: 公開名 → 定義元サブモジュール（相対名、例: ".create"）
+
+    Returns:
+        __getattr__ として代入する関数。一度解決した名前はパッケージ属性に
+        キャッシュするため、以降は __getattr__ を経由しない
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
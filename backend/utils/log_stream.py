@@ -5,24 +5,103 @@ AI PM Framework - ログストリーミング読み取りスクリプト
 指定されたログファイルをtail -f風にリアルタイム読み取り。
 ファイルの追記を監視し、新しい行を逐次出力する。
 
+- 初期表示は末尾から逆方向にブロック単位で読み、ファイル全体は読まない
+- 追記の監視は Linux では inotify、その他の環境ではポーリングで行う
+- ログローテーション（ファイル置き換え）と切り詰め（truncate）に追従する
+- --project/--order 指定時は ORDER の全Workerログを1プロセスで監視し、
+  各行の先頭にタスクIDを付与する
+
 Usage:
     python backend/utils/log_stream.py LOG_FILE_PATH [options]
+    python backend/utils/log_stream.py --project PROJECT_ID --order ORDER_ID [options]
 
 Options:
     --lines N       初期表示行数（デフォルト: 10）
-    --follow        ファイル終端後も監視を続ける（デフォルト: True）
+    --no-follow     ファイル終端後に監視を終了
     --interval SEC  ポーリング間隔秒数（デフォルト: 0.1）
 
 Example:
     python backend/utils/log_stream.py logs/worker_TASK_001.log
     python backend/utils/log_stream.py logs/worker_TASK_001.log --lines 20
+    python backend/utils/log_stream.py --project AI_PM_PJ --order ORDER_001
 """
 
 import argparse
+import os
+import re
+import select
 import sys
 import time
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import Dict, List, Optional, TextIO
+
+# 逆方向読み取りのブロックサイズ
+TAIL_BLOCK_SIZE = 8192
+
+# inotify使用時も、この間隔で最低1回はファイル状態を再確認する
+WATCH_FALLBACK_TIMEOUT = 1.0
+
+# ParallelWorkerLauncher が出力するログファイル名
+#   worker_{task_id}_{YYYYMMDD_HHMMSS}.log / {task_id}_review.log
+WORKER_LOG_PATTERN = re.compile(r"^worker_(?P<task_id>.+)_\d{8}_\d{6}\.log$")
+REVIEW_LOG_PATTERN = re.compile(r"^(?P<task_id>.+)_review\.log$")
+
+
+def _read_tail_from(f, end: int, num_lines: int) -> List[bytes]:
+    """
+    バイナリファイルの end 位置から逆方向にブロック読みし、末尾N行を返す
+
+    Args:
+        f: バイナリモードで開いたファイル
+        end: 読み取り終端のオフセット
+        num_lines: 取得行数
+
+    Returns:
+        改行を除いた行（bytes）のリスト
+    """
+    if num_lines <= 0 or end <= 0:
+        return []
+
+    chunks: List[bytes] = []
+    newlines = 0
+    pos = end
+    # 終端が改行の場合、その改行は最終行の終わりなので数えない
+    f.seek(end - 1)
+    trailing_newline = f.read(1) == b"\n"
+    needed = num_lines + (1 if trailing_newline else 0)
+
+    while pos > 0 and newlines < needed:
+        read_size = min(TAIL_BLOCK_SIZE, pos)
+        pos -= read_size
+        f.seek(pos)
+        chunk = f.read(read_size)
+        chunks.append(chunk)
+        newlines += chunk.count(b"\n")
+
+    data = b"".join(reversed(chunks))
+    if trailing_newline:
+        data = data[:-1]
+    lines = data.split(b"\n")
+    return [line.rstrip(b"\r") for line in lines[-num_lines:]]
+
+
+def read_tail_lines(file_path: Path, num_lines: int = 10) -> List[str]:
+    """
+    ファイルの末尾N行を取得（ファイル全体は読み込まない）
+
+    Args:
+        file_path: ログファイルパス
+        num_lines: 取得行数
+
+    Returns:
+        末尾N行のリスト（改行なし）
+    """
+    with open(file_path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        return [
+            line.decode("utf-8", errors="replace")
+            for line in _read_tail_from(f, end, num_lines)
+        ]
 
 
 def tail_initial_lines(file_path: Path, num_lines: int = 10) -> None:
@@ -37,23 +116,209 @@ def tail_initial_lines(file_path: Path, num_lines: int = 10) -> None:
         return
 
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            # すべての行を読み込んで末尾N行を取得
-            lines = f.readlines()
-            tail_lines = lines[-num_lines:] if len(lines) > num_lines else lines
-
-            for line in tail_lines:
-                print(line, end='')
+        for line in read_tail_lines(file_path, num_lines):
+            print(line)
     except Exception as e:
         print(f"警告: 初期行読み取りエラー: {e}", file=sys.stderr)
 
 
+# ============================================================================
+# 変更監視
+# ============================================================================
+
+class _PollingWatcher:
+    """一定間隔で起床するだけのフォールバック監視"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+
+    def add_directory(self, directory: Path) -> None:
+        pass
+
+    def wait(self) -> None:
+        time.sleep(self.interval)
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWatcher:
+    """
+    inotify（ctypes経由）によるディレクトリ監視
+
+    ファイル単体ではなく親ディレクトリを監視することで、追記・作成・
+    リネーム（ローテーション）をまとめて検知する。
+    """
+
+    _IN_MODIFY = 0x00000002
+    _IN_ATTRIB = 0x00000004
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_MOVED_FROM | _IN_MOVED_TO
+             | _IN_CREATE | _IN_DELETE)
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._watched: set = set()
+
+    def add_directory(self, directory: Path) -> None:
+        key = str(directory)
+        if key in self._watched:
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(key), self._MASK)
+        if wd >= 0:
+            self._watched.add(key)
+
+    def wait(self) -> None:
+        ready, _, _ = select.select([self._fd], [], [], WATCH_FALLBACK_TIMEOUT)
+        if not ready:
+            return
+        # イベント内容は使わない（発生したことだけ分かればよい）
+        try:
+            while os.read(self._fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _create_watcher(interval: float):
+    """利用可能なら inotify、不可ならポーリングの監視オブジェクトを返す"""
+    if sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher()
+        except (OSError, AttributeError):
+            pass
+    return _PollingWatcher(interval)
+
+
+# ============================================================================
+# ファイル追従
+# ============================================================================
+
+class _FollowedFile:
+    """
+    追記監視中の1ファイル
+
+    inode の変化（ローテーション）とサイズ縮小（切り詰め）を検知して
+    再オープン・先頭からの再読み込みを行う。行の途中までしか書かれて
+    いないデータは次の読み取りまでバッファに保持する。
+    """
+
+    def __init__(self, path: Path, label: Optional[str] = None):
+        self.path = path
+        self.label = label
+        self._fh = None
+        self._ident = None
+        self._pending = b""
+
+    def open(self, initial_lines: int, from_start: bool = False) -> List[str]:
+        """
+        ファイルを開き、現在の終端から末尾N行を返す（以降は終端から追従）
+
+        from_start=True の場合は何も返さず、先頭から追従する。
+        """
+        self._fh = open(self.path, "rb")
+        st = os.fstat(self._fh.fileno())
+        self._ident = (st.st_dev, st.st_ino)
+        if from_start:
+            return []
+        end = self._fh.seek(0, os.SEEK_END)
+        lines = _read_tail_from(self._fh, end, initial_lines)
+        self._fh.seek(end)
+        return [line.decode("utf-8", errors="replace") for line in lines]
+
+    def read_new_lines(self) -> List[str]:
+        """前回以降に追記された完全な行を返す"""
+        if self._fh is None:
+            # ローテーション後に新ファイルが未作成だった場合は再オープンを試みる
+            return self._drain() if self._reopen() else []
+
+        lines = self._drain()
+
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return lines  # 削除・ローテーション途中: 旧ハンドルの内容のみ
+
+        if (st.st_dev, st.st_ino) != self._ident:
+            # ローテーション: 旧ファイルを読み切ってから新ファイルを先頭から
+            lines.extend(self._flush_pending())
+            self._fh.close()
+            self._fh = None
+            if self._reopen():
+                lines.extend(self._drain())
+        elif st.st_size < self._fh.tell():
+            # 切り詰め: 先頭から読み直す
+            self._pending = b""
+            self._fh.seek(0)
+            lines.extend(self._drain())
+
+        return lines
+
+    def _reopen(self) -> bool:
+        try:
+            self._fh = open(self.path, "rb")
+        except OSError:
+            return False
+        st = os.fstat(self._fh.fileno())
+        self._ident = (st.st_dev, st.st_ino)
+        return True
+
+    def _drain(self) -> List[str]:
+        data = self._fh.read()
+        if not data:
+            return []
+        data = self._pending + data
+        parts = data.split(b"\n")
+        self._pending = parts.pop()
+        return [p.rstrip(b"\r").decode("utf-8", errors="replace") for p in parts]
+
+    def _flush_pending(self) -> List[str]:
+        if not self._pending:
+            return []
+        line = self._pending.decode("utf-8", errors="replace")
+        self._pending = b""
+        return [line]
+
+    def close(self) -> List[str]:
+        """ファイルを閉じ、改行で終わっていない残りデータを返す"""
+        remaining = self._flush_pending()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        return remaining
+
+    def format(self, line: str) -> str:
+        return f"[{self.label}] {line}" if self.label else line
+
+
+def _emit(followed: _FollowedFile, lines: List[str], out: TextIO) -> None:
+    if not lines:
+        return
+    for line in lines:
+        out.write(followed.format(line) + "\n")
+    out.flush()
+
+
 def stream_log_file(
     file_path: Path,
     *,
     initial_lines: int = 10,
     follow: bool = True,
     interval: float = 0.1,
+    out: Optional[TextIO] = None,
 ) -> None:
     """
     ログファイルをtail -f風にストリーミング表示
@@ -62,54 +327,148 @@ def stream_log_file(
         file_path: ログファイルパス
         initial_lines: 初期表示行数
         follow: ファイル終端後も監視を続けるか
-        interval: ポーリング間隔（秒）
+        interval: ポーリング間隔（秒、inotify非対応環境のみ使用）
+        out: 出力先（デフォルト: 標準出力）
 
     Note:
         - ファイルが存在しない場合は作成を待つ
+        - ローテーション・切り詰めに追従する
         - Ctrl+Cで終了
     """
     file_path = Path(file_path)
+    out = out or sys.stdout
+    watcher = _create_watcher(interval)
+    followed = None
 
-    # ファイルが存在しない場合は待機
-    if not file_path.exists():
-        print(f"ログファイルを待機中: {file_path}", file=sys.stderr)
-        while not file_path.exists():
-            time.sleep(interval)
-        print(f"ログファイル検出: {file_path}", file=sys.stderr)
+    try:
+        watcher.add_directory(file_path.parent)
 
-    # 初期行を表示
-    if initial_lines > 0:
-        tail_initial_lines(file_path, initial_lines)
+        # ファイルが存在しない場合は待機
+        if not file_path.exists():
+            print(f"ログファイルを待機中: {file_path}", file=sys.stderr)
+            while not file_path.exists():
+                watcher.wait()
+            print(f"ログファイル検出: {file_path}", file=sys.stderr)
 
-    # ストリーミング開始
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            # ファイル終端まで移動
-            if initial_lines > 0:
-                f.seek(0, 2)  # ファイル終端へ
-
-            while True:
-                # 新しい行を読み取り
-                line = f.readline()
-
-                if line:
-                    # 新しい行があれば出力
-                    print(line, end='')
-                    sys.stdout.flush()
-                else:
-                    # 新しい行がない場合
-                    if not follow:
-                        # followモードでなければ終了
-                        break
-
-                    # 少し待機してからリトライ
-                    time.sleep(interval)
+        followed = _FollowedFile(file_path)
+        # 初期行を表示（initial_lines=0 の場合は先頭から全体を出力）
+        _emit(followed, followed.open(initial_lines, from_start=initial_lines <= 0), out)
+        _emit(followed, followed.read_new_lines(), out)
+
+        while follow:
+            watcher.wait()
+            _emit(followed, followed.read_new_lines(), out)
+
+        _emit(followed, followed.close(), out)
 
     except KeyboardInterrupt:
         print("\n\nストリーミング終了", file=sys.stderr)
     except Exception as e:
         print(f"\nエラー: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if followed is not None:
+            followed.close()
+        watcher.close()
+
+
+def _task_label_for_log(file_name: str) -> Optional[str]:
+    """Workerログファイル名から表示用ラベル（タスクID）を取得"""
+    match = WORKER_LOG_PATTERN.match(file_name)
+    if match:
+        return match.group("task_id")
+    match = REVIEW_LOG_PATTERN.match(file_name)
+    if match:
+        return f"{match.group('task_id')}:review"
+    return None
+
+
+def _scan_worker_logs(log_dir: Path) -> Dict[str, str]:
+    """LOGSディレクトリ内のWorkerログを {パス: ラベル} で返す"""
+    found = {}
+    try:
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                label = _task_label_for_log(entry.name)
+                if label and entry.is_file():
+                    found[entry.path] = label
+    except OSError:
+        pass
+    return found
+
+
+def stream_order_logs(
+    log_dir: Path,
+    *,
+    initial_lines: int = 10,
+    follow: bool = True,
+    interval: float = 0.1,
+    out: Optional[TextIO] = None,
+) -> None:
+    """
+    ORDERの全Workerログを1プロセスで多重監視
+
+    LOGSディレクトリの worker_*.log / *_review.log を追従し、
+    各行に "[TASK_ID] " を付与して出力する。監視中に新しく作成された
+    ログも自動的に追加する。
+
+    Args:
+        log_dir: PROJECTS/{project_id}/RESULT/{order_id}/LOGS
+        initial_lines: 各ログの初期表示行数
+        follow: 監視を続けるか（False の場合は現時点の内容のみ出力）
+        interval: ポーリング間隔（秒、inotify非対応環境のみ使用）
+        out: 出力先（デフォルト: 標準出力）
+    """
+    log_dir = Path(log_dir)
+    out = out or sys.stdout
+    watcher = _create_watcher(interval)
+    followed: Dict[str, _FollowedFile] = {}
+
+    def _discover(tail: int, from_start: bool) -> None:
+        new_paths = [p for p in _scan_worker_logs(log_dir).items() if p[0] not in followed]
+        new_paths.sort(key=lambda item: _safe_mtime(item[0]))
+        for path, label in new_paths:
+            entry = _FollowedFile(Path(path), label)
+            try:
+                lines = entry.open(tail, from_start=from_start)
+            except OSError:
+                continue
+            followed[path] = entry
+            _emit(entry, lines, out)
+            _emit(entry, entry.read_new_lines(), out)
+
+    try:
+        if not log_dir.exists():
+            print(f"ログディレクトリを待機中: {log_dir}", file=sys.stderr)
+            watcher.add_directory(log_dir.parent)
+            while not log_dir.exists():
+                if not follow:
+                    return
+                watcher.wait()
+        watcher.add_directory(log_dir)
+
+        _discover(initial_lines, from_start=False)
+
+        while follow:
+            watcher.wait()
+            for entry in followed.values():
+                _emit(entry, entry.read_new_lines(), out)
+            # 監視開始後に作成されたログは先頭から出力
+            _discover(0, from_start=True)
+
+    except KeyboardInterrupt:
+        print("\n\nストリーミング終了", file=sys.stderr)
+    finally:
+        for entry in followed.values():
+            _emit(entry, entry.close(), out)
+        watcher.close()
+
+
+def _safe_mtime(path: str) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
 
 
 def main():
@@ -131,8 +490,17 @@ def main():
     parser.add_argument(
         "log_file",
         type=Path,
+        nargs="?",
         help="ログファイルパス"
     )
+    parser.add_argument(
+        "--project",
+        help="プロジェクトID（--order と併用し、ORDERの全Workerログを監視）"
+    )
+    parser.add_argument(
+        "--order",
+        help="ORDER ID（--project と併用）"
+    )
     parser.add_argument(
         "--lines",
         type=int,
@@ -155,13 +523,29 @@ def main():
 
     args = parser.parse_args()
 
+    if args.order or args.project:
+        if not (args.order and args.project):
+            parser.error("--project と --order は併用してください")
+    elif args.log_file is None:
+        parser.error("LOG_FILE_PATH または --project/--order を指定してください")
+
     try:
-        stream_log_file(
-            args.log_file,
-            initial_lines=args.lines,
-            follow=args.follow,
-            interval=args.interval,
-        )
+        if args.order:
+            from config import get_project_paths
+            log_dir = get_project_paths(args.project)["result"] / args.order / "LOGS"
+            stream_order_logs(
+                log_dir,
+                initial_lines=args.lines,
+                follow=args.follow,
+                interval=args.interval,
+            )
+        else:
+            stream_log_file(
+                args.log_file,
+                initial_lines=args.lines,
+                follow=args.follow,
+                interval=args.interval,
+            )
     except Exception as e:
         print(f"予期しないエラー: {e}", file=sys.stderr)
         sys.exit(1)
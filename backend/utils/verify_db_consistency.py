@@ -14,6 +14,9 @@ Options:
     --fix           検出した問題を自動修正（実装予定）
     --project ID    特定プロジェクトのみチェック
     --task TASK_ID  特定タスクのみチェック（--projectと併用）
+    --since CURSOR  差分検証: CURSOR（日時）以降に変更されたエンティティのみチェック
+                    （結果の next_cursor を次回の --since に渡す）
+    --workers N     並列実行するチェック数（デフォルト: 4、1で逐次実行）
 
 Example:
     # 全プロジェクトをチェック
@@ -31,6 +34,9 @@ Example:
     # JSON出力（プログラムから利用）
     python backend/utils/verify_db_consistency.py --project ai_pm_manager --json
 
+    # 差分検証（前回の next_cursor 以降の変更のみ）
+    python backend/utils/verify_db_consistency.py --since 2026-10-18T09:00:00
+
 検証項目:
 1. 外部キー整合性
    - 存在しないプロジェクトIDを参照しているORDER/TASK/BACKLOGがないか
@@ -56,14 +62,23 @@ Example:
 6. アーティファクトファイル整合性
    - 完了済みタスク(DONE/COMPLETED)の06_ARTIFACTSディレクトリが存在するか
    - 完了済みタスクのREPORTファイル(05_REPORT/REPORT_{task_number}.md)が存在するか
+
+実行方式:
+   - SQLチェックは集合単位のアンチジョイン（NOT EXISTS）で、問題の行だけを取得する
+   - アーティファクトチェックはORDERディレクトリごとに1回だけ走査し、
+     FileStatCache で同じORDERのタスク間で結果を共有する
+   - 独立したチェックはスレッドプールで並列実行する（チェックごとに別接続）
 """
 
 import argparse
 import json
+import os
 import sys
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, FrozenSet, Iterable, Tuple
 
 # パス設定
 _current_dir = Path(__file__).resolve().parent
@@ -104,12 +119,101 @@ class ConsistencyIssue:
         }
 
 
+# 並列実行するチェック数のデフォルト
+DEFAULT_CHECK_WORKERS = 4
+
+
+class FileStatCache:
+    """
+    ディレクトリ一覧のキャッシュ（スレッドセーフ）
+
+    同じディレクトリの exists() / glob("*") をタスクごとに繰り返さないよう、
+    1ディレクトリにつき scandir を1回だけ行い、エントリ名の集合を共有する。
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._lock = threading.Lock()
+        self.scans = 0
+
+    def entries(self, path: Path) -> Optional[FrozenSet[str]]:
+        """
+        ディレクトリ内のエントリ名
+
+        Returns:
+            エントリ名の集合（ディレクトリが存在しない場合None）
+        """
+        key = str(path)
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+        try:
+            with os.scandir(path) as it:
+                names: Optional[FrozenSet[str]] = frozenset(entry.name for entry in it)
+        except (FileNotFoundError, NotADirectoryError):
+            names = None
+        except OSError:
+            names = None
+        with self._lock:
+            self.scans += 1
+            return self._entries.setdefault(key, names)
+
+    def exists(self, path: Path) -> bool:
+        """パスが存在するか（親ディレクトリの一覧で判定）"""
+        parent = self.entries(path.parent)
+        return parent is not None and path.name in parent
+
+    def is_empty(self, path: Path) -> bool:
+        """ディレクトリにエントリがないか（Path.glob("*") が空かと同じ）"""
+        return not self.entries(path)
+
+    def prefetch(self, paths: Iterable[Path], max_workers: int = DEFAULT_CHECK_WORKERS) -> None:
+        """複数ディレクトリを並列に走査してキャッシュする"""
+        paths = list(paths)
+        if max_workers <= 1 or len(paths) <= 1:
+            for path in paths:
+                self.entries(path)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(self.entries, paths))
+
+
 class DBConsistencyChecker:
-    """DB整合性チェッカー"""
+    """
+    DB整合性チェッカー
 
-    def __init__(self, project_id: Optional[str] = None, verbose: bool = False):
+    Args:
+        project_id: 特定プロジェクトのみチェック
+        verbose: 詳細表示
+        since: 差分検証のカーソル（この日時以降に変更されたエンティティのみ）
+        max_workers: 並列実行するチェック数（1で逐次実行）
+    """
+
+    # check_all で実行するチェック（互いに独立）
+    CHECKS = (
+        "_check_foreign_keys",
+        "_check_status_validity",
+        "_check_status_transitions",
+        "_check_composite_keys",
+        "_check_task_dependencies",
+        "_check_backlog",
+        "_check_artifact_files",
+    )
+
+    def __init__(
+        self,
+        project_id: Optional[str] = None,
+        verbose: bool = False,
+        *,
+        since: Optional[str] = None,
+        max_workers: int = DEFAULT_CHECK_WORKERS,
+        stat_cache: Optional[FileStatCache] = None,
+    ):
         self.project_id = project_id
         self.verbose = verbose
+        self.since = since
+        self.max_workers = max_workers
+        self.stat_cache = stat_cache or FileStatCache()
         self.issues: List[ConsistencyIssue] = []
         self.stats = {
             "total_checks": 0,
@@ -117,6 +221,7 @@ class DBConsistencyChecker:
             "warnings": 0,
             "info": 0,
         }
+        self._next_cursor: Optional[str] = None
 
     def add_issue(self, issue: ConsistencyIssue) -> None:
         """問題を記録"""
@@ -129,34 +234,79 @@ class DBConsistencyChecker:
             self.stats["info"] += 1
 
     def check_all(self) -> Dict[str, Any]:
-        """全チェックを実行"""
+        """
+        全チェックを実行
+
+        チェックごとに接続と問題リストを分けてスレッドプールで実行し、
+        結果は CHECKS の順に統合する（並列度によらず出力は同じ）。
+        """
+        # 次回の差分検証カーソル（チェック開始時点）。updated_at 等はローカル時刻の
+        # ISO 形式と CURRENT_TIMESTAMP（UTC、秒単位）が混在するため、早い方を秒に
+        # 切り捨てて採る（取りこぼすより再検証する側に倒す）
+        now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._next_cursor = min(datetime.now(), now_utc).replace(microsecond=0).isoformat()
+
+        if self.max_workers <= 1:
+            results = [self._run_check(name) for name in self.CHECKS]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.CHECKS))) as pool:
+                results = list(pool.map(self._run_check, self.CHECKS))
+
+        for total_checks, issues in results:
+            self.stats["total_checks"] += total_checks
+            for issue in issues:
+                self.add_issue(issue)
+
+        return self._build_result()
+
+    def _run_check(self, name: str) -> Tuple[int, List[ConsistencyIssue]]:
+        """1つのチェックを専用の接続・問題リストで実行"""
+        worker = DBConsistencyChecker(
+            self.project_id,
+            self.verbose,
+            since=self.since,
+            max_workers=self.max_workers,
+            stat_cache=self.stat_cache,
+        )
         conn = get_connection()
         try:
-            self._check_foreign_keys(conn)
-            self._check_status_validity(conn)
-            self._check_status_transitions(conn)
-            self._check_composite_keys(conn)
-            self._check_task_dependencies(conn)
-            self._check_backlog(conn)
-            self._check_artifact_files(conn)
-
-            return self._build_result()
+            getattr(worker, name)(conn)
         finally:
             conn.close()
+        return worker.stats["total_checks"], worker.issues
+
+    def _scope(self, alias: str, column: str = "updated_at") -> Tuple[str, tuple]:
+        """
+        プロジェクト・差分カーソルの絞り込み条件
+
+        Returns:
+            (" AND ..." 形式の条件, パラメータ)
+        """
+        clauses = []
+        params: List[Any] = []
+        if self.project_id:
+            clauses.append(f"{alias}.project_id = ?")
+            params.append(self.project_id)
+        if self.since:
+            # CURRENT_TIMESTAMP 形式と ISO 形式が混在するため julianday で比較
+            clauses.append(f"julianday({alias}.{column}) >= julianday(?)")
+            params.append(self.since)
+        return "".join(f" AND {c}" for c in clauses), tuple(params)
 
     def _check_foreign_keys(self, conn) -> None:
         """外部キー整合性チェック"""
         self.stats["total_checks"] += 1
 
         # ORDERの project_id 参照チェック
+        scope, params = self._scope("o")
         orphan_orders = fetch_all(
             conn,
-            """
+            f"""
             SELECT o.id, o.project_id
             FROM orders o
-            LEFT JOIN projects p ON o.project_id = p.id
-            WHERE p.id IS NULL
-            """
+            WHERE NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = o.project_id){scope}
+            """,
+            params,
         )
 
         for row in orphan_orders:
@@ -168,14 +318,15 @@ class DBConsistencyChecker:
             ))
 
         # TASKの project_id / order_id 参照チェック
+        scope, params = self._scope("t")
         orphan_tasks_project = fetch_all(
             conn,
-            """
+            f"""
             SELECT t.id, t.project_id
             FROM tasks t
-            LEFT JOIN projects p ON t.project_id = p.id
-            WHERE p.id IS NULL
-            """
+            WHERE NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = t.project_id){scope}
+            """,
+            params,
         )
 
         for row in orphan_tasks_project:
@@ -188,12 +339,14 @@ class DBConsistencyChecker:
 
         orphan_tasks_order = fetch_all(
             conn,
-            """
+            f"""
             SELECT t.id, t.order_id, t.project_id
             FROM tasks t
-            LEFT JOIN orders o ON t.order_id = o.id AND t.project_id = o.project_id
-            WHERE o.id IS NULL
-            """
+            WHERE NOT EXISTS (
+                SELECT 1 FROM orders o WHERE o.id = t.order_id AND o.project_id = t.project_id
+            ){scope}
+            """,
+            params,
         )
 
         for row in orphan_tasks_order:
@@ -209,14 +362,17 @@ class DBConsistencyChecker:
             ))
 
         # タスク依存関係の参照チェック
+        scope, params = self._scope("td", "created_at")
         orphan_deps = fetch_all(
             conn,
-            """
+            f"""
             SELECT td.task_id, td.depends_on_task_id, td.project_id
             FROM task_dependencies td
-            LEFT JOIN tasks t ON td.depends_on_task_id = t.id AND td.project_id = t.project_id
-            WHERE t.id IS NULL
-            """
+            WHERE NOT EXISTS (
+                SELECT 1 FROM tasks t WHERE t.id = td.depends_on_task_id AND t.project_id = td.project_id
+            ){scope}
+            """,
+            params,
         )
 
         for row in orphan_deps:
@@ -232,14 +388,15 @@ class DBConsistencyChecker:
             ))
 
         # BACKLOGの project_id 参照チェック
+        scope, params = self._scope("b")
         orphan_backlogs = fetch_all(
             conn,
-            """
+            f"""
             SELECT b.id, b.project_id
             FROM backlog_items b
-            LEFT JOIN projects p ON b.project_id = p.id
-            WHERE p.id IS NULL
-            """
+            WHERE NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = b.project_id){scope}
+            """,
+            params,
         )
 
         for row in orphan_backlogs:
@@ -254,204 +411,151 @@ class DBConsistencyChecker:
         """ステータス値の有効性チェック"""
         self.stats["total_checks"] += 1
 
-        # ORDERステータスチェック
-        invalid_order_statuses = fetch_all(
-            conn,
-            f"""
-            SELECT id, project_id, status
-            FROM orders
-            WHERE status NOT IN ({','.join(['?' for _ in VALID_STATUSES['order']])})
-            """,
-            tuple(VALID_STATUSES['order'])
-        )
+        for entity, table, label, id_key in (
+            ("order", "orders", "ORDER", "order_id"),
+            ("task", "tasks", "TASK", "task_id"),
+            ("backlog", "backlog_items", "BACKLOG", "backlog_id"),
+        ):
+            valid = VALID_STATUSES[entity]
+            scope, params = self._scope("e")
+            invalid_statuses = fetch_all(
+                conn,
+                f"""
+                SELECT e.id, e.project_id, e.status
+                FROM {table} e
+                WHERE e.status NOT IN ({','.join(['?' for _ in valid])}){scope}
+                """,
+                tuple(valid) + params,
+            )
 
-        for row in invalid_order_statuses:
-            self.add_issue(ConsistencyIssue(
-                category="STATUS",
-                severity="ERROR",
-                message=f"ORDER {row['id']} が無効なステータス '{row['status']}' を持つ",
-                details={
-                    "order_id": row['id'],
-                    "project_id": row['project_id'],
-                    "status": row['status'],
-                    "valid_statuses": VALID_STATUSES['order']
-                }
-            ))
+            for row in invalid_statuses:
+                self.add_issue(ConsistencyIssue(
+                    category="STATUS",
+                    severity="ERROR",
+                    message=f"{label} {row['id']} が無効なステータス '{row['status']}' を持つ",
+                    details={
+                        id_key: row['id'],
+                        "project_id": row['project_id'],
+                        "status": row['status'],
+                        "valid_statuses": valid
+                    }
+                ))
 
-        # TASKステータスチェック
-        invalid_task_statuses = fetch_all(
-            conn,
-            f"""
-            SELECT id, project_id, status
-            FROM tasks
-            WHERE status NOT IN ({','.join(['?' for _ in VALID_STATUSES['task']])})
-            """,
-            tuple(VALID_STATUSES['task'])
-        )
+    def _check_status_transitions(self, conn) -> None:
+        """
+        状態遷移履歴の整合性チェック
 
-        for row in invalid_task_statuses:
-            self.add_issue(ConsistencyIssue(
-                category="STATUS",
-                severity="ERROR",
-                message=f"TASK {row['id']} が無効なステータス '{row['status']}' を持つ",
-                details={
-                    "task_id": row['id'],
-                    "project_id": row['project_id'],
-                    "status": row['status'],
-                    "valid_statuses": VALID_STATUSES['task']
-                }
-            ))
+        status_transitions（有効なルール）に対するアンチジョインで、
+        ルールにない遷移だけを取得する。初期状態（old_value が NULL / 'None'）は
+        from_status IS NULL のルールと照合する。
+        """
+        self.stats["total_checks"] += 1
 
-        # BACKLOGステータスチェック
-        invalid_backlog_statuses = fetch_all(
+        scope, params = self._scope("ch", "changed_at")
+        invalid_changes = fetch_all(
             conn,
             f"""
-            SELECT id, project_id, status
-            FROM backlog_items
-            WHERE status NOT IN ({','.join(['?' for _ in VALID_STATUSES['backlog']])})
+            SELECT ch.entity_type, ch.entity_id, NULLIF(ch.old_value, 'None') AS from_status,
+                   ch.new_value AS to_status, ch.changed_at
+            FROM change_history ch
+            WHERE ch.field_name = 'status'
+            AND NOT EXISTS (
+                SELECT 1 FROM status_transitions st
+                WHERE st.is_active = 1
+                AND st.entity_type = ch.entity_type
+                AND st.from_status IS NULLIF(ch.old_value, 'None')
+                AND st.to_status = ch.new_value
+            ){scope}
+            ORDER BY ch.entity_type, ch.entity_id, ch.changed_at
             """,
-            tuple(VALID_STATUSES['backlog'])
+            params,
         )
 
-        for row in invalid_backlog_statuses:
+        for change in invalid_changes:
+            entity_type = change['entity_type']
+            from_status = change['from_status']
+            to_status = change['to_status']
             self.add_issue(ConsistencyIssue(
                 category="STATUS",
-                severity="ERROR",
-                message=f"BACKLOG {row['id']} が無効なステータス '{row['status']}' を持つ",
+                severity="WARNING",
+                message=f"{entity_type} {change['entity_id']} に不正な状態遷移履歴: {from_status} → {to_status}",
                 details={
-                    "backlog_id": row['id'],
-                    "project_id": row['project_id'],
-                    "status": row['status'],
-                    "valid_statuses": VALID_STATUSES['backlog']
+                    "entity_type": entity_type,
+                    "entity_id": change['entity_id'],
+                    "from_status": from_status,
+                    "to_status": to_status,
+                    "changed_at": change['changed_at']
                 }
             ))
 
-    def _check_status_transitions(self, conn) -> None:
-        """状態遷移履歴の整合性チェック"""
-        self.stats["total_checks"] += 1
-
-        # change_history から status 変更履歴を取得
-        status_changes = fetch_all(
-            conn,
-            """
-            SELECT entity_type, entity_id, old_value, new_value, changed_at
-            FROM change_history
-            WHERE field_name = 'status'
-            ORDER BY entity_type, entity_id, changed_at
-            """
-        )
-
-        # 遷移ルールを事前に取得
-        transitions = fetch_all(
-            conn,
-            """
-            SELECT entity_type, from_status, to_status, is_active
-            FROM status_transitions
-            WHERE is_active = 1
-            """
-        )
-
-        # 遷移ルールをマップ化
-        transition_map = {}
-        for t in transitions:
-            key = (t['entity_type'], t['from_status'], t['to_status'])
-            transition_map[key] = True
-
-        # 各遷移が有効かチェック
-        for change in status_changes:
-            entity_type = change['entity_type']
-            from_status = change['old_value']
-            to_status = change['new_value']
-
-            # 初期状態からの遷移は from_status = None
-            if from_status == 'None' or from_status is None:
-                from_status = None
-
-            key = (entity_type, from_status, to_status)
-
-            if key not in transition_map:
-                self.add_issue(ConsistencyIssue(
-                    category="STATUS",
-                    severity="WARNING",
-                    message=f"{entity_type} {change['entity_id']} に不正な状態遷移履歴: {from_status} → {to_status}",
-                    details={
-                        "entity_type": entity_type,
-                        "entity_id": change['entity_id'],
-                        "from_status": from_status,
-                        "to_status": to_status,
-                        "changed_at": change['changed_at']
-                    }
-                ))
-
     def _check_composite_keys(self, conn) -> None:
         """複合キー整合性チェック"""
         self.stats["total_checks"] += 1
 
-        # ORDERの複合キー重複チェック
-        duplicate_orders = fetch_all(
-            conn,
-            """
-            SELECT id, project_id, COUNT(*) as count
-            FROM orders
-            GROUP BY id, project_id
-            HAVING count > 1
-            """
-        )
-
-        for row in duplicate_orders:
-            self.add_issue(ConsistencyIssue(
-                category="FK",
-                severity="ERROR",
-                message=f"ORDER複合キー (id={row['id']}, project_id={row['project_id']}) が重複",
-                details={"order_id": row['id'], "project_id": row['project_id'], "count": row['count']}
-            ))
-
-        # TASKの複合キー重複チェック
-        duplicate_tasks = fetch_all(
-            conn,
-            """
-            SELECT id, project_id, COUNT(*) as count
-            FROM tasks
-            GROUP BY id, project_id
-            HAVING count > 1
-            """
-        )
-
-        for row in duplicate_tasks:
-            self.add_issue(ConsistencyIssue(
-                category="FK",
-                severity="ERROR",
-                message=f"TASK複合キー (id={row['id']}, project_id={row['project_id']}) が重複",
-                details={"task_id": row['id'], "project_id": row['project_id'], "count": row['count']}
-            ))
+        for table, label, id_key in (
+            ("orders", "ORDER", "order_id"),
+            ("tasks", "TASK", "task_id"),
+            ("backlog_items", "BACKLOG", "backlog_id"),
+        ):
+            scope, params = self._scope("e")
+            # 差分検証時は変更された行のキーのみ集計（重複相手は変更されていなくてもよい）
+            key_filter = ""
+            if scope:
+                key_filter = f"WHERE (id, project_id) IN (SELECT e.id, e.project_id FROM {table} e WHERE 1 = 1{scope})"
+            duplicates = fetch_all(
+                conn,
+                f"""
+                SELECT id, project_id, COUNT(*) as count
+                FROM {table}
+                {key_filter}
+                GROUP BY id, project_id
+                HAVING count > 1
+                """,
+                params,
+            )
 
-        # BACKLOGの複合キー重複チェック
-        duplicate_backlogs = fetch_all(
-            conn,
-            """
-            SELECT id, project_id, COUNT(*) as count
-            FROM backlog_items
-            GROUP BY id, project_id
-            HAVING count > 1
-            """
-        )
+            for row in duplicates:
+                self.add_issue(ConsistencyIssue(
+                    category="FK",
+                    severity="ERROR",
+                    message=f"{label}複合キー (id={row['id']}, project_id={row['project_id']}) が重複",
+                    details={id_key: row['id'], "project_id": row['project_id'], "count": row['count']}
+                ))
 
-        for row in duplicate_backlogs:
-            self.add_issue(ConsistencyIssue(
-                category="FK",
-                severity="ERROR",
-                message=f"BACKLOG複合キー (id={row['id']}, project_id={row['project_id']}) が重複",
-                details={"backlog_id": row['id'], "project_id": row['project_id'], "count": row['count']}
-            ))
+    def _affected_tasks_cte(self) -> Tuple[str, tuple]:
+        """
+        依存チェック対象タスクの CTE（差分検証時のみ絞り込み）
+
+        変更されたタスクと、変更されたタスクに依存するタスクが対象。
+        """
+        scope, params = self._scope("c")
+        if not scope:
+            return "", ()
+        return f"""
+            WITH changed AS (
+                SELECT c.id, c.project_id FROM tasks c WHERE 1 = 1{scope}
+            ),
+            affected AS (
+                SELECT id, project_id FROM changed
+                UNION
+                SELECT td.task_id, td.project_id
+                FROM task_dependencies td
+                JOIN changed ON td.depends_on_task_id = changed.id AND td.project_id = changed.project_id
+            )
+        """, params
 
     def _check_task_dependencies(self, conn) -> None:
         """タスク依存関係の整合性チェック"""
         self.stats["total_checks"] += 1
 
+        cte, params = self._affected_tasks_cte()
+        affected = " AND (t.id, t.project_id) IN (SELECT id, project_id FROM affected)" if cte else ""
+
         # BLOCKEDだが依存が全て完了しているタスク
         incorrectly_blocked = fetch_all(
             conn,
-            """
+            f"""
+            {cte}
             SELECT t.id, t.project_id, t.status
             FROM tasks t
             WHERE t.status = 'BLOCKED'
@@ -460,8 +564,9 @@ class DBConsistencyChecker:
                 JOIN tasks dep ON td.depends_on_task_id = dep.id AND td.project_id = dep.project_id
                 WHERE td.task_id = t.id AND td.project_id = t.project_id
                 AND dep.status NOT IN ('COMPLETED', 'DONE')
-            )
-            """
+            ){affected}
+            """,
+            params,
         )
 
         for row in incorrectly_blocked:
@@ -475,14 +580,19 @@ class DBConsistencyChecker:
         # BLOCKED以外だが未完了の依存がある（QUEUEDはOK、他は警告）
         should_be_blocked = fetch_all(
             conn,
-            """
-            SELECT DISTINCT t.id, t.project_id, t.status
+            f"""
+            {cte}
+            SELECT t.id, t.project_id, t.status
             FROM tasks t
-            JOIN task_dependencies td ON t.id = td.task_id AND t.project_id = td.project_id
-            JOIN tasks dep ON td.depends_on_task_id = dep.id AND td.project_id = dep.project_id
             WHERE t.status NOT IN ('BLOCKED', 'QUEUED', 'COMPLETED', 'DONE')
-            AND dep.status NOT IN ('COMPLETED', 'DONE')
-            """
+            AND EXISTS (
+                SELECT 1 FROM task_dependencies td
+                JOIN tasks dep ON td.depends_on_task_id = dep.id AND td.project_id = dep.project_id
+                WHERE td.task_id = t.id AND td.project_id = t.project_id
+                AND dep.status NOT IN ('COMPLETED', 'DONE')
+            ){affected}
+            """,
+            params,
         )
 
         for row in should_be_blocked:
@@ -498,15 +608,18 @@ class DBConsistencyChecker:
         self.stats["total_checks"] += 1
 
         # related_order_id が存在しないORDERを参照
+        scope, params = self._scope("b")
         orphan_backlog_orders = fetch_all(
             conn,
-            """
+            f"""
             SELECT b.id, b.project_id, b.related_order_id
             FROM backlog_items b
-            LEFT JOIN orders o ON b.related_order_id = o.id AND b.project_id = o.project_id
             WHERE b.related_order_id IS NOT NULL
-            AND o.id IS NULL
-            """
+            AND NOT EXISTS (
+                SELECT 1 FROM orders o WHERE o.id = b.related_order_id AND o.project_id = b.project_id
+            ){scope}
+            """,
+            params,
         )
 
         for row in orphan_backlog_orders:
@@ -521,16 +634,29 @@ class DBConsistencyChecker:
                 }
             ))
 
-        # ORDERが完了しているのにBACKLOGがDONEでない
+        # ORDERが完了しているのにBACKLOGがDONEでない（BACKLOG・ORDERどちらの変更も対象）
+        backlog_scope, backlog_params = self._scope("b")
+        order_scope, order_params = self._scope("o")
+        changed = ""
+        params = ()
+        if self.since:
+            changed = (
+                f" AND ((1 = 1{backlog_scope}) OR (1 = 1{order_scope}))"
+            )
+            params = backlog_params + order_params
+        elif self.project_id:
+            changed = backlog_scope
+            params = backlog_params
         inconsistent_backlog_status = fetch_all(
             conn,
-            """
+            f"""
             SELECT b.id, b.project_id, b.status, b.related_order_id, o.status as order_status
             FROM backlog_items b
             JOIN orders o ON b.related_order_id = o.id AND b.project_id = o.project_id
             WHERE o.status = 'COMPLETED'
-            AND b.status != 'DONE'
-            """
+            AND b.status != 'DONE'{changed}
+            """,
+            params,
         )
 
         for row in inconsistent_backlog_status:
@@ -548,30 +674,47 @@ class DBConsistencyChecker:
             ))
 
     def _check_artifact_files(self, conn) -> None:
-        """アーティファクトファイルの存在チェック"""
+        """
+        アーティファクトファイルの存在チェック
+
+        完了済みタスクを1回のクエリで取得し、ORDERディレクトリ（RESULT/ORDER_XXX と
+        その 06_ARTIFACTS / 05_REPORT）を1回ずつ走査して同じORDERのタスク間で共有する。
+        """
         self.stats["total_checks"] += 1
 
-        # 完了済みタスクのアーティファクトディレクトリを検証
+        scope, params = self._scope("t")
         completed_tasks = fetch_all(
             conn,
-            """
+            f"""
             SELECT t.id, t.project_id, t.order_id, t.status, p.path as project_path
             FROM tasks t
             JOIN projects p ON t.project_id = p.id
-            WHERE t.status IN ('DONE', 'COMPLETED')
-            """
+            WHERE t.status IN ('DONE', 'COMPLETED'){scope}
+            """,
+            params,
+        )
+
+        cache = self.stat_cache
+        order_dirs = {
+            Path(row['project_path']) / "RESULT" / row['order_id'] for row in completed_tasks
+        }
+        # ORDERディレクトリ → その配下の 06_ARTIFACTS / 05_REPORT の順に並列走査
+        cache.prefetch(order_dirs, self.max_workers)
+        cache.prefetch(
+            [order_dir / name for order_dir in order_dirs for name in ("06_ARTIFACTS", "05_REPORT")
+             if cache.exists(order_dir / name)],
+            self.max_workers,
         )
 
         for row in completed_tasks:
-            project_path = Path(row['project_path'])
             order_id = row['order_id']
             task_id = row['id']
 
             # アーティファクトディレクトリのパスを構築
-            artifacts_dir = project_path / "RESULT" / order_id / "06_ARTIFACTS"
+            artifacts_dir = Path(row['project_path']) / "RESULT" / order_id / "06_ARTIFACTS"
 
             # アーティファクトディレクトリが存在しない場合は警告
-            if not artifacts_dir.exists():
+            if not cache.exists(artifacts_dir):
                 self.add_issue(ConsistencyIssue(
                     category="ARTIFACT",
                     severity="WARNING",
@@ -587,8 +730,7 @@ class DBConsistencyChecker:
                 continue
 
             # アーティファクトディレクトリが空の場合は情報として記録
-            artifact_files = list(artifacts_dir.glob("*"))
-            if not artifact_files:
+            if cache.is_empty(artifacts_dir):
                 self.add_issue(ConsistencyIssue(
                     category="ARTIFACT",
                     severity="INFO",
@@ -603,28 +745,17 @@ class DBConsistencyChecker:
                 ))
 
         # REPORTファイルの存在チェック
-        done_tasks = fetch_all(
-            conn,
-            """
-            SELECT t.id, t.project_id, t.order_id, t.status, p.path as project_path
-            FROM tasks t
-            JOIN projects p ON t.project_id = p.id
-            WHERE t.status IN ('DONE', 'COMPLETED')
-            """
-        )
-
-        for row in done_tasks:
-            project_path = Path(row['project_path'])
+        for row in completed_tasks:
             order_id = row['order_id']
             task_id = row['id']
 
             # REPORTファイルのパスを構築（REPORT_{task_number}.md形式）
             task_number = task_id.split('_')[1] if '_' in task_id else task_id
-            report_dir = project_path / "RESULT" / order_id / "05_REPORT"
+            report_dir = Path(row['project_path']) / "RESULT" / order_id / "05_REPORT"
             report_file = report_dir / f"REPORT_{task_number}.md"
 
             # REPORTディレクトリが存在しない場合は警告
-            if not report_dir.exists():
+            if not cache.exists(report_dir):
                 self.add_issue(ConsistencyIssue(
                     category="ARTIFACT",
                     severity="WARNING",
@@ -640,7 +771,7 @@ class DBConsistencyChecker:
                 continue
 
             # REPORTファイルが存在しない場合は警告
-            if not report_file.exists():
+            if not cache.exists(report_file):
                 self.add_issue(ConsistencyIssue(
                     category="ARTIFACT",
                     severity="WARNING",
@@ -656,13 +787,18 @@ class DBConsistencyChecker:
 
     def _build_result(self) -> Dict[str, Any]:
         """チェック結果を構築"""
-        return {
+        result = {
             "success": self.stats["errors"] == 0,
             "timestamp": datetime.now().isoformat(),
             "project_id": self.project_id or "ALL",
             "stats": self.stats,
             "issues": [issue.to_dict() for issue in self.issues],
         }
+        if self.since:
+            result["since"] = self.since
+        if self._next_cursor:
+            result["next_cursor"] = self._next_cursor
+        return result
 
 
 def verify_task_completion(
@@ -703,7 +839,6 @@ def verify_task_completion(
                 "stats": {}
             }
 
-        checker = DBConsistencyChecker(project_id=project_id, verbose=verbose)
         issues = []
 
         # タスクステータスチェック
@@ -784,6 +919,10 @@ def main():
     parser.add_argument("--project", help="特定プロジェクトのみチェック")
     parser.add_argument("--task", help="特定タスクのみチェック（--projectと併用）")
     parser.add_argument("--fix", action="store_true", help="検出した問題を自動修正（未実装）")
+    parser.add_argument("--since", metavar="CURSOR",
+                        help="差分検証: この日時以降に変更されたエンティティのみチェック")
+    parser.add_argument("--workers", type=int, default=DEFAULT_CHECK_WORKERS,
+                        help=f"並列実行するチェック数（デフォルト: {DEFAULT_CHECK_WORKERS}）")
 
     args = parser.parse_args()
 
@@ -826,7 +965,12 @@ def main():
                 sys.exit(0 if result['success'] else 1)
 
         # 全体チェック
-        checker = DBConsistencyChecker(project_id=args.project, verbose=args.verbose)
+        checker = DBConsistencyChecker(
+            project_id=args.project,
+            verbose=args.verbose,
+            since=args.since,
+            max_workers=args.workers,
+        )
         result = checker.check_all()
 
         if args.json:
@@ -838,6 +982,8 @@ def main():
             print("=" * 60)
             print(f"プロジェクト: {result['project_id']}")
             print(f"チェック日時: {result['timestamp']}")
+            if result.get("since"):
+                print(f"差分検証: {result['since']} 以降（次回カーソル: {result['next_cursor']}）")
             print(f"総チェック数: {result['stats']['total_checks']}")
             print()
 
@@ -2,11 +2,21 @@
 AI PM Framework - Worker管理モジュール
 
 Worker識別子の割当・管理機能を提供。
+
+公開関数は属性アクセス時に遅延インポートする（utils/lazy_import.py）。
 """
 
-from .assign import get_used_workers, get_next_worker
+from utils.lazy_import import lazy_exports
+
+# 公開名 → 定義元サブモジュール
+_LAZY_EXPORTS = {
+    "get_used_workers": ".assign",
+    "get_next_worker": ".assign",
+}
 
 __all__ = [
     "get_used_workers",
     "get_next_worker",
 ]
+
+__getattr__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Child Exit Watcher
+
+Event-driven notification of Worker process exits for the daemon loop.
+Instead of calling ``proc.poll()`` / probing PIDs for every running Worker on
+each iteration, the daemon registers each child here and blocks in
+``wait()``; the wait returns as soon as any registered child exits.
+
+Backends:
+- pidfd: ``os.pidfd_open`` + ``selectors`` (Linux 5.3+, Python 3.9+).
+  No threads, no signal handlers.
+- thread: one daemon thread per child blocked in ``proc.wait()``, waking
+  the selector through a socketpair (Windows / macOS / older kernels).
+
+SIGCHLD handlers are deliberately not used: the daemon already owns
+SIGTERM/SIGINT handling, and a process-wide SIGCHLD handler would interfere
+with other ``subprocess`` users in the same process (git, review workers).
+
+Usage:
+    watcher = ChildExitWatcher()
+    watcher.watch(proc, functools.partial(on_exit, task_id))
+    ...
+    if watcher.wait(timeout=0.5):
+        # at least one callback was invoked; reap now
+        ...
+    watcher.close()
+"""
+
+import logging
+import os
+import queue
+import selectors
+import socket
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+BACKEND_PIDFD = "pidfd"
+BACKEND_THREAD = "thread"
+
+# Callback invoked (in the caller of wait()) with the monotonic time at which
+# the exit was observed.
+ExitCallback = Callable[[float], None]
+
+
+def pidfd_supported() -> bool:
+    """Whether ``os.pidfd_open`` is usable on this platform/kernel."""
+    if not hasattr(os, "pidfd_open"):
+        return False
+    try:
+        fd = os.pidfd_open(os.getpid())
+    except OSError:
+        return False
+    os.close(fd)
+    return True
+
+
+class ChildExitWatcher:
+    """
+    Wait for exits of registered child processes.
+
+    Callbacks are only ever invoked from ``wait()`` (i.e. on the daemon's
+    own thread), so they may touch launcher state without locking.
+    """
+
+    def __init__(self, backend: Optional[str] = None) -> None:
+        if backend is None:
+            backend = BACKEND_PIDFD if pidfd_supported() else BACKEND_THREAD
+        if backend not in (BACKEND_PIDFD, BACKEND_THREAD):
+            raise ValueError(f"Unknown child watcher backend: {backend}")
+        self.backend = backend
+
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+
+        # pidfd backend: {fd: (pid, callback)}
+        self._pidfds: Dict[int, tuple] = {}
+        # thread backend: exits reported by waiter threads
+        self._thread_exits: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._thread_waiters: Dict[int, ExitCallback] = {}
+        # exits observed at registration time (child already gone)
+        self._immediate: Dict[int, tuple] = {}
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def watch(self, proc: subprocess.Popen, callback: ExitCallback) -> None:
+        """
+        Register a child process.
+
+        Args:
+            proc: The child process
+            callback: Called with the monotonic exit-observation time
+        """
+        if self.backend == BACKEND_PIDFD:
+            try:
+                fd = os.pidfd_open(proc.pid)
+            except ProcessLookupError:
+                # Already reaped: report on the next wait()
+                self._immediate[proc.pid] = (time.monotonic(), callback)
+                self.wake()
+                return
+            self._pidfds[fd] = (proc.pid, callback)
+            self._selector.register(fd, selectors.EVENT_READ, fd)
+            return
+
+        self._thread_waiters[proc.pid] = callback
+        thread = threading.Thread(
+            target=self._wait_in_thread,
+            args=(proc,),
+            name=f"child-watcher-{proc.pid}",
+            daemon=True,
+        )
+        thread.start()
+
+    def unwatch(self, pid: int) -> None:
+        """Stop watching a child (e.g. after it was killed and reaped elsewhere)."""
+        for fd, (watched_pid, _) in list(self._pidfds.items()):
+            if watched_pid == pid:
+                self._close_pidfd(fd)
+        self._thread_waiters.pop(pid, None)
+        self._immediate.pop(pid, None)
+
+    def is_watching(self, pid: int) -> bool:
+        """Whether an exit of ``pid`` is still pending notification."""
+        return (
+            pid in self._thread_waiters
+            or pid in self._immediate
+            or any(watched_pid == pid for watched_pid, _ in self._pidfds.values())
+        )
+
+    @property
+    def watched_count(self) -> int:
+        return len(self._pidfds) + len(self._thread_waiters) + len(self._immediate)
+
+    # ------------------------------------------------------------------
+    # Waiting
+    # ------------------------------------------------------------------
+
+    def wait(self, timeout: Optional[float]) -> int:
+        """
+        Block until a watched child exits, ``wake()`` is called, or timeout.
+
+        Args:
+            timeout: Seconds to wait (0 = non-blocking, None = forever)
+
+        Returns:
+            Number of exit callbacks invoked
+        """
+        if self._closed:
+            return 0
+
+        dispatched = self._dispatch_immediate()
+        if dispatched:
+            timeout = 0
+
+        for key, _ in self._selector.select(timeout):
+            if key.data is None:
+                self._drain_wake()
+                continue
+            fd = key.data
+            pid, callback = self._pidfds.get(fd, (None, None))
+            self._close_pidfd(fd)
+            if callback is not None:
+                self._invoke(pid, callback, time.monotonic())
+                dispatched += 1
+
+        while True:
+            try:
+                pid, exited_at = self._thread_exits.get_nowait()
+            except queue.Empty:
+                break
+            callback = self._thread_waiters.pop(pid, None)
+            if callback is not None:
+                self._invoke(pid, callback, exited_at)
+                dispatched += 1
+
+        return dispatched
+
+    def wake(self) -> None:
+        """Interrupt a blocking ``wait()`` (safe from threads and signal handlers)."""
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def close(self) -> None:
+        """Release pidfds, the wake socketpair and the selector."""
+        if self._closed:
+            return
+        self._closed = True
+        for fd in list(self._pidfds):
+            self._close_pidfd(fd)
+        self._thread_waiters.clear()
+        self._immediate.clear()
+        try:
+            self._selector.close()
+        finally:
+            self._wake_r.close()
+            self._wake_w.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _wait_in_thread(self, proc: subprocess.Popen) -> None:
+        try:
+            proc.wait()
+        except Exception as e:
+            logger.debug(f"[child_watcher] wait() failed for PID {proc.pid}: {e}")
+        self._thread_exits.put((proc.pid, time.monotonic()))
+        self.wake()
+
+    def _dispatch_immediate(self) -> int:
+        immediate, self._immediate = self._immediate, {}
+        for pid, (exited_at, callback) in immediate.items():
+            self._invoke(pid, callback, exited_at)
+        return len(immediate)
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _close_pidfd(self, fd: int) -> None:
+        self._pidfds.pop(fd, None)
+        try:
+            self._selector.unregister(fd)
+        except (KeyError, ValueError):
+            pass
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _invoke(pid: Optional[int], callback: ExitCallback, exited_at: float) -> None:
+        try:
+            callback(exited_at)
+        except Exception as e:
+            logger.warning(f"[child_watcher] Exit callback failed for PID {pid}: {e}")
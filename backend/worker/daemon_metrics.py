@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Daemon Metrics
+
+In-process metrics registry for the daemon-mode launcher and the global
+scheduler, exposed on a local HTTP endpoint.
+
+- Counter / Gauge / Histogram with label sets (thread-safe)
+- MetricsRegistry renders the Prometheus text format (``/metrics``) and a
+  compact JSON snapshot (``/metrics.json``)
+- MetricsServer serves the registry from a daemon thread on 127.0.0.1
+- DaemonMetrics declares the launcher metrics: poll duration, SQL
+  statements per poll, launch latency, event-to-launch delay, worker wall
+  time, reap latency, task counts by status, slot utilization and
+  WorkerExecutor step spans
+
+Step spans are written by each Worker (``execute_task.py --spans-file``)
+and folded into the daemon's histograms when the Worker is reaped.
+
+Usage:
+    python backend/worker/parallel_launcher.py PROJECT ORDER --daemon --metrics-port 9464
+    curl http://127.0.0.1:9464/metrics
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds: sub-millisecond DB polls up to multi-minute stalls
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Seconds: Worker processes and their steps (claude calls run for minutes)
+WALL_TIME_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0)
+
+# SQL statements per poll cycle
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+# Task statuses exported as queue depth (zero-filled so drained queues read 0)
+TASK_STATUSES = (
+    "QUEUED", "BLOCKED", "IN_PROGRESS", "DONE", "REWORK",
+    "ESCALATED", "COMPLETED", "REJECTED", "CANCELLED", "SKIPPED",
+)
+
+LabelKey = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [
+        '{}="{}"'.format(n, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for n, v in zip(names, values)
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    """Base class: a named metric family with a fixed label schema."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name}: expected labels {list(self.labelnames)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _labels(self, key: LabelKey) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters cannot decrease")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in items
+        ]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [{"labels": self._labels(key), "value": v} for key, v in items]
+
+
+class Gauge(Counter):
+    """Value per label set that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def remove(self, **labels: Any) -> None:
+        """Drop a label set (e.g. a retired ORDER) from the exposition."""
+        key = self._key(labels)
+        with self._lock:
+            self._values.pop(key, None)
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+        # {key: [per-bucket counts..., +Inf count, sum]}
+        self._series: Dict[LabelKey, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def time(self, **labels: Any) -> "_Timer":
+        """Context manager observing the elapsed seconds of its block."""
+        return _Timer(self, labels)
+
+    def count(self, **labels: Any) -> int:
+        series = self._series.get(self._key(labels))
+        return int(sum(series[:-1])) if series else 0
+
+    def total(self, **labels: Any) -> float:
+        series = self._series.get(self._key(labels))
+        return series[-1] if series else 0.0
+
+    def _cumulative(self, series: List[float]) -> List[float]:
+        running, out = 0.0, []
+        for c in series[:-1]:
+            running += c
+            out.append(running)
+        return out
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        lines = []
+        for key, series in items:
+            cumulative = self._cumulative(series)
+            for bound, c in zip(self.buckets + (float("inf"),), cumulative):
+                le = 'le="{}"'.format(_format_value(bound))
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(c)}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative[-1])}")
+        return lines
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        out = []
+        for key, series in items:
+            count = int(sum(series[:-1]))
+            out.append({
+                "labels": self._labels(key),
+                "count": count,
+                "sum": round(series[-1], 6),
+                "avg": round(series[-1] / count, 6) if count else None,
+                "p50": self._quantile(series, count, 0.5),
+                "p90": self._quantile(series, count, 0.9),
+                "buckets": [int(c) for c in series[:-1]],
+            })
+        return out
+
+    def _quantile(self, series: List[float], count: int, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (None above the last bucket)."""
+        if not count:
+            return None
+        target, running = q * count, 0.0
+        for bound, c in zip(self.buckets, series):
+            running += c
+            if running >= target:
+                return bound
+        return None
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict[str, Any]) -> None:
+        self._histogram = histogram
+        self._labels = labels
+        self._started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._histogram.observe(time.perf_counter() - self._started, **self._labels)
+
+
+class MetricsRegistry:
+    """Named metric families, rendered in registration order."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls: type, name: str, *args: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args)
+            elif type(metric) is not cls:
+                raise ValueError(f"{name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ) -> Histogram:
+        return self._register(Histogram, name, help_text, buckets, labelnames)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render_text(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable view of every metric family."""
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "metrics": {
+                metric.name: {"type": metric.kind, "samples": metric.snapshot()}
+                for metric in list(self._metrics.values())
+            },
+        }
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server API)
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body = self.registry.render_text().encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif path == "/metrics.json":
+            body = json.dumps(
+                self.registry.snapshot(), ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+            content_type = "application/json"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("[metrics] " + format, *args)
+
+
+class MetricsServer:
+    """Serve a registry on ``http://host:port/metrics`` from a daemon thread."""
+
+    def __init__(self, registry: MetricsRegistry, port: int = 0, host: str = "127.0.0.1") -> None:
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        host = self._server.server_address[0]
+        return f"http://{host}:{self.port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._server.server_close()
+
+
+def _epoch(value: Any) -> Optional[float]:
+    """Epoch seconds from an epoch number or an ISO-8601 timestamp (local time)."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return None
+
+
+def write_step_spans(path: Any, task_id: str, spans: Iterable[Dict[str, Any]]) -> None:
+    """Write a Worker's step spans for the daemon (compact JSON)."""
+    data = {"task_id": task_id, "spans": list(spans)}
+    Path(path).write_text(
+        json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+    )
+
+
+def read_step_spans(path: Any) -> List[Dict[str, Any]]:
+    """Read spans written by write_step_spans(); [] when missing or unreadable."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    spans = data.get("spans") if isinstance(data, dict) else None
+    return spans if isinstance(spans, list) else []
+
+
+class DaemonMetrics:
+    """
+    Launcher / scheduler instrumentation on top of a MetricsRegistry.
+
+    One instance is shared by every ParallelWorkerLauncher driven by the
+    same daemon process. SQL statements are counted through
+    ``utils.db.add_statement_observer`` while ``install()`` is active.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        r = self.registry = registry or MetricsRegistry()
+        self.polls = r.counter("aipm_daemon_polls_total", "Daemon poll cycles")
+        self.poll_duration = r.histogram(
+            "aipm_daemon_poll_duration_seconds",
+            "Busy time of one poll cycle (sleep excluded)",
+            LATENCY_BUCKETS,
+        )
+        self.poll_queries = r.histogram(
+            "aipm_daemon_poll_queries", "SQL statements issued per poll cycle", COUNT_BUCKETS
+        )
+        self.db_statements = r.counter(
+            "aipm_db_statements_total", "SQL statements issued by the daemon process"
+        )
+        self.launches = r.counter(
+            "aipm_worker_launches_total", "Processes launched", ("kind", "mode")
+        )
+        self.launch_latency = r.histogram(
+            "aipm_worker_launch_latency_seconds",
+            "Launch request to first step in the process (warm launches)",
+            LATENCY_BUCKETS,
+            ("kind",),
+        )
+        self.event_to_launch = r.histogram(
+            "aipm_event_to_launch_delay_seconds",
+            "Completion event of the last predecessor to launch of the unblocked task",
+            LATENCY_BUCKETS,
+        )
+        self.worker_wall = r.histogram(
+            "aipm_worker_wall_seconds", "Worker process wall time", WALL_TIME_BUCKETS, ("result",)
+        )
+        self.reap_latency = r.histogram(
+            "aipm_worker_reap_latency_seconds",
+            "Child exit notification to reaped and dependency-resolved",
+            LATENCY_BUCKETS,
+        )
+        self.step_duration = r.histogram(
+            "aipm_worker_step_seconds",
+            "WorkerExecutor step spans (start to result)",
+            WALL_TIME_BUCKETS,
+            ("step", "status"),
+        )
+        self.tasks = r.gauge(
+            "aipm_tasks", "Tasks by status", ("project", "order", "status")
+        )
+        self.running_workers = r.gauge("aipm_workers_running", "Running Worker processes")
+        self.worker_slots = r.gauge("aipm_worker_slots", "Worker slots available to the daemon")
+        self.slot_utilization = r.gauge(
+            "aipm_worker_slot_utilization", "Running Workers divided by worker slots"
+        )
+
+        self._statement_count = 0
+        self._poll_started: Optional[float] = None
+        self._poll_statements = 0
+        self._ready_at: Dict[str, float] = {}
+        self._installed = False
+
+    # -- lifecycle --------------------------------------------------------
+
+    def install(self) -> None:
+        """Start counting SQL statements of connections opened from now on."""
+        if not self._installed:
+            from utils.db import add_statement_observer
+            add_statement_observer(self._on_statement)
+            self._installed = True
+
+    def uninstall(self) -> None:
+        if self._installed:
+            from utils.db import remove_statement_observer
+            remove_statement_observer(self._on_statement)
+            self._installed = False
+
+    def _on_statement(self, _sql: str) -> None:
+        self._statement_count += 1
+
+    # -- poll cycle -------------------------------------------------------
+
+    def begin_poll(self) -> None:
+        self._poll_started = time.perf_counter()
+        self._poll_statements = self._statement_count
+
+    def end_poll(self) -> None:
+        """Close the cycle opened by begin_poll() (no-op without one)."""
+        if self._poll_started is None:
+            return
+        statements = self._statement_count - self._poll_statements
+        self.polls.inc()
+        self.poll_duration.observe(time.perf_counter() - self._poll_started)
+        self.poll_queries.observe(statements)
+        self.db_statements.inc(statements)
+        self._poll_started = None
+
+    def record_task_counts(self, project_id: str, order_id: str, counts: Dict[str, int]) -> None:
+        for status in TASK_STATUSES:
+            self.tasks.set(counts.get(status, 0), project=project_id, order=order_id, status=status)
+
+    def forget_order(self, project_id: str, order_id: str) -> None:
+        for status in TASK_STATUSES:
+            self.tasks.remove(project=project_id, order=order_id, status=status)
+
+    def record_slots(self, running: int, slots: int) -> None:
+        self.running_workers.set(running)
+        self.worker_slots.set(slots)
+        self.slot_utilization.set(round(running / slots, 4) if slots > 0 else 0.0)
+
+    # -- worker lifecycle -------------------------------------------------
+
+    def mark_ready(self, task_ids: Iterable[str], event_time: Any = None) -> None:
+        """
+        Remember when tasks became launchable: the completion event of their
+        latest predecessor (default now). Consumed by record_launch().
+        """
+        ready_at = _epoch(event_time) or time.time()
+        for task_id in task_ids:
+            self._ready_at[task_id] = max(ready_at, self._ready_at.get(task_id, ready_at))
+
+    def record_launch(self, task_id: str, kind: str, mode: str, requested_at: float) -> None:
+        self.launches.inc(kind=kind, mode=mode)
+        ready_at = self._ready_at.pop(task_id, None)
+        if kind == "worker" and ready_at is not None:
+            self.event_to_launch.observe(max(requested_at - ready_at, 0.0))
+
+    def record_launch_latency(self, kind: str, latency_ms: float) -> None:
+        self.launch_latency.observe(latency_ms / 1000.0, kind=kind)
+
+    def record_worker_exit(self, retcode: int, wall_seconds: Optional[float]) -> None:
+        if wall_seconds is not None:
+            result = "success" if retcode == 0 else "failure"
+            self.worker_wall.observe(max(wall_seconds, 0.0), result=result)
+
+    def record_reap_latency(self, latency_ms: float) -> None:
+        self.reap_latency.observe(latency_ms / 1000.0)
+
+    def record_step_spans(self, spans: Iterable[Dict[str, Any]]) -> int:
+        """Fold Worker step spans into the step histogram. Returns the span count."""
+        count = 0
+        for span in spans:
+            duration_ms = span.get("duration_ms")
+            if duration_ms is None or not span.get("step"):
+                continue
+            self.step_duration.observe(
+                duration_ms / 1000.0, step=span["step"], status=span.get("status", "")
+            )
+            count += 1
+        return count
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact per-metric summary for results dicts (no bucket arrays)."""
+        out: Dict[str, Any] = {}
+        for name, family in self.registry.snapshot()["metrics"].items():
+            samples = []
+            for sample in family["samples"]:
+                sample = dict(sample)
+                sample.pop("buckets", None)
+                if not sample["labels"]:
+                    sample.pop("labels")
+                samples.append(sample)
+            if samples:
+                out[name] = samples[0] if len(samples) == 1 and "labels" not in samples[0] else samples
+        return out
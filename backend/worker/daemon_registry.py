@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Daemon Lease Registry
+
+Liveness registry of resident launchers in the ``daemons`` table, replacing
+the per-ORDER ``daemon_heartbeat.json`` and the scheduler heartbeat file.
+
+- One row per per-ORDER daemon (``order:{project_id}/{order_id}``) or the
+  global scheduler (``scheduler``)
+- DaemonLease.acquire() / heartbeat(): one UPSERT that only succeeds when
+  the row is missing, already ours, or its lease has expired, so a stale
+  lease is taken over atomically
+- owned_tasks lists the tasks (and Worker PIDs) the daemon is running, so
+  orphan detection can tell which daemon owns an IN_PROGRESS task
+- live_daemons() / order_daemon() / task_owners(): single queries over the
+  lease index (lease_expires_at) answer "which daemons and Workers are alive"
+
+Lease times are computed by SQLite (``datetime('now')``, UTC) so every
+process compares against the same clock.
+
+Usage:
+    python backend/worker/daemon_registry.py [--all] [--reclaim] [--json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils.db import execute_query, fetch_all, get_connection
+
+logger = logging.getLogger(__name__)
+
+# Default lease: a daemon that has not renewed within this many seconds is dead
+DAEMON_LEASE_SECONDS = 60
+
+KIND_ORDER = "order"
+KIND_SCHEDULER = "scheduler"
+
+SCHEDULER_DAEMON_ID = "scheduler"
+
+_UPSERT_SQL = """
+    INSERT INTO daemons (
+        daemon_id, kind, project_id, order_id, pid, status,
+        owned_tasks, info_json, started_at, heartbeat_at, lease_expires_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'), datetime('now', ?))
+    ON CONFLICT(daemon_id) DO UPDATE SET
+        kind = excluded.kind,
+        project_id = excluded.project_id,
+        order_id = excluded.order_id,
+        started_at = CASE WHEN daemons.pid = excluded.pid
+                          THEN daemons.started_at ELSE excluded.started_at END,
+        pid = excluded.pid,
+        status = excluded.status,
+        owned_tasks = excluded.owned_tasks,
+        info_json = excluded.info_json,
+        heartbeat_at = excluded.heartbeat_at,
+        lease_expires_at = excluded.lease_expires_at
+    WHERE daemons.pid = excluded.pid OR daemons.lease_expires_at <= datetime('now')
+"""
+
+_SELECT_SQL = """
+    SELECT daemon_id, kind, project_id, order_id, pid, status, owned_tasks, info_json,
+           started_at, heartbeat_at, lease_expires_at,
+           ROUND((julianday('now') - julianday(heartbeat_at)) * 86400.0, 1) AS age_seconds,
+           lease_expires_at > datetime('now') AS is_alive
+    FROM daemons
+"""
+
+
+def order_daemon_id(project_id: str, order_id: str) -> str:
+    """Registry key of a per-ORDER daemon."""
+    return f"{KIND_ORDER}:{project_id}/{order_id}"
+
+
+def _row_to_daemon(row: Any) -> Dict[str, Any]:
+    data = dict(row)
+    data["is_alive"] = bool(data["is_alive"])
+    try:
+        data["owned_tasks"] = json.loads(data["owned_tasks"] or "[]")
+    except ValueError:
+        data["owned_tasks"] = []
+    try:
+        data["info"] = json.loads(data.pop("info_json") or "{}")
+    except ValueError:
+        data["info"] = {}
+    return data
+
+
+class _Connection:
+    """Use the caller's connection or open (and close) a default one."""
+
+    def __init__(self, conn: Any = None) -> None:
+        self._conn = conn
+        self._own = conn is None
+
+    def __enter__(self) -> Any:
+        if self._own:
+            self._conn = get_connection()
+        return self._conn
+
+    def __exit__(self, *exc) -> None:
+        if self._own:
+            self._conn.close()
+
+
+class DaemonLease:
+    """
+    Lease on one ``daemons`` row held by the current process.
+
+    Args:
+        daemon_id: Registry key (order_daemon_id() or SCHEDULER_DAEMON_ID)
+        kind: KIND_ORDER or KIND_SCHEDULER
+        project_id / order_id: The ORDER of a per-ORDER daemon
+        lease_seconds: Lease length renewed by every heartbeat
+        pid: Owner PID (default: this process)
+    """
+
+    def __init__(
+        self,
+        daemon_id: str,
+        kind: str,
+        *,
+        project_id: Optional[str] = None,
+        order_id: Optional[str] = None,
+        lease_seconds: int = DAEMON_LEASE_SECONDS,
+        pid: Optional[int] = None,
+    ) -> None:
+        if kind not in (KIND_ORDER, KIND_SCHEDULER):
+            raise ValueError(f"unknown daemon kind: {kind}")
+        self.daemon_id = daemon_id
+        self.kind = kind
+        self.project_id = project_id
+        self.order_id = order_id
+        self.lease_seconds = int(lease_seconds)
+        self.pid = pid if pid is not None else os.getpid()
+        self.held = False
+
+    @classmethod
+    def for_order(cls, project_id: str, order_id: str, **kwargs: Any) -> "DaemonLease":
+        return cls(
+            order_daemon_id(project_id, order_id), KIND_ORDER,
+            project_id=project_id, order_id=order_id, **kwargs,
+        )
+
+    @classmethod
+    def for_scheduler(cls, **kwargs: Any) -> "DaemonLease":
+        return cls(SCHEDULER_DAEMON_ID, KIND_SCHEDULER, **kwargs)
+
+    def acquire(self, conn: Any = None) -> bool:
+        """
+        Take the lease if it is free, ours, or expired.
+
+        Returns:
+            False if another live process holds it
+        """
+        return self.heartbeat(conn=conn)
+
+    def heartbeat(
+        self,
+        owned_tasks: Iterable[Dict[str, Any]] = (),
+        *,
+        status: str = "running",
+        info: Optional[Dict[str, Any]] = None,
+        conn: Any = None,
+    ) -> bool:
+        """
+        Renew the lease and publish owned tasks / status (one UPSERT).
+
+        Args:
+            owned_tasks: [{"project_id", "order_id", "task_id", "pid"}] of running Workers
+            status: "running" or "shutting_down"
+            info: Extra status shown by read_heartbeat() (JSON-serializable)
+
+        Returns:
+            False if another live process took the lease over
+        """
+        params = (
+            self.daemon_id, self.kind, self.project_id, self.order_id, self.pid, status,
+            json.dumps(list(owned_tasks), ensure_ascii=False, separators=(",", ":")),
+            json.dumps(info or {}, ensure_ascii=False, separators=(",", ":"), default=str),
+            f"+{self.lease_seconds} seconds",
+        )
+        with _Connection(conn) as c:
+            cursor = execute_query(c, _UPSERT_SQL, params)
+            c.commit()
+        self.held = cursor.rowcount == 1
+        return self.held
+
+    def release(self, conn: Any = None) -> None:
+        """Delete the row if this process still owns it."""
+        with _Connection(conn) as c:
+            execute_query(
+                c, "DELETE FROM daemons WHERE daemon_id = ? AND pid = ?", (self.daemon_id, self.pid)
+            )
+            c.commit()
+        self.held = False
+
+
+def live_daemons(include_expired: bool = False, conn: Any = None) -> List[Dict[str, Any]]:
+    """
+    Registered daemons (alive only by default), with parsed owned_tasks / info.
+
+    Each dict also has ``age_seconds`` (since the last heartbeat) and ``is_alive``.
+    """
+    query = _SELECT_SQL
+    if not include_expired:
+        query += " WHERE lease_expires_at > datetime('now')"
+    with _Connection(conn) as c:
+        rows = fetch_all(c, query + " ORDER BY daemon_id")
+    return [_row_to_daemon(row) for row in rows]
+
+
+def order_daemon(project_id: str, order_id: str, conn: Any = None) -> Optional[Dict[str, Any]]:
+    """
+    The daemon row responsible for an ORDER (alive or not).
+
+    A per-ORDER daemon wins; otherwise the scheduler row if it lists the
+    ORDER in ``info["orders"]``.
+    """
+    with _Connection(conn) as c:
+        rows = fetch_all(
+            c,
+            _SELECT_SQL + " WHERE daemon_id IN (?, ?)",
+            (order_daemon_id(project_id, order_id), SCHEDULER_DAEMON_ID),
+        )
+    daemons = {row["daemon_id"]: _row_to_daemon(row) for row in rows}
+    own = daemons.get(order_daemon_id(project_id, order_id))
+    if own is not None:
+        return own
+    scheduler = daemons.get(SCHEDULER_DAEMON_ID)
+    if scheduler and f"{project_id}/{order_id}" in scheduler["info"].get("orders", []):
+        return scheduler
+    return None
+
+
+def task_owners(project_id: str, conn: Any = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Tasks of a project run by live daemons.
+
+    Returns:
+        {task_id: {"daemon_id", "pid" (daemon), "worker_pid"}}
+    """
+    with _Connection(conn) as c:
+        rows = fetch_all(
+            c,
+            """
+            SELECT d.daemon_id, d.pid,
+                   json_extract(t.value, '$.task_id') AS task_id,
+                   json_extract(t.value, '$.pid') AS worker_pid
+            FROM daemons d, json_each(d.owned_tasks) t
+            WHERE d.lease_expires_at > datetime('now')
+              AND json_extract(t.value, '$.project_id') = ?
+            """,
+            (project_id,),
+        )
+    return {
+        row["task_id"]: {"daemon_id": row["daemon_id"], "pid": row["pid"], "worker_pid": row["worker_pid"]}
+        for row in rows
+    }
+
+
+def reclaim_stale(conn: Any = None) -> List[Dict[str, Any]]:
+    """
+    Delete every expired lease in one write transaction.
+
+    Returns:
+        The reclaimed rows (their owned_tasks are orphan candidates)
+    """
+    with _Connection(conn) as c:
+        execute_query(c, "BEGIN IMMEDIATE")
+        try:
+            rows = fetch_all(c, _SELECT_SQL + " WHERE lease_expires_at <= datetime('now')")
+            if rows:
+                execute_query(c, "DELETE FROM daemons WHERE lease_expires_at <= datetime('now')")
+            c.commit()
+        except Exception:
+            c.rollback()
+            raise
+    return [_row_to_daemon(row) for row in rows]
+
+
+def main():
+    """CLI entry point"""
+    try:
+        from config import setup_utf8_output
+        setup_utf8_output()
+    except ImportError:
+        pass
+
+    parser = argparse.ArgumentParser(description="List resident launcher daemons and their leases")
+    parser.add_argument("--all", action="store_true", help="Include expired leases")
+    parser.add_argument("--reclaim", action="store_true", help="Delete expired leases first")
+    parser.add_argument("--json", action="store_true", help="JSON output format")
+    args = parser.parse_args()
+
+    reclaimed = reclaim_stale() if args.reclaim else []
+    daemons = live_daemons(include_expired=args.all)
+
+    if args.json:
+        print(json.dumps({"daemons": daemons, "reclaimed": reclaimed}, ensure_ascii=False, indent=2))
+        return
+
+    for row in reclaimed:
+        print(f"reclaimed {row['daemon_id']} (PID {row['pid']}, {len(row['owned_tasks'])} task(s))")
+    if not daemons:
+        print("No daemon registered")
+    for row in daemons:
+        state = "alive" if row["is_alive"] else "expired"
+        tasks = ", ".join(t["task_id"] for t in row["owned_tasks"]) or "-"
+        print(f"{row['daemon_id']}  PID {row['pid']}  {row['status']}/{state}  "
+              f"heartbeat {row['age_seconds']}s ago  tasks: {tasks}")
+
+
+if __name__ == "__main__":
+    main()
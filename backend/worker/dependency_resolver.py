@@ -7,11 +7,13 @@ DAG（有向非巡回グラフ）としての依存グラフ構築、トポロ
 
 主要コンポーネント:
 - DependencyGraph: 依存グラフの構築・分析クラス
+- ResidentDependencyGraph: デーモン常駐用の増分更新グラフ（未充足先行タスク数カウンタ）
 - resolve_on_completion(): タスク完了時の後続タスク自動解放
 - unified_dependency_check(): parallel_detector / task_unblock 統一依存チェック
 """
 
 import logging
+import time
 from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
@@ -30,6 +32,17 @@ from utils.db import (
 
 logger = logging.getLogger(__name__)
 
+# 後続タスクを BLOCKED -> QUEUED に解放する先行タスクの状態（resolve_on_completion と同一基準）
+_RELEASE_STATUSES = frozenset(("COMPLETED",))
+
+# 後続タスクの起動を許可する先行タスクの状態（ParallelTaskDetector と同一基準）
+_LAUNCH_STATUSES = frozenset(("COMPLETED", "DONE"))
+
+# 残りパス長の計算で重み0として扱う終了状態
+_FINISHED_STATUSES = frozenset(
+    ("COMPLETED", "DONE", "REJECTED", "CANCELLED", "SKIPPED")
+)
+
 
 # ---------------------------------------------------------------------------
 # DependencyGraph
@@ -58,13 +71,16 @@ class DependencyGraph:
     # グラフ構築
     # ------------------------------------------------------------------
 
-    def build_graph(self, project_id: str, order_id: str) -> "DependencyGraph":
+    def build_graph(
+        self, project_id: str, order_id: str, conn=None
+    ) -> "DependencyGraph":
         """
         DBからタスク依存関係を読み込み、DAGを構築する。
 
         Args:
             project_id: プロジェクトID
             order_id: ORDER ID
+            conn: 既存のDB接続（省略時は新規接続を開いて閉じる）
 
         Returns:
             self (メソッドチェーン用)
@@ -72,7 +88,9 @@ class DependencyGraph:
         Raises:
             DatabaseError: DB読み込みエラー
         """
-        conn = get_connection()
+        own_conn = conn is None
+        if own_conn:
+            conn = get_connection()
         try:
             # 1. ORDER内の全タスクを取得
             tasks = fetch_all(
@@ -125,7 +143,44 @@ class DependencyGraph:
             return self
 
         finally:
-            close_connection(conn)
+            if own_conn:
+                close_connection(conn)
+
+    def add_task(self, task_id: str, status: str = "QUEUED") -> "DependencyGraph":
+        """
+        ノードを追加する（DBを経由しないグラフ構築用。シミュレータ・テストで使用）
+
+        Args:
+            task_id: タスクID
+            status: タスクステータス
+
+        Returns:
+            self (メソッドチェーン用)
+        """
+        self._nodes.add(task_id)
+        self._statuses[task_id] = status
+        self._successors.setdefault(task_id, set())
+        self._predecessors.setdefault(task_id, set())
+        return self
+
+    def add_dependency(self, task_id: str, depends_on: str) -> "DependencyGraph":
+        """
+        依存関係（depends_on → task_id）を追加する
+
+        Args:
+            task_id: 後続タスクID
+            depends_on: 先行タスクID
+
+        Returns:
+            self (メソッドチェーン用)
+        """
+        for node in (task_id, depends_on):
+            self._nodes.add(node)
+            self._successors.setdefault(node, set())
+            self._predecessors.setdefault(node, set())
+        self._successors[depends_on].add(task_id)
+        self._predecessors[task_id].add(depends_on)
+        return self
 
     # ------------------------------------------------------------------
     # トポロジカルソート
@@ -176,19 +231,27 @@ class DependencyGraph:
     # クリティカルパス
     # ------------------------------------------------------------------
 
-    def get_critical_path(self) -> List[str]:
+    def get_critical_path(
+        self, weights: Optional[Dict[str, float]] = None
+    ) -> List[str]:
         """
         最長依存チェーン（クリティカルパス）を計算する。
 
-        各タスクの重みを1（均等）として、DAG上の最長パスを求める。
+        weights 未指定時は各タスクの重みを1（均等）として、DAG上の最長パスを求める。
         トポロジカル順序でDPを行い、最長パスを逆追跡する。
 
+        Args:
+            weights: task_id -> 重み（予測所要秒数など）。指定時は重み付き最長パス
+
         Returns:
             クリティカルパスを構成するタスクIDのリスト（開始 -> 終了の順）
 
         Raises:
             ValueError: グラフに循環がある場合（topological_sort経由）
         """
+        if weights is not None:
+            return self._get_weighted_critical_path(weights)
+
         topo_order = self.topological_sort()
 
         if not topo_order:
@@ -222,6 +285,62 @@ class DependencyGraph:
         path.reverse()
         return path
 
+    def _get_weighted_critical_path(self, weights: Dict[str, float]) -> List[str]:
+        """重み付きクリティカルパス（残りパス長が最大のノードから貪欲に辿る）"""
+        remaining = self.get_remaining_path_lengths(weights)
+        if not remaining:
+            return []
+
+        # 先行タスクを持たないノードのうち残りパス長が最大のものから開始
+        roots = [n for n in self._nodes if not self._predecessors.get(n)]
+        current: Optional[str] = max(roots or self._nodes, key=lambda n: (remaining[n], n))
+
+        path: List[str] = []
+        while current is not None:
+            path.append(current)
+            successors = self._successors.get(current, set())
+            current = max(successors, key=lambda n: (remaining[n], n)) if successors else None
+        return path
+
+    def get_remaining_path_lengths(
+        self,
+        weights: Dict[str, float],
+        default_weight: float = 1.0,
+    ) -> Dict[str, float]:
+        """
+        各タスクからORDER完了までの最長重み付きパス長（bottom level）を計算する。
+
+        rank(n) = weight(n) + max(rank(s) for s in successors(n))
+        終了状態（COMPLETED / DONE など）のタスクは重み0として扱う。
+        並列起動時にこの値が大きいタスクから起動すると、
+        固定ワーカー数でのORDER全体の所要時間（makespan）が短くなる。
+
+        Args:
+            weights: task_id -> 重み（予測所要秒数）
+            default_weight: weights に含まれないタスクの重み
+
+        Returns:
+            task_id -> 残りパス長（自タスクの重みを含む）
+
+        Raises:
+            ValueError: グラフに循環がある場合（topological_sort経由）
+        """
+        topo_order = self.topological_sort()
+        remaining: Dict[str, float] = {}
+
+        for node in reversed(topo_order):
+            if self._statuses.get(node) in _FINISHED_STATUSES:
+                weight = 0.0
+            else:
+                weight = float(weights.get(node, default_weight))
+            tail = max(
+                (remaining[s] for s in self._successors.get(node, set())),
+                default=0.0,
+            )
+            remaining[node] = weight + tail
+
+        return remaining
+
     # ------------------------------------------------------------------
     # 実行可能タスク検出
     # ------------------------------------------------------------------
@@ -333,6 +452,277 @@ class DependencyGraph:
         return list(self._predecessors.get(task_id, set()))
 
 
+# ---------------------------------------------------------------------------
+# ResidentDependencyGraph
+# ---------------------------------------------------------------------------
+
+class ResidentDependencyGraph(DependencyGraph):
+    """
+    デーモンに常駐させるORDER単位の増分更新依存グラフ。
+
+    各ノードについて「未充足の先行タスク数」を2種類保持する。
+    - release カウンタ: COMPLETED でない先行タスク数（0 で BLOCKED -> QUEUED）
+    - launch カウンタ: COMPLETED / DONE でない先行タスク数（0 で起動可能）
+
+    タスク完了時は後続ノードのカウンタを O(出次数) で減らし、
+    0 になった BLOCKED ノードを1回の UPDATE ... WHERE id IN (...) で QUEUED 化する。
+    外部からの編集（依存追加、差し戻し、別プロセスでの承認）は
+    reconcile() で DB から再構築して取り込む。
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        order_id: str,
+        reconcile_interval: float = 60.0,
+    ) -> None:
+        super().__init__()
+        self.project_id = project_id
+        self.order_id = order_id
+        self.reconcile_interval = reconcile_interval
+        self._unmet_release: Dict[str, int] = {}
+        self._unmet_launch: Dict[str, int] = {}
+        self._last_reconciled: float = 0.0
+
+    # ------------------------------------------------------------------
+    # 構築・再同期
+    # ------------------------------------------------------------------
+
+    def load(self, conn=None) -> "ResidentDependencyGraph":
+        """
+        DBからグラフとカウンタを構築する（QUEUED化は行わない）。
+
+        Args:
+            conn: 既存のDB接続（省略時は新規接続を開いて閉じる）
+
+        Returns:
+            self (メソッドチェーン用)
+        """
+        own_conn = conn is None
+        if own_conn:
+            conn = get_connection()
+        try:
+            self._successors.clear()
+            self._predecessors.clear()
+            self._nodes.clear()
+            self._statuses.clear()
+            self.build_graph(self.project_id, self.order_id, conn)
+
+            # ORDER跨ぎ依存の先行タスクのステータスを補完
+            external = [n for n in self._nodes if n not in self._statuses]
+            if external:
+                placeholders = ",".join("?" * len(external))
+                rows = fetch_all(
+                    conn,
+                    f"SELECT id, status FROM tasks "
+                    f"WHERE project_id = ? AND id IN ({placeholders})",
+                    (self.project_id, *external),
+                )
+                for row in rows:
+                    self._statuses[row["id"]] = row["status"]
+
+            self._recount()
+            self._last_reconciled = time.monotonic()
+            return self
+        finally:
+            if own_conn:
+                close_connection(conn)
+
+    def _recount(self) -> None:
+        self._unmet_release = {}
+        self._unmet_launch = {}
+        for node in self._nodes:
+            # tasks に行がない先行タスク（孤立した依存）は resolve_on_completion の
+            # JOIN と同様に数えない
+            statuses = [
+                self._statuses[p] for p in self._predecessors.get(node, set())
+                if p in self._statuses
+            ]
+            self._unmet_release[node] = sum(1 for s in statuses if s not in _RELEASE_STATUSES)
+            self._unmet_launch[node] = sum(1 for s in statuses if s not in _LAUNCH_STATUSES)
+
+    def needs_reconcile(self) -> bool:
+        """前回の再同期から reconcile_interval 秒以上経過したか"""
+        return time.monotonic() - self._last_reconciled >= self.reconcile_interval
+
+    def reconcile(self, conn=None) -> List[str]:
+        """
+        DBから再構築して外部編集を取り込み、解放可能な BLOCKED タスクを QUEUED 化する。
+
+        Returns:
+            BLOCKED -> QUEUED に遷移したタスクIDのリスト
+        """
+        own_conn = conn is None
+        if own_conn:
+            conn = get_connection()
+        try:
+            self.load(conn)
+            ready = [
+                n for n in self._nodes
+                if self._statuses.get(n) == "BLOCKED"
+                and self._predecessors.get(n)
+                and self._unmet_release[n] == 0
+            ]
+            return self._release(conn, ready, trigger=None)
+        finally:
+            if own_conn:
+                close_connection(conn)
+
+    # ------------------------------------------------------------------
+    # 増分更新
+    # ------------------------------------------------------------------
+
+    def set_status(self, task_id: str, status: str) -> None:
+        """
+        ノードのステータスを更新し、後続ノードのカウンタを O(出次数) で調整する。
+        """
+        old = self._statuses.get(task_id)
+        self._statuses[task_id] = status
+        if old == status:
+            return
+
+        # ステータスのなかったノードは未充足として数えていない
+        release_delta = (old is None or old in _RELEASE_STATUSES) - (status in _RELEASE_STATUSES)
+        launch_delta = (old is None or old in _LAUNCH_STATUSES) - (status in _LAUNCH_STATUSES)
+        if not release_delta and not launch_delta:
+            return
+        for successor in self._successors.get(task_id, set()):
+            self._unmet_release[successor] += release_delta
+            self._unmet_launch[successor] += launch_delta
+
+    def on_task_completed(self, task_id: str, conn=None) -> List[str]:
+        """
+        TASK_COMPLETED / DEPENDENCY_RESOLVED イベントを反映する。
+
+        イベントは Worker 終了（DONE）時にも発火するため、対象タスクの現在の
+        ステータスを主キーで1件だけ読み直してからカウンタを更新する。
+        グラフにないタスク（外部で追加されたタスク）の場合は再同期する。
+
+        Args:
+            task_id: イベント対象のタスクID
+            conn: 既存のDB接続（省略時は新規接続を開いて閉じる）
+
+        Returns:
+            BLOCKED -> QUEUED に遷移したタスクIDのリスト
+        """
+        own_conn = conn is None
+        if own_conn:
+            conn = get_connection()
+        try:
+            if task_id not in self._nodes:
+                return self.reconcile(conn)
+
+            row = fetch_one(
+                conn,
+                "SELECT status FROM tasks WHERE id = ? AND project_id = ?",
+                (task_id, self.project_id),
+            )
+            if row is None:
+                return self.reconcile(conn)
+
+            self.set_status(task_id, row["status"])
+            if row["status"] not in _RELEASE_STATUSES:
+                return []
+
+            ready = [
+                s for s in self._successors.get(task_id, set())
+                if self._unmet_release[s] == 0 and self._statuses.get(s) == "BLOCKED"
+            ]
+            return self._release(conn, ready, trigger=task_id)
+        finally:
+            if own_conn:
+                close_connection(conn)
+
+    def _release(self, conn, task_ids: List[str], trigger: Optional[str]) -> List[str]:
+        """
+        BLOCKED -> QUEUED を1回の UPDATE でまとめて行い、change_history に記録する。
+
+        DB上で既に BLOCKED でなくなっているタスクは対象外（外部で遷移済み）。
+        """
+        if not task_ids:
+            return []
+
+        placeholders = ",".join("?" * len(task_ids))
+        rows = fetch_all(
+            conn,
+            f"""
+            SELECT id FROM tasks
+            WHERE project_id = ? AND status = 'BLOCKED' AND id IN ({placeholders})
+            """,
+            (self.project_id, *task_ids),
+        )
+        blocked = sorted(row["id"] for row in rows)
+        skipped = set(task_ids) - set(blocked)
+        if skipped:
+            # 外部で遷移済み: 次回の再同期で正しいステータスを取り込む
+            logger.debug(f"ResidentDependencyGraph: DB上で BLOCKED ではないため対象外: {sorted(skipped)}")
+        if not blocked:
+            return []
+
+        now = datetime.now().isoformat()
+        placeholders = ",".join("?" * len(blocked))
+        try:
+            execute_query(
+                conn,
+                f"""
+                UPDATE tasks
+                SET status = 'QUEUED', updated_at = ?
+                WHERE project_id = ? AND status = 'BLOCKED' AND id IN ({placeholders})
+                """,
+                (now, self.project_id, *blocked),
+            )
+            reason = (
+                f"依存タスク {trigger} のCOMPLETEDにより自動解放"
+                if trigger else "依存グラフ再同期により自動解放"
+            )
+            conn.executemany(
+                """
+                INSERT INTO change_history
+                    (entity_type, entity_id, field_name, old_value, new_value,
+                     changed_by, change_reason, changed_at, project_id)
+                VALUES ('task', ?, 'status', 'BLOCKED', 'QUEUED', ?, ?, ?, ?)
+                """,
+                [
+                    (task_id, "DependencyResolver", reason, now, self.project_id)
+                    for task_id in blocked
+                ],
+            )
+            conn.commit()
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
+
+        for task_id in blocked:
+            self._statuses[task_id] = "QUEUED"
+        logger.info(
+            f"ResidentDependencyGraph: {len(blocked)} 件のタスクを QUEUED化: {blocked}"
+            + (f" (トリガー: {trigger})" if trigger else " (再同期)")
+        )
+        return blocked
+
+    # ------------------------------------------------------------------
+    # 参照
+    # ------------------------------------------------------------------
+
+    def dependencies_satisfied(self, task_id: str) -> Optional[bool]:
+        """
+        起動判定用: 全先行タスクが COMPLETED / DONE か。
+
+        Returns:
+            グラフにないタスクの場合None（呼び出し側でDB判定にフォールバック）
+        """
+        if task_id not in self._unmet_launch:
+            return None
+        return self._unmet_launch[task_id] == 0
+
+    def unmet_count(self, task_id: str) -> int:
+        """未充足（COMPLETED でない）先行タスク数"""
+        return self._unmet_release.get(task_id, 0)
+
+
 # ---------------------------------------------------------------------------
 # resolve_on_completion
 # ---------------------------------------------------------------------------
@@ -20,6 +20,7 @@ Options:
     --review-model MODEL  レビュー用AIモデル（デフォルト: sonnet）
     --loop          タスク完了後に次のQUEUEDタスクを自動起動（連続実行モード）
     --max-tasks N   連続実行時の最大タスク数（デフォルト: 100）
+    --spans-file PATH  ステップ所要時間（span）をJSONで書き出す（Daemonのメトリクス集計用）
 
 Example:
     python backend/worker/execute_task.py AI_PM_PJ TASK_602
@@ -39,9 +40,11 @@ Example:
 """
 
 import argparse
+import importlib
 import json
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -79,6 +82,10 @@ try:
         safe_path_join, validate_path_components, PathValidationError
     )
     from config.db_config import get_project_paths, warn_if_production_db
+    from worker.prompt_context_cache import (
+        PromptContextCache, CACHE_FILENAME as PROMPT_CACHE_FILENAME,
+        get_bugs_version, is_racy,
+    )
 except ImportError as e:
     logger.error(f"内部モジュールのインポートに失敗: {e}")
     sys.exit(1)
@@ -91,26 +98,30 @@ except ImportError:
     CLAUDE_RUNNER_AVAILABLE = False
     logger.warning("claude_cli が利用できません。--skip-ai オプションのみ利用可能です。")
 
-# Auto Recovery Engine (ORDER_109)
-try:
-    from worker.auto_recovery import AutoRecoveryEngine
-    HAS_AUTO_RECOVERY = True
-except ImportError:
-    HAS_AUTO_RECOVERY = False
-
-# 権限プロファイル自動判定（ORDER_121）
-try:
-    from worker.permission_resolver import PermissionResolver
-    PERMISSION_RESOLVER_AVAILABLE = True
-except ImportError:
-    PERMISSION_RESOLVER_AVAILABLE = False
-
-# ドキュメント選択的参照（ORDER_057: docs_selector）
-try:
-    from project.docs_selector import select_docs
-    DOCS_SELECTOR_AVAILABLE = True
-except ImportError:
-    DOCS_SELECTOR_AVAILABLE = False
+# 任意依存モジュール（起動時間短縮のため使用箇所で遅延インポートする）
+#   - worker.auto_recovery.AutoRecoveryEngine (ORDER_109): 失敗時の自己修復でのみ使用。
+#     rollback / snapshot_manager を連鎖インポートするため起動コストが大きい
+#   - worker.permission_resolver.PermissionResolver (ORDER_121): 権限プロファイル自動判定
+#   - project.docs_selector (ORDER_057): ドキュメント選択的参照
+#   - interaction.detect.StreamingQuestionDetector: 実行中のAskUserQuestion検知
+def _optional_import(module_name: str, attr: Optional[str] = None) -> Optional[Any]:
+    """
+    任意依存モジュール（またはその属性）を遅延インポートして返す
+
+    Args:
+        module_name: モジュール名（例: "worker.auto_recovery"）
+        attr: 取得する属性名（Noneの場合はモジュール自体を返す）
+
+    Returns:
+        属性オブジェクトまたはモジュール（モジュールが利用できない場合はNone）
+    """
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    if attr is None:
+        return module
+    return getattr(module, attr, None)
 
 
 class WorkerExecutionError(Exception):
@@ -118,6 +129,11 @@ class WorkerExecutionError(Exception):
     pass
 
 
+class WorkerWaitingInput(Exception):  # noqa: N818 (control-flow signal, not an error)
+    """実行中にAIの質問を検知し、タスクをWAITING_INPUTへ移行した（失敗ではない）"""
+    pass
+
+
 # Worker実行時のデフォルト許可ツール
 # claude -p の --allowedTools に渡される
 DEFAULT_WORKER_ALLOWED_TOOLS = [
@@ -164,9 +180,11 @@ class WorkerExecutor:
         self.rework_comment = rework_comment
         # 権限プロファイル自動判定フラグ: allowed_toolsが未指定の場合、
         # _step_get_task_info()完了後にタスク情報からプロファイルを自動判定する
-        self._needs_profile_resolution = (allowed_tools is None) and PERMISSION_RESOLVER_AVAILABLE
+        self._needs_profile_resolution = allowed_tools is None
         self.allowed_tools = allowed_tools if allowed_tools is not None else DEFAULT_WORKER_ALLOWED_TOOLS.copy()
         self._resolved_profile: Optional[str] = None
+        # プロンプト共通セクションのプロジェクト単位キャッシュ（_build_execution_prompt で使用）
+        self._prompt_cache: Optional[PromptContextCache] = None
 
         # プロジェクトパス（USER_DATA_PATH経由）
         self.project_dir = get_project_paths(project_id)["base"]
@@ -179,6 +197,7 @@ class WorkerExecutor:
             "task_id": self.task_id,
             "project_id": project_id,
             "steps": [],
+            "step_spans": [],
             "success": False,
             "error": None,
             "is_rework": is_rework,
@@ -198,6 +217,9 @@ class WorkerExecutor:
         # ファイルスナップショットID (ORDER_109)
         self.snapshot_id: Optional[str] = None
 
+        # 計測中のステップ開始時刻 {step: time.monotonic()}
+        self._step_started: Dict[str, float] = {}
+
     def _get_dev_workspace_path(self) -> Optional[str]:
         """DBからプロジェクトのdev_workspace_pathを取得"""
         try:
@@ -222,13 +244,27 @@ class WorkerExecutor:
             return None
 
     def _log_step(self, step: str, status: str, detail: str = "") -> None:
-        """ステップログを記録"""
+        """
+        ステップログを記録
+
+        status="start" で計測を開始し、同じステップの次の記録（success / error 等）で
+        所要時間を duration_ms として付与、results["step_spans"] に span を追加する。
+        """
+        now = time.monotonic()
         entry = {
             "step": step,
             "status": status,
             "detail": detail,
             "timestamp": datetime.now().isoformat(),
         }
+        if status == "start":
+            self._step_started[step] = now
+        elif step in self._step_started:
+            duration_ms = round((now - self._step_started.pop(step)) * 1000, 1)
+            entry["duration_ms"] = duration_ms
+            self.results["step_spans"].append(
+                {"step": step, "status": status, "duration_ms": duration_ms}
+            )
         self.results["steps"].append(entry)
         if self.verbose:
             logger.info(f"[{step}] {status}: {detail}")
@@ -314,6 +350,12 @@ class WorkerExecutor:
             self.results["success"] = True
             self._log_step("complete", "success", "Worker処理完了")
 
+        except WorkerWaitingInput as e:
+            # ユーザー回答待ち: ロールバック・REWORKは行わず、回答後の再開を待つ
+            self.results["success"] = True
+            self.results["waiting_input"] = True
+            self._log_step("waiting_input", "info", str(e))
+            self._release_locks_on_error()
         except WorkerExecutionError as e:
             self.results["error"] = str(e)
             self._log_step("error", "failed", str(e))
@@ -361,8 +403,8 @@ class WorkerExecutor:
         4. Update task status (REWORK if retryable, REJECTED if limit exceeded)
 
         ORDER_109: AutoRecoveryEngine統合
-        - HAS_AUTO_RECOVERY=True: AutoRecoveryEngine経由でエラー分析→戦略決定→リカバリ
-        - HAS_AUTO_RECOVERY=False: 従来ロジック（フォールバック）
+        - AutoRecoveryEngine利用可: AutoRecoveryEngine経由でエラー分析→戦略決定→リカバリ
+        - AutoRecoveryEngine利用不可: 従来ロジック（フォールバック）
 
         Args:
             error: The exception that caused the failure
@@ -370,10 +412,11 @@ class WorkerExecutor:
         self._log_step("self_healing", "start", f"Handling execution failure: {error}")
 
         # --- ORDER_109: AutoRecoveryEngine統合 ---
-        if HAS_AUTO_RECOVERY:
+        auto_recovery_cls = _optional_import("worker.auto_recovery", "AutoRecoveryEngine")
+        if auto_recovery_cls is not None:
             try:
                 # db_path: AutoRecoveryEngine側でデフォルト解決するためNone渡し
-                recovery_engine = AutoRecoveryEngine(
+                recovery_engine = auto_recovery_cls(
                     db_path=None,
                     project_id=self.project_id,
                 )
@@ -646,9 +689,13 @@ class WorkerExecutor:
             conn.close()
 
         # 権限プロファイル自動判定（allowed_toolsが未指定の場合のみ）
-        if self._needs_profile_resolution and self.task_info:
+        permission_resolver_cls = (
+            _optional_import("worker.permission_resolver", "PermissionResolver")
+            if self._needs_profile_resolution and self.task_info else None
+        )
+        if permission_resolver_cls is not None:
             try:
-                resolver = PermissionResolver()
+                resolver = permission_resolver_cls()
                 self._resolved_profile = resolver.resolve(self.task_info)
                 resolved_tools = resolver.resolve_tools(self.task_info)
                 self.allowed_tools = resolved_tools
@@ -974,8 +1021,17 @@ class WorkerExecutor:
         # プロンプト構築
         prompt = self._build_execution_prompt(task_content)
 
-        # claude -p 実行
-        result = self.runner.run(prompt)
+        # claude -p 実行（実行中の出力から AskUserQuestion を検知）
+        stream_detector_cls = _optional_import("interaction.detect", "StreamingQuestionDetector")
+        if stream_detector_cls is not None:
+            question_stream = stream_detector_cls()
+            result = self.runner.run(prompt, on_output=question_stream.feed)
+        else:
+            question_stream = None
+            result = self.runner.run(prompt)
+
+        if result.interrupted and question_stream is not None and question_stream.early_result:
+            self._pause_for_input(question_stream.early_result)
 
         if not result.success:
             raise WorkerExecutionError(f"タスク実行に失敗: {result.error_message}")
@@ -989,6 +1045,31 @@ class WorkerExecutor:
             f"cost=${result.cost_usd:.4f}" if result.cost_usd else ""
         )
 
+    def _pause_for_input(self, detection: Any) -> None:
+        """
+        実行中に検知した質問で Interaction を作成し、タスクを WAITING_INPUT にする
+
+        Raises:
+            WorkerWaitingInput: 移行に成功した場合（以降のステップを中断）
+            WorkerExecutionError: Interaction 作成に失敗した場合
+        """
+        from interaction.detect import QuestionDetector
+
+        detector = QuestionDetector(self.project_id, self.task_id)
+        processed = detector.process_detection(detection)
+        if not processed.success:
+            raise WorkerExecutionError(f"質問検知後のInteraction作成に失敗: {processed.error}")
+
+        self.results["interaction_id"] = processed.interaction_id
+        self._log_step(
+            "execute_task",
+            "waiting_input",
+            f"interaction={processed.interaction_id}, question={detection.question_text[:50]}",
+        )
+        raise WorkerWaitingInput(
+            f"AIの質問を検知しWAITING_INPUTへ移行: {processed.interaction_id}"
+        )
+
     def _step_self_verification(self) -> None:
         """Step 3.5: 成果物の自己検証＋自己修正ループ
 
@@ -1192,65 +1273,94 @@ class WorkerExecutor:
             logger.warning(f"REWORK履歴取得に失敗: {e}")
             return (0, "")
 
+    def _get_prompt_cache(self) -> PromptContextCache:
+        """プロジェクト単位のプロンプトキャッシュを取得（初回のみ読み込み）"""
+        if self._prompt_cache is None:
+            self._prompt_cache = PromptContextCache.load(self.project_dir / PROMPT_CACHE_FILENAME)
+        return self._prompt_cache
+
+    def _flush_prompt_cache(self) -> None:
+        """プロンプトキャッシュのhit/missをログに記録し、変更があれば保存"""
+        if self._prompt_cache is None:
+            return
+        self._log_step("prompt_context", "success", self._prompt_cache.summary())
+        self._prompt_cache.save()
+        self._prompt_cache.events.clear()
+
     def _get_known_bugs(self) -> str:
-        """既知のバグパターンをDBから取得してフォーマット"""
+        """
+        既知のバグパターンをDBから取得してフォーマット
+
+        レンダリング結果は bugs テーブルのバージョンをキーにプロジェクト単位で
+        キャッシュする。注入記録（有効性評価用）はタスクごとに行う。
+        """
         try:
             conn = get_connection()
             try:
-                # プロジェクト固有 + 汎用パターンを取得（ACTIVEのみ）
-                bugs = fetch_all(
-                    conn,
-                    """
-                    SELECT id, title, description, pattern_type, severity, solution,
-                           effectiveness_score
-                    FROM bugs
-                    WHERE (project_id = ? OR project_id IS NULL)
-                      AND status = 'ACTIVE'
-                    ORDER BY
-                        severity DESC,
-                        occurrence_count DESC
-                    """,
-                    (self.project_id,)
+                bugs_version = get_bugs_version(conn)
+                rendered = self._get_prompt_cache().get(
+                    "known_bugs",
+                    {"bugs_version": bugs_version} if bugs_version is not None else None,
+                    lambda: self._render_known_bugs(conn),
                 )
+            finally:
+                conn.close()
 
-                if not bugs:
-                    return ""
+            if rendered["bug_ids"]:
+                self._record_bug_injections(rendered["bug_ids"])
+            return rendered["text"]
 
-                bugs_list = rows_to_dicts(bugs)
+        except Exception as e:
+            logger.warning(f"既知バグ取得に失敗: {e}")
+            return ""
 
-                # バグパターン注入を記録（有効性評価用）
-                try:
-                    from quality.bug_learner import EffectivenessEvaluator
-                    evaluator = EffectivenessEvaluator(self.project_id)
-                    for bug in bugs_list:
-                        try:
-                            evaluator.record_injection(bug["id"])
-                        except Exception:
-                            pass  # 個別の記録失敗は無視
-                except ImportError:
-                    pass  # quality.bug_learner 利用不可時は記録をスキップ
-                except Exception:
-                    pass  # 記録失敗は元の動作に影響させない
+    def _render_known_bugs(self, conn) -> Dict[str, Any]:
+        """
+        既知バグパターンセクションを構築
 
-                # バグパターンをフォーマット
-                bug_entries = []
-                for bug in bugs_list:
-                    scope = "汎用" if bug.get("project_id") is None else "固有"
-                    pattern_label = f" [{bug['pattern_type']}]" if bug.get("pattern_type") else ""
-                    eff_score = bug.get("effectiveness_score")
-                    eff_label = f" [有効性: {eff_score:.2f}]" if eff_score is not None else ""
+        Returns:
+            {"text": セクション文字列, "bug_ids": 注入対象のバグIDリスト}
+        """
+        # プロジェクト固有 + 汎用パターンを取得（ACTIVEのみ）
+        bugs = fetch_all(
+            conn,
+            """
+            SELECT id, title, description, pattern_type, severity, solution,
+                   effectiveness_score
+            FROM bugs
+            WHERE (project_id = ? OR project_id IS NULL)
+              AND status = 'ACTIVE'
+            ORDER BY
+                severity DESC,
+                occurrence_count DESC
+            """,
+            (self.project_id,)
+        )
 
-                    entry = f"""### {bug['id']}{pattern_label} - {bug['title']} ({scope}, {bug['severity']}){eff_label}
+        if not bugs:
+            return {"text": "", "bug_ids": []}
+
+        bugs_list = rows_to_dicts(bugs)
+
+        # バグパターンをフォーマット
+        bug_entries = []
+        for bug in bugs_list:
+            scope = "汎用" if bug.get("project_id") is None else "固有"
+            pattern_label = f" [{bug['pattern_type']}]" if bug.get("pattern_type") else ""
+            eff_score = bug.get("effectiveness_score")
+            eff_label = f" [有効性: {eff_score:.2f}]" if eff_score is not None else ""
+
+            entry = f"""### {bug['id']}{pattern_label} - {bug['title']} ({scope}, {bug['severity']}){eff_label}
 {bug['description']}"""
 
-                    if bug.get("solution"):
-                        entry += f"\n**解決策**: {bug['solution']}"
+            if bug.get("solution"):
+                entry += f"\n**解決策**: {bug['solution']}"
 
-                    bug_entries.append(entry)
+            bug_entries.append(entry)
 
-                bug_section = "\n\n".join(bug_entries)
+        bug_section = "\n\n".join(bug_entries)
 
-                return f"""
+        text = f"""
 ## ⚠️ 既知バグパターン（必読）
 
 このプロジェクトおよびフレームワーク全体で過去に発生したバグパターンです。
@@ -1259,12 +1369,22 @@ class WorkerExecutor:
 {bug_section}
 
 """
-            finally:
-                conn.close()
+        return {"text": text, "bug_ids": [bug["id"] for bug in bugs_list]}
 
-        except Exception as e:
-            logger.warning(f"既知バグ取得に失敗: {e}")
-            return ""
+    def _record_bug_injections(self, bug_ids: list) -> None:
+        """バグパターン注入を記録（有効性評価用）"""
+        try:
+            from quality.bug_learner import EffectivenessEvaluator
+            evaluator = EffectivenessEvaluator(self.project_id)
+            for bug_id in bug_ids:
+                try:
+                    evaluator.record_injection(bug_id)
+                except Exception:
+                    pass  # 個別の記録失敗は無視
+        except ImportError:
+            pass  # quality.bug_learner 利用不可時は記録をスキップ
+        except Exception:
+            pass  # 記録失敗は元の動作に影響させない
 
     def _get_project_docs_section(self) -> str:
         """
@@ -1277,7 +1397,8 @@ class WorkerExecutor:
         Returns:
             ドキュメントセクション文字列（空文字列の場合はスキップ）
         """
-        if not DOCS_SELECTOR_AVAILABLE:
+        docs_selector = _optional_import("project.docs_selector")
+        if docs_selector is None:
             return ""
 
         if not self.task_info:
@@ -1287,10 +1408,23 @@ class WorkerExecutor:
             task_title = self.task_info.get("title", "")
             task_description = self.task_info.get("description", "")
 
-            docs = select_docs(
+            # docs/ の内容はプロジェクト単位でキャッシュし、選択のみタスクごとに行う
+            docs_path = get_project_paths(self.project_id)["docs"]
+            fingerprint = docs_selector.docs_fingerprint(docs_path)
+            doc_contents = None
+            if fingerprint is not None:
+                doc_contents = self._get_prompt_cache().get(
+                    "docs",
+                    fingerprint,
+                    lambda: docs_selector.load_doc_contents(docs_path),
+                    cacheable=not is_racy(fingerprint),
+                )
+
+            docs = docs_selector.select_docs(
                 project_id=self.project_id,
                 task_title=task_title,
                 task_description=task_description,
+                doc_contents=doc_contents,
             )
 
             if not docs:
@@ -1645,6 +1779,9 @@ output_file = "tmp/tmp_results.json"
         # プロジェクトドキュメント選択的参照（ORDER_057）
         project_docs_section = self._get_project_docs_section()
 
+        # 共通セクションのキャッシュ利用状況を記録・保存
+        self._flush_prompt_cache()
+
         mode_label = "【リワーク】" if self.is_rework else ""
 
         # REWORK回数に応じた警告メッセージ
@@ -2659,6 +2796,17 @@ JSONのみを出力し、説明文は含めないでください。"""
                 logger.exception("check_successors詳細エラー")
 
 
+def _write_step_spans(path: str, results: Dict[str, Any]) -> None:
+    """ステップ span を Daemon 用のファイルへ書き出す（失敗してもWorker結果には影響させない）"""
+    write_step_spans = _optional_import("worker.daemon_metrics", "write_step_spans")
+    if write_step_spans is None:
+        return
+    try:
+        write_step_spans(path, results["task_id"], results.get("step_spans", []))
+    except OSError as e:
+        logger.debug(f"step span書き出し失敗: {e}")
+
+
 def main():
     """CLI エントリーポイント"""
     # Windows環境でのUTF-8出力設定
@@ -2693,6 +2841,8 @@ def main():
     parser.add_argument("--max-workers", type=int, default=5, help="並列起動時の最大Worker数（デフォルト: 5）")
     parser.add_argument("--allowed-tools", type=str, default=None,
                         help="カンマ区切りの許可ツールリスト（例: Read,Write,Bash）。未指定時はデフォルト権限を使用")
+    parser.add_argument("--spans-file", default=None,
+                        help="ステップ所要時間（span）の書き出し先JSON（Daemonが指定）")
 
     args = parser.parse_args()
 
@@ -2807,13 +2957,19 @@ def main():
         results = executor.execute()
         all_results.append(results)
 
+        if args.spans_file:
+            _write_step_spans(args.spans_file, results)
+
         # 出力
         if args.json:
             # 大きなコンテンツは除外
             output = {k: v for k, v in results.items() if k not in ("execution_result",)}
             print(json.dumps(output, ensure_ascii=False, indent=2, default=str))
         else:
-            if results["success"]:
+            if results.get("waiting_input"):
+                print(f"【回答待ち】{results['task_id']} はユーザーの回答待ち（WAITING_INPUT）です")
+                print(f"  Interaction ID: {results.get('interaction_id')}")
+            elif results["success"]:
                 print(f"【Worker処理完了】{results['task_id']} ({executed_count}/{args.max_tasks if args.loop else 1})")
                 print(f"  プロジェクト: {results['project_id']}")
                 print(f"  Worker: {results.get('worker_id', 'Auto')}")
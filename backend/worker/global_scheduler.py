@@ -0,0 +1,1018 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Global Multi-ORDER Scheduler
+
+Single resident scheduler that manages every active (IN_PROGRESS) ORDER
+across all projects, replacing one ``parallel_launcher --daemon`` per ORDER.
+
+- One consolidated DB poll per cycle (task status counts for all active ORDERs)
+- One resource sample and one lease renewal (``daemons`` table) per cycle
+- A global worker slot pool with per-project and per-priority quotas
+  (``WorkerPriorityConfig.get_max_workers_for_priority``)
+- Fair slot distribution across ORDERs (ORDER priority first, then the ORDER
+  with the fewest running workers, then the least recently served)
+
+Per-ORDER worker lifecycle (launch, reap, health checks, review workers,
+REWORK handling) is delegated to ``ParallelWorkerLauncher`` instances that
+are driven by this scheduler instead of their own ``daemon_loop``.
+
+Usage:
+    python backend/worker/global_scheduler.py [options]
+
+Options:
+    --project ID                 Only manage ORDERs of this project (repeatable)
+    --max-workers N              Global worker slot count (default: worker config)
+    --max-workers-per-project N  Per-project quota (default: no limit)
+    --max-p0-workers N ...       Per-priority quotas (P0..P3, default: no limit)
+    --poll-interval SEC          Poll interval in seconds (default: 10)
+    --exit-when-idle             Exit when no active ORDER and no running worker remain
+    --warm-pool-size N           Pre-imported idle worker processes (0 = cold spawn only)
+    --metrics-port N             Serve metrics on http://127.0.0.1:N/metrics (0 = any free port)
+    --dry-run                    Print one allocation plan and exit
+    --json                       JSON output format
+
+Example:
+    python backend/worker/global_scheduler.py
+    python backend/worker/global_scheduler.py --max-workers 6 --max-workers-per-project 3
+    python backend/worker/global_scheduler.py --project ai_pm_manager --dry-run --json
+"""
+
+import argparse
+import dataclasses
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Add parent directory to path
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils.db import get_connection, fetch_all, DatabaseError
+from config.worker_config import (
+    get_worker_config,
+    get_priority_config,
+    WorkerResourceConfig,
+    WorkerPriorityConfig,
+)
+from config.db_config import USER_DATA_PATH
+from worker.parallel_detector import ParallelTaskDetector
+from worker.parallel_launcher import (
+    ParallelWorkerLauncher,
+    find_orphaned_done_tasks,
+    summarize_latencies,
+)
+from worker.resource_monitor import ResourceMonitor
+
+# Optional imports for event-driven operation (TASK_1090)
+try:
+    from worker.event_notifier import AdaptivePoller
+    _HAS_EVENT_NOTIFIER = True
+except ImportError:
+    _HAS_EVENT_NOTIFIER = False
+
+try:
+    from worker.child_watcher import ChildExitWatcher
+    _HAS_CHILD_WATCHER = True
+except ImportError:
+    _HAS_CHILD_WATCHER = False
+
+try:
+    from worker.warm_pool import WarmWorkerPool
+    _HAS_WARM_POOL = True
+except ImportError:
+    _HAS_WARM_POOL = False
+
+try:
+    from worker.daemon_metrics import DaemonMetrics, MetricsServer
+    _HAS_DAEMON_METRICS = True
+except ImportError:
+    _HAS_DAEMON_METRICS = False
+
+try:
+    from worker.daemon_registry import (
+        DAEMON_LEASE_SECONDS,
+        KIND_ORDER,
+        KIND_SCHEDULER,
+        DaemonLease,
+        live_daemons,
+        reclaim_stale,
+    )
+    _HAS_DAEMON_REGISTRY = True
+except ImportError:
+    _HAS_DAEMON_REGISTRY = False
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_RANK = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+
+# Non-terminal task statuses (same definition as ParallelWorkerLauncher._is_order_complete)
+NON_TERMINAL_STATUSES = ("QUEUED", "BLOCKED", "IN_PROGRESS", "DONE", "REWORK", "ESCALATED")
+
+OrderKey = Tuple[str, str]  # (project_id, order_id)
+
+
+def _priority_rank(priority: Optional[str]) -> int:
+    return PRIORITY_RANK.get(priority or "P1", 1)
+
+
+def poll_active_orders(project_ids: Optional[Iterable[str]] = None) -> Dict[OrderKey, Dict[str, Any]]:
+    """
+    Consolidated poll: task status counts for every active ORDER in one query.
+
+    Args:
+        project_ids: Restrict to these projects (None = all projects)
+
+    Returns:
+        {(project_id, order_id): {"order_priority", "order_status", "counts": {status: n}}}
+    """
+    params: List[Any] = []
+    project_filter = ""
+    if project_ids:
+        project_ids = list(project_ids)
+        project_filter = f"AND o.project_id IN ({','.join('?' * len(project_ids))})"
+        params.extend(project_ids)
+
+    conn = get_connection()
+    try:
+        rows = fetch_all(
+            conn,
+            f"""
+            SELECT o.project_id, o.id AS order_id, o.priority AS order_priority,
+                   o.status AS order_status, o.sort_order,
+                   t.status AS task_status, COUNT(t.id) AS count
+            FROM orders o
+            LEFT JOIN tasks t ON t.order_id = o.id AND t.project_id = o.project_id
+            WHERE o.status = 'IN_PROGRESS'
+              {project_filter}
+            GROUP BY o.project_id, o.id, t.status
+            """,
+            tuple(params),
+        )
+    finally:
+        conn.close()
+
+    orders: Dict[OrderKey, Dict[str, Any]] = {}
+    for row in rows:
+        key = (row["project_id"], row["order_id"])
+        entry = orders.setdefault(key, {
+            "order_priority": row["order_priority"] or "P1",
+            "order_status": row["order_status"],
+            "sort_order": row["sort_order"] if row["sort_order"] is not None else 999,
+            "counts": {},
+        })
+        if row["task_status"] is not None:
+            entry["counts"][row["task_status"]] = row["count"]
+    return orders
+
+
+def is_order_settled(counts: Dict[str, int]) -> bool:
+    """True if every task of the ORDER has reached a terminal state."""
+    return sum(counts.get(status, 0) for status in NON_TERMINAL_STATUSES) == 0
+
+
+class SlotPool:
+    """
+    Global worker slot pool with per-project and per-priority quotas.
+
+    ``allocate`` distributes free slots over ORDER candidate lists one task per
+    ORDER per round (round-robin), visiting ORDERs by
+    (ORDER priority, running workers of the ORDER, last time served) so that
+    no ORDER is starved while others hold many slots.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        per_project_max: Optional[int] = None,
+        priority_config: Optional[WorkerPriorityConfig] = None,
+    ):
+        self.max_workers = max_workers
+        self.per_project_max = per_project_max
+        self.priority_config = priority_config or WorkerPriorityConfig()
+        self._last_served: Dict[OrderKey, float] = {}
+        self._serve_seq = 0.0
+
+    def allocate(
+        self,
+        running: Dict[OrderKey, List[str]],
+        candidates: Dict[OrderKey, List[Dict[str, Any]]],
+        order_priorities: Optional[Dict[OrderKey, str]] = None,
+        capacity: Optional[int] = None,
+    ) -> Dict[OrderKey, List[Dict[str, Any]]]:
+        """
+        Decide which candidate tasks to launch.
+
+        Args:
+            running: {order_key: [task priority of each running worker]}
+            candidates: {order_key: launchable tasks in launch order}
+            order_priorities: {order_key: ORDER priority} (default P1)
+            capacity: Current global capacity (e.g. resource-adjusted);
+                      defaults to ``max_workers``
+
+        Returns:
+            {order_key: [tasks to launch]} (ORDERs without allocation omitted)
+        """
+        order_priorities = order_priorities or {}
+        capacity = self.max_workers if capacity is None else min(capacity, self.max_workers)
+
+        total_running = sum(len(p) for p in running.values())
+        free = capacity - total_running
+        if free <= 0:
+            return {}
+
+        per_order = {key: len(p) for key, p in running.items()}
+        per_project: Dict[str, int] = {}
+        per_priority: Dict[str, int] = {}
+        for (project_id, _), priorities in running.items():
+            per_project[project_id] = per_project.get(project_id, 0) + len(priorities)
+            for priority in priorities:
+                per_priority[priority] = per_priority.get(priority, 0) + 1
+
+        queues = {key: list(tasks) for key, tasks in candidates.items() if tasks}
+        allocation: Dict[OrderKey, List[Dict[str, Any]]] = {}
+
+        while free > 0 and queues:
+            progressed = False
+            visit = sorted(
+                queues,
+                key=lambda k: (
+                    _priority_rank(order_priorities.get(k)),
+                    per_order.get(k, 0),
+                    self._last_served.get(k, 0.0),
+                    k,
+                ),
+            )
+            for key in visit:
+                if free <= 0:
+                    break
+                project_id = key[0]
+                if self.per_project_max is not None and per_project.get(project_id, 0) >= self.per_project_max:
+                    del queues[key]
+                    continue
+
+                task = self._pop_admissible(queues[key], per_priority)
+                if task is None:
+                    del queues[key]
+                    continue
+                if not queues[key]:
+                    del queues[key]
+
+                priority = task.get("priority") or "P1"
+                allocation.setdefault(key, []).append(task)
+                per_order[key] = per_order.get(key, 0) + 1
+                per_project[project_id] = per_project.get(project_id, 0) + 1
+                per_priority[priority] = per_priority.get(priority, 0) + 1
+                self._serve_seq += 1
+                self._last_served[key] = self._serve_seq
+                free -= 1
+                progressed = True
+            if not progressed:
+                break
+
+        return allocation
+
+    def _pop_admissible(
+        self,
+        queue: List[Dict[str, Any]],
+        per_priority: Dict[str, int],
+    ) -> Optional[Dict[str, Any]]:
+        """Pop the first task whose priority quota still has room."""
+        for idx, task in enumerate(queue):
+            priority = task.get("priority") or "P1"
+            limit = self.priority_config.get_max_workers_for_priority(priority)
+            if limit is None or per_priority.get(priority, 0) < limit:
+                return queue.pop(idx)
+        queue.clear()
+        return None
+
+    def forget(self, key: OrderKey) -> None:
+        """Drop fairness state of a retired ORDER."""
+        self._last_served.pop(key, None)
+
+
+class GlobalScheduler:
+    """Resident scheduler for all active ORDERs across projects"""
+
+    def __init__(
+        self,
+        *,
+        project_ids: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        per_project_max: Optional[int] = None,
+        worker_config: Optional[WorkerResourceConfig] = None,
+        priority_config: Optional[WorkerPriorityConfig] = None,
+        poll_interval: int = 10,
+        exit_when_idle: bool = False,
+        verbose: bool = False,
+        timeout: int = 1800,
+        model: Optional[str] = None,
+        no_review: bool = False,
+        stale_log_timeout: int = 600,
+        worker_process_timeout: int = 1800,
+        allowed_tools: Optional[List[str]] = None,
+        escalated_timeout: int = 300,
+    ):
+        self.project_ids = project_ids
+        self.worker_config = worker_config or get_worker_config()
+        self.priority_config = priority_config or get_priority_config()
+        self.poll_interval = poll_interval
+        self.exit_when_idle = exit_when_idle
+        self.escalated_timeout = escalated_timeout
+
+        limit = self.worker_config.max_concurrent_workers
+        if max_workers is not None and max_workers > limit:
+            logger.warning(
+                f"Requested max_workers ({max_workers}) exceeds config limit ({limit}). Using config limit."
+            )
+        self.max_workers = min(max_workers, limit) if max_workers is not None else limit
+
+        self.slot_pool = SlotPool(
+            self.max_workers,
+            per_project_max=per_project_max,
+            priority_config=self.priority_config,
+        )
+
+        # One resource monitor for the whole scheduler; per-ORDER launchers do not sample
+        self.resource_monitor = ResourceMonitor(
+            max_cpu_percent=self.worker_config.max_cpu_percent,
+            max_memory_percent=self.worker_config.max_memory_percent,
+        ) if self.worker_config.enable_resource_monitoring else None
+
+        self._launcher_kwargs = {
+            "max_workers": self.max_workers,
+            "verbose": verbose,
+            "timeout": timeout,
+            "model": model,
+            "no_review": no_review,
+            "worker_config": dataclasses.replace(self.worker_config, enable_resource_monitoring=False),
+            "poll_interval": poll_interval,
+            "stale_log_timeout": stale_log_timeout,
+            "worker_process_timeout": worker_process_timeout,
+            "allowed_tools": allowed_tools,
+        }
+
+        # {(project_id, order_id): ParallelWorkerLauncher}
+        self._orders: Dict[OrderKey, ParallelWorkerLauncher] = {}
+        self._order_info: Dict[OrderKey, Dict[str, Any]] = {}
+        self._adaptive_poller: Optional[Any] = None
+        # One child watcher shared by every ORDER's launcher (created in run())
+        self._child_watcher: Optional[Any] = None
+        # One warm worker pool shared by every ORDER's launcher (created in run())
+        self._warm_pool: Optional[Any] = None
+        # One metrics registry shared by every ORDER's launcher (created in run())
+        self._metrics: Optional[Any] = None
+        self._metrics_url: Optional[str] = None
+        # Lease on the scheduler's daemons row (acquired in run())
+        self._lease: Optional[Any] = None
+        # ORDERs run by live per-ORDER daemons, refreshed once per poll
+        self._external_orders: set = set()
+        self._shutdown_requested = False
+
+        self.results: Dict[str, Any] = {
+            "max_workers": self.max_workers,
+            "per_project_max": per_project_max,
+            "launched_count": 0,
+            "launched_tasks": [],
+            "failed_tasks": [],
+            "completed_orders": [],
+            "worker_exit_latency": [],
+            "worker_launch_latency": [],
+            "errors": [],
+            "start_time": datetime.now().isoformat(),
+        }
+
+    # ------------------------------------------------------------------
+    # ORDER contexts
+    # ------------------------------------------------------------------
+
+    def _get_order(self, key: OrderKey) -> ParallelWorkerLauncher:
+        """Return (creating on first use) the launcher that owns an ORDER's workers."""
+        launcher = self._orders.get(key)
+        if launcher is None:
+            project_id, order_id = key
+            launcher = ParallelWorkerLauncher(project_id, order_id, **self._launcher_kwargs)
+            launcher.escalated_timeout = self.escalated_timeout
+            launcher.init_daemon_state()
+            self._attach_shared(launcher)
+            self._orders[key] = launcher
+            logger.info(f"[scheduler] Managing {project_id}/{order_id}")
+        return launcher
+
+    def _attach_shared(self, launcher: ParallelWorkerLauncher) -> None:
+        """Hand the scheduler-wide watcher, warm pool and metrics to a launcher."""
+        launcher.attach_shared(
+            child_watcher=self._child_watcher,
+            warm_pool=self._warm_pool,
+            metrics=self._metrics,
+        )
+
+    def _retire_order(self, key: OrderKey) -> None:
+        launcher = self._orders.pop(key, None)
+        self._order_info.pop(key, None)
+        self.slot_pool.forget(key)
+        if self._metrics is not None:
+            self._metrics.forget_order(*key)
+        if launcher is None:
+            return
+        launcher.release()
+        self._merge_results(launcher)
+        self.results["completed_orders"].append(f"{key[0]}/{key[1]}")
+        logger.info(f"[scheduler] Released {key[0]}/{key[1]}")
+
+    def _merge_results(self, launcher: ParallelWorkerLauncher) -> None:
+        for task in launcher.results["launched_tasks"]:
+            self.results["launched_tasks"].append(dict(task, project_id=launcher.project_id, order_id=launcher.order_id))
+        for task in launcher.results["failed_tasks"]:
+            self.results["failed_tasks"].append(dict(task, project_id=launcher.project_id, order_id=launcher.order_id))
+        self.results["launched_count"] += launcher.results["launched_count"]
+        self.results["errors"].extend(launcher.results["errors"])
+        for name in ("worker_exit_latency", "worker_launch_latency"):
+            for entry in launcher.results.pop(name, []):
+                self.results[name].append(dict(entry, project_id=launcher.project_id, order_id=launcher.order_id))
+        launcher.results["launched_tasks"] = []
+        launcher.results["failed_tasks"] = []
+        launcher.results["launched_count"] = 0
+        launcher.results["errors"] = []
+
+    def _load_external_orders(self) -> set:
+        """ORDERs held by live per-ORDER daemons (one registry query)."""
+        if not _HAS_DAEMON_REGISTRY:
+            return set()
+        try:
+            rows = live_daemons()
+        except Exception as e:
+            logger.debug(f"[scheduler] Daemon registry unavailable: {e}")
+            return set()
+        return {
+            (row["project_id"], row["order_id"])
+            for row in rows
+            if row["kind"] == KIND_ORDER and row["pid"] != os.getpid()
+        }
+
+    def _is_managed_elsewhere(self, key: OrderKey) -> bool:
+        """True if a per-ORDER daemon (parallel_launcher --daemon) already runs this ORDER."""
+        return key in self._external_orders
+
+    def running_priorities(self) -> Dict[OrderKey, List[str]]:
+        """{order_key: [priority of each running worker]} across managed ORDERs."""
+        return {
+            key: launcher.running_priorities()
+            for key, launcher in self._orders.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _poll(self) -> Dict[OrderKey, Dict[str, Any]]:
+        """Consolidated poll, minus ORDERs already run by a per-ORDER daemon."""
+        orders = poll_active_orders(self.project_ids)
+        self._external_orders = self._load_external_orders()
+        for key in list(orders):
+            if key not in self._orders and self._is_managed_elsewhere(key):
+                logger.debug(f"[scheduler] {key[0]}/{key[1]} is managed by a per-ORDER daemon, skipping")
+                del orders[key]
+        return orders
+
+    def plan(self, orders: Dict[OrderKey, Dict[str, Any]]) -> Dict[OrderKey, List[Dict[str, Any]]]:
+        """
+        Compute which tasks to launch this cycle.
+
+        Args:
+            orders: Result of ``poll_active_orders``
+
+        Returns:
+            {order_key: [tasks to launch]}
+        """
+        running = self.running_priorities()
+        total_running = sum(len(p) for p in running.values())
+
+        if self.resource_monitor and self.worker_config.enable_auto_scaling:
+            capacity = self.resource_monitor.get_predicted_worker_count(total_running, self.max_workers)
+        else:
+            capacity = self.max_workers
+
+        free = capacity - total_running
+        if free <= 0:
+            return {}
+
+        candidates: Dict[OrderKey, List[Dict[str, Any]]] = {}
+        for key, info in orders.items():
+            if info["counts"].get("QUEUED", 0) == 0:
+                continue
+            try:
+                launcher = self._orders.get(key)
+                tasks = ParallelTaskDetector.find_parallel_launchable_tasks(
+                    key[0], key[1], max_tasks=free,
+                    dependency_graph=launcher.dependency_graph() if launcher else None,
+                )
+            except Exception as e:
+                logger.warning(f"[scheduler] Task detection failed for {key[0]}/{key[1]}: {e}")
+                continue
+            if launcher is not None:
+                running_ids = set(launcher.running_task_ids)
+                tasks = [t for t in tasks if t["id"] not in running_ids]
+            if tasks:
+                candidates[key] = tasks
+
+        order_priorities = {key: info["order_priority"] for key, info in orders.items()}
+        return self.slot_pool.allocate(running, candidates, order_priorities, capacity=capacity)
+
+    def run_cycle(self, check_orphans: bool = False) -> Dict[str, Any]:
+        """
+        Execute one scheduler cycle.
+
+        Args:
+            check_orphans: Also look for orphaned DONE tasks awaiting review
+
+        Returns:
+            {"orders": n, "running": n, "launched": n, "events": n}
+        """
+        event_count = 0
+        if self._metrics is not None:
+            self._metrics.begin_poll()
+
+        # 1. Per-ORDER process bookkeeping (no DB polling unless something changed).
+        #    With a child watcher only notified workers are polled; the full
+        #    sweep runs with the orphan check as a safety net.
+        full_sweep = self._child_watcher is None or check_orphans
+        for launcher in list(self._orders.values()):
+            launcher.reap_step(full_sweep=full_sweep)
+
+        # 2. Event consumption + dependency resolution (TASK_1090)
+        for launcher in list(self._orders.values()):
+            event_count += len(launcher.process_events())
+
+        # 3. One resource sample for all ORDERs
+        if self.resource_monitor:
+            self.resource_monitor.collect_sample()
+
+        # 4. Consolidated poll
+        orders = self._poll()
+        self._order_info = orders
+        if self._metrics is not None:
+            for key, info in orders.items():
+                self._metrics.record_task_counts(key[0], key[1], info["counts"])
+
+        # 5. Per-ORDER checks gated by the consolidated counts
+        for key, info in orders.items():
+            counts = info["counts"]
+            launcher = self._orders.get(key)
+            if launcher is None:
+                if not (counts.get("IN_PROGRESS", 0) or counts.get("ESCALATED", 0)):
+                    continue
+                launcher = self._get_order(key)
+            launcher.check_status_counts(counts)
+
+        # 6. Orphaned DONE tasks (one query across all projects) and expired leases
+        if check_orphans:
+            if _HAS_DAEMON_REGISTRY:
+                try:
+                    for row in reclaim_stale():
+                        logger.info(
+                            f"[scheduler] Reclaimed stale lease {row['daemon_id']} (PID {row['pid']})"
+                        )
+                except Exception as e:
+                    logger.debug(f"[scheduler] Lease reclaim failed: {e}")
+            try:
+                for task in find_orphaned_done_tasks():
+                    key = (task["project_id"], task["order_id"])
+                    if key in orders:
+                        self._get_order(key).launch_review_worker(task)
+            except Exception as e:
+                logger.warning(f"[scheduler] Orphan DONE task detection failed: {e}")
+
+        # 7. Retire ORDERs that are settled (or no longer active) with nothing running
+        for key in list(self._orders):
+            launcher = self._orders[key]
+            if launcher.has_running_processes():
+                continue
+            info = orders.get(key)
+            if info is None or is_order_settled(info["counts"]):
+                self._retire_order(key)
+
+        # 8. Allocate slots and launch
+        launched = 0
+        allocation = self.plan(orders)
+        for key, tasks in allocation.items():
+            launcher = self._get_order(key)
+            launched += launcher.launch_batch(tasks)
+            self._merge_results(launcher)
+
+        running = sum(len(launcher.running_task_ids) for launcher in self._orders.values())
+        if self._metrics is not None:
+            self._metrics.record_slots(running, self.max_workers)
+
+        # 9. One lease renewal
+        self._write_heartbeat()
+
+        if self._metrics is not None:
+            self._metrics.end_poll()
+
+        return {
+            "orders": len(orders),
+            "running": running,
+            "launched": launched,
+            "events": event_count,
+        }
+
+    def plan_once(self) -> Dict[str, Any]:
+        """Dry-run: compute one allocation plan without launching anything."""
+        orders = self._poll()
+        allocation = self.plan(orders)
+        return {
+            "max_workers": self.max_workers,
+            "per_project_max": self.slot_pool.per_project_max,
+            "orders": [
+                {
+                    "project_id": key[0],
+                    "order_id": key[1],
+                    "order_priority": info["order_priority"],
+                    "counts": info["counts"],
+                    "planned_tasks": [
+                        {"task_id": t["id"], "priority": t.get("priority", "P1")}
+                        for t in allocation.get(key, [])
+                    ],
+                }
+                for key, info in sorted(orders.items())
+            ],
+        }
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the scheduler loop until shutdown (or until idle with ``exit_when_idle``).
+
+        Returns:
+            Cumulative results dict.
+        """
+        logger.info(
+            f"[scheduler] Starting global scheduler "
+            f"(max_workers={self.max_workers}, per_project_max={self.slot_pool.per_project_max}, "
+            f"poll_interval={self.poll_interval}s)"
+        )
+        if not self._acquire_lease():
+            msg = "scheduler: another global scheduler holds a live lease"
+            logger.error(f"[scheduler] {msg}")
+            self.results["errors"].append(msg)
+            self.results["end_time"] = datetime.now().isoformat()
+            return self.results
+
+        self._register_signal_handlers()
+
+        if _HAS_EVENT_NOTIFIER:
+            self._adaptive_poller = AdaptivePoller(
+                min_interval=1.0,
+                max_interval=30.0,
+                default_interval=float(self.poll_interval),
+            )
+        if _HAS_CHILD_WATCHER and self._child_watcher is None:
+            self._child_watcher = ChildExitWatcher()
+            logger.info(f"[scheduler] Child exit notification enabled ({self._child_watcher.backend})")
+        if _HAS_WARM_POOL and self.worker_config.warm_pool_size > 0 and self._warm_pool is None:
+            self._warm_pool = WarmWorkerPool(
+                self.worker_config.warm_pool_size,
+                log_file=USER_DATA_PATH / "logs" / "warm_pool.log",
+            ).start()
+            logger.info(f"[scheduler] Warm worker pool enabled (size={self._warm_pool.size})")
+        metrics_server = None
+        if _HAS_DAEMON_METRICS and self._metrics is None:
+            self._metrics = DaemonMetrics()
+            self._metrics.install()
+            if self.worker_config.metrics_port is not None:
+                try:
+                    metrics_server = MetricsServer(
+                        self._metrics.registry, port=self.worker_config.metrics_port
+                    ).start()
+                    self._metrics_url = metrics_server.url
+                    logger.info(f"[scheduler] Metrics endpoint: {self._metrics_url}")
+                except OSError as e:
+                    logger.warning(f"[scheduler] Cannot start metrics endpoint: {e}")
+
+        for launcher in self._orders.values():
+            self._attach_shared(launcher)
+
+        started = datetime.now()
+        loop_count = 0
+        last_orphan_check = 0.0
+        orphan_check_interval = 60
+
+        try:
+            while not self._shutdown_requested:
+                loop_count += 1
+                now = time.time()
+                check_orphans = now - last_orphan_check >= orphan_check_interval
+                if check_orphans:
+                    last_orphan_check = now
+
+                try:
+                    stats = self.run_cycle(check_orphans=check_orphans)
+                except DatabaseError as e:
+                    logger.warning(f"[scheduler] Poll failed: {e}")
+                    stats = {"orders": 0, "running": 0, "launched": 0, "events": 0}
+
+                if check_orphans:
+                    logger.info(
+                        f"[scheduler] status: orders={stats['orders']}, "
+                        f"running={stats['running']}/{self.max_workers}"
+                    )
+
+                if self.exit_when_idle and stats["orders"] == 0 and not self._orders:
+                    logger.info("[scheduler] No active ORDER remains, exiting")
+                    break
+
+                if self._adaptive_poller:
+                    if stats["events"] or stats["launched"]:
+                        self._adaptive_poller.notify_event_detected()
+                    else:
+                        self._adaptive_poller.notify_idle_cycle()
+                    self._interruptible_sleep(self._adaptive_poller.get_next_interval())
+                else:
+                    self._interruptible_sleep(float(self.poll_interval))
+
+        except KeyboardInterrupt:
+            logger.info("[scheduler] KeyboardInterrupt received, shutting down...")
+        except Exception as e:
+            logger.exception(f"[scheduler] Unexpected error: {e}")
+            self.results["errors"].append(f"scheduler: {e}")
+        finally:
+            for launcher in self._orders.values():
+                launcher.finish()
+                self._merge_results(launcher)
+            self._remove_heartbeat()
+            if self._child_watcher is not None:
+                self._child_watcher.close()
+                self._child_watcher = None
+            if self._warm_pool is not None:
+                self.results["warm_pool_stats"] = self._warm_pool.to_dict()
+                self._warm_pool.close()
+                self._warm_pool = None
+            if self._metrics is not None:
+                self.results["metrics"] = self._metrics.summary()
+                self._metrics.uninstall()
+                if metrics_server is not None:
+                    metrics_server.close()
+                self._metrics = None
+                self._metrics_url = None
+            for launcher in self._orders.values():
+                self._attach_shared(launcher)
+
+        self.results["end_time"] = datetime.now().isoformat()
+        self.results["loops"] = loop_count
+        self.results["elapsed_seconds"] = round((datetime.now() - started).total_seconds(), 1)
+        self.results["worker_exit_latency_summary"] = summarize_latencies(self.results["worker_exit_latency"])
+        self.results["worker_launch_latency_summary"] = summarize_latencies(self.results["worker_launch_latency"])
+        return self.results
+
+    # ------------------------------------------------------------------
+    # Heartbeat / signals
+    # ------------------------------------------------------------------
+
+    def _acquire_lease(self) -> bool:
+        """
+        Register the scheduler in the ``daemons`` table (reclaiming expired leases).
+
+        Returns:
+            False if another live scheduler holds the lease.
+            True when the lease is held or the registry is unavailable.
+        """
+        if not _HAS_DAEMON_REGISTRY:
+            return True
+        lease = DaemonLease.for_scheduler(
+            lease_seconds=max(DAEMON_LEASE_SECONDS, 3 * int(self.poll_interval))
+        )
+        try:
+            reclaim_stale()
+            if not lease.acquire():
+                return False
+        except Exception as e:
+            logger.warning(f"[heartbeat] Daemon registry unavailable: {e}")
+            return True
+        self._lease = lease
+        return True
+
+    def _write_heartbeat(self) -> None:
+        """Renew the scheduler lease with the workers of every managed ORDER."""
+        if self._lease is None:
+            return
+        owned = [
+            entry
+            for _, launcher in sorted(self._orders.items())
+            for entry in launcher.owned_tasks()
+        ]
+        info = {
+            "max_workers": self.max_workers,
+            "orders": [f"{key[0]}/{key[1]}" for key in sorted(self._orders)],
+            "resource_trend": (
+                self.resource_monitor.get_trend_status() if self.resource_monitor else None
+            ),
+            "metrics_url": self._metrics_url,
+        }
+        try:
+            held = self._lease.heartbeat(
+                owned,
+                status="shutting_down" if self._shutdown_requested else "running",
+                info=info,
+            )
+        except Exception as e:
+            logger.debug(f"[heartbeat] Failed to renew scheduler lease: {e}")
+            return
+        if not held:
+            logger.error("[heartbeat] Scheduler lease was taken over by another process; shutting down")
+            self._shutdown_requested = True
+
+    def _remove_heartbeat(self) -> None:
+        if self._lease is None:
+            return
+        try:
+            self._lease.release()
+        except Exception as e:
+            logger.debug(f"[heartbeat] Failed to release scheduler lease: {e}")
+        self._lease = None
+
+    @staticmethod
+    def read_heartbeat() -> Optional[Dict[str, Any]]:
+        """
+        Read the scheduler entry of the ``daemons`` table.
+
+        Returns:
+            Heartbeat dict with ``age_seconds`` / ``is_alive`` (lease not expired)
+            and per-ORDER worker lists, or None if no scheduler is registered.
+        """
+        if not _HAS_DAEMON_REGISTRY:
+            return None
+        try:
+            row = next((r for r in live_daemons(include_expired=True) if r["kind"] == KIND_SCHEDULER), None)
+        except Exception:
+            return None
+        if row is None:
+            return None
+        orders = []
+        for name in row["info"].get("orders", []):
+            project_id, _, order_id = name.partition("/")
+            pids = [
+                t.get("pid") for t in row["owned_tasks"]
+                if t.get("project_id") == project_id and t.get("order_id") == order_id
+            ]
+            orders.append({
+                "project_id": project_id,
+                "order_id": order_id,
+                "active_workers": len(pids),
+                "active_worker_pids": pids,
+            })
+        return {
+            "pid": row["pid"],
+            "scheduler": True,
+            "timestamp": row["heartbeat_at"],
+            "status": row["status"],
+            "max_workers": row["info"].get("max_workers"),
+            "active_workers": len(row["owned_tasks"]),
+            "orders": orders,
+            "resource_trend": row["info"].get("resource_trend"),
+            "metrics_url": row["info"].get("metrics_url"),
+            "age_seconds": row["age_seconds"],
+            "is_alive": row["is_alive"],
+        }
+
+    def _register_signal_handlers(self) -> None:
+        def _handle_signal(signum, frame):
+            logger.info(f"[scheduler] Received {signal.Signals(signum).name}, requesting shutdown...")
+            self._shutdown_requested = True
+
+        try:
+            signal.signal(signal.SIGTERM, _handle_signal)
+            signal.signal(signal.SIGINT, _handle_signal)
+        except (OSError, ValueError):
+            pass
+
+    def _interruptible_sleep(self, seconds: float) -> None:
+        """Sleep in 0.5s slices; returns early on shutdown or when any Worker exits."""
+        steps = int(seconds / 0.5)
+        for _ in range(max(steps, 1)):
+            if self._shutdown_requested:
+                break
+            if self._child_watcher is not None:
+                if self._child_watcher.wait(0.5):
+                    break
+            else:
+                time.sleep(0.5)
+
+
+def main():
+    """CLI entry point"""
+    try:
+        from config import setup_utf8_output
+        setup_utf8_output()
+    except ImportError:
+        pass
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    parser = argparse.ArgumentParser(
+        description="Global scheduler for all active ORDERs across projects",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--project", action="append", dest="projects", help="Only manage ORDERs of this project (repeatable)")
+    parser.add_argument("--max-workers", type=int, help="Global worker slot count (default: worker config max_concurrent_workers)")
+    parser.add_argument("--max-workers-per-project", type=int, help="Maximum workers per project (default: no limit)")
+    for level in ("p0", "p1", "p2", "p3"):
+        parser.add_argument(f"--max-{level}-workers", type=int, help=f"Maximum workers for {level.upper()} tasks")
+    parser.add_argument("--poll-interval", type=int, default=10, help="Poll interval in seconds (default: 10)")
+    parser.add_argument("--exit-when-idle", action="store_true", help="Exit when no active ORDER and no running worker remain")
+    parser.add_argument("--dry-run", action="store_true", help="Print one allocation plan and exit")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Detailed logging")
+    parser.add_argument("--json", action="store_true", help="JSON output format")
+    parser.add_argument("--timeout", type=int, default=1800, help="Worker timeout in seconds (default: 1800)")
+    parser.add_argument("--model", help="AI model for workers (haiku/sonnet/opus)")
+    parser.add_argument("--no-review", action="store_true", help="Disable auto-review after worker completion")
+    parser.add_argument("--no-resource-monitoring", action="store_true", help="Disable resource monitoring")
+    parser.add_argument("--no-auto-scaling", action="store_true", help="Disable auto-scaling based on resources")
+    parser.add_argument("--stale-log-timeout", type=int, default=600, help="Seconds without log update before worker is considered stuck (default: 600)")
+    parser.add_argument("--worker-process-timeout", type=int, default=1800, help="Maximum seconds a worker process may run (default: 1800)")
+    parser.add_argument("--escalated-timeout", type=int, default=300, help="Seconds before ESCALATED tasks are auto-rejected (default: 300)")
+    parser.add_argument("--warm-pool-size", type=int, help="Pre-imported idle worker processes (0 = cold spawn only, default: worker config)")
+    parser.add_argument("--metrics-port", type=int, help="Serve metrics on http://127.0.0.1:PORT/metrics (0 = any free port)")
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    try:
+        worker_config = get_worker_config()
+        if args.no_resource_monitoring:
+            worker_config.enable_resource_monitoring = False
+        if args.no_auto_scaling:
+            worker_config.enable_auto_scaling = False
+        if args.warm_pool_size is not None:
+            worker_config.warm_pool_size = args.warm_pool_size
+        if args.metrics_port is not None:
+            worker_config.metrics_port = args.metrics_port
+
+        priority_config = dataclasses.replace(get_priority_config())
+        for level in ("p0", "p1", "p2", "p3"):
+            value = getattr(args, f"max_{level}_workers")
+            if value is not None:
+                setattr(priority_config, f"max_{level}_workers", value)
+
+        scheduler = GlobalScheduler(
+            project_ids=args.projects,
+            max_workers=args.max_workers,
+            per_project_max=args.max_workers_per_project,
+            worker_config=worker_config,
+            priority_config=priority_config,
+            poll_interval=args.poll_interval,
+            exit_when_idle=args.exit_when_idle,
+            verbose=args.verbose,
+            timeout=args.timeout,
+            model=args.model,
+            no_review=args.no_review,
+            stale_log_timeout=args.stale_log_timeout,
+            worker_process_timeout=args.worker_process_timeout,
+            escalated_timeout=args.escalated_timeout,
+        )
+
+        if args.dry_run:
+            plan = scheduler.plan_once()
+            if args.json:
+                print(json.dumps(plan, ensure_ascii=False, indent=2))
+            else:
+                print(f"Global slots: {plan['max_workers']} (per project: {plan['per_project_max'] or '-'})")
+                for order in plan["orders"]:
+                    planned = ", ".join(t["task_id"] for t in order["planned_tasks"]) or "-"
+                    print(f"  {order['project_id']}/{order['order_id']} [{order['order_priority']}] "
+                          f"{order['counts']} -> {planned}")
+            sys.exit(0)
+
+        results = scheduler.run()
+        if args.json:
+            print(json.dumps(results, ensure_ascii=False, indent=2, default=str))
+        else:
+            print(f"Launched: {results['launched_count']}, completed ORDERs: {len(results['completed_orders'])}")
+        sys.exit(1 if results.get("errors") else 0)
+
+    except DatabaseError as e:
+        print(f"データベースエラー: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"予期しないエラー: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
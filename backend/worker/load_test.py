@@ -0,0 +1,706 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Launcher Load Test Harness
+
+Runs the real ``ParallelWorkerLauncher`` daemon loop (ParallelTaskDetector,
+EventNotifier, ResidentDependencyGraph / DependencyResolver, file locks,
+child exit watcher, optional ResourceMonitor) end to end against a
+synthetic ORDER in a temporary DB, without real ``claude`` runs.
+
+- ``generate_order()`` builds N tasks with a configurable DAG shape
+  (independent / chain / layered / diamond / random) and a ratio of tasks
+  whose ``target_files`` overlap through a small shared pool.
+- ``claude`` is replaced by a stub on ``PATH`` (``--fake-claude``) with a
+  configurable latency distribution, heavy-tail stragglers and failure rate.
+- Workers are stub processes (``--fake-worker``) that call the stub through
+  ``utils.claude_cli`` and apply the same DB-visible outcome as a Worker
+  followed by an approving review: REPORT file, IN_PROGRESS -> DONE,
+  lock release, DONE -> COMPLETED. A failed run exits non-zero and leaves
+  the task IN_PROGRESS, so the daemon's own crash recovery re-queues it.
+- A run ends when the ORDER completes, when only BLOCKED tasks behind a
+  REJECTED predecessor remain (reported as ``stalled``), or at ``max_seconds``.
+- The daemon runs in a child process whose ``AI_PM_ROOT`` / ``AI_PM_USERDATA``
+  point at the temp directory, so no module globals are patched.
+
+The report (JSON) covers throughput, makespan, slot utilization, DB
+statement counts per poll and per-poll overhead for regression tracking.
+Reviews are not simulated (the daemon runs with ``no_review``) and the warm
+pool is disabled because its spares run the real ``execute_task.main()``.
+
+Usage:
+    python backend/worker/load_test.py --tasks 50 --shape layered --max-workers 8 \\
+        --latency-dist lognormal --latency-mean 0.5 --failure-rate 0.05 --json
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add parent directory to path
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+logger = logging.getLogger(__name__)
+
+
+SHAPE_INDEPENDENT = "independent"
+SHAPE_CHAIN = "chain"
+SHAPE_LAYERED = "layered"
+SHAPE_DIAMOND = "diamond"
+SHAPE_RANDOM = "random"
+SHAPES = (SHAPE_INDEPENDENT, SHAPE_CHAIN, SHAPE_LAYERED, SHAPE_DIAMOND, SHAPE_RANDOM)
+
+DIST_FIXED = "fixed"
+DIST_UNIFORM = "uniform"
+DIST_EXPONENTIAL = "exponential"
+DIST_LOGNORMAL = "lognormal"
+DISTRIBUTIONS = (DIST_FIXED, DIST_UNIFORM, DIST_EXPONENTIAL, DIST_LOGNORMAL)
+
+PROJECT_ID = "LOADTEST"
+ORDER_ID = "ORDER_001"
+
+# Fake claude configuration (JSON) and per-run sampling key
+ENV_FAKE_CLAUDE = "AIPM_FAKE_CLAUDE"
+ENV_FAKE_CLAUDE_KEY = "AIPM_FAKE_CLAUDE_KEY"
+
+_FAKE_RESULT = (
+    "## 実施内容\n"
+    "- Simulated change generated by the load test harness\n\n"
+    "## 成果物\n"
+    "- (none)\n"
+)
+
+
+@dataclass
+class LoadTestSpec:
+    """Parameters of one load test run."""
+
+    tasks: int = 20
+    shape: str = SHAPE_LAYERED
+    width: int = 4                  # layered: tasks per layer
+    fan_in: int = 2                 # layered / random: max predecessors per task
+    edge_probability: float = 0.2   # random: probability of each candidate edge
+    overlap_ratio: float = 0.0      # share of tasks writing a file from the shared pool
+    max_workers: int = 4
+    latency_dist: str = DIST_LOGNORMAL
+    latency_mean: float = 0.5       # seconds per fake claude call
+    latency_spread: float = 0.5     # uniform: +/- ratio, lognormal: sigma
+    tail_rate: float = 0.0          # share of calls slowed by tail_factor
+    tail_factor: float = 10.0
+    failure_rate: float = 0.0       # share of calls that fail (worker exits 1)
+    poll_interval: int = 1
+    resource_monitoring: bool = False
+    escalated_timeout: int = 0      # auto-reject escalated tasks right away
+    max_seconds: float = 600.0
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.tasks < 1:
+            raise ValueError("tasks must be >= 1")
+        if self.shape not in SHAPES:
+            raise ValueError(f"Unknown DAG shape: {self.shape}")
+        if self.latency_dist not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.latency_dist}")
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        for name in ("overlap_ratio", "edge_probability", "tail_rate", "failure_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadTestSpec":
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+
+# ----------------------------------------------------------------------
+# Synthetic ORDER
+# ----------------------------------------------------------------------
+
+def generate_order(spec: LoadTestSpec) -> List[Dict[str, Any]]:
+    """
+    Build the synthetic tasks of one ORDER.
+
+    Returns:
+        [{"id", "title", "priority", "depends_on": [...], "target_files": [...]}]
+        in creation order (predecessors always come first)
+    """
+    rng = random.Random(spec.seed)
+    n = spec.tasks
+    ids = [f"TASK_{i + 1:03d}" for i in range(n)]
+    deps: List[List[int]] = [[] for _ in range(n)]
+
+    if spec.shape == SHAPE_CHAIN:
+        for i in range(1, n):
+            deps[i] = [i - 1]
+    elif spec.shape == SHAPE_LAYERED:
+        width = max(1, spec.width)
+        for i in range(width, n):
+            layer_start = (i // width - 1) * width
+            previous = list(range(layer_start, layer_start + width))
+            deps[i] = sorted(rng.sample(previous, min(max(1, spec.fan_in), len(previous))))
+    elif spec.shape == SHAPE_DIAMOND:
+        # root -> (n - 2) parallel tasks -> sink
+        for i in range(1, n):
+            deps[i] = [0]
+        if n > 2:
+            deps[n - 1] = list(range(1, n - 1))
+    elif spec.shape == SHAPE_RANDOM:
+        for i in range(1, n):
+            candidates = [j for j in range(i) if rng.random() < spec.edge_probability]
+            if len(candidates) > spec.fan_in:
+                candidates = sorted(rng.sample(candidates, spec.fan_in))
+            deps[i] = candidates
+
+    shared_pool = max(1, n // 10)
+    tasks = []
+    for i in range(n):
+        if rng.random() < spec.overlap_ratio:
+            target = f"src/shared/module_{rng.randrange(shared_pool)}.py"
+        else:
+            target = f"src/tasks/{ids[i].lower()}.py"
+        tasks.append({
+            "id": ids[i],
+            "title": f"Load test task {i + 1}",
+            "priority": "P1",
+            "depends_on": [ids[j] for j in deps[i]],
+            "target_files": [target],
+        })
+    return tasks
+
+
+def populate_db(
+    db_path: Path,
+    schema_path: Path,
+    tasks: List[Dict[str, Any]],
+    project_path: Path,
+) -> None:
+    """Create a fresh DB with the load test project, ORDER and tasks."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.executescript(schema_path.read_text(encoding="utf-8"))
+        conn.execute(
+            "INSERT INTO projects (id, name, path) VALUES (?, ?, ?)",
+            (PROJECT_ID, "Load test", str(project_path)),
+        )
+        conn.execute(
+            "INSERT INTO orders (id, project_id, title, status) VALUES (?, ?, ?, 'IN_PROGRESS')",
+            (ORDER_ID, PROJECT_ID, "Load test ORDER"),
+        )
+        conn.executemany(
+            "INSERT INTO tasks (id, order_id, project_id, title, status, priority, target_files) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    t["id"], ORDER_ID, PROJECT_ID, t["title"],
+                    "BLOCKED" if t["depends_on"] else "QUEUED",
+                    t["priority"], json.dumps(t["target_files"]),
+                )
+                for t in tasks
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO task_dependencies (task_id, depends_on_task_id, project_id) VALUES (?, ?, ?)",
+            [(t["id"], dep, PROJECT_ID) for t in tasks for dep in t["depends_on"]],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# Fake claude CLI
+# ----------------------------------------------------------------------
+
+def sample_latency(rng: random.Random, dist: str, mean: float, spread: float) -> float:
+    """Draw one latency (seconds) with the given mean."""
+    if mean <= 0:
+        return 0.0
+    if dist == DIST_UNIFORM:
+        return rng.uniform(mean * (1 - spread), mean * (1 + spread))
+    if dist == DIST_EXPONENTIAL:
+        return rng.expovariate(1.0 / mean)
+    if dist == DIST_LOGNORMAL:
+        # scaled so that E[latency] == mean
+        return mean * rng.lognormvariate(0.0, spread) / math.exp(spread * spread / 2)
+    return mean
+
+
+def install_fake_claude(bin_dir: Path) -> Path:
+    """Write a ``claude`` executable that runs this module with ``--fake-claude``."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    script = Path(__file__).resolve()
+    if sys.platform == "win32":
+        path = bin_dir / "claude.cmd"
+        path.write_text(f'@"{sys.executable}" "{script}" --fake-claude %*\r\n', encoding="utf-8")
+    else:
+        path = bin_dir / "claude"
+        path.write_text(
+            f'#!/bin/sh\nexec "{sys.executable}" "{script}" --fake-claude "$@"\n',
+            encoding="utf-8",
+        )
+        path.chmod(0o755)
+    return path
+
+
+def _fake_claude() -> int:
+    """``claude -p`` stand-in: consume the prompt, wait, succeed or fail."""
+    config = json.loads(os.environ.get(ENV_FAKE_CLAUDE) or "{}")
+    key = os.environ.get(ENV_FAKE_CLAUDE_KEY) or str(os.getpid())
+    rng = random.Random(f"{config.get('seed', 0)}:{key}")
+
+    sys.stdin.read()
+    latency = sample_latency(
+        rng,
+        config.get("latency_dist", DIST_FIXED),
+        float(config.get("latency_mean", 0.0)),
+        float(config.get("latency_spread", 0.0)),
+    )
+    if rng.random() < float(config.get("tail_rate", 0.0)):
+        latency *= float(config.get("tail_factor", 1.0))
+    time.sleep(latency)
+
+    if rng.random() < float(config.get("failure_rate", 0.0)):
+        print("simulated claude failure", file=sys.stderr)
+        return 1
+    print(_FAKE_RESULT)
+    return 0
+
+
+# ----------------------------------------------------------------------
+# Fake worker
+# ----------------------------------------------------------------------
+
+def _read_runs(runs_log: Path) -> List[Dict[str, Any]]:
+    if not runs_log.exists():
+        return []
+    with open(runs_log, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _fake_worker(
+    project_id: str,
+    order_id: str,
+    task_id: str,
+    runs_log: Path,
+    spans_file: Optional[str] = None,
+) -> int:
+    """Worker stand-in: one fake claude call, then the Worker + approval DB updates."""
+    from config.db_config import USER_DATA_PATH
+    from task.update import update_task
+    from utils.claude_cli import create_runner
+    from utils.file_lock import FileLockManager
+
+    started_at = time.time()
+    attempt = sum(1 for r in _read_runs(runs_log) if r["task_id"] == task_id)
+    os.environ[ENV_FAKE_CLAUDE_KEY] = f"{task_id}:{attempt}"
+
+    result = create_runner(model="sonnet", timeout_seconds=3600).run(f"Execute {task_id}")
+    claude_done = time.time()
+    error = None
+    if result.success:
+        try:
+            report_dir = USER_DATA_PATH / "PROJECTS" / project_id / "RESULT" / order_id / "05_REPORT"
+            report_dir.mkdir(parents=True, exist_ok=True)
+            report_file = report_dir / f"REPORT_{task_id.replace('TASK_', '')}.md"
+            report_file.write_text(
+                f"# {task_id} REPORT (load test)\n\n{result.result_text}\n", encoding="utf-8"
+            )
+            update_task(project_id, task_id, status="DONE", role="Worker", render=False)
+            FileLockManager.release_locks(project_id, task_id)
+            update_task(
+                project_id, task_id, status="COMPLETED", role="PM",
+                reason="load test auto-approve", render=False,
+            )
+        except Exception as e:
+            error = str(e)
+    else:
+        error = result.error_message
+
+    record = {
+        "task_id": task_id,
+        "attempt": attempt,
+        "pid": os.getpid(),
+        "started_at": started_at,
+        "finished_at": time.time(),
+        "success": error is None,
+        "error": error,
+    }
+    # One O_APPEND write per record keeps concurrent workers from interleaving
+    with open(runs_log, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    if spans_file:
+        from worker.daemon_metrics import write_step_spans
+        status = "success" if error is None else "error"
+        write_step_spans(spans_file, task_id, [
+            {"step": "execute_task", "status": "success" if result.success else "error",
+             "duration_ms": round((claude_done - started_at) * 1000, 1)},
+            {"step": "update_status_done", "status": status,
+             "duration_ms": round((record["finished_at"] - claude_done) * 1000, 1)},
+        ])
+    return 0 if error is None else 1
+
+
+# ----------------------------------------------------------------------
+# Daemon runner (child process)
+# ----------------------------------------------------------------------
+
+def _distribution(values: List[float], digits: int = 2) -> Dict[str, Any]:
+    if not values:
+        return {"count": 0, "avg": None, "p50": None, "p95": None, "max": None}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "avg": round(sum(ordered) / len(ordered), digits),
+        "p50": round(ordered[len(ordered) // 2], digits),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], digits),
+        "max": round(ordered[-1], digits),
+    }
+
+
+def _run_daemon(spec: LoadTestSpec, workdir: Path) -> Dict[str, Any]:
+    """Run the daemon against the prepared DB and build the report."""
+    from config.worker_config import WorkerResourceConfig
+    from utils.db import add_statement_observer, fetch_all, get_connection, remove_statement_observer
+    from worker.parallel_launcher import ParallelWorkerLauncher
+
+    runs_log = workdir / "runs.jsonl"
+    statements = [0]
+
+    def _count_statement(_sql: str) -> None:
+        statements[0] += 1
+
+    class SimulatedLauncher(ParallelWorkerLauncher):
+        """Launcher whose Workers are ``--fake-worker`` stubs; records per-poll cost."""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.poll_busy: List[float] = []
+            self.poll_statements: List[int] = []
+            self.slept_seconds = 0.0
+            self.stalled = False
+            self._busy_since = time.perf_counter()
+            self._statements_mark = 0
+
+        def _build_worker_command(self, task_id, task_info=None):
+            return [
+                sys.executable, str(Path(__file__).resolve()), "--fake-worker",
+                self.project_id, self.order_id, task_id, "--runs-log", str(runs_log),
+            ]
+
+        def _is_order_complete(self, summary):
+            if super()._is_order_complete(summary):
+                return True
+            # Only BLOCKED tasks left behind a REJECTED predecessor: the real
+            # daemon would wait forever, the load test reports a stall
+            waiting = sum(
+                summary.get(status, 0)
+                for status in ("QUEUED", "IN_PROGRESS", "DONE", "REWORK", "ESCALATED")
+            )
+            if waiting == 0 and not self._running_workers:
+                self.stalled = True
+                return True
+            return False
+
+        def end_poll(self) -> None:
+            self.poll_busy.append(time.perf_counter() - self._busy_since)
+            self.poll_statements.append(statements[0] - self._statements_mark)
+
+        def _interruptible_sleep_float(self, seconds):
+            self.end_poll()
+            started = time.perf_counter()
+            super()._interruptible_sleep_float(seconds)
+            self.slept_seconds += time.perf_counter() - started
+            self._busy_since = time.perf_counter()
+            self._statements_mark = statements[0]
+
+    launcher = SimulatedLauncher(
+        PROJECT_ID,
+        ORDER_ID,
+        max_workers=spec.max_workers,
+        no_review=True,
+        poll_interval=spec.poll_interval,
+        worker_config=WorkerResourceConfig(
+            max_concurrent_workers=spec.max_workers,
+            enable_resource_monitoring=spec.resource_monitoring,
+            enable_auto_scaling=spec.resource_monitoring,
+            warm_pool_size=0,
+        ),
+    )
+    launcher.escalated_timeout = spec.escalated_timeout
+
+    timed_out = threading.Event()
+
+    def _stop() -> None:
+        timed_out.set()
+        launcher._shutdown_requested = True
+        if launcher._child_watcher is not None:
+            launcher._child_watcher.wake()
+
+    timer = threading.Timer(spec.max_seconds, _stop)
+    timer.daemon = True
+
+    add_statement_observer(_count_statement)
+    timer.start()
+    started = time.perf_counter()
+    try:
+        launcher._busy_since = started
+        results = launcher.daemon_loop()
+        makespan = time.perf_counter() - started
+        launcher.end_poll()
+    finally:
+        timer.cancel()
+        remove_statement_observer(_count_statement)
+        for info in launcher._running_workers.values():
+            try:
+                info["process"].kill()
+                info["process"].wait(timeout=10)
+            except Exception:
+                pass
+
+    conn = get_connection()
+    try:
+        rows = fetch_all(
+            conn,
+            "SELECT status, COUNT(*) AS count FROM tasks WHERE project_id = ? AND order_id = ? GROUP BY status",
+            (PROJECT_ID, ORDER_ID),
+        )
+    finally:
+        conn.close()
+    statuses = {row["status"]: row["count"] for row in rows}
+
+    runs = _read_runs(runs_log)
+    busy = [r["finished_at"] - r["started_at"] for r in runs]
+    completed = statuses.get("COMPLETED", 0)
+    polls = len(launcher.poll_busy)
+
+    return {
+        "spec": spec.to_dict(),
+        "timed_out": timed_out.is_set(),
+        "stalled": launcher.stalled,
+        "makespan_seconds": round(makespan, 3),
+        "throughput_tasks_per_minute": round(completed / makespan * 60, 2) if makespan > 0 else None,
+        "tasks": {"total": spec.tasks, "completed": completed, "by_status": statuses},
+        "attempts": len(runs),
+        "failed_attempts": sum(1 for r in runs if not r["success"]),
+        "slot_utilization": round(sum(busy) / (spec.max_workers * makespan), 3) if makespan > 0 else None,
+        "worker_busy_seconds": _distribution(busy, 3),
+        "daemon": {
+            "polls": polls,
+            "poll_overhead_ms": _distribution([b * 1000 for b in launcher.poll_busy]),
+            "poll_overhead_total_seconds": round(sum(launcher.poll_busy), 3),
+            "sleep_seconds": round(launcher.slept_seconds, 3),
+            "db_statements": statements[0],
+            "db_statements_per_poll": _distribution([float(s) for s in launcher.poll_statements]),
+        },
+        "launched": results.get("launched_count", 0),
+        "launch_errors": len(results.get("errors", [])),
+        "worker_launch_latency": results.get("worker_launch_latency_summary"),
+        "worker_exit_latency": results.get("worker_exit_latency_summary"),
+        "adaptive_poller": results.get("adaptive_poller_stats"),
+        "metrics": results.get("metrics"),
+    }
+
+
+# ----------------------------------------------------------------------
+# Entry points
+# ----------------------------------------------------------------------
+
+def run_load_test(
+    spec: LoadTestSpec,
+    workdir: Optional[Path] = None,
+    keep_workdir: bool = False,
+) -> Dict[str, Any]:
+    """
+    Prepare a temp environment, run the daemon in a child process and return the report.
+
+    Args:
+        spec: Load test parameters
+        workdir: Directory for DB, logs and the fake claude (default: new temp dir)
+        keep_workdir: Keep the directory after the run (it is always kept when
+            ``workdir`` is given)
+
+    Returns:
+        Report dict (see module docstring); ``workdir`` is included when kept
+    """
+    from config.db_config import get_schema_path
+
+    own_workdir = workdir is None
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="aipm_loadtest_"))
+    try:
+        populate_db(
+            workdir / "data" / "aipm.db",
+            get_schema_path(),
+            generate_order(spec),
+            workdir / "PROJECTS" / PROJECT_ID,
+        )
+        bin_dir = workdir / "bin"
+        install_fake_claude(bin_dir)
+        spec_file = workdir / "spec.json"
+        spec_file.write_text(json.dumps(spec.to_dict()), encoding="utf-8")
+
+        env = os.environ.copy()
+        env.update({
+            "AI_PM_ROOT": str(workdir),
+            "AI_PM_USERDATA": str(workdir),
+            "AIPM_DB_PATH": str(workdir / "data" / "aipm.db"),
+            "PATH": str(bin_dir) + os.pathsep + env.get("PATH", ""),
+            "PYTHONPATH": str(_package_root) + os.pathsep + env.get("PYTHONPATH", ""),
+            ENV_FAKE_CLAUDE: json.dumps({
+                "seed": spec.seed,
+                "latency_dist": spec.latency_dist,
+                "latency_mean": spec.latency_mean,
+                "latency_spread": spec.latency_spread,
+                "tail_rate": spec.tail_rate,
+                "tail_factor": spec.tail_factor,
+                "failure_rate": spec.failure_rate,
+            }),
+        })
+        env.pop(ENV_FAKE_CLAUDE_KEY, None)
+
+        proc = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--run", str(spec_file)],
+            cwd=str(_package_root),
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=spec.max_seconds + 120,
+        )
+        report_file = workdir / "report.json"
+        if proc.returncode != 0 or not report_file.exists():
+            raise RuntimeError(
+                f"Load test run failed (exit {proc.returncode}): {proc.stderr.strip()[-2000:]}"
+            )
+        report = json.loads(report_file.read_text(encoding="utf-8"))
+        if keep_workdir or not own_workdir:
+            report["workdir"] = str(workdir)
+        return report
+    finally:
+        if own_workdir and not keep_workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _run_child(spec_file: Path) -> int:
+    workdir = spec_file.parent
+    logging.basicConfig(
+        filename=str(workdir / "daemon.log"),
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    spec = LoadTestSpec.from_dict(json.loads(spec_file.read_text(encoding="utf-8")))
+    report = _run_daemon(spec, workdir)
+    (workdir / "report.json").write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+def main() -> int:
+    """CLI entry point"""
+    # The fake claude receives the real CLI's arguments (-p, --model=..., ...)
+    if sys.argv[1:2] == ["--fake-claude"]:
+        return _fake_claude()
+
+    parser = argparse.ArgumentParser(description="Launcher load test with a fake claude CLI")
+    parser.add_argument("--fake-worker", nargs=3, metavar=("PROJECT", "ORDER", "TASK"), help=argparse.SUPPRESS)
+    parser.add_argument("--runs-log", help=argparse.SUPPRESS)
+    parser.add_argument("--spans-file", help=argparse.SUPPRESS)
+    parser.add_argument("--run", metavar="SPEC_JSON", help=argparse.SUPPRESS)
+
+    defaults = LoadTestSpec()
+    parser.add_argument("--tasks", type=int, default=defaults.tasks, help="Number of tasks")
+    parser.add_argument("--shape", choices=SHAPES, default=defaults.shape, help="DAG shape")
+    parser.add_argument("--width", type=int, default=defaults.width, help="Tasks per layer (layered)")
+    parser.add_argument("--fan-in", type=int, default=defaults.fan_in, help="Max predecessors per task")
+    parser.add_argument("--edge-probability", type=float, default=defaults.edge_probability,
+                        help="Edge probability (random)")
+    parser.add_argument("--overlap-ratio", type=float, default=defaults.overlap_ratio,
+                        help="Share of tasks writing a shared file")
+    parser.add_argument("--max-workers", type=int, default=defaults.max_workers, help="Daemon max workers")
+    parser.add_argument("--latency-dist", choices=DISTRIBUTIONS, default=defaults.latency_dist,
+                        help="Fake claude latency distribution")
+    parser.add_argument("--latency-mean", type=float, default=defaults.latency_mean,
+                        help="Mean fake claude latency in seconds")
+    parser.add_argument("--latency-spread", type=float, default=defaults.latency_spread,
+                        help="Uniform +/- ratio or lognormal sigma")
+    parser.add_argument("--tail-rate", type=float, default=defaults.tail_rate, help="Share of straggler calls")
+    parser.add_argument("--tail-factor", type=float, default=defaults.tail_factor, help="Straggler slowdown")
+    parser.add_argument("--failure-rate", type=float, default=defaults.failure_rate,
+                        help="Share of failing claude calls")
+    parser.add_argument("--poll-interval", type=int, default=defaults.poll_interval,
+                        help="Daemon poll interval in seconds")
+    parser.add_argument("--resource-monitoring", action="store_true",
+                        help="Enable ResourceMonitor and auto-scaling")
+    parser.add_argument("--max-seconds", type=float, default=defaults.max_seconds,
+                        help="Stop the daemon after this many seconds")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed")
+    parser.add_argument("--workdir", help="Keep DB / logs / report in this directory")
+    parser.add_argument("--json", action="store_true", help="JSON output format")
+    args = parser.parse_args()
+
+    if args.fake_worker:
+        return _fake_worker(*args.fake_worker, Path(args.runs_log), args.spans_file)
+    if args.run:
+        return _run_child(Path(args.run))
+
+    spec = LoadTestSpec(
+        tasks=args.tasks,
+        shape=args.shape,
+        width=args.width,
+        fan_in=args.fan_in,
+        edge_probability=args.edge_probability,
+        overlap_ratio=args.overlap_ratio,
+        max_workers=args.max_workers,
+        latency_dist=args.latency_dist,
+        latency_mean=args.latency_mean,
+        latency_spread=args.latency_spread,
+        tail_rate=args.tail_rate,
+        tail_factor=args.tail_factor,
+        failure_rate=args.failure_rate,
+        poll_interval=args.poll_interval,
+        resource_monitoring=args.resource_monitoring,
+        max_seconds=args.max_seconds,
+        seed=args.seed,
+    )
+    workdir = Path(args.workdir) if args.workdir else None
+    if workdir is not None:
+        workdir.mkdir(parents=True, exist_ok=True)
+    report = run_load_test(spec, workdir=workdir)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        daemon = report["daemon"]
+        print(f"Load test: {spec.tasks} tasks ({spec.shape}), max_workers={spec.max_workers}")
+        note = " (timed out)" if report["timed_out"] else " (stalled)" if report["stalled"] else ""
+        print(f"  makespan     {report['makespan_seconds']:.2f} s{note}")
+        print(f"  completed    {report['tasks']['completed']}/{spec.tasks} "
+              f"({report['throughput_tasks_per_minute']} tasks/min)")
+        print(f"  attempts     {report['attempts']} ({report['failed_attempts']} failed)")
+        print(f"  utilization  {report['slot_utilization']}")
+        print(f"  polls        {daemon['polls']} (overhead avg {daemon['poll_overhead_ms']['avg']} ms, "
+              f"p95 {daemon['poll_overhead_ms']['p95']} ms)")
+        print(f"  DB stmts     {daemon['db_statements']} "
+              f"(avg {daemon['db_statements_per_poll']['avg']} / poll)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
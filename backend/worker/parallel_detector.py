@@ -3,25 +3,34 @@ AI PM Framework - Parallel Task Detection Module
 
 Detects tasks within an ORDER that can be launched in parallel based on:
 1. No dependency conflicts (all dependencies completed)
-2. No file lock conflicts (no overlapping target_files)
+2. No file lock conflicts (no overlapping target_files; directory and glob
+   locks cover the files below them - see utils.file_lock.PathLockTrie)
 3. Task status is QUEUED
 
 Integrates logic from ORDER_076 (file locks) and ORDER_078 (dependency auto-trigger).
 """
 
 import logging
-from typing import List, Dict, Any, Set, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
 
 from utils.db import (
     get_connection, fetch_all, fetch_one,
     row_to_dict, rows_to_dicts
 )
-from utils.file_lock import FileLockManager
+from utils.file_lock import FileLockManager, PathLockTrie
 from utils.task_unblock import TaskUnblocker
+from worker.dependency_resolver import DependencyGraph, ResidentDependencyGraph
+from worker.task_duration import DEFAULT_TASK_SECONDS, fetch_task_rows, get_model
 
 logger = logging.getLogger(__name__)
 
+# Launch ordering policies for find_parallel_launchable_tasks()
+ORDERING_CRITICAL_PATH = "critical_path"
+ORDERING_PRIORITY = "priority"
+
+_PRIORITY_RANK = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+
 
 class ParallelTaskDetector:
     """Detects tasks that can be launched in parallel"""
@@ -30,7 +39,9 @@ class ParallelTaskDetector:
     def find_parallel_launchable_tasks(
         project_id: str,
         order_id: str,
-        max_tasks: int = 10
+        max_tasks: int = 10,
+        ordering: str = ORDERING_CRITICAL_PATH,
+        dependency_graph: Optional[ResidentDependencyGraph] = None,
     ) -> List[Dict[str, Any]]:
         """
         Find all QUEUED tasks in an ORDER that can be launched in parallel
@@ -39,10 +50,16 @@ class ParallelTaskDetector:
             project_id: Project ID
             order_id: ORDER ID to search within
             max_tasks: Maximum number of tasks to return (default: 10)
+            ordering: ORDERING_CRITICAL_PATH (default) or ORDERING_PRIORITY
+            dependency_graph: Resident graph kept by the launcher daemon; when
+                given, dependency readiness comes from its counters instead of
+                a COUNT(*) query per task
 
         Returns:
-            List of task info dicts that can be launched in parallel
-            Sorted by priority (P0 > P1 > P2 > P3) and creation time
+            List of task info dicts that can be launched in parallel.
+            Sorted by priority (P0 > P1 > P2 > P3), then - with critical_path
+            ordering - by longest remaining weighted path to ORDER completion
+            (``critical_path_rank``, predicted seconds), then creation time
         """
         conn = get_connection()
         try:
@@ -50,7 +67,8 @@ class ParallelTaskDetector:
             queued_tasks = fetch_all(
                 conn,
                 """
-                SELECT id, title, priority, status, target_files, created_at
+                SELECT id, title, priority, status, target_files, created_at,
+                       complexity_score
                 FROM tasks
                 WHERE project_id = ?
                   AND order_id = ?
@@ -73,27 +91,37 @@ class ParallelTaskDetector:
 
             logger.info(f"Found {len(queued_tasks)} QUEUED tasks in {order_id}")
 
+            queued_dicts = [
+                row_to_dict(task) if not isinstance(task, dict) else task
+                for task in queued_tasks
+            ]
+            if ordering == ORDERING_CRITICAL_PATH and len(queued_dicts) > 1:
+                queued_dicts = ParallelTaskDetector._order_by_critical_path(
+                    conn, project_id, order_id, queued_dicts, dependency_graph
+                )
+
             # Filter tasks that can be launched
             launchable_tasks = []
-            locked_files: Set[str] = set()
+            lock_index = PathLockTrie.load(conn, project_id)
+            held_by = lock_index.task_ids
 
-            for task in queued_tasks:
-                task_dict = row_to_dict(task) if not isinstance(task, dict) else task
+            for task_dict in queued_dicts:
                 task_id = task_dict["id"]
+                target_files = FileLockManager.parse_target_files(
+                    task_dict.get("target_files")
+                )
 
                 # Check if task can be launched
                 can_launch, reason = ParallelTaskDetector._can_task_launch(
-                    conn, project_id, task_id, locked_files
+                    conn, project_id, task_id, target_files, lock_index, held_by,
+                    dependency_graph
                 )
 
                 if can_launch:
                     launchable_tasks.append(task_dict)
 
-                    # Add this task's target files to locked set
-                    target_files = FileLockManager.parse_target_files(
-                        task_dict.get("target_files")
-                    )
-                    locked_files.update(target_files)
+                    # Add this task's target files to the lock index
+                    lock_index.add_many(task_id, target_files)
 
                     logger.info(f"Task {task_id} can be launched: {reason}")
 
@@ -113,12 +141,64 @@ class ParallelTaskDetector:
         finally:
             conn.close()
 
+    @staticmethod
+    def _order_by_critical_path(
+        conn,
+        project_id: str,
+        order_id: str,
+        queued_tasks: List[Dict[str, Any]],
+        graph: Optional[DependencyGraph] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Re-order QUEUED tasks by longest remaining weighted path (bottom level)
+
+        Weights are predicted durations from the task prediction model
+        (worker/task_duration.py). Within a priority bucket, tasks that head
+        the longest chain of predicted work are launched first, which shortens the ORDER makespan
+        for a fixed number of workers. Falls back to the incoming
+        (priority, created_at) order on any error.
+        """
+        try:
+            model = get_model(project_id, conn)
+            weights = {
+                task["id"]: model.predict_task(task)["seconds"]
+                for task in fetch_task_rows(conn, project_id, order_id)
+            }
+            if graph is None:
+                graph = DependencyGraph().build_graph(project_id, order_id, conn)
+            ranks = graph.get_remaining_path_lengths(
+                weights, default_weight=DEFAULT_TASK_SECONDS
+            )
+        except Exception as e:
+            logger.warning(
+                f"Critical-path ordering unavailable for {order_id}, "
+                f"falling back to priority order: {e}"
+            )
+            return queued_tasks
+
+        for task in queued_tasks:
+            task["critical_path_rank"] = round(
+                ranks.get(task["id"], weights.get(task["id"], 0.0)), 1
+            )
+
+        # sorted() is stable: ties keep the (priority, created_at) order
+        return sorted(
+            queued_tasks,
+            key=lambda t: (
+                _PRIORITY_RANK.get(t.get("priority"), 3),
+                -t["critical_path_rank"],
+            ),
+        )
+
     @staticmethod
     def _can_task_launch(
         conn,
         project_id: str,
         task_id: str,
-        already_locked_files: Set[str]
+        target_files: List[str],
+        lock_index: PathLockTrie,
+        held_by: Set[str],
+        dependency_graph: Optional[ResidentDependencyGraph] = None,
     ) -> Tuple[bool, str]:
         """
         Check if a task can be launched in parallel
@@ -127,24 +207,38 @@ class ParallelTaskDetector:
             conn: Database connection
             project_id: Project ID
             task_id: Task ID to check
-            already_locked_files: Set of files that will be locked by other parallel tasks
+            target_files: The task's target files
+            lock_index: Locks held in the DB plus those of tasks already picked
+                in this pass (loaded once per pass)
+            held_by: Task IDs holding locks in the DB when the index was loaded
+            dependency_graph: Optional resident graph answering dependency readiness
 
         Returns:
             Tuple of (can_launch: bool, reason: str)
         """
         # Check 1: All dependencies must be COMPLETED or DONE
-        if not ParallelTaskDetector._check_dependencies_ready(conn, project_id, task_id):
+        deps_ready = None
+        if dependency_graph is not None:
+            deps_ready = dependency_graph.dependencies_satisfied(task_id)
+        if deps_ready is None:
+            deps_ready = ParallelTaskDetector._check_dependencies_ready(conn, project_id, task_id)
+        if not deps_ready:
             return (False, "pending dependencies")
 
+        if not target_files:
+            return (True, "all checks passed")
+        blocking_tasks = lock_index.blocking_tasks(target_files)
+
         # Check 2: No file lock conflicts with existing IN_PROGRESS tasks
-        can_start, blocking_tasks = FileLockManager.can_task_start(project_id, task_id)
-        if not can_start:
-            return (False, f"file locks held by {', '.join(blocking_tasks)}")
+        held = [t for t in blocking_tasks if t in held_by]
+        if held:
+            return (False, f"file locks held by {', '.join(held)}")
 
         # Check 3: No file conflicts with other parallel launch candidates
-        if ParallelTaskDetector._has_file_conflict(
-            conn, project_id, task_id, already_locked_files
-        ):
+        if blocking_tasks:
+            logger.debug(
+                f"Task {task_id} has file conflicts with {', '.join(blocking_tasks)}"
+            )
             return (False, "file conflict with parallel tasks")
 
         return (True, "all checks passed")
@@ -179,55 +273,6 @@ class ParallelTaskDetector:
 
         return pending_deps is None or pending_deps["count"] == 0
 
-    @staticmethod
-    def _has_file_conflict(
-        conn,
-        project_id: str,
-        task_id: str,
-        already_locked_files: Set[str]
-    ) -> bool:
-        """
-        Check if task's target files conflict with already locked files
-
-        Args:
-            conn: Database connection
-            project_id: Project ID
-            task_id: Task ID to check
-            already_locked_files: Set of files already locked by parallel tasks
-
-        Returns:
-            True if there's a conflict, False otherwise
-        """
-        if not already_locked_files:
-            # No files locked yet, no conflict possible
-            return False
-
-        # Get task's target files
-        task = fetch_one(
-            conn,
-            "SELECT target_files FROM tasks WHERE id = ? AND project_id = ?",
-            (task_id, project_id)
-        )
-
-        if not task or not task["target_files"]:
-            # No target files specified, no conflict
-            return False
-
-        target_files = FileLockManager.parse_target_files(task["target_files"])
-        if not target_files:
-            # No valid target files, no conflict
-            return False
-
-        # Check for intersection
-        conflicts = already_locked_files.intersection(set(target_files))
-        if conflicts:
-            logger.debug(
-                f"Task {task_id} has file conflicts: {', '.join(conflicts)}"
-            )
-            return True
-
-        return False
-
     @staticmethod
     def get_parallel_launch_summary(
         project_id: str,
@@ -286,18 +331,18 @@ class ParallelTaskDetector:
 
             blocked_by_deps = []
             blocked_by_locks = []
-            locked_files: Set[str] = set()
+            lock_index = PathLockTrie.load(conn, project_id)
 
             for task in all_queued:
                 task_dict = row_to_dict(task) if not isinstance(task, dict) else task
                 task_id = task_dict["id"]
+                target_files = FileLockManager.parse_target_files(
+                    task_dict.get("target_files")
+                )
 
                 # Skip if already in launchable list
                 if any(t["id"] == task_id for t in launchable_tasks):
-                    target_files = FileLockManager.parse_target_files(
-                        task_dict.get("target_files")
-                    )
-                    locked_files.update(target_files)
+                    lock_index.add_many(task_id, target_files)
                     continue
 
                 # Determine blocking reason
@@ -305,11 +350,7 @@ class ParallelTaskDetector:
                     conn, project_id, task_id
                 ):
                     blocked_by_deps.append(task_id)
-                elif not FileLockManager.can_task_start(project_id, task_id)[0]:
-                    blocked_by_locks.append(task_id)
-                elif ParallelTaskDetector._has_file_conflict(
-                    conn, project_id, task_id, locked_files
-                ):
+                elif lock_index.blocking_tasks(target_files):
                     blocked_by_locks.append(task_id)
 
             return {
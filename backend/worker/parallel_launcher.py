@@ -17,6 +17,8 @@ Options:
     --timeout SEC       Worker timeout in seconds (default: 1800)
     --model MODEL       AI model for workers (haiku/sonnet/opus)
     --no-review         Disable auto-review after worker completion
+    --warm-pool-size N  Daemon: pre-imported idle worker processes (0 = cold spawn only)
+    --metrics-port N    Daemon: serve metrics on http://127.0.0.1:N/metrics (0 = any free port)
 
 Example:
     python -m worker.parallel_launcher ai_pm_manager ORDER_090
@@ -25,7 +27,7 @@ Example:
 """
 
 import argparse
-import asyncio
+import functools
 import json
 import logging
 import os
@@ -70,11 +72,46 @@ except ImportError:
     _HAS_RECOVER_CRASHED = False
 
 try:
-    from worker.dependency_resolver import resolve_on_completion
+    from worker.dependency_resolver import ResidentDependencyGraph, resolve_on_completion
     _HAS_DEPENDENCY_RESOLVER = True
 except ImportError:
     _HAS_DEPENDENCY_RESOLVER = False
 
+# Event-driven child exit notification (pidfd / waiter threads)
+try:
+    from worker.child_watcher import ChildExitWatcher
+    _HAS_CHILD_WATCHER = True
+except ImportError:
+    _HAS_CHILD_WATCHER = False
+
+# Pre-imported idle worker processes for fast launches
+try:
+    from worker.warm_pool import KIND_EXECUTE_TASK, KIND_REVIEW_WORKER, WarmWorkerPool
+    _HAS_WARM_POOL = True
+except ImportError:
+    KIND_EXECUTE_TASK, KIND_REVIEW_WORKER = "execute_task", "review_worker"
+    _HAS_WARM_POOL = False
+
+# Metrics registry and /metrics endpoint for daemon mode
+try:
+    from worker.daemon_metrics import DaemonMetrics, MetricsServer, read_step_spans
+    _HAS_DAEMON_METRICS = True
+except ImportError:
+    _HAS_DAEMON_METRICS = False
+
+# Daemon liveness / lease registry (daemons table)
+try:
+    from worker.daemon_registry import (
+        DAEMON_LEASE_SECONDS,
+        DaemonLease,
+        order_daemon,
+        reclaim_stale,
+        task_owners,
+    )
+    _HAS_DAEMON_REGISTRY = True
+except ImportError:
+    _HAS_DAEMON_REGISTRY = False
+
 # 権限プロファイル自動判定（ORDER_121）
 try:
     from worker.permission_resolver import PermissionResolver
@@ -84,6 +121,30 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# ORDER_042: consecutive launch failures of one task before it is escalated
+MAX_LAUNCH_FAILURES = 5
+
+
+def summarize_latencies(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize per-worker latencies recorded by the daemon.
+
+    - worker_exit_latency: child exit observed -> reaping, REPORT
+      verification and dependency resolution finished
+    - worker_launch_latency: launch requested -> job started in the
+      (warm) worker process
+
+    Entries without a measurement (exits found by a poll sweep, cold
+    launches) are counted but not averaged.
+    """
+    measured = [e["latency_ms"] for e in entries if e.get("latency_ms") is not None]
+    return {
+        "count": len(entries),
+        "measured": len(measured),
+        "avg_ms": round(sum(measured) / len(measured), 1) if measured else None,
+        "max_ms": max(measured) if measured else None,
+    }
+
 
 def find_orphaned_done_tasks(
     project_id: Optional[str] = None,
@@ -278,6 +339,25 @@ class ParallelWorkerLauncher:
         self._event_notifier: Optional[Any] = None
         self._adaptive_poller: Optional[Any] = None
 
+        # Resident dependency graph for this ORDER (loaded lazily by the daemon)
+        self._dependency_graph: Optional[Any] = None
+
+        # Child exit notification (set up by daemon_loop / GlobalScheduler)
+        self._child_watcher: Optional[Any] = None
+        # {task_id: (pid, exited_at)} filled by watcher callbacks
+        self._exited_workers: Dict[str, tuple] = {}
+        # [(task_id, exit_code, exited_at)] reaped but not yet dependency-resolved
+        self._pending_exit_latencies: List[tuple] = []
+
+        # Warm worker pool (set up by daemon_loop / GlobalScheduler)
+        self._warm_pool: Optional[Any] = None
+
+        # Daemon metrics (set up by daemon_loop / GlobalScheduler)
+        self._metrics: Optional[Any] = None
+        self._metrics_url: Optional[str] = None
+        # Lease on this ORDER's daemons row (daemon mode only)
+        self._lease: Optional[Any] = None
+
         self.results: Dict[str, Any] = {
             "project_id": project_id,
             "order_id": order_id,
@@ -702,46 +782,277 @@ class ParallelWorkerLauncher:
             logger.error(f"Failed to get worker status summary: {e}")
             return {}
 
+    # ------------------------------------------------------------------
+    # Managed mode: per-cycle steps driven by daemon_loop / GlobalScheduler
+    # ------------------------------------------------------------------
+
+    def init_daemon_state(self) -> None:
+        """
+        Initialize the per-ORDER state used by the resident loop.
+
+        Resets the consecutive launch failure counters (ORDER_042) and creates
+        the EventNotifier when available. Called by daemon_loop() and by the
+        GlobalScheduler when it takes over an ORDER.
+        """
+        self._task_launch_failure_count: Dict[str, int] = {}
+        self._max_launch_failures = MAX_LAUNCH_FAILURES
+        self._event_notifier = EventNotifier(self.project_id, self.order_id) if _HAS_EVENT_NOTIFIER else None
+
+    def attach_shared(
+        self,
+        *,
+        child_watcher: Optional[Any] = None,
+        warm_pool: Optional[Any] = None,
+        metrics: Optional[Any] = None,
+    ) -> None:
+        """
+        Use components owned by the caller (GlobalScheduler) instead of
+        per-launcher ones. Passing None detaches a component.
+        """
+        self._child_watcher = child_watcher
+        self._warm_pool = warm_pool
+        self._metrics = metrics
+
+    @property
+    def running_task_ids(self) -> List[str]:
+        """Task IDs of the Workers currently tracked by this launcher."""
+        return list(self._running_workers)
+
+    def running_priorities(self) -> List[str]:
+        """Priority of each running Worker (P1 when unknown)."""
+        return [info.get("priority") or "P1" for info in self._running_workers.values()]
+
+    def has_running_processes(self) -> bool:
+        """True while any Worker or review_worker process is tracked."""
+        return bool(self._running_workers or self._running_review_workers)
+
+    def owned_tasks(self) -> List[Dict[str, Any]]:
+        """Running workers as daemons.owned_tasks entries."""
+        return self._owned_tasks()
+
+    def dependency_graph(self) -> Optional[Any]:
+        """Resident dependency graph for this ORDER (None if unavailable)."""
+        return self._get_dependency_graph()
+
+    def reap_step(self, full_sweep: bool = True) -> None:
+        """
+        Reap finished Workers, check the health of the remaining ones and
+        reap finished review_workers.
+
+        Args:
+            full_sweep: Poll every Worker, not only those the child watcher
+                reported as exited
+        """
+        self._reap_finished_workers(full_sweep=full_sweep)
+        if self._running_workers:
+            self._check_worker_health()
+        self._reap_finished_review_workers()
+
+    def process_events(self) -> List[Dict[str, Any]]:
+        """
+        Consume pending events and resolve dependencies for completions
+        (TASK_1090), then record exit latencies of the reaped Workers.
+
+        Returns:
+            Consumed events (empty when EventNotifier is unavailable)
+        """
+        events = self._event_notifier.consume_events() if self._event_notifier else []
+        for ev in events:
+            ev_type = ev.get("event_type", "")
+            ev_task_id = ev.get("task_id", "")
+            logger.info(f"[daemon] Event consumed: {ev_type} for {ev_task_id}")
+            if ev_type in ("TASK_COMPLETED", "DEPENDENCY_RESOLVED") and _HAS_DEPENDENCY_RESOLVER:
+                try:
+                    newly_queued = self._resolve_completion_event(ev_task_id, ev.get("timestamp"))
+                    if newly_queued:
+                        logger.info(
+                            f"[daemon] {self.order_id}: DependencyResolver unblocked "
+                            f"{len(newly_queued)} task(s): {newly_queued}"
+                        )
+                except Exception as e:
+                    logger.warning(f"[daemon] dependency resolution failed for {ev_task_id}: {e}")
+        self._record_exit_latencies()
+        return events
+
+    def check_status_counts(self, counts: Dict[str, int]) -> None:
+        """
+        Run the per-ORDER safety checks that the status counts call for.
+
+        Looks for orphaned IN_PROGRESS tasks only when the DB has more of them
+        than this launcher tracks, and for ESCALATED timeouts only when there
+        are ESCALATED tasks.
+
+        Args:
+            counts: {status: task count} for this ORDER
+        """
+        if counts.get("IN_PROGRESS", 0) > len(self._running_workers):
+            self._detect_orphaned_in_progress_tasks()
+        if counts.get("ESCALATED", 0) > 0:
+            self._check_escalated_timeout()
+
+    def launch_batch(self, tasks: List[Dict[str, Any]]) -> int:
+        """
+        Launch Workers for the given tasks (daemon mode).
+
+        Returns:
+            Number of Workers actually started
+        """
+        before = len(self._running_workers)
+        self._daemon_launch_batch(tasks)
+        return len(self._running_workers) - before
+
+    def launch_review_worker(self, task: Dict[str, Any]) -> bool:
+        """Launch review_worker for a DONE task awaiting review."""
+        return self._launch_review_worker(task)
+
+    def finish(self) -> None:
+        """Final reap on shutdown: record exit latencies and close log handles."""
+        self._reap_finished_workers()
+        self._record_exit_latencies()
+        self._cleanup_log_handles()
+
+    def release(self) -> None:
+        """Release resources of an ORDER that is no longer managed."""
+        self._cleanup_log_handles()
+        if self._event_notifier:
+            try:
+                self._event_notifier.cleanup_old_events()
+            except Exception as e:
+                logger.debug(f"[daemon] Event cleanup failed: {e}")
+
 
     # ------------------------------------------------------------------
     # Parent heartbeat (TASK_1014)
     # ------------------------------------------------------------------
 
-    def _get_heartbeat_file_path(self) -> Path:
+    def _get_dependency_graph(self) -> Optional[Any]:
         """
-        Return the heartbeat file path for this daemon instance.
+        Return the resident dependency graph for this ORDER.
 
-        Location: PROJECTS/{project_id}/RESULT/{order_id}/LOGS/daemon_heartbeat.json
+        Loaded on first use and reconciled against the DB every
+        ``reconcile_interval`` seconds to pick up external edits (new
+        dependencies, REWORK of a predecessor, approvals by other
+        processes). Returns None when the resolver is unavailable or the
+        graph cannot be loaded; callers then fall back to SQL checks.
         """
-        log_dir = self._get_log_dir()
-        return log_dir / "daemon_heartbeat.json"
+        if not _HAS_DEPENDENCY_RESOLVER:
+            return None
+
+        if self._dependency_graph is None:
+            try:
+                self._dependency_graph = ResidentDependencyGraph(
+                    self.project_id, self.order_id
+                ).load()
+                logger.info(
+                    f"[daemon] Resident dependency graph loaded: "
+                    f"{self._dependency_graph.node_count} nodes, "
+                    f"{self._dependency_graph.edge_count} edges"
+                )
+            except Exception as e:
+                logger.warning(f"[daemon] Failed to load dependency graph: {e}")
+                self._dependency_graph = None
+            return self._dependency_graph
+
+        if self._dependency_graph.needs_reconcile():
+            try:
+                unblocked = self._dependency_graph.reconcile()
+                if unblocked:
+                    logger.info(
+                        f"[daemon] Dependency graph reconcile unblocked "
+                        f"{len(unblocked)} task(s): {unblocked}"
+                    )
+            except Exception as e:
+                logger.warning(f"[daemon] Dependency graph reconcile failed: {e}")
+        return self._dependency_graph
+
+    def _resolve_completion_event(self, task_id: str, event_time: Optional[str] = None) -> List[str]:
+        """
+        Apply a TASK_COMPLETED / DEPENDENCY_RESOLVED event.
+
+        Uses the resident graph (O(out-degree) counter updates plus one
+        batched UPDATE) and falls back to resolve_on_completion() when the
+        graph is unavailable.
+
+        Args:
+            task_id: Completed task
+            event_time: Event timestamp; unblocked tasks are measured from
+                it for the event-to-launch delay metric
+
+        Returns:
+            Task IDs transitioned BLOCKED -> QUEUED
+        """
+        graph = self._get_dependency_graph()
+        if graph is not None:
+            newly_queued = graph.on_task_completed(task_id)
+        else:
+            newly_queued = resolve_on_completion(self.project_id, self.order_id, task_id)
+        if self._metrics is not None:
+            # Successors may already have been released by the process that
+            # approved the task; the event still marks when they became ready
+            ready = set(newly_queued)
+            if graph is not None:
+                ready.update(graph.get_successors(task_id))
+            self._metrics.mark_ready(ready, event_time)
+        return newly_queued
+
+    def _acquire_lease(self) -> bool:
+        """
+        Register this daemon in the ``daemons`` table.
+
+        Expired leases (daemons that died without releasing) are reclaimed
+        first; their IN_PROGRESS tasks are picked up by orphan detection.
+
+        Returns:
+            False if another live daemon already runs this ORDER.
+            True when the lease is held or the registry is unavailable.
+        """
+        if not _HAS_DAEMON_REGISTRY:
+            return True
+        lease = DaemonLease.for_order(
+            self.project_id,
+            self.order_id,
+            lease_seconds=max(DAEMON_LEASE_SECONDS, 3 * int(self.poll_interval)),
+        )
+        try:
+            for row in reclaim_stale():
+                logger.info(
+                    f"[heartbeat] Reclaimed stale lease {row['daemon_id']} "
+                    f"(PID {row['pid']}, {len(row['owned_tasks'])} task(s))"
+                )
+            if not lease.acquire():
+                return False
+        except Exception as e:
+            # Registry table missing (migration not applied) etc.
+            logger.warning(f"[heartbeat] Daemon registry unavailable: {e}")
+            return True
+        self._lease = lease
+        return True
+
+    def _owned_tasks(self) -> List[Dict[str, Any]]:
+        """Running workers as daemons.owned_tasks entries."""
+        return [
+            {
+                "project_id": self.project_id,
+                "order_id": self.order_id,
+                "task_id": task_id,
+                "pid": info["pid"],
+            }
+            for task_id, info in self._running_workers.items()
+        ]
 
     def _write_heartbeat(self) -> None:
         """
-        Write heartbeat to a JSON file. Called every poll cycle.
+        Renew this daemon's lease. Called every poll cycle.
 
-        The file contains:
-        - pid: daemon process PID
-        - order_id: the ORDER being managed
-        - project_id: project name
-        - timestamp: ISO-format last-update time
-        - active_workers: count of running workers
-        - active_worker_pids: list of worker PIDs
-        - status: "running" or "shutting_down"
+        The row carries the owned tasks (task ID + worker PID), the status
+        ("running" / "shutting_down") and, in ``info_json``:
         - adaptive_poll_interval: current adaptive polling interval (if available)
         - resource_trend: resource trend status (if available)
+        - metrics_url: /metrics endpoint (if enabled)
         """
-        heartbeat_path = self._get_heartbeat_file_path()
-        data = {
-            "pid": os.getpid(),
-            "order_id": self.order_id,
-            "project_id": self.project_id,
-            "timestamp": datetime.now().isoformat(),
-            "active_workers": len(self._running_workers),
-            "active_worker_pids": [
-                info["pid"] for info in self._running_workers.values()
-            ],
-            "status": "shutting_down" if self._shutdown_requested else "running",
+        if self._lease is None:
+            return
+        info = {
             "adaptive_poll_interval": (
                 self._adaptive_poller.get_next_interval()
                 if self._adaptive_poller else None
@@ -750,29 +1061,39 @@ class ParallelWorkerLauncher:
                 self.resource_monitor.get_trend_status()
                 if self.resource_monitor else None
             ),
+            "metrics_url": self._metrics_url,
         }
         try:
-            heartbeat_path.write_text(
-                json.dumps(data, ensure_ascii=False, indent=2),
-                encoding="utf-8",
+            held = self._lease.heartbeat(
+                self._owned_tasks(),
+                status="shutting_down" if self._shutdown_requested else "running",
+                info=info,
             )
         except Exception as e:
-            logger.debug(f"[heartbeat] Failed to write heartbeat file: {e}")
+            logger.debug(f"[heartbeat] Failed to renew lease: {e}")
+            return
+        if not held:
+            logger.error(
+                f"[heartbeat] Lease for {self.order_id} was taken over by another daemon; "
+                f"shutting down"
+            )
+            self._shutdown_requested = True
 
     def _remove_heartbeat(self) -> None:
-        """Remove the heartbeat file on clean shutdown."""
+        """Release the lease on clean shutdown."""
+        if self._lease is None:
+            return
         try:
-            hb_path = self._get_heartbeat_file_path()
-            if hb_path.exists():
-                hb_path.unlink()
-                logger.debug("[heartbeat] Heartbeat file removed")
+            self._lease.release()
+            logger.debug("[heartbeat] Lease released")
         except Exception as e:
-            logger.debug(f"[heartbeat] Failed to remove heartbeat file: {e}")
+            logger.debug(f"[heartbeat] Failed to release lease: {e}")
+        self._lease = None
 
     @staticmethod
     def read_heartbeat(project_id: str, order_id: str) -> Optional[Dict[str, Any]]:
         """
-        Read and validate a daemon's heartbeat file.
+        Read the liveness entry of the daemon running an ORDER.
 
         This is a static/class method so it can be called from external
         code (e.g. Electron app, CLI health check) without instantiating
@@ -783,27 +1104,41 @@ class ParallelWorkerLauncher:
             order_id: ORDER ID
 
         Returns:
-            Heartbeat dict if file exists and is fresh, else None.
-            Returns None if the file is older than 60 seconds.
+            Heartbeat dict from the ``daemons`` table, else None.
+            ``is_alive`` is False once the lease has expired.
+            When the ORDER is run by the global scheduler (worker/global_scheduler.py)
+            instead of a per-ORDER daemon, the scheduler entry is returned
+            (``scheduler`` is True) with this ORDER's workers only.
         """
-        hb_path = (
-            USER_DATA_PATH / "PROJECTS" / project_id / "RESULT" / order_id
-            / "LOGS" / "daemon_heartbeat.json"
-        )
+        if not _HAS_DAEMON_REGISTRY:
+            return None
         try:
-            if not hb_path.exists():
-                return None
-
-            data = json.loads(hb_path.read_text(encoding="utf-8"))
-
-            # Check freshness: file mtime
-            age = time.time() - hb_path.stat().st_mtime
-            data["age_seconds"] = round(age, 1)
-            data["is_alive"] = age < 60  # considered alive if updated within 60s
-
-            return data
+            row = order_daemon(project_id, order_id)
         except Exception:
             return None
+        if row is None:
+            return None
+        pids = [
+            t.get("pid") for t in row["owned_tasks"]
+            if t.get("project_id") == project_id and t.get("order_id") == order_id
+        ]
+        data = {
+            "pid": row["pid"],
+            "order_id": order_id,
+            "project_id": project_id,
+            "timestamp": row["heartbeat_at"],
+            "active_workers": len(pids),
+            "active_worker_pids": pids,
+            "status": row["status"],
+            "age_seconds": row["age_seconds"],
+            "is_alive": row["is_alive"],
+        }
+        if row["kind"] == "scheduler":
+            data["scheduler"] = True
+            data["metrics_url"] = row["info"].get("metrics_url")
+        else:
+            data.update(row["info"])
+        return data
 
     # ------------------------------------------------------------------
     # Daemon mode (--daemon): polling loop until ORDER complete
@@ -832,12 +1167,24 @@ class ParallelWorkerLauncher:
             f"(poll_interval={self.poll_interval}s, max_workers={self.max_workers})"
         )
 
+        # One daemon per ORDER: refuse to start while another holds a live lease
+        if not self._acquire_lease():
+            holder = self.read_heartbeat(self.project_id, self.order_id) or {}
+            msg = (
+                f"daemon_loop: {self.order_id} is already run by "
+                f"PID {holder.get('pid')} (lease still alive)"
+            )
+            logger.error(f"[daemon] {msg}")
+            self.results["errors"].append(msg)
+            self.results["end_time"] = datetime.now().isoformat()
+            return self.results
+
         # Register signal handlers for graceful shutdown
         self._register_signal_handlers()
 
-        # Initialize event-driven components (TASK_1090)
+        # Per-ORDER state: launch failure counters (ORDER_042), EventNotifier (TASK_1090)
+        self.init_daemon_state()
         if _HAS_EVENT_NOTIFIER:
-            self._event_notifier = EventNotifier(self.project_id, self.order_id)
             self._adaptive_poller = AdaptivePoller(
                 min_interval=1.0,
                 max_interval=30.0,
@@ -849,7 +1196,6 @@ class ParallelWorkerLauncher:
                 f"{self._adaptive_poller.max_interval:.0f}s)"
             )
         else:
-            self._event_notifier = None
             self._adaptive_poller = None
             logger.info("[daemon] Event-driven mode unavailable (EventNotifier not found)")
 
@@ -858,23 +1204,60 @@ class ParallelWorkerLauncher:
         else:
             logger.info("[daemon] DependencyResolver not available, using DB-only task detection")
 
+        own_watcher = self._child_watcher is None and _HAS_CHILD_WATCHER
+        if own_watcher:
+            self._child_watcher = ChildExitWatcher()
+        if self._child_watcher is not None:
+            logger.info(
+                f"[daemon] Child exit notification enabled ({self._child_watcher.backend})"
+            )
+
+        own_pool = (
+            self._warm_pool is None
+            and _HAS_WARM_POOL
+            and self.worker_config.warm_pool_size > 0
+        )
+        if own_pool:
+            self._warm_pool = WarmWorkerPool(
+                self.worker_config.warm_pool_size,
+                log_file=self._get_log_dir() / "warm_pool.log",
+            ).start()
+            logger.info(f"[daemon] Warm worker pool enabled (size={self._warm_pool.size})")
+
+        own_metrics = self._metrics is None and _HAS_DAEMON_METRICS
+        metrics_server = None
+        if own_metrics:
+            self._metrics = DaemonMetrics()
+            self._metrics.install()
+            if self.worker_config.metrics_port is not None:
+                try:
+                    metrics_server = MetricsServer(
+                        self._metrics.registry, port=self.worker_config.metrics_port
+                    ).start()
+                    self._metrics_url = metrics_server.url
+                    logger.info(f"[daemon] Metrics endpoint: {self._metrics_url}")
+                except OSError as e:
+                    logger.warning(f"[daemon] Cannot start metrics endpoint: {e}")
+
         daemon_start = datetime.now()
         loop_count = 0
         # Track time for periodic checks (orphan review) independent of adaptive interval
         last_orphan_check_time = time.time()
         orphan_check_interval = 60  # seconds
 
-        # ORDER_042: Track consecutive launch failures per task to prevent infinite retry loops
-        self._task_launch_failure_count: Dict[str, int] = {}
-        self._max_launch_failures = 5  # Max consecutive failures before escalating
-
         try:
             while not self._shutdown_requested:
                 loop_count += 1
                 logger.debug(f"[daemon] poll #{loop_count}")
-
-                # 1. Reap finished workers
-                self._reap_finished_workers()
+                if self._metrics is not None:
+                    self._metrics.begin_poll()
+
+                # 1. Reap finished workers (watched workers only when notified;
+                #    full poll sweep every ~60s as a safety net)
+                sweep_due = time.time() - last_orphan_check_time >= orphan_check_interval
+                self._reap_finished_workers(
+                    full_sweep=self._child_watcher is None or sweep_due
+                )
 
                 # 1.5. Check worker health (PID alive, process timeout, log staleness)
                 if self._running_workers:
@@ -908,34 +1291,10 @@ class ParallelWorkerLauncher:
                 self._reap_finished_review_workers()
 
                 # 2. Event consumption + dependency resolution (TASK_1090)
-                if self._event_notifier:
-                    events = self._event_notifier.consume_events()
+                events = self.process_events()
+                if self._adaptive_poller:
                     if events:
                         self._adaptive_poller.notify_event_detected()
-                        for ev in events:
-                            ev_type = ev.get("event_type", "")
-                            ev_task_id = ev.get("task_id", "")
-                            logger.info(
-                                f"[daemon] Event consumed: {ev_type} for {ev_task_id}"
-                            )
-                            if ev_type in ("TASK_COMPLETED", "DEPENDENCY_RESOLVED"):
-                                if _HAS_DEPENDENCY_RESOLVER:
-                                    try:
-                                        newly_queued = resolve_on_completion(
-                                            self.project_id,
-                                            self.order_id,
-                                            ev_task_id,
-                                        )
-                                        if newly_queued:
-                                            logger.info(
-                                                f"[daemon] DependencyResolver unblocked "
-                                                f"{len(newly_queued)} task(s): {newly_queued}"
-                                            )
-                                    except Exception as e:
-                                        logger.warning(
-                                            f"[daemon] resolve_on_completion failed "
-                                            f"for {ev_task_id}: {e}"
-                                        )
                     else:
                         self._adaptive_poller.notify_idle_cycle()
 
@@ -948,6 +1307,8 @@ class ParallelWorkerLauncher:
 
                 # 3. Check if ORDER is complete
                 summary = self.get_worker_status_summary()
+                if self._metrics is not None:
+                    self._metrics.record_task_counts(self.project_id, self.order_id, summary)
                 if self._is_order_complete(summary):
                     logger.info(
                         f"[daemon] ORDER {self.order_id} complete: {summary}"
@@ -972,6 +1333,7 @@ class ParallelWorkerLauncher:
                         self.project_id,
                         self.order_id,
                         max_tasks=available_slots,
+                        dependency_graph=self._get_dependency_graph(),
                     )
 
                     if launchable:
@@ -982,6 +1344,9 @@ class ParallelWorkerLauncher:
                         )
                         self._daemon_launch_batch(launchable)
 
+                if self._metrics is not None:
+                    self._metrics.record_slots(len(self._running_workers), dynamic_max)
+
                 # 4.5. Write heartbeat
                 self._write_heartbeat()
 
@@ -990,6 +1355,9 @@ class ParallelWorkerLauncher:
                     # Piggyback on the orphan-check timing (~60s)
                     self._log_daemon_status(summary, daemon_start)
 
+                if self._metrics is not None:
+                    self._metrics.end_poll()
+
                 # 6. Adaptive sleep (TASK_1090)
                 if self._adaptive_poller:
                     sleep_interval = self._adaptive_poller.get_next_interval()
@@ -1004,15 +1372,25 @@ class ParallelWorkerLauncher:
             self.results["errors"].append(f"daemon_loop: {e}")
         finally:
             # Final reap
-            self._reap_finished_workers()
-            self._cleanup_log_handles()
+            self.finish()
             self._remove_heartbeat()
+            if own_watcher:
+                self._child_watcher.close()
+                self._child_watcher = None
+            if own_pool:
+                self.results["warm_pool_stats"] = self._warm_pool.to_dict()
+                self._warm_pool.close()
+                self._warm_pool = None
+            if own_metrics:
+                self._metrics.end_poll()
+                self.results["metrics"] = self._metrics.summary()
+                self._metrics.uninstall()
+                if metrics_server is not None:
+                    metrics_server.close()
+                self._metrics = None
+                self._metrics_url = None
             # Event cleanup (TASK_1090)
-            if self._event_notifier:
-                try:
-                    self._event_notifier.cleanup_old_events()
-                except Exception as e:
-                    logger.debug(f"[daemon] Event cleanup failed: {e}")
+            self.release()
 
         self.results["end_time"] = datetime.now().isoformat()
         self.results["daemon_loops"] = loop_count
@@ -1026,6 +1404,13 @@ class ParallelWorkerLauncher:
         if self._adaptive_poller:
             self.results["adaptive_poller_stats"] = self._adaptive_poller.to_dict()
 
+        self.results["worker_exit_latency_summary"] = summarize_latencies(
+            self.results.get("worker_exit_latency", [])
+        )
+        self.results["worker_launch_latency_summary"] = summarize_latencies(
+            self.results.get("worker_launch_latency", [])
+        )
+
         logger.info(
             f"[daemon] Daemon loop ended after {loop_count} polls "
             f"({elapsed:.0f}s). Final: {final_summary}"
@@ -1049,22 +1434,28 @@ class ParallelWorkerLauncher:
 
     def _interruptible_sleep(self, seconds: int) -> None:
         """Sleep in small increments so we can respond to shutdown quickly."""
-        for _ in range(seconds * 2):
-            if self._shutdown_requested:
-                break
-            time.sleep(0.5)
+        if seconds > 0:
+            self._interruptible_sleep_float(float(seconds))
 
     def _interruptible_sleep_float(self, seconds: float) -> None:
         """Sleep in small increments (0.5s) for float seconds.
 
         Similar to ``_interruptible_sleep`` but accepts float values,
         which is required for the AdaptivePoller integration.
+
+        With a child watcher the sleep also ends as soon as a Worker exits,
+        so reaping and dependency resolution happen without waiting for
+        the next poll.
         """
         steps = int(seconds / 0.5)
         for _ in range(max(steps, 1)):
             if self._shutdown_requested:
                 break
-            time.sleep(0.5)
+            if self._child_watcher is not None:
+                if self._child_watcher.wait(0.5):
+                    break
+            else:
+                time.sleep(0.5)
 
     def _is_order_complete(self, summary: Dict[str, Any]) -> bool:
         """
@@ -1083,7 +1474,7 @@ class ParallelWorkerLauncher:
         )
         return non_terminal == 0
 
-    def _reap_finished_workers(self) -> None:
+    def _reap_finished_workers(self, full_sweep: bool = True) -> None:
         """
         Check running workers and reap any that have finished.
 
@@ -1094,16 +1485,26 @@ class ParallelWorkerLauncher:
 
         Also checks PID liveness when proc.poll() returns None (TASK_1156):
         if the PID is actually dead (zombie/orphan), treat as crashed.
+
+        Args:
+            full_sweep: Poll every worker. When False, workers registered
+                with the child watcher are only polled after their exit
+                was notified.
         """
-        finished: List[tuple] = []  # list of (task_id, retcode)
+        finished: List[tuple] = []  # list of (task_id, retcode, exited_at)
         crashed_pids: List[str] = []  # task_ids whose PID is dead but poll() returned None
+        exited, self._exited_workers = self._exited_workers, {}
 
         for task_id, info in self._running_workers.items():
             proc: subprocess.Popen = info["process"]
+            exit_info = exited.get(task_id)
+            exited_at = exit_info[1] if exit_info and exit_info[0] == info["pid"] else None
+            if not full_sweep and info.get("watched") and exited_at is None:
+                continue
             retcode = proc.poll()  # None if still running
 
             if retcode is not None:
-                finished.append((task_id, retcode))
+                finished.append((task_id, retcode, exited_at))
                 if retcode == 0:
                     logger.info(
                         f"[daemon] Worker for {task_id} finished successfully "
@@ -1126,7 +1527,7 @@ class ParallelWorkerLauncher:
                     if hasattr(self, '_task_launch_failure_count'):
                         count = self._task_launch_failure_count.get(task_id, 0) + 1
                         self._task_launch_failure_count[task_id] = count
-                        max_failures = getattr(self, '_max_launch_failures', 5)
+                        max_failures = getattr(self, '_max_launch_failures', MAX_LAUNCH_FAILURES)
                         if count >= max_failures:
                             logger.error(
                                 f"[daemon] Task {task_id} has failed {count} times consecutively. "
@@ -1142,7 +1543,7 @@ class ParallelWorkerLauncher:
                                 )
                             except Exception as esc_err:
                                 logger.error(f"[daemon] Failed to escalate {task_id}: {esc_err}")
-            else:
+            elif not info.get("watched"):
                 # proc.poll() returned None (appears running), but verify PID is alive (TASK_1156)
                 pid = info["pid"]
                 if not self._is_pid_alive(pid):
@@ -1152,8 +1553,12 @@ class ParallelWorkerLauncher:
                     )
                     crashed_pids.append(task_id)
 
-        for task_id, retcode in finished:
-            del self._running_workers[task_id]
+        for task_id, retcode, exited_at in finished:
+            info = self._running_workers.pop(task_id)
+            self._record_launch_latency(task_id, info)
+            self._pending_exit_latencies.append((task_id, retcode, exited_at))
+            if self._metrics is not None:
+                self._record_worker_metrics(retcode, info)
 
             # ORDER_142: Worker正常終了時にREPORTファイル存在を検証
             if retcode == 0:
@@ -1162,6 +1567,13 @@ class ParallelWorkerLauncher:
                     USER_DATA_PATH / "PROJECTS" / self.project_id / "RESULT"
                     / self.order_id / "05_REPORT" / f"REPORT_{report_num}.md"
                 )
+                if not report_file.exists() and self._get_task_status(task_id) == "WAITING_INPUT":
+                    # Worker paused on a question detected mid-run; resumed after the answer
+                    logger.info(
+                        f"[daemon] Worker {task_id} exited 0 waiting for user input "
+                        f"(WAITING_INPUT, no REPORT yet)"
+                    )
+                    continue
                 if not report_file.exists():
                     logger.error(
                         f"[daemon] Worker {task_id} exited 0 but REPORT missing: {report_file}. "
@@ -1221,6 +1633,133 @@ class ParallelWorkerLauncher:
         for task_id in crashed_pids:
             self._recover_stuck_worker(task_id, detection_method="pid_alive_check")
 
+    def _get_task_status(self, task_id: str) -> Optional[str]:
+        """Current DB status of a task of this project (None if unknown)."""
+        try:
+            conn = get_connection()
+            try:
+                row = fetch_one(
+                    conn,
+                    "SELECT status FROM tasks WHERE id = ? AND project_id = ?",
+                    (task_id, self.project_id),
+                )
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.debug(f"[daemon] Failed to read status of {task_id}: {e}")
+            return None
+        return row["status"] if row else None
+
+    def _spawn_process(
+        self,
+        kind: str,
+        cmd: List[str],
+        log_file_path: Path,
+    ) -> tuple:
+        """
+        Start a Worker / review_worker process.
+
+        Uses an idle process from the warm pool when available (the job runs
+        the same script main() with ``cmd[2:]`` as argv); otherwise spawns
+        ``cmd`` cold with output to ``log_file_path``.
+
+        Returns:
+            (Popen, launch_mode) where launch_mode is "warm" or "cold"
+        """
+        if self._warm_pool is not None:
+            try:
+                process = self._warm_pool.launch(kind, cmd[2:], log_file_path)
+            except Exception as e:
+                logger.warning(f"[daemon] Warm pool launch failed, spawning cold: {e}")
+                process = None
+            if process is not None:
+                return process, "warm"
+
+        log_fh = open(str(log_file_path), "w", encoding="utf-8")
+        self._log_file_handles.append(log_fh)
+
+        # Ensure PYTHONPATH includes backend/ for python-embed compatibility
+        env = os.environ.copy()
+        env["PYTHONPATH"] = str(_package_root) + os.pathsep + env.get("PYTHONPATH", "")
+        process = subprocess.Popen(
+            cmd,
+            cwd=_package_root,
+            stdout=log_fh,
+            stderr=subprocess.STDOUT,
+            text=True,
+            env=env,
+        )
+        return process, "cold"
+
+    def _record_launch_latency(self, task_id: str, info: Dict[str, Any], kind: str = "worker") -> None:
+        """Record launch-to-first-step latency of a reaped process (warm launches only)."""
+        mode = info.get("launch_mode")
+        if mode is None:
+            return
+        latency_ms = None
+        if mode == "warm" and _HAS_WARM_POOL:
+            ack = WarmWorkerPool.read_ack(info["process"])
+            requested = info.get("launch_requested_at")
+            if ack and requested is not None:
+                latency_ms = round(max(ack["started_at"] - requested, 0.0) * 1000, 1)
+        if latency_ms is not None and self._metrics is not None:
+            self._metrics.record_launch_latency(kind, latency_ms)
+        self.results.setdefault("worker_launch_latency", []).append({
+            "task_id": task_id,
+            "kind": kind,
+            "mode": mode,
+            "latency_ms": latency_ms,
+        })
+
+    def _record_worker_metrics(self, retcode: int, info: Dict[str, Any]) -> None:
+        """Record wall time and the step spans written by a reaped Worker."""
+        requested = info.get("launch_requested_at")
+        self._metrics.record_worker_exit(
+            retcode, time.time() - requested if requested is not None else None
+        )
+        spans_file = info.get("spans_file")
+        if spans_file:
+            self._metrics.record_step_spans(read_step_spans(spans_file))
+
+    def _watch_worker(self, task_id: str, process: subprocess.Popen) -> bool:
+        """Register a Worker with the child watcher. Returns True if watched."""
+        if self._child_watcher is None:
+            return False
+        try:
+            self._child_watcher.watch(
+                process, functools.partial(self._on_worker_exit, task_id, process.pid)
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"[daemon] Cannot watch PID {process.pid} for {task_id}: {e}")
+            return False
+
+    def _on_worker_exit(self, task_id: str, pid: int, exited_at: float) -> None:
+        """Child watcher callback: mark the Worker for reaping."""
+        self._exited_workers[task_id] = (pid, exited_at)
+
+    def _record_exit_latencies(self) -> None:
+        """
+        Record per-worker exit latency once reaping, REPORT verification and
+        dependency resolution for the exited Workers are done.
+        """
+        if not self._pending_exit_latencies:
+            return
+        now = time.monotonic()
+        detected_by = self._child_watcher.backend if self._child_watcher else "poll"
+        entries = self.results.setdefault("worker_exit_latency", [])
+        for task_id, retcode, exited_at in self._pending_exit_latencies:
+            latency_ms = round((now - exited_at) * 1000, 1) if exited_at is not None else None
+            entries.append({
+                "task_id": task_id,
+                "exit_code": retcode,
+                "detected_by": detected_by if exited_at is not None else "poll",
+                "latency_ms": latency_ms,
+            })
+            if latency_ms is not None and self._metrics is not None:
+                self._metrics.record_reap_latency(latency_ms)
+        self._pending_exit_latencies = []
+
     # ------------------------------------------------------------------
     # ORDER_055: Worker完了→PMレビュー自動起動
     # ------------------------------------------------------------------
@@ -1316,26 +1855,29 @@ class ParallelWorkerLauncher:
                 # Build command & launch (with per-task permission profile)
                 cmd = self._build_worker_command(task_id, task_info=task)
                 log_file_path = self._get_log_file_path(task_id)
-                log_fh = open(str(log_file_path), "w", encoding="utf-8")
-                self._log_file_handles.append(log_fh)
-
-                # Ensure PYTHONPATH includes backend/ for python-embed compatibility
-                env = os.environ.copy()
-                env["PYTHONPATH"] = str(_package_root) + os.pathsep + env.get("PYTHONPATH", "")
-                process = subprocess.Popen(
+                spans_file = None
+                if self._metrics is not None:
+                    spans_file = log_file_path.with_suffix(".spans.json")
+                    cmd.extend(["--spans-file", str(spans_file)])
+                requested_at = time.time()
+                process, launch_mode = self._spawn_process(
+                    KIND_EXECUTE_TASK,
                     cmd,
-                    cwd=_package_root,
-                    stdout=log_fh,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    env=env,
+                    log_file_path,
                 )
+                if self._metrics is not None:
+                    self._metrics.record_launch(task_id, "worker", launch_mode, requested_at)
 
                 self._running_workers[task_id] = {
                     "process": process,
                     "pid": process.pid,
                     "log_file": str(log_file_path),
                     "launched_at": datetime.now().isoformat(),
+                    "priority": task.get("priority", "P1"),
+                    "watched": self._watch_worker(task_id, process),
+                    "launch_mode": launch_mode,
+                    "launch_requested_at": requested_at,
+                    "spans_file": str(spans_file) if spans_file else None,
                 }
 
                 self.results["launched_count"] += 1
@@ -1349,7 +1891,7 @@ class ParallelWorkerLauncher:
                 })
 
                 logger.info(
-                    f"[daemon] Launched {task_id} (PID {process.pid}), "
+                    f"[daemon] Launched {task_id} (PID {process.pid}, {launch_mode}), "
                     f"active={len(self._running_workers)}/{self.max_workers}"
                 )
 
@@ -1408,22 +1950,15 @@ class ParallelWorkerLauncher:
             log_dir.mkdir(parents=True, exist_ok=True)
             log_file_path = log_dir / f"{task_id}_review.log"
 
-            # Open log file
-            log_fh = open(str(log_file_path), "w", encoding="utf-8")
-            self._log_file_handles.append(log_fh)
-
-            # Launch review_worker subprocess
-            # Ensure PYTHONPATH includes backend/ for python-embed compatibility
-            env = os.environ.copy()
-            env["PYTHONPATH"] = str(_package_root) + os.pathsep + env.get("PYTHONPATH", "")
-            process = subprocess.Popen(
+            # Launch review_worker (warm pool or cold subprocess)
+            requested_at = time.time()
+            process, launch_mode = self._spawn_process(
+                KIND_REVIEW_WORKER,
                 cmd,
-                cwd=_package_root,
-                stdout=log_fh,
-                stderr=subprocess.STDOUT,
-                text=True,
-                env=env,
+                log_file_path,
             )
+            if self._metrics is not None:
+                self._metrics.record_launch(task_id, "review", launch_mode, requested_at)
 
             # Track the review_worker process
             self._running_review_workers[task_id] = {
@@ -1433,11 +1968,13 @@ class ParallelWorkerLauncher:
                 "launched_at": datetime.now().isoformat(),
                 "project_id": project_id,
                 "order_id": task.get("order_id"),
+                "launch_mode": launch_mode,
+                "launch_requested_at": requested_at,
             }
 
             logger.info(
                 f"[review_worker] Launched review_worker for {task_id} "
-                f"(PID {process.pid}, log: {log_file_path.name})"
+                f"(PID {process.pid}, {launch_mode}, log: {log_file_path.name})"
             )
             return True
 
@@ -1481,6 +2018,7 @@ class ParallelWorkerLauncher:
         # Remove finished review_workers from tracking and handle results
         for task_id, retcode, info in finished_tasks:
             del self._running_review_workers[task_id]
+            self._record_launch_latency(task_id, info, kind="review")
 
             # ORDER_055: Handle review verdict based on DB task status
             if retcode == 0:
@@ -1693,13 +2231,17 @@ class ParallelWorkerLauncher:
             log_file = info.get("log_file")
 
             # --- Check 1: PID liveness ---
-            retcode = proc.poll()
-            if retcode is not None:
-                # Process already exited - will be handled by _reap_finished_workers
+            # Watched workers report their exit through the child watcher
+            if not info.get("watched"):
+                retcode = proc.poll()
+                if retcode is not None:
+                    # Process already exited - will be handled by _reap_finished_workers
+                    continue
+            elif task_id in self._exited_workers:
                 continue
 
             # Process is running, check if it's actually making progress
-            if not self._is_pid_alive(pid):
+            if not info.get("watched") and not self._is_pid_alive(pid):
                 logger.warning(
                     f"[health] {task_id}: PID {pid} is no longer alive "
                     f"(zombie / orphaned)"
@@ -1788,10 +2330,11 @@ class ParallelWorkerLauncher:
     def _detect_orphaned_in_progress_tasks(self) -> None:
         """
         Detect IN_PROGRESS tasks in this ORDER that are NOT tracked in
-        ``_running_workers``.
+        ``_running_workers`` and not owned by another live daemon in the
+        ``daemons`` registry.
 
-        These are orphans: their daemon was restarted (dict lost), the
-        worker process died without being reaped, etc.
+        These are orphans: their daemon was restarted (dict lost) or its
+        lease expired, the worker process died without being reaped, etc.
 
         For each orphan, use ``recover_crashed_task()`` from
         ``worker.recover_crashed`` to revert the task to QUEUED and
@@ -1812,16 +2355,30 @@ class ParallelWorkerLauncher:
             finally:
                 conn.close()
 
-            if not rows:
+            untracked = [r for r in rows if r["task_id"] not in self._running_workers]
+            if not untracked:
                 return
 
+            # Tasks run by another live daemon (still holding its lease) are
+            # not orphans; expired daemons no longer own anything
+            owners: Dict[str, Dict[str, Any]] = {}
+            if _HAS_DAEMON_REGISTRY:
+                try:
+                    owners = task_owners(self.project_id)
+                except Exception as e:
+                    logger.debug(f"[orphan-ip] Daemon registry unavailable: {e}")
+
             orphans_found = 0
 
-            for row in rows:
+            for row in untracked:
                 task_id = row["task_id"]
 
-                # If this task is tracked in _running_workers, it is NOT an orphan
-                if task_id in self._running_workers:
+                owner = owners.get(task_id)
+                if owner is not None and owner["pid"] != os.getpid():
+                    logger.debug(
+                        f"[orphan-ip] {task_id} is owned by live daemon "
+                        f"{owner['daemon_id']} (PID {owner['pid']})"
+                    )
                     continue
 
                 # Orphan detected: IN_PROGRESS in DB but not tracked by daemon
@@ -2013,6 +2570,9 @@ class ParallelWorkerLauncher:
 
         # 5. Remove from running workers
         del self._running_workers[task_id]
+        self._exited_workers.pop(task_id, None)
+        if self._child_watcher is not None:
+            self._child_watcher.unwatch(pid)
 
         # 6. Emit WORKER_CRASHED event (TASK_1156 R4)
         if self._event_notifier:
@@ -2281,6 +2841,21 @@ def display_results(results: Dict[str, Any], json_output: bool = False) -> None:
         for fail in results["failed_tasks"]:
             print(f"  - {fail['task_id']}: {fail['reason']}")
 
+    latency = results.get("worker_exit_latency_summary")
+    if latency and latency["count"]:
+        print("\n【Worker終了検知】")
+        print(f"  Reaped: {latency['count']} (measured: {latency['measured']})")
+        if latency["measured"]:
+            print(f"  Exit latency: avg {latency['avg_ms']:.1f} ms / max {latency['max_ms']:.1f} ms")
+
+    latency = results.get("worker_launch_latency_summary")
+    if latency and latency["count"]:
+        pool = results.get("warm_pool_stats") or {}
+        print("\n【Worker起動】")
+        print(f"  Launched: {latency['count']} (warm: {latency['measured']}, pool fallbacks: {pool.get('fallbacks', 0)})")
+        if latency["measured"]:
+            print(f"  Warm launch-to-first-step: avg {latency['avg_ms']:.1f} ms / max {latency['max_ms']:.1f} ms")
+
     if results.get("message"):
         print(f"\n{results['message']}")
 
@@ -2335,6 +2910,10 @@ def main():
                         help="Comma-separated list of allowed tools for workers (e.g. Read,Write,Bash). Uses default if not specified")
     parser.add_argument("--escalated-timeout", type=int, default=300,
                         help="Seconds before ESCALATED tasks are auto-rejected (default: 300)")
+    parser.add_argument("--warm-pool-size", type=int, default=None,
+                        help="Daemon: pre-imported idle worker processes (0 = cold spawn only, default: worker config)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="Daemon: serve metrics on http://127.0.0.1:PORT/metrics (0 = any free port)")
 
     args = parser.parse_args()
 
@@ -2358,6 +2937,10 @@ def main():
             worker_config.enable_resource_monitoring = False
         if args.no_auto_scaling:
             worker_config.enable_auto_scaling = False
+        if args.warm_pool_size is not None:
+            worker_config.warm_pool_size = args.warm_pool_size
+        if args.metrics_port is not None:
+            worker_config.metrics_port = args.metrics_port
 
         # Parse allowed_tools
         allowed_tools = None
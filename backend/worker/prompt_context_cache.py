@@ -0,0 +1,193 @@
+"""
+AI PM Framework - Workerプロンプト共通コンテキストキャッシュ
+
+同一プロジェクトのタスク間で共通となるプロンプトセクション
+（既知バグパターン、docs/ の内容）をレンダリング済みの状態で
+PROJECTS/{project_id}/.prompt_context_cache.json に保存し、
+並列実行される Worker プロセス間で共有する。
+
+各セクションは入力の指紋（bugs テーブルのバージョン、docs/ ファイルの
+mtime_ns/size）をキーとして保存され、キーが一致しない場合のみ再構築する。
+タスク固有の部分（REWORK履歴、docs の選択結果など）は各 Worker が組み立てる。
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils.db import fetch_one, table_exists
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = ".prompt_context_cache.json"
+CACHE_VERSION = 1
+
+# 直近に更新されたファイルは同一 mtime のまま再更新される可能性があるためキャッシュしない
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def get_bugs_version(conn: sqlite3.Connection) -> Optional[int]:
+    """
+    bugs テーブルのバージョン（table_versions の変更カウンタ）を取得
+
+    Returns:
+        バージョン番号。table_versions が存在しない（未マイグレーション）場合はNone
+    """
+    if not table_exists(conn, "table_versions"):
+        return None
+    row = fetch_one(
+        conn,
+        "SELECT version FROM table_versions WHERE table_name = 'bugs'",
+    )
+    return row["version"] if row else None
+
+
+class PromptContextCache:
+    """
+    プロジェクト単位のプロンプト共通セクションキャッシュ
+
+    get() でセクションを取得し、結果（hit / miss と理由）を events に記録する。
+    変更があった場合のみ save() でアトミックに書き込む。
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.sections: Dict[str, Dict[str, Any]] = {}
+        self.events: List[Tuple[str, str, str]] = []
+        self._load_error: Optional[str] = None
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "PromptContextCache":
+        """キャッシュを読み込む（存在しない・破損時は空で開始）"""
+        cache = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cache
+        except (OSError, ValueError) as e:
+            cache._load_error = f"unreadable ({e.__class__.__name__})"
+            return cache
+
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            cache._load_error = "version mismatch"
+            return cache
+
+        sections = data.get("sections")
+        if isinstance(sections, dict):
+            cache.sections = sections
+        return cache
+
+    def get(
+        self,
+        section: str,
+        key: Any,
+        builder: Callable[[], Any],
+        cacheable: bool = True,
+    ) -> Any:
+        """
+        セクションを取得（キーが一致すればキャッシュ、しなければ builder で再構築）
+
+        Args:
+            section: セクション名（例: "known_bugs"）
+            key: 入力の指紋（JSONシリアライズ可能な値）。Noneの場合はキャッシュしない
+            builder: セクションを構築する関数（戻り値はJSONシリアライズ可能であること）
+            cacheable: Falseの場合は構築結果を保存しない（入力が更新直後の場合など）
+
+        Returns:
+            builder の戻り値（またはキャッシュ済みの値）
+        """
+        if key is None:
+            self.events.append((section, "miss", "no version key"))
+            return builder()
+
+        # JSON往復後の値と比較するため正規化（tuple → list など）
+        key = json.loads(json.dumps(key))
+        entry = self.sections.get(section)
+        if entry is not None and entry.get("key") == key:
+            self.events.append((section, "hit", ""))
+            return entry.get("value")
+
+        if entry is not None:
+            reason = "inputs changed"
+        elif self._load_error:
+            reason = self._load_error
+        else:
+            reason = "not cached"
+        self.events.append((section, "miss", reason))
+
+        value = builder()
+        if cacheable:
+            self.sections[section] = {"key": key, "value": value}
+            self._dirty = True
+        elif section in self.sections:
+            del self.sections[section]
+            self._dirty = True
+        return value
+
+    def save(self) -> bool:
+        """
+        キャッシュをアトミックに書き込む（変更がない場合は何もしない）
+
+        Returns:
+            書き込んだ場合True
+        """
+        if self.path is None or not self._dirty:
+            return False
+
+        payload = {"version": CACHE_VERSION, "sections": self.sections}
+
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.path.parent),
+                prefix=".tmp_prompt_context_",
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, str(self.path))
+            tmp_path = None
+            self._dirty = False
+            return True
+        except OSError as e:
+            logger.warning(f"プロンプトキャッシュの保存に失敗: {e}")
+            return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def summary(self) -> str:
+        """セクションごとの hit / miss を1行にまとめる（ログ用）"""
+        parts = []
+        for section, result, reason in self.events:
+            parts.append(f"{section}={result}" + (f"({reason})" if reason else ""))
+        return ", ".join(parts) if parts else "no sections"
+
+
+def is_racy(fingerprint: Optional[List[List[Any]]]) -> bool:
+    """
+    指紋中に直近 RACY_WINDOW_NS 以内に更新されたファイルがあるか
+
+    Args:
+        fingerprint: [[name, mtime_ns, size], ...]
+    """
+    if not fingerprint:
+        return False
+    now_ns = time.time_ns()
+    return any(now_ns - entry[1] <= RACY_WINDOW_NS for entry in fingerprint)
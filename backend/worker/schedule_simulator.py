@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - 並列起動スケジューリングシミュレータ
+
+過去のORDERを再生し、固定ワーカー数での所要時間（makespan）を
+起動順序ポリシーごとに比較する。
+
+ポリシー:
+- fifo: 従来の並び順（priority → created_at）
+- critical_path: priority → 残りパス長（予測所要時間の重み付き）→ created_at
+
+再生は ParallelTaskDetector と同じ制約（依存完了・target_files の競合）で
+リストスケジューリングを行う。実行時間には change_history から得た実所要時間を、
+優先順位付けには予測値（対象ORDERを学習から除外した TaskPredictionModel）を使う。
+
+Usage:
+    python backend/worker/schedule_simulator.py PROJECT_ID [options]
+
+Options:
+    --order ORDER_ID    対象ORDER（複数指定可。省略時は完了済みORDER全て）
+    --max-workers N     ワーカー数（デフォルト: 5）
+    --limit N           省略時に対象とするORDERの最大数（デフォルト: 20）
+    --json              JSON形式で出力
+
+Example:
+    python backend/worker/schedule_simulator.py ai_pm_manager --max-workers 3
+    python backend/worker/schedule_simulator.py ai_pm_manager --order ORDER_090 --json
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils.db import fetch_all, get_connection
+from utils.file_lock import FileLockManager
+from worker.dependency_resolver import DependencyGraph
+from worker.task_duration import (
+    TaskPredictionModel,
+    fetch_task_durations,
+    fetch_task_rows,
+    fetch_training_samples,
+    get_model,
+)
+
+logger = logging.getLogger(__name__)
+
+POLICY_FIFO = "fifo"
+POLICY_CRITICAL_PATH = "critical_path"
+POLICIES = (POLICY_FIFO, POLICY_CRITICAL_PATH)
+
+_PRIORITY_RANK = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+
+# ETA 計算で完了済みとみなすステータス
+_ETA_FINISHED_STATUSES = ("DONE", "COMPLETED", "CANCELLED", "SKIPPED", "REJECTED")
+
+
+@dataclass
+class SimTask:
+    """シミュレーション対象タスク"""
+    task_id: str
+    duration: float
+    predicted: float
+    priority: str = "P1"
+    created_at: str = ""
+    depends_on: Set[str] = field(default_factory=set)
+    target_files: Set[str] = field(default_factory=set)
+
+
+def _build_graph(tasks: Sequence[SimTask]) -> DependencyGraph:
+    graph = DependencyGraph()
+    known = {t.task_id for t in tasks}
+    for task in tasks:
+        graph.add_task(task.task_id)
+        for dep in task.depends_on:
+            # ORDER外の依存は再生開始時点で完了済みとみなす
+            if dep in known:
+                graph.add_dependency(task.task_id, dep)
+    return graph
+
+
+def simulate(
+    tasks: Sequence[SimTask],
+    max_workers: int,
+    policy: str = POLICY_CRITICAL_PATH,
+) -> Dict[str, Any]:
+    """
+    リストスケジューリングで1つのORDERを再生する
+
+    空きワーカーがある限り、依存が完了し実行中タスクと target_files が
+    競合しないタスクをポリシーの順に起動する。
+
+    Args:
+        tasks: 対象タスク
+        max_workers: ワーカー数
+        policy: POLICY_FIFO または POLICY_CRITICAL_PATH
+
+    Returns:
+        {"policy", "makespan", "schedule": [{"task_id", "start", "end"}, ...]}
+
+    Raises:
+        ValueError: 未知のポリシー、または依存グラフに循環がある場合
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"未知のポリシー: {policy}")
+    if max_workers < 1:
+        raise ValueError("max_workers は1以上を指定してください")
+
+    by_id = {t.task_id: t for t in tasks}
+    graph = _build_graph(tasks)
+    ranks = graph.get_remaining_path_lengths({t.task_id: t.predicted for t in tasks})
+
+    def sort_key(task: SimTask):
+        priority = _PRIORITY_RANK.get(task.priority, 3)
+        if policy == POLICY_CRITICAL_PATH:
+            return (priority, -ranks[task.task_id], task.created_at, task.task_id)
+        return (priority, task.created_at, task.task_id)
+
+    pending_deps = {
+        t.task_id: {d for d in t.depends_on if d in by_id} for t in tasks
+    }
+    ready: List[SimTask] = [by_id[tid] for tid, deps in pending_deps.items() if not deps]
+    running: List[tuple] = []  # heap of (end, task_id)
+    locked_files: Dict[str, str] = {}
+    schedule: List[Dict[str, Any]] = []
+    now = 0.0
+
+    while ready or running:
+        ready.sort(key=sort_key)
+        for task in list(ready):
+            if len(running) >= max_workers:
+                break
+            if any(f in locked_files for f in task.target_files):
+                continue
+            ready.remove(task)
+            for f in task.target_files:
+                locked_files[f] = task.task_id
+            end = now + task.duration
+            heapq.heappush(running, (end, task.task_id))
+            schedule.append({"task_id": task.task_id, "start": now, "end": end})
+
+        if not running:
+            # 依存が循環しているか、競合で起動不能（グラフ検証済みのため通常到達しない）
+            break
+
+        now, finished_id = heapq.heappop(running)
+        finished = [finished_id]
+        while running and running[0][0] == now:
+            finished.append(heapq.heappop(running)[1])
+
+        for task_id in finished:
+            for f in by_id[task_id].target_files:
+                if locked_files.get(f) == task_id:
+                    del locked_files[f]
+            for successor in graph.get_successors(task_id):
+                deps = pending_deps[successor]
+                deps.discard(task_id)
+                if not deps:
+                    ready.append(by_id[successor])
+
+    return {
+        "policy": policy,
+        "makespan": max((s["end"] for s in schedule), default=0.0),
+        "schedule": schedule,
+    }
+
+
+def _fetch_order_dependencies(conn, project_id: str, order_id: str) -> Dict[str, Set[str]]:
+    """ORDER内タスクの依存関係（task_id -> 先行タスクID集合）"""
+    deps = fetch_all(
+        conn,
+        """
+        SELECT td.task_id, td.depends_on_task_id
+        FROM task_dependencies td
+        JOIN tasks t ON td.task_id = t.id AND td.project_id = t.project_id
+        WHERE td.project_id = ? AND t.order_id = ?
+        """,
+        (project_id, order_id),
+    )
+    depends_on: Dict[str, Set[str]] = {}
+    for dep in deps:
+        depends_on.setdefault(dep["task_id"], set()).add(dep["depends_on_task_id"])
+    return depends_on
+
+
+def load_order_tasks(
+    conn,
+    project_id: str,
+    order_id: str,
+    model: TaskPredictionModel,
+) -> List[SimTask]:
+    """
+    ORDERのタスクを SimTask として読み込む
+
+    実所要時間が取れないタスク（未実行・履歴欠落）は予測値で代用する。
+    """
+    actual = {
+        d["task_id"]: d["seconds"]
+        for d in fetch_task_durations(conn, project_id, order_id)
+    }
+    rows = [
+        row for row in fetch_task_rows(conn, project_id, order_id)
+        if row["status"] not in ("CANCELLED", "SKIPPED", "REJECTED")
+    ]
+    depends_on = _fetch_order_dependencies(conn, project_id, order_id)
+
+    tasks = []
+    for row in rows:
+        predicted = model.predict_task(row)["seconds"]
+        tasks.append(SimTask(
+            task_id=row["id"],
+            duration=actual.get(row["id"], predicted),
+            predicted=predicted,
+            priority=row["priority"] or "P1",
+            created_at=row["created_at"] or "",
+            depends_on=depends_on.get(row["id"], set()),
+            target_files=set(FileLockManager.parse_target_files(row["target_files"])),
+        ))
+    return tasks
+
+
+def estimate_order_eta(
+    conn,
+    project_id: str,
+    order_id: str,
+    max_workers: int = 5,
+    model: Optional[TaskPredictionModel] = None,
+) -> Dict[str, Any]:
+    """
+    ORDERの完了見込み（残り所要時間）を予測値でシミュレーションして求める
+
+    未完了タスクを予測所要時間で critical_path ポリシーにより再生する。
+    IN_PROGRESS のタスクは started_at からの経過時間を差し引く（予測の10%を下限とする）。
+
+    Args:
+        conn: DB接続
+        project_id: プロジェクトID
+        order_id: ORDER ID
+        max_workers: ワーカー数
+        model: 予測モデル（省略時は get_model(project_id)）
+
+    Returns:
+        {"eta_seconds": 残り秒数, "remaining_tasks": 未完了タスク数}
+    """
+    if model is None:
+        model = get_model(project_id, conn)
+
+    now = datetime.now()
+    rows = fetch_task_rows(conn, project_id, order_id)
+    depends_on = _fetch_order_dependencies(conn, project_id, order_id)
+    finished = {row["id"] for row in rows if row["status"] in _ETA_FINISHED_STATUSES}
+    tasks = []
+    for row in rows:
+        if row["id"] in finished:
+            continue
+        predicted = model.predict_task(row)["seconds"]
+        remaining = predicted
+        if row["status"] == "IN_PROGRESS" and row["started_at"]:
+            try:
+                elapsed = (now - datetime.fromisoformat(str(row["started_at"]))).total_seconds()
+                remaining = max(predicted - elapsed, predicted * 0.1)
+            except ValueError:
+                pass
+        tasks.append(SimTask(
+            task_id=row["id"],
+            duration=remaining,
+            predicted=remaining,
+            priority=row["priority"] or "P1",
+            created_at=row["created_at"] or "",
+            depends_on=depends_on.get(row["id"], set()) - finished,
+            target_files=set(FileLockManager.parse_target_files(row["target_files"])),
+        ))
+
+    if not tasks:
+        return {"eta_seconds": 0.0, "remaining_tasks": 0}
+    result = simulate(tasks, max_workers, POLICY_CRITICAL_PATH)
+    return {"eta_seconds": result["makespan"], "remaining_tasks": len(tasks)}
+
+
+def replay(
+    project_id: str,
+    order_ids: Optional[List[str]] = None,
+    max_workers: int = 5,
+    limit: int = 20,
+) -> Dict[str, Any]:
+    """
+    過去ORDERを再生し、ポリシーごとの makespan を比較する
+
+    Args:
+        project_id: プロジェクトID
+        order_ids: 対象ORDER（Noneの場合は完了済みORDERの新しい順に limit 件）
+        max_workers: ワーカー数
+        limit: order_ids 省略時の最大ORDER数
+
+    Returns:
+        {"project_id", "max_workers", "orders": [...], "total": {policy: makespan},
+         "improvement_pct"}
+    """
+    conn = get_connection()
+    try:
+        if not order_ids:
+            rows = fetch_all(
+                conn,
+                """
+                SELECT id FROM orders
+                WHERE project_id = ? AND status = 'COMPLETED'
+                ORDER BY completed_at DESC, id DESC
+                LIMIT ?
+                """,
+                (project_id, limit),
+            )
+            order_ids = [row["id"] for row in rows]
+
+        history = fetch_training_samples(conn, project_id)
+        results = []
+        for order_id in order_ids:
+            # 対象ORDER自身の実績は予測に使わない（leave-one-order-out）
+            model = TaskPredictionModel.fit(
+                sample for sample in history if sample["order_id"] != order_id
+            )
+            tasks = load_order_tasks(conn, project_id, order_id, model)
+            if not tasks:
+                continue
+            makespans = {
+                policy: simulate(tasks, max_workers, policy)["makespan"]
+                for policy in POLICIES
+            }
+            results.append({
+                "order_id": order_id,
+                "task_count": len(tasks),
+                "makespan": makespans,
+            })
+    finally:
+        conn.close()
+
+    total = {
+        policy: sum(r["makespan"][policy] for r in results) for policy in POLICIES
+    }
+    baseline = total[POLICY_FIFO]
+    improvement = (
+        (baseline - total[POLICY_CRITICAL_PATH]) / baseline * 100.0 if baseline else 0.0
+    )
+    return {
+        "project_id": project_id,
+        "max_workers": max_workers,
+        "orders": results,
+        "total": total,
+        "improvement_pct": round(improvement, 2),
+    }
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, sec = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{sec:02d}s" if hours else f"{minutes}m{sec:02d}s"
+
+
+def main():
+    """CLI エントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="過去ORDERを再生し、起動順序ポリシーごとの所要時間を比較",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("project_id", help="プロジェクトID")
+    parser.add_argument("--order", dest="orders", action="append",
+                        help="対象ORDER（複数指定可）")
+    parser.add_argument("--max-workers", type=int, default=5,
+                        help="ワーカー数（デフォルト: 5）")
+    parser.add_argument("--limit", type=int, default=20,
+                        help="--order 省略時の最大ORDER数（デフォルト: 20）")
+    parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+    args = parser.parse_args()
+
+    if args.max_workers < 1:
+        print("エラー: --max-workers は1以上を指定してください", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        result = replay(args.project_id, args.orders, args.max_workers, args.limit)
+    except Exception as e:
+        print(f"エラー: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    if not result["orders"]:
+        print("再生対象のORDERがありません")
+        return
+
+    print(f"【スケジューリングシミュレーション】{result['project_id']} "
+          f"(max_workers={result['max_workers']})")
+    print(f"{'ORDER':<14} {'tasks':>5} {'fifo':>12} {'critical_path':>14}")
+    for r in result["orders"]:
+        print(f"{r['order_id']:<14} {r['task_count']:>5} "
+              f"{_format_seconds(r['makespan'][POLICY_FIFO]):>12} "
+              f"{_format_seconds(r['makespan'][POLICY_CRITICAL_PATH]):>14}")
+    print(f"{'合計':<13} {'':>5} {_format_seconds(result['total'][POLICY_FIFO]):>12} "
+          f"{_format_seconds(result['total'][POLICY_CRITICAL_PATH]):>14}")
+    print(f"改善率: {result['improvement_pct']:+.2f}%")
+
+
+if __name__ == "__main__":
+    main()
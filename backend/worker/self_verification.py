@@ -42,6 +42,13 @@ logger = logging.getLogger(__name__)
 # Windows判定
 _IS_WINDOWS = sys.platform == "win32"
 
+# 解析サービス（quality/analysis_service.py）経由で実行するコマンド
+# ruff はプロジェクト共有キャッシュ、mypy は常駐 dmypy で実行される
+_SERVED_COMMANDS = {
+    "ruff check .": ("ruff", ["check", "."]),
+    "mypy .": ("mypy", ["."]),
+}
+
 
 @dataclass
 class VerificationCheck:
@@ -136,16 +143,19 @@ class SelfVerificationRunner:
         project_dir: Path,
         artifacts: Optional[List[str]] = None,
         timeout: int = 120,
+        use_service: bool = True,
     ):
         """
         Args:
             project_dir: プロジェクトディレクトリ（検証コマンドの実行ディレクトリ）
             artifacts: 成果物ファイルパスのリスト
             timeout: 各コマンドのタイムアウト秒数（デフォルト: 120秒）
+            use_service: ruff / mypy をプロジェクト単位の解析サービス経由で実行するか
         """
         self.project_dir = Path(project_dir).resolve()
         self.artifacts = artifacts or []
         self.timeout = timeout
+        self.use_service = use_service
 
         # 成果物からプロジェクトルートを推定
         self._effective_root = self._resolve_project_root()
@@ -408,17 +418,19 @@ class SelfVerificationRunner:
         logger.info(f"検証実行中: [{check_type}] {command}")
 
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                timeout=self.timeout,
-                cwd=str(self._effective_root),
-                shell=True,
-                encoding="utf-8",
-                errors="replace",
-            )
+            result = self._run_served(command)
+            if result is None:
+                result = subprocess.run(
+                    command,
+                    capture_output=True,
+                    timeout=self.timeout,
+                    cwd=str(self._effective_root),
+                    shell=True,
+                    encoding="utf-8",
+                    errors="replace",
+                )
 
-            output = result.stdout + result.stderr
+            output = (result.stdout or "") + (result.stderr or "")
             passed = result.returncode == 0
             errors = self._parse_errors(check_type, output, result.returncode)
 
@@ -480,6 +492,44 @@ class SelfVerificationRunner:
                 errors=[error_msg],
             )
 
+    def _run_served(self, command: str) -> Optional[subprocess.CompletedProcess]:
+        """
+        ruff / mypy のコマンドを解析サービス経由で実行する。
+
+        並列Worker間で ruff キャッシュと常駐 dmypy を共有し、mypy の同時実行は直列化される。
+
+        Args:
+            command: 検出済みコマンド文字列
+
+        Returns:
+            実行結果。サービス対象外・利用不可の場合None（通常のサブプロセス実行）
+        """
+        served = _SERVED_COMMANDS.get(command)
+        if not self.use_service or served is None:
+            return None
+        try:
+            from quality.analysis_service import get_service
+        except ImportError as e:
+            logger.debug(f"解析サービスを利用できません: {e}")
+            return None
+
+        def runner(cmd: List[str]) -> subprocess.CompletedProcess:
+            return subprocess.run(
+                cmd,
+                capture_output=True,
+                timeout=self.timeout,
+                cwd=str(self._effective_root),
+                shell=_IS_WINDOWS,
+                encoding="utf-8",
+                errors="replace",
+            )
+
+        tool, args = served
+        service = get_service(self._effective_root)
+        if tool == "mypy":
+            return service.run_mypy([], args, runner).process
+        return service.run_ruff(args, runner).process
+
     def _parse_errors(
         self, check_type: str, output: str, return_code: int
     ) -> List[str]:
@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - タスク所要時間・トークン数の予測モデル
+
+完了タスクの実績（change_history の IN_PROGRESS → DONE 区間、tasks.actual_tokens）から、
+特徴量バケットごとの分位点（p50 / p90）を学習し、所要時間とトークン数を予測する。
+
+特徴量:
+- complexity_score（未設定の場合は title / description から cost.task_complexity で算出）
+- recommended_model
+- target_files の件数
+- 依存タスク数
+
+予測時は細かいバケットから順にサンプル数が MIN_BUCKET_SAMPLES 以上のものを採用し、
+最終的に全体の分位点（complexity でスケール）、履歴がなければ既定値にフォールバックする。
+
+学習済みモデルは task_prediction_models テーブルに保存され、
+並列起動の優先順位付け（クリティカルパスの重み）、コスト見積もり（cost_tracker estimate）、
+ダッシュボードのORDER完了見込み（ETA）で使用する。
+
+Usage:
+    python backend/worker/task_duration.py train [--project PROJECT_ID] [--json]
+    python backend/worker/task_duration.py show [--project PROJECT_ID] [--json]
+    python backend/worker/task_duration.py predict PROJECT_ID TASK_ID [--json]
+"""
+
+import argparse
+import json
+import logging
+import math
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+from utils.db import (
+    execute_query,
+    fetch_all,
+    fetch_one,
+    get_connection,
+    table_exists,
+    transaction,
+)
+from utils.file_lock import FileLockManager
+
+logger = logging.getLogger(__name__)
+
+# model_json の形式バージョン（特徴量・バケット定義を変えたら上げる）
+MODEL_VERSION = 1
+
+# 全プロジェクト横断モデルの scope
+GLOBAL_SCOPE = "*"
+
+# 履歴が全くない場合の既定値
+DEFAULT_TASK_SECONDS = 600.0
+DEFAULT_TASK_TOKENS = 20000
+
+DEFAULT_MODEL = "Opus"
+
+# complexity_score (0-100) の帯の幅
+COMPLEXITY_BUCKET_WIDTH = 20
+
+# バケットの分位点を採用する最小サンプル数（未満の場合はより粗いバケットへ）
+MIN_BUCKET_SAMPLES = 3
+
+TARGETS = ("seconds", "tokens")
+_DEFAULTS = {"seconds": DEFAULT_TASK_SECONDS, "tokens": float(DEFAULT_TASK_TOKENS)}
+
+# get_model() のキャッシュ有効期間（秒）
+MODEL_CACHE_TTL = 300.0
+
+_model_cache: Dict[Optional[str], Tuple[float, "TaskPredictionModel"]] = {}
+
+
+# ---------------------------------------------------------------------------
+# 実績の集計
+# ---------------------------------------------------------------------------
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", ""))
+    except ValueError:
+        return None
+
+
+def _working_seconds(transitions: Iterable[Tuple[str, Any]]) -> Optional[float]:
+    """
+    ステータス遷移列から作業時間を合計する
+
+    IN_PROGRESS に入ってから次に DONE / COMPLETED になるまでの区間を合計する
+    （REWORK による再実行も含め、レビュー待ちの時間は含めない）。
+    """
+    total = 0.0
+    started: Optional[datetime] = None
+    found = False
+    for new_value, changed_at in transitions:
+        ts = _parse_timestamp(changed_at)
+        if ts is None:
+            continue
+        if new_value == "IN_PROGRESS":
+            if started is None:
+                started = ts
+        elif new_value in ("DONE", "COMPLETED") and started is not None:
+            total += max((ts - started).total_seconds(), 0.0)
+            started = None
+            found = True
+    return total if found else None
+
+
+def fetch_task_durations(
+    conn,
+    project_id: Optional[str] = None,
+    order_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    過去タスクの実所要時間を集計する
+
+    Args:
+        conn: DB接続
+        project_id: 対象プロジェクト（Noneの場合は全プロジェクト）
+        order_id: 対象ORDER（Noneの場合は全ORDER）
+
+    Returns:
+        [{"project_id", "order_id", "task_id", "complexity_score", "seconds"}, ...]
+        所要時間を算出できないタスクは含まない
+    """
+    if not table_exists(conn, "change_history"):
+        return []
+
+    conditions = ["ch.entity_type = 'task'", "ch.field_name = 'status'"]
+    params: List[Any] = []
+    if project_id:
+        conditions.append("t.project_id = ?")
+        params.append(project_id)
+    if order_id:
+        conditions.append("t.order_id = ?")
+        params.append(order_id)
+
+    rows = fetch_all(
+        conn,
+        f"""
+        SELECT t.project_id, t.order_id, t.id AS task_id, t.complexity_score,
+               ch.new_value, ch.changed_at
+        FROM change_history ch
+        JOIN tasks t
+          ON ch.entity_id = t.id
+         AND (ch.project_id IS NULL OR ch.project_id = t.project_id)
+        WHERE {' AND '.join(conditions)}
+        ORDER BY t.project_id, t.id, ch.changed_at, ch.id
+        """,
+        tuple(params),
+    )
+
+    grouped: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for row in rows:
+        key = (row["project_id"], row["task_id"])
+        entry = grouped.get(key)
+        if entry is None:
+            entry = grouped[key] = {
+                "project_id": row["project_id"],
+                "order_id": row["order_id"],
+                "task_id": row["task_id"],
+                "complexity_score": row["complexity_score"],
+                "transitions": [],
+            }
+        entry["transitions"].append((row["new_value"], row["changed_at"]))
+
+    durations = []
+    for entry in grouped.values():
+        seconds = _working_seconds(entry.pop("transitions"))
+        if seconds is not None:
+            entry["seconds"] = seconds
+            durations.append(entry)
+    return durations
+
+
+def fetch_task_rows(
+    conn,
+    project_id: str,
+    order_id: Optional[str] = None,
+    statuses: Optional[Iterable[str]] = None,
+    task_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    予測に必要なタスク属性（依存タスク数を含む）を取得する
+
+    Args:
+        conn: DB接続
+        project_id: プロジェクトID
+        order_id: 対象ORDER（Noneの場合は全ORDER）
+        statuses: 対象ステータス（Noneの場合は全ステータス）
+        task_id: 対象タスク（Noneの場合は全タスク）
+    """
+    conditions = ["t.project_id = ?"]
+    params: List[Any] = [project_id]
+    if task_id:
+        conditions.append("t.id = ?")
+        params.append(task_id)
+    if order_id:
+        conditions.append("t.order_id = ?")
+        params.append(order_id)
+    if statuses:
+        statuses = list(statuses)
+        conditions.append(f"t.status IN ({','.join('?' * len(statuses))})")
+        params.extend(statuses)
+
+    rows = fetch_all(
+        conn,
+        f"""
+        SELECT t.project_id, t.order_id, t.id, t.title, t.description, t.status,
+               t.priority, t.recommended_model, t.complexity_score, t.target_files,
+               t.actual_tokens, t.started_at, t.created_at,
+               (SELECT COUNT(*) FROM task_dependencies td
+                 WHERE td.task_id = t.id AND td.project_id = t.project_id) AS dependency_count
+        FROM tasks t
+        WHERE {' AND '.join(conditions)}
+        """,
+        tuple(params),
+    )
+    return [dict(row) for row in rows]
+
+
+def fetch_training_samples(
+    conn,
+    project_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    完了タスクの学習サンプルを取得する
+
+    Returns:
+        [{"project_id", "order_id", "task_id", "features", "seconds", "tokens"}, ...]
+        seconds / tokens は実績がない場合None
+    """
+    if project_id:
+        project_ids = [project_id]
+    else:
+        project_ids = [row["project_id"] for row in fetch_all(
+            conn, "SELECT DISTINCT project_id FROM tasks"
+        )]
+
+    durations = {
+        (d["project_id"], d["task_id"]): d["seconds"]
+        for d in fetch_task_durations(conn, project_id)
+    }
+
+    samples = []
+    for pid in project_ids:
+        for task in fetch_task_rows(conn, pid, statuses=("DONE", "COMPLETED")):
+            seconds = durations.get((pid, task["id"]))
+            tokens = task["actual_tokens"]
+            if seconds is None and not tokens:
+                continue
+            samples.append({
+                "project_id": pid,
+                "order_id": task["order_id"],
+                "task_id": task["id"],
+                "features": task_features(task),
+                "seconds": seconds,
+                "tokens": float(tokens) if tokens else None,
+            })
+    return samples
+
+
+# ---------------------------------------------------------------------------
+# 特徴量
+# ---------------------------------------------------------------------------
+
+def task_features(task: Mapping[str, Any], dependency_count: Optional[int] = None) -> Dict[str, Any]:
+    """
+    タスク属性から特徴量を作る
+
+    Args:
+        task: tasks 行（title, description, complexity_score, target_files,
+              recommended_model, dependency_count）
+        dependency_count: 依存タスク数（task に dependency_count がない場合に使用）
+    """
+    deps = task.get("dependency_count")
+    if deps is None:
+        deps = dependency_count or 0
+    files = len(FileLockManager.parse_target_files(task.get("target_files")))
+
+    complexity = task.get("complexity_score")
+    if complexity is None:
+        from cost.task_complexity import calculate_complexity
+        complexity = calculate_complexity(
+            title=task.get("title") or "",
+            description=task.get("description") or "",
+            dependency_count=deps,
+            target_file_count=files,
+        )
+
+    return {
+        "complexity": min(max(int(complexity), 0), 100),
+        "model": task.get("recommended_model") or DEFAULT_MODEL,
+        "files": files,
+        "deps": int(deps),
+    }
+
+
+def _complexity_bucket(complexity: int) -> int:
+    return min(complexity // COMPLEXITY_BUCKET_WIDTH, 100 // COMPLEXITY_BUCKET_WIDTH - 1)
+
+
+def _count_bucket(count: int) -> str:
+    if count <= 1:
+        return str(max(count, 0))
+    return "2" if count < 5 else "5"
+
+
+def bucket_keys(features: Mapping[str, Any]) -> List[str]:
+    """特徴量のバケットキー（細かい順）。最後は全体を表す '*'"""
+    c = f"c{_complexity_bucket(features['complexity'])}"
+    m = f"m{features['model']}"
+    f = f"f{_count_bucket(features['files'])}"
+    d = f"d{_count_bucket(features['deps'])}"
+    return [f"{c}|{m}|{f}|{d}", f"{c}|{m}|{f}", f"{c}|{m}", c, "*"]
+
+
+def _quantile(sorted_values: List[float], q: float) -> float:
+    """線形補間による分位点（sorted_values は昇順・非空）"""
+    pos = (len(sorted_values) - 1) * q
+    lower = math.floor(pos)
+    upper = math.ceil(pos)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (pos - lower)
+
+
+# ---------------------------------------------------------------------------
+# モデル
+# ---------------------------------------------------------------------------
+
+class TaskPredictionModel:
+    """
+    特徴量バケットごとの分位点によるタスク所要時間・トークン数予測
+
+    buckets[target][key] = {"n": サンプル数, "p50": 中央値, "p90": 90パーセンタイル}
+    """
+
+    def __init__(
+        self,
+        buckets: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None,
+        sample_count: int = 0,
+        trained_at: Optional[str] = None,
+    ):
+        self.buckets = buckets or {target: {} for target in TARGETS}
+        for target in TARGETS:
+            self.buckets.setdefault(target, {})
+        self.sample_count = sample_count
+        self.trained_at = trained_at
+
+    @classmethod
+    def fit(cls, samples: Iterable[Mapping[str, Any]]) -> "TaskPredictionModel":
+        """
+        学習サンプルから予測モデルを作る
+
+        Args:
+            samples: {"features", "seconds", "tokens"} の列（seconds / tokens はNone可）
+        """
+        values: Dict[str, Dict[str, List[float]]] = {target: {} for target in TARGETS}
+        count = 0
+        for sample in samples:
+            keys = bucket_keys(sample["features"])
+            used = False
+            for target in TARGETS:
+                value = sample.get(target)
+                if value is None or value <= 0:
+                    continue
+                used = True
+                for key in keys:
+                    values[target].setdefault(key, []).append(float(value))
+            count += used
+
+        buckets: Dict[str, Dict[str, Dict[str, float]]] = {target: {} for target in TARGETS}
+        for target, by_key in values.items():
+            for key, observed in by_key.items():
+                observed.sort()
+                buckets[target][key] = {
+                    "n": len(observed),
+                    "p50": _quantile(observed, 0.5),
+                    "p90": _quantile(observed, 0.9),
+                }
+        return cls(buckets, count, datetime.now().isoformat(timespec="seconds"))
+
+    def _lookup(self, target: str, features: Mapping[str, Any]) -> Tuple[float, float, str]:
+        keys = bucket_keys(features)
+        by_key = self.buckets[target]
+        for key in keys[:-1]:
+            stats = by_key.get(key)
+            if stats is not None and stats["n"] >= MIN_BUCKET_SAMPLES:
+                return stats["p50"], stats["p90"], key
+
+        # 帯のサンプル不足: complexity 50 を全体の値とみなして線形にスケール
+        scale = 0.5 + features["complexity"] / 100.0
+        overall = by_key.get("*")
+        if overall is not None:
+            return overall["p50"] * scale, overall["p90"] * scale, "*"
+        default = _DEFAULTS[target] * scale
+        return default, default, "default"
+
+    def predict(self, features: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        特徴量から所要時間（秒）とトークン数を予測する
+
+        Returns:
+            {"seconds", "seconds_p90", "tokens", "tokens_p90", "basis": {target: bucket key}}
+        """
+        result: Dict[str, Any] = {"basis": {}}
+        for target in TARGETS:
+            p50, p90, key = self._lookup(target, features)
+            result[target] = p50
+            result[f"{target}_p90"] = p90
+            result["basis"][target] = key
+        result["tokens"] = int(round(result["tokens"]))
+        result["tokens_p90"] = int(round(result["tokens_p90"]))
+        return result
+
+    def predict_task(
+        self,
+        task: Mapping[str, Any],
+        dependency_count: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """tasks 行から予測する（predict(task_features(task)) の省略形）"""
+        return self.predict(task_features(task, dependency_count))
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": MODEL_VERSION,
+                "sample_count": self.sample_count,
+                "trained_at": self.trained_at,
+                "buckets": self.buckets,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> Optional["TaskPredictionModel"]:
+        """model_json から復元（形式バージョンが異なる・破損時はNone）"""
+        try:
+            data = json.loads(text)
+        except (TypeError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != MODEL_VERSION:
+            return None
+        return cls(data.get("buckets"), data.get("sample_count", 0), data.get("trained_at"))
+
+
+# ---------------------------------------------------------------------------
+# 保存・読み込み
+# ---------------------------------------------------------------------------
+
+def save_model(conn, model: TaskPredictionModel, scope: str = GLOBAL_SCOPE) -> None:
+    """学習済みモデルを task_prediction_models に保存する（commit は呼び出し側）"""
+    execute_query(
+        conn,
+        """
+        INSERT OR REPLACE INTO task_prediction_models
+            (scope, model_version, sample_count, model_json, trained_at)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """,
+        (scope, MODEL_VERSION, model.sample_count, model.to_json()),
+    )
+
+
+def load_model(conn, scope: str = GLOBAL_SCOPE) -> Optional[TaskPredictionModel]:
+    """
+    保存済みモデルを読み込む
+
+    Returns:
+        モデル。未学習・未マイグレーション・形式バージョン不一致の場合None
+    """
+    if not table_exists(conn, "task_prediction_models"):
+        return None
+    row = fetch_one(
+        conn,
+        "SELECT model_version, model_json FROM task_prediction_models WHERE scope = ?",
+        (scope,),
+    )
+    if row is None or row["model_version"] != MODEL_VERSION:
+        return None
+    return TaskPredictionModel.from_json(row["model_json"])
+
+
+def train_models(project_id: Optional[str] = None, db_path: Optional[Path] = None) -> Dict[str, int]:
+    """
+    予測モデルを学習して保存する
+
+    Args:
+        project_id: 対象プロジェクト（Noneの場合は全プロジェクト + 横断モデル）
+        db_path: DBパス（Noneの場合はデフォルト）
+
+    Returns:
+        scope -> 学習サンプル数
+    """
+    with transaction(db_path=db_path) as conn:
+        if not table_exists(conn, "task_prediction_models"):
+            raise RuntimeError(
+                "task_prediction_models テーブルがありません。"
+                "マイグレーション 007 を適用してください"
+            )
+        samples = fetch_training_samples(conn, project_id)
+        scopes: Dict[str, List[Dict[str, Any]]] = {}
+        for sample in samples:
+            scopes.setdefault(sample["project_id"], []).append(sample)
+        if project_id:
+            scopes.setdefault(project_id, [])
+        else:
+            scopes[GLOBAL_SCOPE] = samples
+
+        trained = {}
+        for scope, scope_samples in scopes.items():
+            model = TaskPredictionModel.fit(scope_samples)
+            save_model(conn, model, scope)
+            trained[scope] = model.sample_count
+
+    clear_model_cache()
+    return trained
+
+
+def load_stored_model(conn, project_id: Optional[str] = None) -> Optional[TaskPredictionModel]:
+    """
+    保存済みのプロジェクトモデル → 保存済みの横断モデルの順に探す（学習はしない）
+
+    Returns:
+        サンプルを持つ保存済みモデル。未学習・テーブルなしの場合None
+    """
+    for scope in ([project_id] if project_id else []) + [GLOBAL_SCOPE]:
+        model = load_model(conn, scope)
+        if model is not None and model.sample_count > 0:
+            return model
+    return None
+
+
+def get_model(project_id: Optional[str] = None, conn=None) -> TaskPredictionModel:
+    """
+    予測モデルを取得（MODEL_CACHE_TTL 秒キャッシュ）
+
+    保存済みのプロジェクトモデル → 保存済みの横断モデル →
+    履歴からその場で学習（プロジェクト、空なら全プロジェクト）の順に探す。
+
+    Args:
+        project_id: プロジェクトID
+        conn: 既存のDB接続（省略時は新規接続を開いて閉じる）
+    """
+    now = time.monotonic()
+    cached = _model_cache.get(project_id)
+    if cached is not None and now - cached[0] < MODEL_CACHE_TTL:
+        return cached[1]
+
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    try:
+        model = load_stored_model(conn, project_id)
+        if model is None:
+            model = TaskPredictionModel.fit(fetch_training_samples(conn, project_id))
+            if model.sample_count == 0 and project_id is not None:
+                model = TaskPredictionModel.fit(fetch_training_samples(conn, None))
+    finally:
+        if own_conn:
+            conn.close()
+
+    _model_cache[project_id] = (now, model)
+    return model
+
+
+def clear_model_cache() -> None:
+    """get_model() のキャッシュを破棄する"""
+    _model_cache.clear()
+
+
+def predict_task(project_id: str, task_id: str, conn=None) -> Optional[Dict[str, Any]]:
+    """
+    タスクの所要時間・トークン数を予測する
+
+    Returns:
+        predict() の結果に task_id / recommended_model を加えたdict。タスクが存在しない場合None
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    try:
+        tasks = fetch_task_rows(conn, project_id, task_id=task_id)
+        if not tasks:
+            return None
+        result = get_model(project_id, conn).predict_task(tasks[0])
+    finally:
+        if own_conn:
+            conn.close()
+
+    result["task_id"] = task_id
+    result["recommended_model"] = tasks[0]["recommended_model"] or DEFAULT_MODEL
+    return result
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    """CLI エントリーポイント"""
+    parser = argparse.ArgumentParser(
+        description="タスク所要時間・トークン数予測モデルの学習・確認",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    train_parser = subparsers.add_parser("train", help="実績から学習してDBに保存")
+    train_parser.add_argument("--project", help="対象プロジェクト（省略時は全プロジェクト + 横断モデル）")
+    train_parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+
+    show_parser = subparsers.add_parser("show", help="保存済みモデルを表示")
+    show_parser.add_argument("--project", help="プロジェクト（省略時は横断モデル）")
+    show_parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+
+    predict_parser = subparsers.add_parser("predict", help="タスクの予測値を表示")
+    predict_parser.add_argument("project_id", help="プロジェクトID")
+    predict_parser.add_argument("task_id", help="タスクID")
+    predict_parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    try:
+        if args.command == "train":
+            trained = train_models(args.project)
+            if args.json:
+                print(json.dumps(trained, ensure_ascii=False, indent=2))
+            else:
+                for scope, count in trained.items():
+                    print(f"[OK] {scope}: {count} samples")
+
+        elif args.command == "show":
+            conn = get_connection()
+            try:
+                model = load_model(conn, args.project or GLOBAL_SCOPE)
+            finally:
+                conn.close()
+            if model is None:
+                print("エラー: 学習済みモデルがありません（train を実行してください）", file=sys.stderr)
+                sys.exit(1)
+            if args.json:
+                print(model.to_json())
+            else:
+                print(f"samples: {model.sample_count}  trained_at: {model.trained_at}")
+                for target in TARGETS:
+                    overall = model.buckets[target].get("*")
+                    if overall:
+                        print(f"  {target}: p50={overall['p50']:.0f} p90={overall['p90']:.0f} "
+                              f"(n={overall['n']}, buckets={len(model.buckets[target])})")
+
+        elif args.command == "predict":
+            result = predict_task(args.project_id, args.task_id)
+            if result is None:
+                print(f"エラー: タスクが見つかりません: {args.task_id}", file=sys.stderr)
+                sys.exit(1)
+            if args.json:
+                print(json.dumps(result, ensure_ascii=False, indent=2))
+            else:
+                print(f"{args.task_id} ({result['recommended_model']})")
+                print(f"  所要時間: {result['seconds'] / 60:.1f}分 (p90 {result['seconds_p90'] / 60:.1f}分)")
+                print(f"  トークン: {result['tokens']:,} (p90 {result['tokens_p90']:,})")
+
+    except Exception as e:
+        print(f"エラー: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+AI PM Framework - Warm Worker Pool
+
+Keeps a few pre-imported idle Python processes ("spares") so the daemon can
+start a Worker / review_worker without paying for interpreter start-up,
+``sys.path`` setup, module imports, config resolution and the first DB
+connect on every launch.
+
+- Each spare imports ``worker.execute_task`` and ``review_worker`` and opens
+  (then closes) a DB connection, then blocks reading one JSON job from stdin.
+- A job is ``{"kind", "argv", "log_file"}``. The spare acknowledges on its
+  stdout pipe, redirects stdout/stderr to the task log and runs the module's
+  ``main()`` with ``argv`` exactly as a cold ``python execute_task.py ...``
+  would, then exits with its exit code.
+- One spare runs one job: a crash only ever affects its own task, and the
+  daemon keeps a normal ``subprocess.Popen`` handle (pid / poll / kill /
+  exit code), so reaping and health checks are unchanged.
+- Spares older than ``max_idle_seconds`` are recycled so code and config
+  changes are picked up; if no live spare is available the caller falls
+  back to a cold spawn.
+
+Usage:
+    pool = WarmWorkerPool(size=2).start()
+    proc = pool.launch("execute_task", ["AI_PM_PJ", "TASK_602", "--timeout", "1800"], log_file)
+    if proc is None:
+        proc = subprocess.Popen(cold_command, ...)
+    ...
+    pool.close()
+
+    # Compare launch-to-first-step latency with cold spawn
+    python backend/worker/warm_pool.py --benchmark --runs 5
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional
+
+# Add parent directory to path
+_current_dir = Path(__file__).resolve().parent
+_package_root = _current_dir.parent
+if str(_package_root) not in sys.path:
+    sys.path.insert(0, str(_package_root))
+
+logger = logging.getLogger(__name__)
+
+
+KIND_EXECUTE_TASK = "execute_task"
+KIND_REVIEW_WORKER = "review_worker"
+KIND_PROBE = "probe"
+
+# kind -> (module, script path used as argv[0])
+JOB_ENTRY_POINTS: Dict[str, tuple] = {
+    KIND_EXECUTE_TASK: ("worker.execute_task", _current_dir / "execute_task.py"),
+    KIND_REVIEW_WORKER: ("review_worker", _package_root / "review_worker.py"),
+}
+
+PRELOAD_MODULES = ("worker.execute_task", "review_worker")
+
+
+def _worker_env() -> Dict[str, str]:
+    """Same environment as a cold Worker spawn (backend/ on PYTHONPATH)."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(_package_root) + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+class WarmWorkerPool:
+    """Pool of pre-imported idle processes that each run exactly one job."""
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        max_idle_seconds: float = 600.0,
+        log_file: Optional[Path] = None,
+    ) -> None:
+        """
+        Args:
+            size: Number of idle spares to keep
+            max_idle_seconds: Recycle spares idle for longer than this
+            log_file: Where spares write output before they receive a job
+                (import errors etc.). None discards it.
+        """
+        self.size = max(0, size)
+        self.max_idle_seconds = max_idle_seconds
+        self.log_file = log_file
+        self._log_fh: Optional[IO] = None
+        # [(Popen, spawned_at monotonic)]
+        self._spares: List[tuple] = []
+        self._closed = False
+        self.stats: Dict[str, int] = {
+            "spawned": 0,
+            "launched": 0,
+            "fallbacks": 0,
+            "recycled": 0,
+            "dead": 0,
+        }
+
+    def start(self) -> "WarmWorkerPool":
+        self._fill()
+        return self
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._spares)
+
+    # ------------------------------------------------------------------
+    # Spares
+    # ------------------------------------------------------------------
+
+    def _spawn(self) -> Optional[subprocess.Popen]:
+        if self.log_file is not None and self._log_fh is None:
+            try:
+                self.log_file.parent.mkdir(parents=True, exist_ok=True)
+                self._log_fh = open(str(self.log_file), "a", encoding="utf-8")
+            except OSError as e:
+                logger.debug(f"[warm_pool] Cannot open {self.log_file}: {e}")
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, str(Path(__file__).resolve()), "--serve"],
+                cwd=_package_root,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._log_fh or subprocess.DEVNULL,
+                env=_worker_env(),
+            )
+        except OSError as e:
+            logger.warning(f"[warm_pool] Failed to spawn spare: {e}")
+            return None
+        self.stats["spawned"] += 1
+        return proc
+
+    def _fill(self) -> None:
+        while not self._closed and len(self._spares) < self.size:
+            proc = self._spawn()
+            if proc is None:
+                return
+            self._spares.append((proc, time.monotonic()))
+
+    def _take_spare(self) -> Optional[subprocess.Popen]:
+        now = time.monotonic()
+        while self._spares:
+            proc, spawned_at = self._spares.pop(0)
+            if proc.poll() is not None:
+                self.stats["dead"] += 1
+                logger.warning(
+                    f"[warm_pool] Spare PID {proc.pid} exited with {proc.returncode} before use"
+                )
+                self._discard(proc)
+                continue
+            if now - spawned_at > self.max_idle_seconds:
+                self.stats["recycled"] += 1
+                self._discard(proc)
+                continue
+            return proc
+        return None
+
+    @staticmethod
+    def _discard(proc: subprocess.Popen) -> None:
+        try:
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait(timeout=5)
+        except Exception:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+        for stream in (proc.stdin, proc.stdout):
+            try:
+                if stream:
+                    stream.close()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def launch(self, kind: str, argv: List[str], log_file: Path) -> Optional[subprocess.Popen]:
+        """
+        Hand a job to an idle spare.
+
+        Args:
+            kind: KIND_EXECUTE_TASK / KIND_REVIEW_WORKER / KIND_PROBE
+            argv: Arguments after the script path (as for a cold spawn)
+            log_file: Task log file (stdout/stderr of the job)
+
+        Returns:
+            The spare's Popen handle (now running the job), or None when no
+            spare is available and the caller should spawn cold.
+        """
+        if self._closed:
+            return None
+        if kind not in JOB_ENTRY_POINTS and kind != KIND_PROBE:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job = json.dumps({"kind": kind, "argv": list(argv), "log_file": str(log_file)})
+        while True:
+            proc = self._take_spare()
+            if proc is None:
+                self.stats["fallbacks"] += 1
+                self._fill()
+                return None
+            try:
+                proc.stdin.write((job + "\n").encode("utf-8"))
+                proc.stdin.close()
+            except (BrokenPipeError, OSError) as e:
+                self.stats["dead"] += 1
+                logger.warning(f"[warm_pool] Spare PID {proc.pid} rejected job: {e}")
+                self._discard(proc)
+                continue
+            self.stats["launched"] += 1
+            self._fill()
+            return proc
+
+    @staticmethod
+    def read_ack(proc: subprocess.Popen) -> Optional[Dict[str, Any]]:
+        """
+        Read the job acknowledgement of a warm-launched process.
+
+        Call once the process has exited (the read would otherwise block
+        until the job starts). Returns ``{"pid", "started_at"}`` or None.
+        """
+        stream = proc.stdout
+        if stream is None:
+            return None
+        try:
+            line = stream.readline()
+            return json.loads(line) if line else None
+        except (OSError, ValueError):
+            return None
+        finally:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Terminate idle spares (running jobs are not affected)."""
+        self._closed = True
+        spares, self._spares = self._spares, []
+        for proc, _ in spares:
+            self._discard(proc)
+        if self._log_fh is not None:
+            try:
+                self._log_fh.close()
+            except Exception:
+                pass
+            self._log_fh = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.stats, size=self.size, idle=self.idle_count)
+
+
+# ---------------------------------------------------------------------------
+# Spare side
+# ---------------------------------------------------------------------------
+
+def _preload() -> None:
+    """Imports, config resolution and first DB connect done before any job."""
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"[warm_pool] preload {name} failed: {e}", file=sys.stderr)
+    try:
+        from config.db_config import get_db_path
+        from utils.db import get_connection, close_connection
+        if not get_db_path().exists():
+            return
+        conn = get_connection()
+        try:
+            conn.execute("SELECT 1")
+        finally:
+            close_connection(conn)
+    except Exception as e:
+        print(f"[warm_pool] DB warm-up failed: {e}", file=sys.stderr)
+
+
+def _ack(stream: IO, started_at: float) -> None:
+    stream.write(json.dumps({"pid": os.getpid(), "started_at": started_at}) + "\n")
+    stream.flush()
+
+
+def _run_job(job: Dict[str, Any]) -> int:
+    module_name, script = JOB_ENTRY_POINTS[job["kind"]]
+    module = importlib.import_module(module_name)
+    sys.argv = [str(script)] + list(job.get("argv", []))
+    try:
+        module.main()
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _redirect_output(log_file: str) -> None:
+    fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(fd, 1)
+    os.dup2(fd, 2)
+    os.close(fd)
+
+
+def serve() -> int:
+    """Spare main loop: preload, wait for one job, run it, exit."""
+    _preload()
+    line = sys.stdin.readline()
+    if not line:
+        return 0
+    job = json.loads(line)
+    _ack(sys.stdout, time.time())
+    if job["kind"] == KIND_PROBE:
+        return 0
+    _redirect_output(job["log_file"])
+    code = _run_job(job)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    return code
+
+
+def _probe() -> int:
+    """Cold-spawn counterpart of a probe job (for --benchmark)."""
+    _preload()
+    _ack(sys.stdout, time.time())
+    return 0
+
+
+def benchmark(runs: int = 5) -> Dict[str, Any]:
+    """
+    Measure launch-to-first-step latency of cold spawn vs warm pool.
+
+    "First step" is the point where the job's ``main()`` would be entered:
+    after interpreter start-up, imports, config resolution and DB connect.
+    """
+    def _ms(values: List[float]) -> Dict[str, float]:
+        values = sorted(values)
+        return {
+            "avg_ms": round(sum(values) / len(values), 1),
+            "p50_ms": round(values[len(values) // 2], 1),
+            "max_ms": round(values[-1], 1),
+        }
+
+    cold: List[float] = []
+    for _ in range(runs):
+        requested = time.time()
+        proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--probe"],
+            cwd=_package_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_worker_env(),
+        )
+        proc.wait()
+        ack = WarmWorkerPool.read_ack(proc)
+        if ack:
+            cold.append((ack["started_at"] - requested) * 1000)
+
+    warm: List[float] = []
+    pool = WarmWorkerPool(size=1).start()
+    try:
+        for _ in range(runs):
+            # Let the replacement spare finish preloading, as in steady state
+            time.sleep(max(cold) / 1000 * 1.5 if cold else 2.0)
+            requested = time.time()
+            proc = pool.launch(KIND_PROBE, [], Path(os.devnull))
+            if proc is None:
+                continue
+            proc.wait()
+            ack = WarmWorkerPool.read_ack(proc)
+            if ack:
+                warm.append((ack["started_at"] - requested) * 1000)
+    finally:
+        pool.close()
+
+    result: Dict[str, Any] = {"runs": runs}
+    if cold:
+        result["cold"] = _ms(cold)
+    if warm:
+        result["warm"] = _ms(warm)
+    if cold and warm:
+        result["speedup"] = round(result["cold"]["avg_ms"] / max(result["warm"]["avg_ms"], 0.1), 1)
+    return result
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description="Warm worker pool (spare process / benchmark)")
+    parser.add_argument("--serve", action="store_true", help="Run as a pool spare (internal)")
+    parser.add_argument("--probe", action="store_true", help="Cold-spawn probe for --benchmark (internal)")
+    parser.add_argument("--benchmark", action="store_true", help="Compare cold spawn vs warm pool launch latency")
+    parser.add_argument("--runs", type=int, default=5, help="Benchmark runs (default: 5)")
+    parser.add_argument("--json", action="store_true", help="JSON output format")
+    args = parser.parse_args()
+
+    if args.serve:
+        sys.exit(serve())
+    if args.probe:
+        sys.exit(_probe())
+    if args.benchmark:
+        result = benchmark(args.runs)
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        else:
+            print(f"Launch-to-first-step latency ({args.runs} runs)")
+            for mode in ("cold", "warm"):
+                if mode in result:
+                    r = result[mode]
+                    print(f"  {mode:<5} avg {r['avg_ms']:.1f} ms / p50 {r['p50_ms']:.1f} ms / max {r['max_ms']:.1f} ms")
+            if "speedup" in result:
+                print(f"  speedup x{result['speedup']}")
+        return
+    parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
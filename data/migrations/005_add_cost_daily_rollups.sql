@@ -0,0 +1,41 @@
+-- ============================================================================
+-- Migration 005: Add cost daily rollup tables
+-- Created: 2026-10-18
+-- Description: Adds cost_daily_rollups (daily cost aggregates keyed by
+--              project/order/model/day) and cost_rollup_state (materialized
+--              watermark) used by cost/cost_report.py
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS cost_daily_rollups (
+    project_id TEXT NOT NULL,
+    order_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    day TEXT NOT NULL,
+    task_count INTEGER NOT NULL DEFAULT 0,
+    cost_count INTEGER NOT NULL DEFAULT 0,
+    total_cost_usd REAL NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    complexity_count INTEGER NOT NULL DEFAULT 0,
+    complexity_sum INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (project_id, order_id, model, day)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cost_daily_rollups_day ON cost_daily_rollups(day);
+
+CREATE TABLE IF NOT EXISTS cost_rollup_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    rolled_through TEXT,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Range scans over not-yet-rolled-up days
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at);
+
+-- ============================================================================
+-- NOTES:
+-- - Rollups are populated lazily on the next cost report, or explicitly with
+--   `python backend/cost/cost_rollup.py backfill`
+-- ============================================================================
+-- END OF MIGRATION
+-- ============================================================================
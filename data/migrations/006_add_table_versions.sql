@@ -0,0 +1,45 @@
+-- ============================================================================
+-- Migration 006: Add table_versions change counters
+-- Created: 2026-10-18
+-- Description: Adds table_versions and triggers that bump the 'bugs' version
+--              whenever a bug row that is rendered into Worker prompts changes.
+--              Used as the cache key by worker/prompt_context_cache.py
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('bugs', 0);
+
+CREATE TRIGGER IF NOT EXISTS trigger_bugs_version_insert
+AFTER INSERT ON bugs
+BEGIN
+    UPDATE table_versions SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'bugs';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trigger_bugs_version_delete
+AFTER DELETE ON bugs
+BEGIN
+    UPDATE table_versions SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'bugs';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trigger_bugs_version_update
+AFTER UPDATE OF project_id, title, description, pattern_type, severity, status,
+                solution, occurrence_count, effectiveness_score ON bugs
+BEGIN
+    UPDATE table_versions SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'bugs';
+END;
+
+-- ============================================================================
+-- NOTES:
+-- - Until this migration is applied, Worker prompts rebuild the known-bugs
+--   section on every task (no version key available)
+-- ============================================================================
+-- END OF MIGRATION
+-- ============================================================================
@@ -0,0 +1,15 @@
+-- ============================================================================
+-- Migration 007: Add task_prediction_models
+-- Created: 2026-10-18
+-- Description: Stores offline-trained task duration / token predictors
+--              (quantiles over feature buckets) built by
+--              worker/task_duration.py train
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS task_prediction_models (
+    scope TEXT PRIMARY KEY,
+    model_version INTEGER NOT NULL,
+    sample_count INTEGER NOT NULL DEFAULT 0,
+    model_json TEXT NOT NULL,
+    trained_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,24 @@
+-- ============================================================================
+-- Migration 008: Add daemons
+-- Created: 2026-10-18
+-- Description: Lease / liveness registry of resident launchers
+--              (worker/daemon_registry.py), replacing the per-ORDER
+--              daemon_heartbeat.json and scheduler_heartbeat.json files
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS daemons (
+    daemon_id TEXT PRIMARY KEY,                   -- 'order:{project_id}/{order_id}' or 'scheduler'
+    kind TEXT NOT NULL CHECK (kind IN ('order', 'scheduler')),
+    project_id TEXT,                              -- Per-ORDER daemon only
+    order_id TEXT,                                -- Per-ORDER daemon only
+    pid INTEGER NOT NULL,                         -- Lease owner process
+    status TEXT NOT NULL DEFAULT 'running' CHECK (status IN ('running', 'shutting_down')),
+    owned_tasks TEXT NOT NULL DEFAULT '[]',       -- JSON [{"project_id", "order_id", "task_id", "pid"}]
+    info_json TEXT,                               -- Poll interval, resource trend, metrics URL, managed ORDERs
+    started_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    heartbeat_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    lease_expires_at DATETIME NOT NULL            -- Alive while in the future (UTC)
+);
+
+CREATE INDEX IF NOT EXISTS idx_daemons_lease ON daemons(lease_expires_at);
+CREATE INDEX IF NOT EXISTS idx_daemons_order ON daemons(project_id, order_id);
@@ -0,0 +1,21 @@
+-- ============================================================================
+-- Migration 009: Add static_analysis_cache
+-- Created: 2026-10-18
+-- Description: Caches static analysis results keyed by content hash, tool
+--              version and config hash so unchanged files are not
+--              re-analyzed (quality/static_analyzer.py)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS static_analysis_cache (
+    tool TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    tool_version TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    file_path TEXT,
+    issues_json TEXT NOT NULL DEFAULT '[]',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    last_used_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (tool, content_hash, tool_version, config_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_static_analysis_cache_last_used ON static_analysis_cache(last_used_at);
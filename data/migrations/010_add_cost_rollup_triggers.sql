@@ -0,0 +1,96 @@
+-- ============================================================================
+-- Migration 010: Add cost rollup maintenance triggers
+-- Created: 2026-10-18
+-- Description: Keeps cost_daily_rollups in sync with tasks for days that are
+--              already rolled up (day <= cost_rollup_state.rolled_through).
+--              Covers cost records, reclassification (order / model /
+--              complexity), backdated or late inserts and deletes, whichever
+--              process or clock wrote the row
+-- ============================================================================
+
+CREATE TRIGGER IF NOT EXISTS trigger_tasks_cost_rollup_insert
+AFTER INSERT ON tasks
+WHEN DATE(NEW.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+BEGIN
+    INSERT INTO cost_daily_rollups (
+        project_id, order_id, model, day, task_count, cost_count, total_cost_usd,
+        total_tokens, complexity_count, complexity_sum, updated_at
+    )
+    VALUES (
+        NEW.project_id, NEW.order_id, COALESCE(NEW.recommended_model, 'Unknown'),
+        DATE(NEW.created_at), 1, NEW.cost_usd IS NOT NULL, COALESCE(NEW.cost_usd, 0),
+        COALESCE(NEW.actual_tokens, 0), NEW.complexity_score IS NOT NULL,
+        COALESCE(NEW.complexity_score, 0), CURRENT_TIMESTAMP
+    )
+    ON CONFLICT(project_id, order_id, model, day) DO UPDATE SET
+        task_count = task_count + excluded.task_count,
+        cost_count = cost_count + excluded.cost_count,
+        total_cost_usd = total_cost_usd + excluded.total_cost_usd,
+        total_tokens = total_tokens + excluded.total_tokens,
+        complexity_count = complexity_count + excluded.complexity_count,
+        complexity_sum = complexity_sum + excluded.complexity_sum,
+        updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trigger_tasks_cost_rollup_delete
+AFTER DELETE ON tasks
+WHEN DATE(OLD.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+BEGIN
+    UPDATE cost_daily_rollups SET
+        task_count = task_count - 1,
+        cost_count = cost_count - (OLD.cost_usd IS NOT NULL),
+        total_cost_usd = total_cost_usd - COALESCE(OLD.cost_usd, 0),
+        total_tokens = total_tokens - COALESCE(OLD.actual_tokens, 0),
+        complexity_count = complexity_count - (OLD.complexity_score IS NOT NULL),
+        complexity_sum = complexity_sum - COALESCE(OLD.complexity_score, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE project_id = OLD.project_id AND order_id = OLD.order_id
+      AND model = COALESCE(OLD.recommended_model, 'Unknown') AND day = DATE(OLD.created_at);
+END;
+
+-- Moves the task's whole contribution from its old bucket to its new one
+CREATE TRIGGER IF NOT EXISTS trigger_tasks_cost_rollup_update
+AFTER UPDATE OF project_id, order_id, recommended_model, complexity_score,
+                actual_tokens, cost_usd, created_at ON tasks
+WHEN DATE(OLD.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+  OR DATE(NEW.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+BEGIN
+    UPDATE cost_daily_rollups SET
+        task_count = task_count - 1,
+        cost_count = cost_count - (OLD.cost_usd IS NOT NULL),
+        total_cost_usd = total_cost_usd - COALESCE(OLD.cost_usd, 0),
+        total_tokens = total_tokens - COALESCE(OLD.actual_tokens, 0),
+        complexity_count = complexity_count - (OLD.complexity_score IS NOT NULL),
+        complexity_sum = complexity_sum - COALESCE(OLD.complexity_score, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE project_id = OLD.project_id AND order_id = OLD.order_id
+      AND model = COALESCE(OLD.recommended_model, 'Unknown') AND day = DATE(OLD.created_at)
+      AND day <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1);
+
+    INSERT INTO cost_daily_rollups (
+        project_id, order_id, model, day, task_count, cost_count, total_cost_usd,
+        total_tokens, complexity_count, complexity_sum, updated_at
+    )
+    SELECT
+        NEW.project_id, NEW.order_id, COALESCE(NEW.recommended_model, 'Unknown'),
+        DATE(NEW.created_at), 1, NEW.cost_usd IS NOT NULL, COALESCE(NEW.cost_usd, 0),
+        COALESCE(NEW.actual_tokens, 0), NEW.complexity_score IS NOT NULL,
+        COALESCE(NEW.complexity_score, 0), CURRENT_TIMESTAMP
+    WHERE DATE(NEW.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+    ON CONFLICT(project_id, order_id, model, day) DO UPDATE SET
+        task_count = task_count + excluded.task_count,
+        cost_count = cost_count + excluded.cost_count,
+        total_cost_usd = total_cost_usd + excluded.total_cost_usd,
+        total_tokens = total_tokens + excluded.total_tokens,
+        complexity_count = complexity_count + excluded.complexity_count,
+        complexity_sum = complexity_sum + excluded.complexity_sum,
+        updated_at = excluded.updated_at;
+END;
+
+-- ============================================================================
+-- NOTES:
+-- - cost_tracker.record_cost no longer patches buckets itself; its UPDATE of
+--   actual_tokens / cost_usd is handled by trigger_tasks_cost_rollup_update
+-- ============================================================================
+-- END OF MIGRATION
+-- ============================================================================
@@ -0,0 +1,16 @@
+-- ============================================================================
+-- Migration 011: Add static_analysis_tools
+-- Created: 2026-10-18
+-- Description: Persists StaticAnalyzer tool detection and '<tool> --version'
+--              results per project root, keyed by the detection fingerprint,
+--              so each worker process does not re-probe npx / --version
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS static_analysis_tools (
+    project_root TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    tools_json TEXT NOT NULL,
+    commands_json TEXT NOT NULL,
+    versions_json TEXT NOT NULL DEFAULT '{}',
+    detected_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
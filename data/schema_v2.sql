@@ -1,8 +1,8 @@
 -- ============================================================================
 -- AI PM Framework Database Schema
--- Version: 2.5.0
+-- Version: 2.12.0
 -- Created: 2026-01-29
--- Updated: 2026-02-25
+-- Updated: 2026-10-18
 -- Description: SQLite schema with composite primary keys for multi-project support
 -- ============================================================================
 --
@@ -45,6 +45,53 @@
 --   * Migration: migrate_backlog_to_orders.py
 --   * Backlog items are migrated as DRAFT orders for unified management
 --
+-- CHANGELOG v2.6.0 (2026-10-18):
+-- - Added cost_daily_rollups / cost_rollup_state tables
+--   * Daily cost aggregates keyed by (project, order, model, day)
+--   * Maintained by cost/cost_rollup.py and cost_tracker.record_cost
+--   * Added index idx_tasks_created_at for range scans of un-rolled days
+--   * Migration: 005_add_cost_daily_rollups.sql
+--
+-- CHANGELOG v2.7.0 (2026-10-18):
+-- - Added table_versions table and bugs change-counter triggers
+--   * version is bumped on INSERT/DELETE and on updates of rendered bug columns
+--   * Used as the cache key for worker/prompt_context_cache.py
+--   * Migration: 006_add_table_versions.sql
+--
+-- CHANGELOG v2.8.0 (2026-10-18):
+-- - Added task_prediction_models table
+--   * Trained task duration / token predictors (quantiles over feature buckets)
+--   * One row per scope (project_id, or '*' for the cross-project model)
+--   * Maintained by worker/task_duration.py train
+--   * Migration: 007_add_task_prediction_models.sql
+--
+-- CHANGELOG v2.9.0 (2026-10-18):
+-- - Added daemons table (replaces daemon_heartbeat.json / scheduler_heartbeat.json)
+--   * One row per resident launcher, upserted once per poll cycle
+--   * Lease expiry, owner PID and owned task IDs (orphan detection)
+--   * Maintained by worker/daemon_registry.py
+--   * Migration: 008_add_daemons.sql
+--
+-- CHANGELOG v2.10.0 (2026-10-18):
+-- - Added static_analysis_cache table
+--   * Per-file static analysis results keyed by (tool, content hash,
+--     tool version, config hash); cross-file tools key on the file set
+--   * Maintained by quality/analysis_cache.py (StaticAnalyzer)
+--   * Migration: 009_add_static_analysis_cache.sql
+--
+-- CHANGELOG v2.11.0 (2026-10-18):
+-- - Added cost rollup maintenance triggers on tasks
+--   * Insert / delete / update of bucket columns on rolled-up days adjust
+--     cost_daily_rollups in place (replaces cost_tracker's delta update)
+--   * Migration: 010_add_cost_rollup_triggers.sql
+--
+-- CHANGELOG v2.12.0 (2026-10-18):
+-- - Added static_analysis_tools table
+--   * Tool detection and tool versions per project root, keyed by the
+--     detection fingerprint (config files present, PATH)
+--   * Shared by StaticAnalyzer across worker processes
+--   * Migration: 011_add_static_analysis_tools.sql
+--
 -- ============================================================================
 
 -- Enable foreign key constraints
@@ -341,6 +388,7 @@ CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
 CREATE INDEX IF NOT EXISTS idx_tasks_assignee ON tasks(assignee);
 CREATE INDEX IF NOT EXISTS idx_tasks_reviewed_at ON tasks(reviewed_at);
 CREATE INDEX IF NOT EXISTS idx_tasks_is_destructive_db_change ON tasks(is_destructive_db_change);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at);
 
 -- Task dependencies indexes
 CREATE INDEX IF NOT EXISTS idx_task_dependencies_task_id ON task_dependencies(task_id);
@@ -612,6 +660,233 @@ CREATE INDEX IF NOT EXISTS idx_incidents_project_id ON incidents(project_id);
 CREATE INDEX IF NOT EXISTS idx_incidents_task_id ON incidents(task_id);
 CREATE INDEX IF NOT EXISTS idx_incidents_category ON incidents(category);
 
+-- ============================================================================
+-- COST_DAILY_ROLLUPS TABLE
+-- ============================================================================
+-- Materialized daily cost aggregates used by cost/cost_report.py
+-- Only closed days (<= cost_rollup_state.rolled_through) are stored; later days
+-- are aggregated from tasks at report time
+
+CREATE TABLE IF NOT EXISTS cost_daily_rollups (
+    project_id TEXT NOT NULL,
+    order_id TEXT NOT NULL,
+    model TEXT NOT NULL,                        -- COALESCE(recommended_model, 'Unknown')
+    day TEXT NOT NULL,                          -- DATE(tasks.created_at)
+    task_count INTEGER NOT NULL DEFAULT 0,
+    cost_count INTEGER NOT NULL DEFAULT 0,      -- Tasks with cost_usd recorded
+    total_cost_usd REAL NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    complexity_count INTEGER NOT NULL DEFAULT 0, -- Tasks with complexity_score set
+    complexity_sum INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (project_id, order_id, model, day)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cost_daily_rollups_day ON cost_daily_rollups(day);
+
+CREATE TABLE IF NOT EXISTS cost_rollup_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    rolled_through TEXT,                        -- Last materialized day (YYYY-MM-DD)
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Keep rolled-up days in sync with every write to tasks, whichever process or
+-- clock wrote the row (later days are aggregated from tasks at report time)
+
+CREATE TRIGGER IF NOT EXISTS trigger_tasks_cost_rollup_insert
+AFTER INSERT ON tasks
+WHEN DATE(NEW.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+BEGIN
+    INSERT INTO cost_daily_rollups (
+        project_id, order_id, model, day, task_count, cost_count, total_cost_usd,
+        total_tokens, complexity_count, complexity_sum, updated_at
+    )
+    VALUES (
+        NEW.project_id, NEW.order_id, COALESCE(NEW.recommended_model, 'Unknown'),
+        DATE(NEW.created_at), 1, NEW.cost_usd IS NOT NULL, COALESCE(NEW.cost_usd, 0),
+        COALESCE(NEW.actual_tokens, 0), NEW.complexity_score IS NOT NULL,
+        COALESCE(NEW.complexity_score, 0), CURRENT_TIMESTAMP
+    )
+    ON CONFLICT(project_id, order_id, model, day) DO UPDATE SET
+        task_count = task_count + excluded.task_count,
+        cost_count = cost_count + excluded.cost_count,
+        total_cost_usd = total_cost_usd + excluded.total_cost_usd,
+        total_tokens = total_tokens + excluded.total_tokens,
+        complexity_count = complexity_count + excluded.complexity_count,
+        complexity_sum = complexity_sum + excluded.complexity_sum,
+        updated_at = excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trigger_tasks_cost_rollup_delete
+AFTER DELETE ON tasks
+WHEN DATE(OLD.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+BEGIN
+    UPDATE cost_daily_rollups SET
+        task_count = task_count - 1,
+        cost_count = cost_count - (OLD.cost_usd IS NOT NULL),
+        total_cost_usd = total_cost_usd - COALESCE(OLD.cost_usd, 0),
+        total_tokens = total_tokens - COALESCE(OLD.actual_tokens, 0),
+        complexity_count = complexity_count - (OLD.complexity_score IS NOT NULL),
+        complexity_sum = complexity_sum - COALESCE(OLD.complexity_score, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE project_id = OLD.project_id AND order_id = OLD.order_id
+      AND model = COALESCE(OLD.recommended_model, 'Unknown') AND day = DATE(OLD.created_at);
+END;
+
+-- Moves the task's whole contribution from its old bucket to its new one
+CREATE TRIGGER IF NOT EXISTS trigger_tasks_cost_rollup_update
+AFTER UPDATE OF project_id, order_id, recommended_model, complexity_score,
+                actual_tokens, cost_usd, created_at ON tasks
+WHEN DATE(OLD.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+  OR DATE(NEW.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+BEGIN
+    UPDATE cost_daily_rollups SET
+        task_count = task_count - 1,
+        cost_count = cost_count - (OLD.cost_usd IS NOT NULL),
+        total_cost_usd = total_cost_usd - COALESCE(OLD.cost_usd, 0),
+        total_tokens = total_tokens - COALESCE(OLD.actual_tokens, 0),
+        complexity_count = complexity_count - (OLD.complexity_score IS NOT NULL),
+        complexity_sum = complexity_sum - COALESCE(OLD.complexity_score, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE project_id = OLD.project_id AND order_id = OLD.order_id
+      AND model = COALESCE(OLD.recommended_model, 'Unknown') AND day = DATE(OLD.created_at)
+      AND day <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1);
+
+    INSERT INTO cost_daily_rollups (
+        project_id, order_id, model, day, task_count, cost_count, total_cost_usd,
+        total_tokens, complexity_count, complexity_sum, updated_at
+    )
+    SELECT
+        NEW.project_id, NEW.order_id, COALESCE(NEW.recommended_model, 'Unknown'),
+        DATE(NEW.created_at), 1, NEW.cost_usd IS NOT NULL, COALESCE(NEW.cost_usd, 0),
+        COALESCE(NEW.actual_tokens, 0), NEW.complexity_score IS NOT NULL,
+        COALESCE(NEW.complexity_score, 0), CURRENT_TIMESTAMP
+    WHERE DATE(NEW.created_at) <= (SELECT rolled_through FROM cost_rollup_state WHERE id = 1)
+    ON CONFLICT(project_id, order_id, model, day) DO UPDATE SET
+        task_count = task_count + excluded.task_count,
+        cost_count = cost_count + excluded.cost_count,
+        total_cost_usd = total_cost_usd + excluded.total_cost_usd,
+        total_tokens = total_tokens + excluded.total_tokens,
+        complexity_count = complexity_count + excluded.complexity_count,
+        complexity_sum = complexity_sum + excluded.complexity_sum,
+        updated_at = excluded.updated_at;
+END;
+
+-- ============================================================================
+-- TABLE_VERSIONS TABLE
+-- ============================================================================
+-- Change counters for tables whose rendered content is cached outside the DB
+-- (worker/prompt_context_cache.py keys the known-bugs prompt section on 'bugs')
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('bugs', 0);
+
+CREATE TRIGGER IF NOT EXISTS trigger_bugs_version_insert
+AFTER INSERT ON bugs
+BEGIN
+    UPDATE table_versions SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'bugs';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trigger_bugs_version_delete
+AFTER DELETE ON bugs
+BEGIN
+    UPDATE table_versions SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'bugs';
+END;
+
+-- total_injections / related_failures / updated_at are not rendered and do not bump the version
+CREATE TRIGGER IF NOT EXISTS trigger_bugs_version_update
+AFTER UPDATE OF project_id, title, description, pattern_type, severity, status,
+                solution, occurrence_count, effectiveness_score ON bugs
+BEGIN
+    UPDATE table_versions SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'bugs';
+END;
+
+-- ============================================================================
+-- TASK_PREDICTION_MODELS TABLE
+-- ============================================================================
+-- Offline-trained task duration / token predictors (worker/task_duration.py).
+-- model_json holds per-bucket quantiles; consumed by the parallel launcher
+-- (critical-path weights), cost_tracker estimate and the dashboard ORDER ETA
+
+CREATE TABLE IF NOT EXISTS task_prediction_models (
+    scope TEXT PRIMARY KEY,                       -- project_id, or '*' (all projects)
+    model_version INTEGER NOT NULL,               -- Feature/format version of model_json
+    sample_count INTEGER NOT NULL DEFAULT 0,      -- Training samples
+    model_json TEXT NOT NULL,                     -- Serialized model
+    trained_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================================================
+-- DAEMONS TABLE
+-- ============================================================================
+-- Liveness / lease registry of resident launchers (worker/daemon_registry.py).
+-- One row per per-ORDER daemon or the global scheduler, upserted once per
+-- poll cycle. A row is alive while lease_expires_at is in the future; an
+-- expired lease may be taken over by another process
+
+CREATE TABLE IF NOT EXISTS daemons (
+    daemon_id TEXT PRIMARY KEY,                   -- 'order:{project_id}/{order_id}' or 'scheduler'
+    kind TEXT NOT NULL CHECK (kind IN ('order', 'scheduler')),
+    project_id TEXT,                              -- Per-ORDER daemon only
+    order_id TEXT,                                -- Per-ORDER daemon only
+    pid INTEGER NOT NULL,                         -- Lease owner process
+    status TEXT NOT NULL DEFAULT 'running' CHECK (status IN ('running', 'shutting_down')),
+    owned_tasks TEXT NOT NULL DEFAULT '[]',       -- JSON [{"project_id", "order_id", "task_id", "pid"}]
+    info_json TEXT,                               -- Poll interval, resource trend, metrics URL, managed ORDERs
+    started_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    heartbeat_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    lease_expires_at DATETIME NOT NULL            -- Alive while in the future (UTC)
+);
+
+CREATE INDEX IF NOT EXISTS idx_daemons_lease ON daemons(lease_expires_at);
+CREATE INDEX IF NOT EXISTS idx_daemons_order ON daemons(project_id, order_id);
+
+-- ============================================================================
+-- STATIC_ANALYSIS_CACHE TABLE
+-- ============================================================================
+-- Static analysis results (quality/static_analyzer.py). Files whose content,
+-- tool version and tool configuration are unchanged are not re-analyzed;
+-- entries unused for 30 days are pruned on write
+
+CREATE TABLE IF NOT EXISTS static_analysis_cache (
+    tool TEXT NOT NULL,                           -- ruff / mypy / tsc / eslint
+    content_hash TEXT NOT NULL,                   -- SHA-256 of the file (mypy/tsc: of the analyzed file set)
+    tool_version TEXT NOT NULL,                   -- '<tool> --version' output
+    config_hash TEXT NOT NULL,                    -- SHA-256 of tool arguments and config files
+    file_path TEXT,                               -- Path at the time of analysis (informational)
+    issues_json TEXT NOT NULL DEFAULT '[]',       -- JSON list of AnalysisIssue dicts
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    last_used_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (tool, content_hash, tool_version, config_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_static_analysis_cache_last_used ON static_analysis_cache(last_used_at);
+
+-- ============================================================================
+-- STATIC_ANALYSIS_TOOLS TABLE
+-- ============================================================================
+-- Tool detection results of quality/static_analyzer.py per project root.
+-- Reused by other worker processes while the fingerprint matches and the
+-- row is younger than DETECTION_CACHE_TTL_SECONDS
+
+CREATE TABLE IF NOT EXISTS static_analysis_tools (
+    project_root TEXT PRIMARY KEY,                -- Resolved project root path
+    fingerprint TEXT NOT NULL,                    -- SHA-256 of config files present and PATH
+    tools_json TEXT NOT NULL,                     -- {"ruff": true, ...}
+    commands_json TEXT NOT NULL,                  -- {"tsc": ["npx", "tsc"], ...}
+    versions_json TEXT NOT NULL DEFAULT '{}',     -- '<tool> --version' output (null: unavailable)
+    detected_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
 -- ============================================================================
 -- END OF SCHEMA
 -- ============================================================================
@@ -1708,7 +1708,7 @@ export class AipmDbService {
    * 並列実行デーモンのハートビート情報を取得
    *
    * ORDER_128: TASK_1127 - タスク進捗情報取得API
-   * daemon_heartbeat.jsonから並列実行の状態を読み込む
+   * daemonsテーブル（デーモンのリース登録）から並列実行の状態を読み込む
    *
    * @param projectId プロジェクトID
    * @param orderId ORDER ID
@@ -1730,47 +1730,61 @@ export class AipmDbService {
     ageSeconds: number;
     isAlive: boolean;
   } | null {
-    const configService = getConfigService();
-    const frameworkPath = configService.getActiveFrameworkPath();
-
-    if (!frameworkPath) {
-      return null;
-    }
-
-    const heartbeatPath = path.join(
-      frameworkPath,
-      'PROJECTS',
-      projectId,
-      'RESULT',
-      orderId,
-      'LOGS',
-      'daemon_heartbeat.json'
-    );
-
-    if (!fs.existsSync(heartbeatPath)) {
-      return null;
-    }
-
     try {
-      const content = fs.readFileSync(heartbeatPath, 'utf-8');
-      const data = JSON.parse(content);
+      const db = this.getConnection();
+      // ORDER専用デーモンを優先し、なければこのORDERを管理するグローバルスケジューラ
+      const rows = db
+        .prepare(
+          `SELECT daemon_id, kind, pid, status, owned_tasks, info_json, heartbeat_at,
+                  ROUND((julianday('now') - julianday(heartbeat_at)) * 86400.0, 1) AS age_seconds,
+                  lease_expires_at > datetime('now') AS is_alive
+           FROM daemons
+           WHERE daemon_id IN (?, 'scheduler')`
+        )
+        .all(`order:${projectId}/${orderId}`) as Array<{
+        daemon_id: string;
+        kind: string;
+        pid: number;
+        status: string;
+        owned_tasks: string;
+        info_json: string | null;
+        heartbeat_at: string;
+        age_seconds: number;
+        is_alive: number;
+      }>;
+
+      const info = (row: { info_json: string | null }) =>
+        row.info_json ? JSON.parse(row.info_json) : {};
+      const row =
+        rows.find((r) => r.kind === 'order') ??
+        rows.find((r) =>
+          (info(r).orders || []).includes(`${projectId}/${orderId}`)
+        );
+      if (!row) {
+        return null;
+      }
 
-      // ファイルの更新時刻からage_secondsを計算
-      const stats = fs.statSync(heartbeatPath);
-      const ageSeconds = (Date.now() - stats.mtimeMs) / 1000;
+      const data = info(row);
+      const pids = (JSON.parse(row.owned_tasks || '[]') as Array<{
+        project_id: string;
+        order_id: string;
+        pid: number;
+      }>)
+        .filter((t) => t.project_id === projectId && t.order_id === orderId)
+        .map((t) => t.pid);
 
       return {
-        pid: data.pid,
-        orderId: data.order_id,
-        projectId: data.project_id,
-        timestamp: data.timestamp,
-        activeWorkers: data.active_workers,
-        activeWorkerPids: data.active_worker_pids || [],
-        status: data.status,
+        pid: row.pid,
+        orderId,
+        projectId,
+        timestamp: row.heartbeat_at,
+        activeWorkers: pids.length,
+        activeWorkerPids: pids,
+        status: row.status,
         adaptivePollInterval: data.adaptive_poll_interval || null,
         resourceTrend: data.resource_trend || null,
-        ageSeconds: Math.round(ageSeconds * 10) / 10,
-        isAlive: ageSeconds < 60,
+        ageSeconds: row.age_seconds,
+        isAlive: row.is_alive === 1,
       };
     } catch (error) {
       console.error(